@@ -0,0 +1,27 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Micro-benchmarks for hot paths of the Firestore client.
+
+Each module can be run directly, e.g.::
+
+    $ python -m benchmarks.watch_doc_tree
+
+:mod:`benchmarks.suite` times the hot paths together and compares them with
+a stored baseline, to catch regressions::
+
+    $ python -m benchmarks.suite
+
+These are not part of the distributed package.
+"""
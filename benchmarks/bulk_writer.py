@@ -0,0 +1,106 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark write throughput, sequential batches vs. BulkWriter.
+
+A :class:`~benchmarks.fake_firestore.FakeFirestore` server sleeps
+``--latency-ms`` per request and fails a ``--error-rate`` fraction of
+``BatchWrite`` writes with ``ABORTED``. ``--docs`` deletes are then sent
+either as sequential :class:`WriteBatch` commits of ``--batch-size``
+writes, or through a :class:`BulkWriter` (unthrottled) with each
+``--in-flight`` setting.
+
+    $ python -m benchmarks.bulk_writer --docs 2000 --latency-ms 20
+"""
+
+import argparse
+import time
+
+import grpc  # type: ignore
+
+from benchmarks.fake_firestore import FakeFirestore
+from benchmarks.fake_firestore import FakeFirestoreServer
+
+
+def _run_batches(client, documents, batch_size):
+    start = time.perf_counter()
+    for i in range(0, len(documents), batch_size):
+        batch = client.batch()
+        for document in documents[i : i + batch_size]:
+            batch.delete(document)
+        batch.commit()
+    return time.perf_counter() - start
+
+
+def _run_bulk_writer(client, documents, batch_size, in_flight):
+    start = time.perf_counter()
+    with client.bulk_writer(
+        max_batch_size=batch_size, max_in_flight=in_flight, throttle=False
+    ) as bulk_writer:
+        futures = [bulk_writer.delete(document) for document in documents]
+    elapsed = time.perf_counter() - start
+    failed = sum(1 for future in futures if future.exception() is not None)
+    return elapsed, failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=2000)
+    parser.add_argument("--batch-size", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--in-flight", type=int, nargs="+", default=[1, 5, 10, 20],
+    )
+    args = parser.parse_args(argv)
+
+    fake = FakeFirestore(
+        latency=args.latency_ms / 1000.0,
+        error_rate={"BatchWrite": args.error_rate},
+        error_code=grpc.StatusCode.ABORTED,
+    )
+    with FakeFirestoreServer(fake, max_workers=max(args.in_flight) + 4) as server:
+        client = server.client(project="bench")
+        collection = client.collection("bench")
+        documents = [collection.document("doc-{}".format(i)) for i in range(args.docs)]
+
+        print(
+            "{} deletes, {} per batch, {:.0f} ms latency".format(
+                args.docs, args.batch_size, args.latency_ms
+            )
+        )
+        print(
+            "{:<16} {:>10} {:>12} {:>8}".format(
+                "mode", "time (s)", "writes/s", "failed"
+            )
+        )
+        baseline = _run_batches(client, documents, args.batch_size)
+        print(
+            "{:<16} {:>10.2f} {:>12.0f} {:>8}".format(
+                "batch.commit", baseline, args.docs / baseline, "-"
+            )
+        )
+        for in_flight in args.in_flight:
+            elapsed, failed = _run_bulk_writer(
+                client, documents, args.batch_size, in_flight
+            )
+            print(
+                "{:<16} {:>10.2f} {:>12.0f} {:>8}".format(
+                    "bulk x{}".format(in_flight), elapsed, args.docs / elapsed, failed
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Load test of document reads over a pool of gRPC channels.
+
+A local gRPC server implements ``GetDocument``, sleeping ``--latency-ms``
+per request, and ``Listen``, holding streams open. Like Firestore, it
+accepts at most ``--max-streams`` concurrent streams per connection.
+``--listeners`` listen streams are opened first; then ``--concurrency``
+threads read ``--reads`` documents, once for each ``--pool-size``.
+
+    $ python -m benchmarks.channel_pool --listeners 90 --concurrency 64
+"""
+
+import argparse
+import concurrent.futures
+import threading
+import time
+
+import grpc  # type: ignore
+
+from google.auth.credentials import AnonymousCredentials  # type: ignore
+from google.cloud.firestore_v1.channel_pool import ChannelOptions
+from google.cloud.firestore_v1.channel_pool import ChannelPool
+from google.cloud.firestore_v1.client import Client
+from google.cloud.firestore_v1.services.firestore import client as firestore_client
+from google.cloud.firestore_v1.services.firestore.transports import grpc as transport
+from google.cloud.firestore_v1.types import document
+from google.cloud.firestore_v1.types import firestore
+
+
+class _FakeFirestore(object):
+    def __init__(self, latency):
+        self.latency = latency
+
+    def get_document(self, request, context):
+        time.sleep(self.latency)
+        return document.Document(name=request.name)
+
+    def listen(self, request_iterator, context):
+        yield firestore.ListenResponse()
+        for _ in request_iterator:
+            pass
+
+
+def _start_server(servicer, max_workers, max_streams):
+    handlers = {
+        "GetDocument": grpc.unary_unary_rpc_method_handler(
+            servicer.get_document,
+            request_deserializer=firestore.GetDocumentRequest.deserialize,
+            response_serializer=document.Document.serialize,
+        ),
+        "Listen": grpc.stream_stream_rpc_method_handler(
+            servicer.listen,
+            request_deserializer=firestore.ListenRequest.deserialize,
+            response_serializer=firestore.ListenResponse.serialize,
+        ),
+    }
+    server = grpc.server(
+        concurrent.futures.ThreadPoolExecutor(max_workers=max_workers),
+        options=[("grpc.max_concurrent_streams", max_streams)],
+    )
+    server.add_generic_rpc_handlers(
+        (
+            grpc.method_handlers_generic_handler(
+                "google.firestore.v1.Firestore", handlers
+            ),
+        )
+    )
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+    return server, "localhost:{}".format(port)
+
+
+def _make_client(address, options):
+    client = Client(project="bench", credentials=AnonymousCredentials())
+
+    def create_channel():
+        return grpc.insecure_channel(address, options=options.grpc_options())
+
+    if options.pool_size > 1:
+        channel = ChannelPool(create_channel, options)
+    else:
+        channel = create_channel()
+    client._firestore_api_internal = firestore_client.FirestoreClient(
+        transport=transport.FirestoreGrpcTransport(channel=channel)
+    )
+    return client, channel
+
+
+def _open_listeners(client, count, stop):
+    def requests():
+        yield firestore.ListenRequest(database=client._database_string)
+        stop.wait()
+
+    # Each call returns once the first response of its stream arrives.
+    return [client._firestore_api.listen(requests()) for _ in range(count)]
+
+
+def _run_reads(client, reads, concurrency):
+    documents = [client.document("bench", "doc-{}".format(i)) for i in range(reads)]
+    start = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(lambda reference: reference.get(), documents))
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reads", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--listeners", type=int, default=90)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--max-streams", type=int, default=100)
+    parser.add_argument("--pool-size", type=int, nargs="+", default=[1, 2, 4])
+    args = parser.parse_args(argv)
+
+    servicer = _FakeFirestore(args.latency_ms / 1000.0)
+    server, address = _start_server(
+        servicer,
+        max(args.pool_size) * args.listeners + args.concurrency + 4,
+        args.max_streams,
+    )
+    try:
+        print(
+            "{} reads x{}, {} listeners, {:.0f} ms latency, {} streams per "
+            "connection".format(
+                args.reads,
+                args.concurrency,
+                args.listeners,
+                args.latency_ms,
+                args.max_streams,
+            )
+        )
+        print(
+            "{:<10} {:>10} {:>12} {:>10}".format(
+                "pool", "time (s)", "reads/s", "channels"
+            )
+        )
+        for pool_size in args.pool_size:
+            options = ChannelOptions(
+                pool_size=pool_size, max_concurrent_streams=args.max_streams
+            )
+            client, channel = _make_client(address, options)
+            stop = threading.Event()
+            try:
+                # Hold on to the streams: they are cancelled once collected.
+                listeners = _open_listeners(client, args.listeners, stop)
+                elapsed = _run_reads(client, args.reads, args.concurrency)
+            finally:
+                stop.set()
+            del listeners
+            channels = len(channel.channels) if pool_size > 1 else 1
+            print(
+                "{:<10} {:>10.2f} {:>12.0f} {:>10}".format(
+                    "x{}".format(pool_size), elapsed, args.reads / elapsed, channels
+                )
+            )
+            channel.close()
+    finally:
+        server.stop(None)
+
+
+if __name__ == "__main__":
+    main()
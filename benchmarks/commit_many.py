@@ -0,0 +1,125 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark committing many batches, one at a time vs. ``commit_many``.
+
+A :class:`~benchmarks.fake_firestore.FakeFirestore` server sleeps
+``--latency-ms`` per request and fails a ``--error-rate`` fraction of
+``Commit`` requests with ``ABORTED``. ``--batches`` batches of
+``--batch-size`` deletes are then committed either one
+``WriteBatch.commit`` at a time (retrying aborted commits with the same
+backoff), or with :meth:`Client.commit_many` for each ``--in-flight``
+setting.
+
+    $ python -m benchmarks.commit_many --batches 200 --latency-ms 20
+"""
+
+import argparse
+import time
+
+import grpc  # type: ignore
+
+from google.api_core import exceptions  # type: ignore
+
+from google.cloud.firestore_v1.base_transaction import _INITIAL_SLEEP
+from google.cloud.firestore_v1.transaction import _sleep
+
+from benchmarks.fake_firestore import FakeFirestore
+from benchmarks.fake_firestore import FakeFirestoreServer
+
+
+def _make_batches(client, num_batches, batch_size):
+    collection = client.collection("bench")
+    batches = []
+    for i in range(num_batches):
+        batch = client.batch()
+        for j in range(batch_size):
+            batch.delete(collection.document("doc-{}-{}".format(i, j)))
+        batches.append(batch)
+    return batches
+
+
+def _run_sequential(client, batches):
+    start = time.perf_counter()
+    for batch in batches:
+        current_sleep = _INITIAL_SLEEP
+        while True:
+            try:
+                batch.commit(retry=None)
+                break
+            except exceptions.Aborted:
+                current_sleep = _sleep(current_sleep)
+    return time.perf_counter() - start
+
+
+def _run_commit_many(client, batches, in_flight):
+    start = time.perf_counter()
+    client.commit_many(batches, max_in_flight=in_flight, max_attempts=100, retry=None)
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batches", type=int, default=200)
+    parser.add_argument("--batch-size", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--in-flight", type=int, nargs="+", default=[1, 5, 10, 20],
+    )
+    args = parser.parse_args(argv)
+
+    fake = FakeFirestore(
+        latency=args.latency_ms / 1000.0,
+        error_rate={"Commit": args.error_rate},
+        error_code=grpc.StatusCode.ABORTED,
+    )
+    with FakeFirestoreServer(fake, max_workers=max(args.in_flight) + 4) as server:
+        client = server.client(project="bench")
+        writes = args.batches * args.batch_size
+
+        print(
+            "{} batches of {} deletes, {:.0f} ms latency".format(
+                args.batches, args.batch_size, args.latency_ms
+            )
+        )
+        print(
+            "{:<16} {:>10} {:>12} {:>10}".format(
+                "mode", "time (s)", "writes/s", "requests"
+            )
+        )
+        batches = _make_batches(client, args.batches, args.batch_size)
+        fake.requests.clear()
+        elapsed = _run_sequential(client, batches)
+        print(
+            "{:<16} {:>10.2f} {:>12.0f} {:>10}".format(
+                "batch.commit", elapsed, writes / elapsed, fake.requests["Commit"]
+            )
+        )
+        for in_flight in args.in_flight:
+            batches = _make_batches(client, args.batches, args.batch_size)
+            fake.requests.clear()
+            elapsed = _run_commit_many(client, batches, in_flight)
+            print(
+                "{:<16} {:>10.2f} {:>12.0f} {:>10}".format(
+                    "commit_many x{}".format(in_flight),
+                    elapsed,
+                    writes / elapsed,
+                    fake.requests["Commit"],
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark decoding document fields into native Python values.
+
+Compares :func:`~google.cloud.firestore_v1._helpers.decode_dict`, which walks
+the raw protobuf messages, against the previous recursive decoder, which went
+through a proto-plus wrapper for every nested ``Value``.
+
+Documents are taken from the ``jsonData`` of the conformance tests in
+``tests/unit/v1/testdata`` plus synthetic wide and deep documents.
+
+    $ python -m benchmarks.decode_value --repeat 5
+"""
+
+import argparse
+import glob
+import json
+import os
+import time
+
+from google.api_core.datetime_helpers import DatetimeWithNanoseconds  # type: ignore
+from google.cloud.firestore_v1 import _helpers
+from google.cloud.firestore_v1.types import document
+
+
+_TESTDATA = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "tests",
+    "unit",
+    "v1",
+    "testdata",
+)
+
+
+def legacy_decode_value(value, client):
+    """The recursive, proto-plus based decoder used before the fast path."""
+    value_type = value._pb.WhichOneof("value_type")
+
+    if value_type == "null_value":
+        return None
+    elif value_type == "boolean_value":
+        return value.boolean_value
+    elif value_type == "integer_value":
+        return value.integer_value
+    elif value_type == "double_value":
+        return value.double_value
+    elif value_type == "timestamp_value":
+        return DatetimeWithNanoseconds.from_timestamp_pb(value._pb.timestamp_value)
+    elif value_type == "string_value":
+        return value.string_value
+    elif value_type == "bytes_value":
+        return value.bytes_value
+    elif value_type == "reference_value":
+        return _helpers.reference_value_to_document(value.reference_value, client)
+    elif value_type == "geo_point_value":
+        return _helpers.GeoPoint(
+            value.geo_point_value.latitude, value.geo_point_value.longitude
+        )
+    elif value_type == "array_value":
+        return [
+            legacy_decode_value(element, client) for element in value.array_value.values
+        ]
+    elif value_type == "map_value":
+        return legacy_decode_dict(value.map_value.fields, client)
+    else:
+        raise ValueError("Unknown ``value_type``", value_type)
+
+
+def legacy_decode_dict(value_fields, client):
+    return {
+        key: legacy_decode_value(value, client) for key, value in value_fields.items()
+    }
+
+
+def _conformance_documents():
+    documents = []
+    for filename in sorted(glob.glob(os.path.join(_TESTDATA, "*.json"))):
+        with open(filename) as json_file:
+            test = json.load(json_file)
+        for case in test.get("tests", ()):
+            for kind in ("create", "set", "update"):
+                json_data = case.get(kind, {}).get("jsonData")
+                if json_data is not None:
+                    data = json.loads(json_data)
+                    if isinstance(data, dict):
+                        documents.append(data)
+    return documents
+
+
+def _wide_document(width):
+    return {
+        "field_{:04d}".format(i): (i, "value-{}".format(i), i * 0.5, i % 2 == 0)[i % 4]
+        for i in range(width)
+    }
+
+
+def _deep_document(depth):
+    data = {"leaf": [1, 2.5, "three", None]}
+    for level in range(depth):
+        data = {"level_{}".format(level): data, "sibling": [level, {"x": level}]}
+    return data
+
+
+def _array_document(length):
+    return {"values": [{"i": i, "tags": ["a", "b", i]} for i in range(length)]}
+
+
+def _to_fields(data):
+    return document.Document(fields=_helpers.encode_dict(data)).fields
+
+
+def _time(func, fields_list, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for fields in fields_list:
+            func(fields, None)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--copies",
+        type=int,
+        default=50,
+        help="Times each conformance document is decoded per run.",
+    )
+    args = parser.parse_args(argv)
+
+    conformance = [_to_fields(data) for data in _conformance_documents()]
+    workloads = [
+        ("conformance", conformance * args.copies),
+        ("wide (1000 fields)", [_to_fields(_wide_document(1000))]),
+        ("deep (20 levels)", [_to_fields(_deep_document(20))]),
+        ("arrays (1000 maps)", [_to_fields(_array_document(1000))]),
+    ]
+
+    print(
+        "{:<22} {:>6} {:>14} {:>14} {:>9}".format(
+            "workload", "docs", "legacy (ms)", "fast (ms)", "speedup"
+        )
+    )
+    for name, fields_list in workloads:
+        for fields in fields_list:
+            assert legacy_decode_dict(fields, None) == _helpers.decode_dict(
+                fields, None
+            )
+        legacy = _time(legacy_decode_dict, fields_list, args.repeat)
+        fast = _time(_helpers.decode_dict, fields_list, args.repeat)
+        print(
+            "{:<22} {:>6} {:>14.2f} {:>14.2f} {:>8.1f}x".format(
+                name, len(fields_list), legacy * 1000, fast * 1000, legacy / fast
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark preparing ``Write`` protobufs for create, set and update.
+
+Times :func:`~google.cloud.firestore_v1._helpers.pbs_for_create`,
+:func:`~google.cloud.firestore_v1._helpers.pbs_for_set_with_merge` (merging
+all fields, then a tenth of the top-level fields) and
+:func:`~google.cloud.firestore_v1._helpers.pbs_for_update` on wide and deep
+documents, each with a few transforms.
+
+    $ python -m benchmarks.document_extractor --width 1000 --depth 50
+"""
+
+import argparse
+import time
+
+from google.cloud.firestore_v1 import _helpers
+from google.cloud.firestore_v1 import transforms
+
+
+_DOCUMENT_PATH = "projects/bench/databases/(default)/documents/bench/doc"
+
+
+def _wide_document(width):
+    data = {
+        "field_{:04d}".format(i): (i, "value-{}".format(i), i * 0.5, [i, i + 1])[i % 4]
+        for i in range(width)
+    }
+    data["updated"] = transforms.SERVER_TIMESTAMP
+    data["visits"] = transforms.Increment(1)
+    return data
+
+
+def _deep_document(depth):
+    data = {"leaf": 1, "stamp": transforms.SERVER_TIMESTAMP}
+    for level in range(depth):
+        data = {
+            "level_{:03d}".format(level): data,
+            "sibling_{:03d}".format(level): {"x": level, "tags": ["a", "b"]},
+            "value": level,
+        }
+    return data
+
+
+def _update_data(data):
+    """Field paths to update: nested maps are flattened one level."""
+    field_updates = {}
+    for key, value in data.items():
+        if isinstance(value, dict) and value:
+            for nested_key, nested_value in value.items():
+                field_updates["{}.{}".format(key, nested_key)] = nested_value
+        else:
+            field_updates[key] = value
+    return field_updates
+
+
+def _cases(data):
+    merge_paths = sorted(data)[:: max(len(data) // 10, 1)]
+    field_updates = _update_data(data)
+    return [
+        ("create", lambda: _helpers.pbs_for_create(_DOCUMENT_PATH, data)),
+        (
+            "set, merge=True",
+            lambda: _helpers.pbs_for_set_with_merge(_DOCUMENT_PATH, data, True),
+        ),
+        (
+            "set, merge=[paths]",
+            lambda: _helpers.pbs_for_set_with_merge(_DOCUMENT_PATH, data, merge_paths),
+        ),
+        (
+            "update",
+            lambda: _helpers.pbs_for_update(_DOCUMENT_PATH, field_updates, None),
+        ),
+    ]
+
+
+def _time(func, calls, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / calls
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--width", type=int, default=1000)
+    parser.add_argument("--depth", type=int, default=50)
+    parser.add_argument("--calls", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    documents = [
+        ("wide ({} fields)".format(args.width), _wide_document(args.width)),
+        ("deep ({} levels)".format(args.depth), _deep_document(args.depth)),
+    ]
+    print("{:<20} {:<20} {:>12}".format("document", "operation", "ms / call"))
+    for document_name, data in documents:
+        for name, func in _cases(data):
+            elapsed = _time(func, args.calls, args.repeat)
+            print("{:<20} {:<20} {:>12.3f}".format(document_name, name, elapsed * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark encoding documents into ``Write`` protobufs (docs / sec).
+
+Compares :func:`~google.cloud.firestore_v1._helpers.pbs_for_set_no_merge`,
+which dispatches on ``type(value)`` and fills raw protobuf messages in place,
+against the previous ``isinstance()`` chain building proto-plus wrappers.
+
+    $ python -m benchmarks.encode_value --docs 2000
+"""
+
+import argparse
+import datetime
+import time
+
+from google.api_core.datetime_helpers import DatetimeWithNanoseconds  # type: ignore
+from google.protobuf import struct_pb2
+from google.cloud._helpers import _datetime_to_pb_timestamp  # type: ignore
+from google.cloud.firestore_v1 import _helpers
+from google.cloud.firestore_v1.types import document
+from google.cloud.firestore_v1.types import write
+
+
+def legacy_encode_value(value):
+    """The ``isinstance()`` based encoder used before the dispatch table."""
+    if value is None:
+        return document.Value(null_value=struct_pb2.NULL_VALUE)
+    if isinstance(value, bool):
+        return document.Value(boolean_value=value)
+    if isinstance(value, int):
+        return document.Value(integer_value=value)
+    if isinstance(value, float):
+        return document.Value(double_value=value)
+    if isinstance(value, DatetimeWithNanoseconds):
+        return document.Value(timestamp_value=value.timestamp_pb())
+    if isinstance(value, datetime.datetime):
+        return document.Value(timestamp_value=_datetime_to_pb_timestamp(value))
+    if isinstance(value, str):
+        return document.Value(string_value=value)
+    if isinstance(value, bytes):
+        return document.Value(bytes_value=value)
+    document_path = getattr(value, "_document_path", None)
+    if document_path is not None:
+        return document.Value(reference_value=document_path)
+    if isinstance(value, _helpers.GeoPoint):
+        return document.Value(geo_point_value=value.to_protobuf())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        value_list = tuple(legacy_encode_value(element) for element in value)
+        return document.Value(array_value=document.ArrayValue(values=value_list))
+    if isinstance(value, dict):
+        value_dict = legacy_encode_dict(value)
+        return document.Value(map_value=document.MapValue(fields=value_dict))
+    raise TypeError("Cannot convert to a Firestore Value", value)
+
+
+def legacy_encode_dict(values_dict):
+    return {key: legacy_encode_value(value) for key, value in values_dict.items()}
+
+
+def legacy_pbs_for_set_no_merge(document_path, document_data):
+    extractor = _helpers.DocumentExtractor(document_data)
+    return [
+        write.Write(
+            update=document.Document(
+                name=document_path, fields=legacy_encode_dict(extractor.set_fields)
+            )
+        )
+    ]
+
+
+def _flat_document(i):
+    return {
+        "name": "user-{}".format(i),
+        "age": i % 90,
+        "score": i * 0.25,
+        "active": i % 2 == 0,
+        "created": datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc),
+        "avatar": b"\x89PNG",
+        "home": _helpers.GeoPoint(37.4, -122.1),
+        "nickname": None,
+    }
+
+
+def _nested_document(i):
+    return {
+        "profile": {
+            "name": {"first": "Ada", "last": "Lovelace-{}".format(i)},
+            "address": {"city": "London", "zip": {"code": i, "suffix": "AB"}},
+        },
+        "settings": {"theme": "dark", "flags": {"beta": True, "ads": False}},
+    }
+
+
+def _array_document(i):
+    return {
+        "tags": ["tag-{}".format(n) for n in range(20)],
+        "scores": [float(n + i) for n in range(50)],
+        "events": [{"at": n, "kind": "click"} for n in range(10)],
+    }
+
+
+def _throughput(func, docs):
+    start = time.perf_counter()
+    for path, data in docs:
+        func(path, data)
+    return len(docs) / (time.perf_counter() - start)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    path = "projects/bench/databases/(default)/documents/bench/{}"
+    workloads = [
+        ("flat", _flat_document),
+        ("nested", _nested_document),
+        ("array-heavy", _array_document),
+    ]
+
+    print(
+        "{:<12} {:>16} {:>16} {:>9}".format(
+            "workload", "legacy (docs/s)", "fast (docs/s)", "speedup"
+        )
+    )
+    for name, factory in workloads:
+        docs = [(path.format(i), factory(i)) for i in range(args.docs)]
+        assert all(
+            legacy_pbs_for_set_no_merge(*doc) == _helpers.pbs_for_set_no_merge(*doc)
+            for doc in docs[:10]
+        )
+        legacy = max(
+            _throughput(legacy_pbs_for_set_no_merge, docs) for _ in range(args.repeat)
+        )
+        fast = max(
+            _throughput(_helpers.pbs_for_set_no_merge, docs) for _ in range(args.repeat)
+        )
+        print(
+            "{:<12} {:>16,.0f} {:>16,.0f} {:>8.1f}x".format(
+                name, legacy, fast, fast / legacy
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
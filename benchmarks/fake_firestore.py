@@ -0,0 +1,1316 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""An in-process fake of the Firestore gRPC service.
+
+:class:`FakeFirestore` implements ``BatchGetDocuments``, ``BatchWrite``,
+``BeginTransaction``, ``Commit``, ``GetDocument``, ``ListCollectionIds``,
+``ListDocuments``, ``Listen``, ``PartitionQuery``, ``Rollback`` and
+``RunQuery`` on documents kept in memory, and :class:`FakeFirestoreServer`
+serves it on a local port. Each RPC can be slowed down by a fixed latency
+and made to fail, at random or on demand, so that batching, pooling and
+streaming can be measured reproducibly, without a network::
+
+    with FakeFirestoreServer(FakeFirestore(latency=0.005)) as server:
+        client = server.client()
+        client.collection("users").document("ada").set({"name": "Ada"})
+
+Transactions are accepted but not isolated, and read times are ignored.
+
+Run as a module, it serves until interrupted, for clients connecting with
+``FIRESTORE_EMULATOR_HOST`` (synchronous ones only); with ``--bench``, it times the round trips of
+a few operations instead.
+
+    $ python -m benchmarks.fake_firestore --port 8080 --latency-ms 5
+    $ python -m benchmarks.fake_firestore --bench --latency-ms 5
+"""
+
+import argparse
+import collections
+import concurrent.futures
+import functools
+import itertools
+import math
+import operator
+import queue
+import random
+import threading
+import time
+
+import grpc  # type: ignore
+from grpc.experimental import aio  # type: ignore
+
+from google.auth.credentials import AnonymousCredentials  # type: ignore
+from google.protobuf import empty_pb2  # type: ignore
+from google.protobuf import timestamp_pb2  # type: ignore
+from google.rpc import status_pb2  # type: ignore
+
+from google.cloud.firestore_v1.async_client import AsyncClient
+from google.cloud.firestore_v1.client import Client
+from google.cloud.firestore_v1.field_path import parse_field_path
+from google.cloud.firestore_v1.order import Order
+from google.cloud.firestore_v1.order import TypeOrder
+from google.cloud.firestore_v1.services.firestore import (
+    async_client as firestore_async_client,
+)
+from google.cloud.firestore_v1.services.firestore import client as firestore_client
+from google.cloud.firestore_v1.services.firestore.transports import (
+    grpc as grpc_transport,
+)
+from google.cloud.firestore_v1.services.firestore.transports import (
+    grpc_asyncio as grpc_asyncio_transport,
+)
+from google.cloud.firestore_v1.types import document
+from google.cloud.firestore_v1.types import firestore
+from google.cloud.firestore_v1.types import query
+from google.cloud.firestore_v1.types import write
+
+
+_SERVICE = "google.firestore.v1.Firestore"
+_NAME_PATH = ("__name__",)
+
+_Document = document.Document.pb()
+_Value = document.Value.pb()
+_Cursor = query.Cursor.pb()
+_WriteResult = write.WriteResult.pb()
+_ListenResponse = firestore.ListenResponse.pb()
+_TargetChange = firestore.TargetChange.pb()
+
+_FieldOp = query.StructuredQuery.FieldFilter.Operator
+_UnaryOp = query.StructuredQuery.UnaryFilter.Operator
+_DESCENDING = query.StructuredQuery.Direction.DESCENDING
+_ChangeType = firestore.TargetChange.TargetChangeType
+_REQUEST_TIME = write.DocumentTransform.FieldTransform.ServerValue.REQUEST_TIME
+
+_NULL = TypeOrder.NULL.value
+_BOOLEAN = TypeOrder.BOOLEAN.value
+_NUMBER = TypeOrder.NUMBER.value
+_TIMESTAMP = TypeOrder.TIMESTAMP.value
+_STRING = TypeOrder.STRING.value
+_BLOB = TypeOrder.BLOB.value
+_REF = TypeOrder.REF.value
+_GEO_POINT = TypeOrder.GEO_POINT.value
+_ARRAY = TypeOrder.ARRAY.value
+_OBJECT = TypeOrder.OBJECT.value
+
+_INEQUALITY_OPS = frozenset(
+    [
+        _FieldOp.LESS_THAN,
+        _FieldOp.LESS_THAN_OR_EQUAL,
+        _FieldOp.GREATER_THAN,
+        _FieldOp.GREATER_THAN_OR_EQUAL,
+        _FieldOp.NOT_EQUAL,
+        _FieldOp.NOT_IN,
+    ]
+)
+
+
+def _value_key(value_pb):
+    """Compute a natively comparable, hashable key for a ``Value`` protobuf.
+
+    Used to evaluate filters and array transforms; documents are ordered
+    with :func:`_order_key`.
+    """
+    kind = value_pb.WhichOneof("value_type")
+    if kind == "boolean_value":
+        return (_BOOLEAN, value_pb.boolean_value)
+    if kind == "integer_value":
+        return (_NUMBER, 1, value_pb.integer_value)
+    if kind == "double_value":
+        if math.isnan(value_pb.double_value):
+            return (_NUMBER, 0)
+        return (_NUMBER, 1, value_pb.double_value)
+    if kind == "timestamp_value":
+        timestamp_pb = value_pb.timestamp_value
+        return (_TIMESTAMP, timestamp_pb.seconds, timestamp_pb.nanos)
+    if kind == "string_value":
+        return (_STRING, value_pb.string_value)
+    if kind == "bytes_value":
+        return (_BLOB, value_pb.bytes_value)
+    if kind == "reference_value":
+        return (_REF, tuple(value_pb.reference_value.split("/")))
+    if kind == "geo_point_value":
+        geo_point = value_pb.geo_point_value
+        return (_GEO_POINT, geo_point.latitude, geo_point.longitude)
+    if kind == "array_value":
+        return (
+            _ARRAY,
+            tuple(_value_key(element) for element in value_pb.array_value.values),
+        )
+    if kind == "map_value":
+        fields = value_pb.map_value.fields
+        return (
+            _OBJECT,
+            tuple((key, _value_key(fields[key])) for key in sorted(fields)),
+        )
+    return (_NULL,)
+
+
+_ascending_key = functools.cmp_to_key(Order.compare)
+_descending_key = functools.cmp_to_key(lambda left, right: Order.compare(right, left))
+
+
+def _order_key(value_pb, descending):
+    """Compute the key ordering query results by a ``Value`` protobuf.
+
+    Values are compared with :meth:`~google.cloud.firestore_v1.order.Order.compare`
+    rather than with the sort keys of the client, so that a bug in those
+    is not mirrored by the server.
+    """
+    value = document.Value.wrap(value_pb)
+    return _descending_key(value) if descending else _ascending_key(value)
+
+
+def _number(value_pb):
+    """The number held by a ``Value`` protobuf, or :data:`None`."""
+    if value_pb is None:
+        return None
+    kind = value_pb.WhichOneof("value_type")
+    if kind == "integer_value":
+        return value_pb.integer_value
+    if kind == "double_value":
+        return value_pb.double_value
+    return None
+
+
+def _parse_path(field_path):
+    return tuple(parse_field_path(field_path))
+
+
+def _get_value(fields, path):
+    """The value at ``path`` in a map of fields, or :data:`None`."""
+    for name in path[:-1]:
+        if name not in fields:
+            return None
+        value_pb = fields[name]
+        if value_pb.WhichOneof("value_type") != "map_value":
+            return None
+        fields = value_pb.map_value.fields
+    if path[-1] not in fields:
+        return None
+    return fields[path[-1]]
+
+
+def _get_field(document_pb, path):
+    """The value at ``path`` in a document, ``__name__`` included."""
+    if path == _NAME_PATH:
+        return _Value(reference_value=document_pb.name)
+    return _get_value(document_pb.fields, path)
+
+
+def _set_value(fields, path, value_pb):
+    """Set the value at ``path`` in a map of fields, creating maps as needed."""
+    for name in path[:-1]:
+        entry = fields[name]
+        if entry.WhichOneof("value_type") != "map_value":
+            entry.Clear()
+            entry.map_value.SetInParent()
+        fields = entry.map_value.fields
+    fields[path[-1]].CopyFrom(value_pb)
+
+
+def _delete_value(fields, path):
+    """Remove the value at ``path`` from a map of fields, if present."""
+    for name in path[:-1]:
+        if name not in fields or fields[name].WhichOneof("value_type") != "map_value":
+            return
+        fields = fields[name].map_value.fields
+    if path[-1] in fields:
+        del fields[path[-1]]
+
+
+def _project(document_pb, paths):
+    """Copy a document, keeping the fields at ``paths`` only."""
+    projected = _Document(
+        name=document_pb.name,
+        create_time=document_pb.create_time,
+        update_time=document_pb.update_time,
+    )
+    for path in paths:
+        value_pb = _get_value(document_pb.fields, path)
+        if value_pb is not None:
+            _set_value(projected.fields, path, value_pb)
+    return projected
+
+
+def _masked(document_pb, request_pb):
+    """Apply the ``mask`` of a read request to a document."""
+    if not request_pb.HasField("mask"):
+        return document_pb
+    return _project(
+        document_pb, [_parse_path(path) for path in request_pb.mask.field_paths]
+    )
+
+
+def _compare_filter(compare):
+    def matches(key, operand_key):
+        # Range filters only match values of the operand's type.
+        return key[0] == operand_key[0] and compare(key, operand_key)
+
+    return matches
+
+
+def _array_contains(key, operand_key):
+    return key[0] == _ARRAY and operand_key in key[1]
+
+
+def _array_contains_any(key, operand_keys):
+    return key[0] == _ARRAY and any(element in operand_keys for element in key[1])
+
+
+def _not_equal(key, operand_key):
+    return key != (_NULL,) and key != operand_key
+
+
+def _in(key, operand_keys):
+    return key in operand_keys
+
+
+def _not_in(key, operand_keys):
+    return key != (_NULL,) and key not in operand_keys
+
+
+_FIELD_FILTERS = {
+    _FieldOp.LESS_THAN: _compare_filter(operator.lt),
+    _FieldOp.LESS_THAN_OR_EQUAL: _compare_filter(operator.le),
+    _FieldOp.GREATER_THAN: _compare_filter(operator.gt),
+    _FieldOp.GREATER_THAN_OR_EQUAL: _compare_filter(operator.ge),
+    _FieldOp.EQUAL: operator.eq,
+    _FieldOp.NOT_EQUAL: _not_equal,
+    _FieldOp.ARRAY_CONTAINS: _array_contains,
+    _FieldOp.IN: _in,
+    _FieldOp.ARRAY_CONTAINS_ANY: _array_contains_any,
+    _FieldOp.NOT_IN: _not_in,
+}
+# Operators taking an array of operands.
+_LIST_OPS = frozenset([_FieldOp.IN, _FieldOp.ARRAY_CONTAINS_ANY, _FieldOp.NOT_IN])
+
+
+def _is_nan(value_pb):
+    number = _number(value_pb)
+    return isinstance(number, float) and math.isnan(number)
+
+
+_UNARY_FILTERS = {
+    _UnaryOp.IS_NAN: _is_nan,
+    _UnaryOp.IS_NULL: lambda value_pb: value_pb.WhichOneof("value_type")
+    == "null_value",
+    _UnaryOp.IS_NOT_NAN: lambda value_pb: not _is_nan(value_pb),
+    _UnaryOp.IS_NOT_NULL: lambda value_pb: (
+        value_pb.WhichOneof("value_type") != "null_value"
+    ),
+}
+
+
+class _Query(object):
+    """A structured query, prepared for evaluation against documents.
+
+    Args:
+        parent (str): The parent resource of the query.
+        query_pb (google.cloud.firestore_v1.types.StructuredQuery._pb):
+            The query.
+    """
+
+    def __init__(self, parent, query_pb):
+        (selector,) = query_pb.from_
+        self._prefix = parent + "/"
+        self._collection_id = selector.collection_id
+        self._all_descendants = selector.all_descendants
+
+        self._filters = []
+        inequality_path = None
+        if query_pb.HasField("where"):
+            inequality_path = self._add_filter(query_pb.where)
+
+        self._orders = [
+            (_parse_path(order_pb.field.field_path), order_pb.direction == _DESCENDING)
+            for order_pb in query_pb.order_by
+        ]
+        if not self._orders and inequality_path is not None:
+            self._orders.append((inequality_path, False))
+        if not self._orders or self._orders[-1][0] != _NAME_PATH:
+            descending = self._orders[-1][1] if self._orders else False
+            self._orders.append((_NAME_PATH, descending))
+
+        self._start_at = self._cursor(query_pb, "start_at")
+        self._end_at = self._cursor(query_pb, "end_at")
+        self._offset = query_pb.offset
+        self._limit = query_pb.limit.value if query_pb.HasField("limit") else None
+        self._projection = None
+        if query_pb.HasField("select"):
+            self._projection = [
+                _parse_path(field_pb.field_path)
+                for field_pb in query_pb.select.fields
+                if field_pb.field_path != "__name__"
+            ]
+
+    @property
+    def bounded(self):
+        """bool: Whether matching documents may be left out of the results."""
+        return bool(
+            self._limit is not None or self._offset or self._start_at or self._end_at
+        )
+
+    def _add_filter(self, filter_pb):
+        """Compile a filter, returning the path of an inequality, if any."""
+        kind = filter_pb.WhichOneof("filter_type")
+        if kind == "composite_filter":
+            inequality_path = None
+            for sub_filter_pb in filter_pb.composite_filter.filters:
+                inequality_path = self._add_filter(sub_filter_pb) or inequality_path
+            return inequality_path
+
+        if kind == "unary_filter":
+            unary_pb = filter_pb.unary_filter
+            path = _parse_path(unary_pb.field.field_path)
+            test = _UNARY_FILTERS[unary_pb.op]
+            self._filters.append((path, test, None))
+            return None
+
+        field_pb = filter_pb.field_filter
+        path = _parse_path(field_pb.field.field_path)
+        if field_pb.op in _LIST_OPS:
+            operand = frozenset(
+                _value_key(value_pb) for value_pb in field_pb.value.array_value.values
+            )
+        else:
+            operand = _value_key(field_pb.value)
+        self._filters.append((path, _FIELD_FILTERS[field_pb.op], operand))
+        return path if field_pb.op in _INEQUALITY_OPS else None
+
+    def _cursor(self, query_pb, name):
+        if not query_pb.HasField(name):
+            return None
+        cursor_pb = getattr(query_pb, name)
+        key = tuple(
+            _order_key(value_pb, descending)
+            for value_pb, (_, descending) in zip(cursor_pb.values, self._orders)
+        )
+        return key, cursor_pb.before
+
+    def contains(self, name):
+        """Whether a document is in the collection(s) queried."""
+        if not name.startswith(self._prefix):
+            return False
+        parts = name[len(self._prefix) :].split("/")
+        if self._all_descendants:
+            return parts[-2] == self._collection_id
+        return len(parts) == 2 and parts[0] == self._collection_id
+
+    def matches(self, document_pb):
+        """Whether a document is in the results of the query, bounds aside."""
+        if not self.contains(document_pb.name):
+            return False
+        for path, test, operand in self._filters:
+            value_pb = _get_field(document_pb, path)
+            if value_pb is None:
+                return False
+            if operand is None:
+                if not test(value_pb):
+                    return False
+            elif not test(_value_key(value_pb), operand):
+                return False
+        # Documents without a field ordered by are left out.
+        return all(
+            _get_field(document_pb, path) is not None for path, _ in self._orders
+        )
+
+    def sort_key(self, document_pb):
+        return tuple(
+            _order_key(_get_field(document_pb, path), descending)
+            for path, descending in self._orders
+        )
+
+    def _within_cursors(self, key):
+        if self._start_at is not None:
+            cursor_key, before = self._start_at
+            prefix = key[: len(cursor_key)]
+            if prefix < cursor_key or (prefix == cursor_key and not before):
+                return False
+        if self._end_at is not None:
+            cursor_key, before = self._end_at
+            prefix = key[: len(cursor_key)]
+            if prefix > cursor_key or (prefix == cursor_key and before):
+                return False
+        return True
+
+    def run(self, documents, project=True):
+        """Evaluate the query against documents.
+
+        Args:
+            documents (Iterable[google.cloud.firestore_v1.types.Document._pb]):
+                All the documents of the database.
+            project (bool): Whether to apply the ``select`` of the query.
+
+        Returns:
+            List[google.cloud.firestore_v1.types.Document._pb]: The
+            results, in order.
+        """
+        keyed = sorted(
+            (
+                (self.sort_key(document_pb), document_pb)
+                for document_pb in documents
+                if self.matches(document_pb)
+            ),
+            key=operator.itemgetter(0),
+        )
+        results = [
+            document_pb for key, document_pb in keyed if self._within_cursors(key)
+        ]
+        results = results[self._offset :]
+        if self._limit is not None:
+            results = results[: self._limit]
+        if project and self._projection is not None:
+            results = [
+                _project(document_pb, self._projection) for document_pb in results
+            ]
+        return results
+
+
+class _WriteError(Exception):
+    """A write which cannot be applied, failing its commit."""
+
+    def __init__(self, code, message):
+        super(_WriteError, self).__init__(message)
+        self.code = code
+        self.message = message
+
+
+def _apply_transform(fields, transform_pb, commit_time):
+    """Apply a field transform to a map of fields.
+
+    Returns:
+        google.cloud.firestore_v1.types.Value._pb: The transformed value.
+    """
+    path = _parse_path(transform_pb.field_path)
+    current = _get_value(fields, path)
+    kind = transform_pb.WhichOneof("transform_type")
+    if kind == "set_to_server_value":
+        result = _Value(timestamp_value=commit_time)
+    elif kind in ("increment", "maximum", "minimum"):
+        operand = getattr(transform_pb, kind)
+        current_number = _number(current)
+        operand_number = _number(operand)
+        if current_number is None:
+            result = operand
+        elif kind == "increment":
+            total = current_number + operand_number
+            if isinstance(total, int):
+                result = _Value(integer_value=total)
+            else:
+                result = _Value(double_value=total)
+        elif kind == "maximum":
+            result = operand if operand_number > current_number else current
+        else:
+            result = operand if operand_number < current_number else current
+    else:
+        elements = []
+        if current is not None and current.WhichOneof("value_type") == "array_value":
+            elements = list(current.array_value.values)
+        operands = getattr(transform_pb, kind).values
+        if kind == "append_missing_elements":
+            keys = set(_value_key(element) for element in elements)
+            for operand in operands:
+                key = _value_key(operand)
+                if key not in keys:
+                    keys.add(key)
+                    elements.append(operand)
+        else:
+            removed = set(_value_key(operand) for operand in operands)
+            elements = [
+                element for element in elements if _value_key(element) not in removed
+            ]
+        result = _Value()
+        result.array_value.values.extend(elements)
+
+    _set_value(fields, path, result)
+    return result
+
+
+def _apply_write(write_pb, existing, commit_time):
+    """Apply a write to a document.
+
+    Args:
+        write_pb (google.cloud.firestore_v1.types.Write._pb): The write.
+        existing (Optional[google.cloud.firestore_v1.types.Document._pb]):
+            The document written, if it exists.
+        commit_time (google.protobuf.timestamp_pb2.Timestamp): The time of
+            the write.
+
+    Returns:
+        Tuple[Optional[google.cloud.firestore_v1.types.Document._pb], \
+            google.cloud.firestore_v1.types.WriteResult._pb]: The new
+        document, :data:`None` if deleted, and the result of the write.
+
+    Raises:
+        _WriteError: If the precondition of the write fails.
+    """
+    name = _write_name(write_pb)
+    if write_pb.HasField("current_document"):
+        precondition = write_pb.current_document
+        if precondition.WhichOneof("condition_type") == "exists":
+            if precondition.exists and existing is None:
+                raise _WriteError(
+                    grpc.StatusCode.NOT_FOUND, "No document to update: " + name
+                )
+            if not precondition.exists and existing is not None:
+                raise _WriteError(
+                    grpc.StatusCode.ALREADY_EXISTS, "Document already exists: " + name
+                )
+        elif existing is None or existing.update_time != precondition.update_time:
+            raise _WriteError(
+                grpc.StatusCode.FAILED_PRECONDITION,
+                "The document was updated since: " + name,
+            )
+
+    if write_pb.WhichOneof("operation") == "delete":
+        return None, _WriteResult(update_time=commit_time)
+
+    new = _Document()
+    if write_pb.WhichOneof("operation") == "transform":
+        if existing is not None:
+            new.CopyFrom(existing)
+        transform_pbs = write_pb.transform.field_transforms
+    elif write_pb.HasField("update_mask"):
+        if existing is not None:
+            new.CopyFrom(existing)
+        for field_path in write_pb.update_mask.field_paths:
+            path = _parse_path(field_path)
+            value_pb = _get_value(write_pb.update.fields, path)
+            if value_pb is None:
+                _delete_value(new.fields, path)
+            else:
+                _set_value(new.fields, path, value_pb)
+        transform_pbs = write_pb.update_transforms
+    else:
+        new.CopyFrom(write_pb.update)
+        transform_pbs = write_pb.update_transforms
+
+    transform_results = [
+        _apply_transform(new.fields, transform_pb, commit_time)
+        for transform_pb in transform_pbs
+    ]
+    new.name = name
+    new.create_time.CopyFrom(commit_time if existing is None else existing.create_time)
+    new.update_time.CopyFrom(commit_time)
+    return (
+        new,
+        _WriteResult(update_time=commit_time, transform_results=transform_results),
+    )
+
+
+def _write_name(write_pb):
+    kind = write_pb.WhichOneof("operation")
+    if kind == "update":
+        return write_pb.update.name
+    if kind == "delete":
+        return write_pb.delete
+    return write_pb.transform.document
+
+
+class _Target(object):
+    """A target of a ``Listen`` stream, and the documents last sent for it.
+
+    Args:
+        target_id (int): The ID of the target.
+        names (Optional[Set[str]]): The documents listened to, for a
+            documents target.
+        query (Optional[_Query]): The query listened to, for a query
+            target.
+    """
+
+    def __init__(self, target_id, names=None, query=None):
+        self.target_id = target_id
+        self.names = names
+        self.query = query
+        self.sent = {}
+
+    def initial_responses(self, documents):
+        """Responses adding the target, and its current documents."""
+        responses = [
+            _ListenResponse(
+                target_change=_TargetChange(
+                    target_change_type=_ChangeType.ADD, target_ids=[self.target_id]
+                )
+            )
+        ]
+        if self.query is None:
+            matches = [
+                documents[name] for name in sorted(self.names) if name in documents
+            ]
+        else:
+            matches = self.query.run(documents.values(), project=False)
+        for document_pb in matches:
+            responses.append(self._change(document_pb))
+        return responses
+
+    def changes(self, documents, changed):
+        """Responses for the documents of the target changed by a write.
+
+        Args:
+            documents (Dict[str, google.cloud.firestore_v1.types.Document._pb]):
+                All the documents of the database, after the write.
+            changed (Iterable[str]): The names of the documents written.
+
+        Returns:
+            List[google.cloud.firestore_v1.types.ListenResponse._pb]: The
+            responses.
+        """
+        if self.query is None:
+            names = [name for name in changed if name in self.names]
+            matches = {name: documents[name] for name in names if name in documents}
+        elif self.query.bounded:
+            # Writes may move other documents in or out of the results.
+            names = set(self.sent).union(changed)
+            matches = {
+                document_pb.name: document_pb
+                for document_pb in self.query.run(documents.values(), project=False)
+            }
+            names.update(matches)
+        else:
+            names = changed
+            matches = {
+                name: documents[name]
+                for name in changed
+                if name in documents and self.query.matches(documents[name])
+            }
+
+        responses = []
+        for name in sorted(names):
+            document_pb = matches.get(name)
+            if document_pb is not None:
+                if self.sent.get(name) != document_pb.update_time:
+                    responses.append(self._change(document_pb))
+            elif name in self.sent:
+                del self.sent[name]
+                kind = "document_remove" if name in documents else "document_delete"
+                response = _ListenResponse()
+                getattr(response, kind).document = name
+                getattr(response, kind).removed_target_ids.append(self.target_id)
+                responses.append(response)
+        return responses
+
+    def _change(self, document_pb):
+        self.sent[document_pb.name] = document_pb.update_time
+        response = _ListenResponse()
+        response.document_change.document.CopyFrom(document_pb)
+        response.document_change.target_ids.append(self.target_id)
+        return response
+
+
+class _ListenStream(object):
+    """The state of one ``Listen`` stream.
+
+    Responses are queued by the thread reading the requests of the stream
+    and by writes, and sent by the server thread of the stream.
+    """
+
+    def __init__(self):
+        self.targets = {}
+        self.responses = queue.Queue()
+
+    def put(self, responses):
+        for response in responses:
+            self.responses.put(response)
+
+    def close(self):
+        self.responses.put(None)
+
+
+class FakeFirestore(object):
+    """An in-memory implementation of the Firestore gRPC service.
+
+    ``latency`` and ``error_rate`` are either numbers, applying to every
+    RPC, or mappings from RPC names (e.g. ``"Commit"``) to numbers. An RPC
+    failing at random fails with ``error_code`` before doing anything,
+    except for ``BatchWrite``, where each write fails on its own. Failures
+    can also be scheduled with :meth:`fail_next`.
+
+    Args:
+        latency (Union[float, Dict[str, float]]): Seconds each RPC waits
+            before being handled.
+        error_rate (Union[float, Dict[str, float]]): The fraction of RPCs
+            failing.
+        error_code (grpc.StatusCode): The code of random failures.
+        seed (Optional[int]): Seed of the random failures.
+    """
+
+    def __init__(
+        self,
+        latency=0.0,
+        error_rate=0.0,
+        error_code=grpc.StatusCode.UNAVAILABLE,
+        seed=None,
+    ):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_code = error_code
+        self.requests = collections.Counter()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._documents = {}
+        self._streams = set()
+        self._failures = collections.defaultdict(collections.deque)
+        self._last_nanos = 0
+        self._transaction_ids = itertools.count(1)
+
+    def fail_next(self, method, code=grpc.StatusCode.UNAVAILABLE, count=1):
+        """Make the next calls of an RPC fail.
+
+        Args:
+            method (str): The name of the RPC, e.g. ``"Commit"``.
+            code (grpc.StatusCode): The code of the failures.
+            count (int): The number of calls failing.
+        """
+        with self._lock:
+            self._failures[method].extend([code] * count)
+
+    def get(self, name):
+        """Get a stored document.
+
+        Args:
+            name (str): The fully-qualified name of the document.
+
+        Returns:
+            Optional[google.cloud.firestore_v1.types.Document]: The
+            document, if it exists.
+        """
+        with self._lock:
+            document_pb = self._documents.get(name)
+        if document_pb is None:
+            return None
+        copy = _Document()
+        copy.CopyFrom(document_pb)
+        return document.Document.wrap(copy)
+
+    def clear(self):
+        """Delete every document."""
+        with self._lock:
+            self._commit_locked(
+                {name: None for name in self._documents}, self._now_locked()
+            )
+
+    def _setting(self, value, method):
+        if isinstance(value, dict):
+            return value.get(method, 0.0)
+        return value
+
+    def _begin(self, method, context, random_errors=True):
+        """Count a call, then delay or fail it as configured."""
+        latency = self._setting(self.latency, method)
+        if latency:
+            time.sleep(latency)
+        with self._lock:
+            self.requests[method] += 1
+            failures = self._failures.get(method)
+            code = failures.popleft() if failures else None
+            if (
+                code is None
+                and random_errors
+                and self._random.random() < self._setting(self.error_rate, method)
+            ):
+                code = self.error_code
+        if code is not None:
+            context.abort(code, "Injected {} error.".format(code.name))
+
+    def _now_locked(self):
+        """The current time, strictly later than the previous call."""
+        nanos = max(int(time.time() * 1e9), self._last_nanos + 1)
+        self._last_nanos = nanos
+        return timestamp_pb2.Timestamp(seconds=nanos // 10 ** 9, nanos=nanos % 10 ** 9)
+
+    def _new_transaction_id(self):
+        return "transaction-{}".format(next(self._transaction_ids)).encode("ascii")
+
+    def _commit_locked(self, changes, commit_time):
+        """Store written documents and notify the ``Listen`` streams.
+
+        Args:
+            changes (Dict[str, Optional[google.cloud.firestore_v1.types.Document._pb]]):
+                The new documents, :data:`None` for deleted ones.
+            commit_time (google.protobuf.timestamp_pb2.Timestamp): The time
+                of the writes.
+        """
+        for name, document_pb in changes.items():
+            if document_pb is None:
+                self._documents.pop(name, None)
+            else:
+                self._documents[name] = document_pb
+        for stream in self._streams:
+            responses = []
+            for target in stream.targets.values():
+                responses.extend(target.changes(self._documents, changes))
+            if responses:
+                responses.append(self._no_change(commit_time))
+                stream.put(responses)
+
+    def _no_change(self, read_time):
+        """A global ``NO_CHANGE``, marking a consistent snapshot."""
+        return _ListenResponse(
+            target_change=_TargetChange(
+                target_change_type=_ChangeType.NO_CHANGE,
+                read_time=read_time,
+                resume_token=read_time.SerializeToString(),
+            )
+        )
+
+    def handler(self):
+        """The gRPC handler of the service, for :meth:`grpc.Server.add_generic_rpc_handlers`."""
+
+        def unary_unary(method, request_type, response_type):
+            return grpc.unary_unary_rpc_method_handler(
+                method,
+                request_deserializer=request_type.pb().FromString,
+                response_serializer=response_type.pb().SerializeToString,
+            )
+
+        def unary_stream(method, request_type, response_type):
+            return grpc.unary_stream_rpc_method_handler(
+                method,
+                request_deserializer=request_type.pb().FromString,
+                response_serializer=response_type.pb().SerializeToString,
+            )
+
+        handlers = {
+            "BatchGetDocuments": unary_stream(
+                self.batch_get_documents,
+                firestore.BatchGetDocumentsRequest,
+                firestore.BatchGetDocumentsResponse,
+            ),
+            "BatchWrite": unary_unary(
+                self.batch_write,
+                firestore.BatchWriteRequest,
+                firestore.BatchWriteResponse,
+            ),
+            "BeginTransaction": unary_unary(
+                self.begin_transaction,
+                firestore.BeginTransactionRequest,
+                firestore.BeginTransactionResponse,
+            ),
+            "Commit": unary_unary(
+                self.commit, firestore.CommitRequest, firestore.CommitResponse
+            ),
+            "GetDocument": unary_unary(
+                self.get_document, firestore.GetDocumentRequest, document.Document
+            ),
+            "ListCollectionIds": unary_unary(
+                self.list_collection_ids,
+                firestore.ListCollectionIdsRequest,
+                firestore.ListCollectionIdsResponse,
+            ),
+            "ListDocuments": unary_unary(
+                self.list_documents,
+                firestore.ListDocumentsRequest,
+                firestore.ListDocumentsResponse,
+            ),
+            "Listen": grpc.stream_stream_rpc_method_handler(
+                self.listen,
+                request_deserializer=firestore.ListenRequest.pb().FromString,
+                response_serializer=_ListenResponse.SerializeToString,
+            ),
+            "PartitionQuery": unary_unary(
+                self.partition_query,
+                firestore.PartitionQueryRequest,
+                firestore.PartitionQueryResponse,
+            ),
+            "Rollback": grpc.unary_unary_rpc_method_handler(
+                self.rollback,
+                request_deserializer=firestore.RollbackRequest.pb().FromString,
+                response_serializer=empty_pb2.Empty.SerializeToString,
+            ),
+            "RunQuery": unary_stream(
+                self.run_query, firestore.RunQueryRequest, firestore.RunQueryResponse
+            ),
+        }
+        return grpc.method_handlers_generic_handler(_SERVICE, handlers)
+
+    def get_document(self, request, context):
+        self._begin("GetDocument", context)
+        with self._lock:
+            document_pb = self._documents.get(request.name)
+        if document_pb is None:
+            context.abort(
+                grpc.StatusCode.NOT_FOUND, "Document not found: " + request.name
+            )
+        return _masked(document_pb, request)
+
+    def batch_get_documents(self, request, context):
+        self._begin("BatchGetDocuments", context)
+        with self._lock:
+            read_time = self._now_locked()
+            found = [(name, self._documents.get(name)) for name in request.documents]
+        response_type = firestore.BatchGetDocumentsResponse.pb()
+        if request.HasField("new_transaction"):
+            yield response_type(transaction=self._new_transaction_id())
+        for name, document_pb in found:
+            if document_pb is None:
+                yield response_type(missing=name, read_time=read_time)
+            else:
+                yield response_type(
+                    found=_masked(document_pb, request), read_time=read_time
+                )
+
+    def run_query(self, request, context):
+        self._begin("RunQuery", context)
+        compiled = _Query(request.parent, request.structured_query)
+        with self._lock:
+            read_time = self._now_locked()
+            documents = list(self._documents.values())
+        response_type = firestore.RunQueryResponse.pb()
+        if request.HasField("new_transaction"):
+            yield response_type(transaction=self._new_transaction_id())
+        results = compiled.run(documents)
+        if not results:
+            yield response_type(read_time=read_time)
+        for document_pb in results:
+            yield response_type(document=document_pb, read_time=read_time)
+
+    def begin_transaction(self, request, context):
+        self._begin("BeginTransaction", context)
+        return firestore.BeginTransactionResponse.pb()(
+            transaction=self._new_transaction_id()
+        )
+
+    def rollback(self, request, context):
+        self._begin("Rollback", context)
+        return empty_pb2.Empty()
+
+    def commit(self, request, context):
+        self._begin("Commit", context)
+        with self._lock:
+            commit_time = self._now_locked()
+            changes = {}
+            write_results = []
+            for write_pb in request.writes:
+                name = _write_name(write_pb)
+                existing = (
+                    changes[name] if name in changes else self._documents.get(name)
+                )
+                try:
+                    new, write_result = _apply_write(write_pb, existing, commit_time)
+                except _WriteError as exc:
+                    context.abort(exc.code, exc.message)
+                changes[name] = new
+                write_results.append(write_result)
+            self._commit_locked(changes, commit_time)
+        return firestore.CommitResponse.pb()(
+            write_results=write_results, commit_time=commit_time
+        )
+
+    def batch_write(self, request, context):
+        self._begin("BatchWrite", context, random_errors=False)
+        error_rate = self._setting(self.error_rate, "BatchWrite")
+        write_results = []
+        statuses = []
+        with self._lock:
+            commit_time = self._now_locked()
+            changes = {}
+            for write_pb in request.writes:
+                name = _write_name(write_pb)
+                existing = (
+                    changes[name] if name in changes else self._documents.get(name)
+                )
+                if self._random.random() < error_rate:
+                    code = self.error_code
+                    message = "Injected {} error.".format(code.name)
+                else:
+                    try:
+                        changes[name], write_result = _apply_write(
+                            write_pb, existing, commit_time
+                        )
+                    except _WriteError as exc:
+                        code, message = exc.code, exc.message
+                    else:
+                        write_results.append(write_result)
+                        statuses.append(status_pb2.Status())
+                        continue
+                write_results.append(_WriteResult())
+                statuses.append(status_pb2.Status(code=code.value[0], message=message))
+            self._commit_locked(changes, commit_time)
+        return firestore.BatchWriteResponse.pb()(
+            write_results=write_results, status=statuses
+        )
+
+    def list_collection_ids(self, request, context):
+        self._begin("ListCollectionIds", context)
+        prefix = request.parent + "/"
+        with self._lock:
+            names = list(self._documents)
+        collection_ids = sorted(
+            set(
+                name[len(prefix) :].split("/", 1)[0]
+                for name in names
+                if name.startswith(prefix)
+            )
+        )
+        return firestore.ListCollectionIdsResponse.pb()(collection_ids=collection_ids)
+
+    def list_documents(self, request, context):
+        self._begin("ListDocuments", context)
+        prefix = "{}/{}/".format(request.parent, request.collection_id)
+        with self._lock:
+            documents = dict(
+                (name, document_pb)
+                for name, document_pb in self._documents.items()
+                if name.startswith(prefix)
+            )
+        listed = {}
+        for name, document_pb in documents.items():
+            doc_id, _, rest = name[len(prefix) :].partition("/")
+            if not rest:
+                listed[name] = _masked(document_pb, request)
+            elif request.show_missing and prefix + doc_id not in documents:
+                # A missing document, with documents in its subcollections.
+                listed[prefix + doc_id] = _Document(name=prefix + doc_id)
+
+        names = sorted(listed)
+        start = int(request.page_token or 0)
+        end = start + request.page_size if request.page_size else len(names)
+        next_page_token = str(end) if end < len(names) else ""
+        return firestore.ListDocumentsResponse.pb()(
+            documents=[listed[name] for name in names[start:end]],
+            next_page_token=next_page_token,
+        )
+
+    def partition_query(self, request, context):
+        self._begin("PartitionQuery", context)
+        compiled = _Query(request.parent, request.structured_query)
+        with self._lock:
+            documents = list(self._documents.values())
+        results = compiled.run(documents, project=False)
+        partitions = []
+        if request.partition_count > 1 and results:
+            step = max(len(results) // request.partition_count, 1)
+            for document_pb in results[step::step][: request.partition_count - 1]:
+                cursor_pb = _Cursor()
+                cursor_pb.values.add(reference_value=document_pb.name)
+                partitions.append(cursor_pb)
+        return firestore.PartitionQueryResponse.pb()(partitions=partitions)
+
+    def listen(self, request_iterator, context):
+        self._begin("Listen", context)
+        stream = _ListenStream()
+        context.add_callback(stream.close)
+        reader = threading.Thread(
+            target=self._read_listen_requests,
+            args=(request_iterator, stream),
+            name="FakeFirestore.listen",
+            daemon=True,
+        )
+        with self._lock:
+            self._streams.add(stream)
+        reader.start()
+        try:
+            while True:
+                response = stream.responses.get()
+                if response is None:
+                    return
+                yield response
+        finally:
+            with self._lock:
+                self._streams.discard(stream)
+
+    def _read_listen_requests(self, request_iterator, stream):
+        """Add and remove the targets of a ``Listen`` stream."""
+        try:
+            for request in request_iterator:
+                with self._lock:
+                    stream.put(self._listen_request_locked(stream, request))
+        except grpc.RpcError:
+            pass
+        finally:
+            stream.close()
+
+    def _listen_request_locked(self, stream, request):
+        if request.WhichOneof("target_change") == "remove_target":
+            target_id = request.remove_target
+            stream.targets.pop(target_id, None)
+            return [
+                _ListenResponse(
+                    target_change=_TargetChange(
+                        target_change_type=_ChangeType.REMOVE, target_ids=[target_id]
+                    )
+                )
+            ]
+
+        target_pb = request.add_target
+        if target_pb.WhichOneof("target_type") == "documents":
+            target = _Target(
+                target_pb.target_id, names=set(target_pb.documents.documents)
+            )
+        else:
+            query_pb = target_pb.query
+            target = _Target(
+                target_pb.target_id,
+                query=_Query(query_pb.parent, query_pb.structured_query),
+            )
+        stream.targets[target.target_id] = target
+
+        read_time = self._now_locked()
+        responses = target.initial_responses(self._documents)
+        responses.append(
+            _ListenResponse(
+                target_change=_TargetChange(
+                    target_change_type=_ChangeType.CURRENT,
+                    target_ids=[target.target_id],
+                    read_time=read_time,
+                )
+            )
+        )
+        responses.append(self._no_change(read_time))
+        return responses
+
+
+class FakeFirestoreServer(object):
+    """Serve a :class:`FakeFirestore` on a local port.
+
+    Args:
+        fake (Optional[FakeFirestore]): The service. Defaults to a new one,
+            without latency or errors.
+        port (int): The port to listen on. Defaults to an unused one.
+        max_workers (int): The number of server threads. Each ``Listen``
+            stream holds one while open.
+        options (Optional[List[Tuple[str, Any]]]): gRPC server options.
+    """
+
+    def __init__(self, fake=None, port=0, max_workers=32, options=None):
+        self.fake = FakeFirestore() if fake is None else fake
+        self._server = grpc.server(
+            concurrent.futures.ThreadPoolExecutor(max_workers=max_workers),
+            options=options,
+        )
+        self._server.add_generic_rpc_handlers((self.fake.handler(),))
+        self.port = self._server.add_insecure_port("localhost:{}".format(port))
+        self.address = "localhost:{}".format(self.port)
+
+    def start(self):
+        self._server.start()
+        return self
+
+    def stop(self, grace=None):
+        self._server.stop(grace).wait()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def client(self, project="fake-project", **kwargs):
+        """Create a client connected to the server.
+
+        Args:
+            project (str): The project of the client.
+            kwargs: Other arguments for the client.
+
+        Returns:
+            ~google.cloud.firestore_v1.client.Client: The client.
+        """
+        client = Client(project=project, credentials=AnonymousCredentials(), **kwargs)
+        client._firestore_api_internal = firestore_client.FirestoreClient(
+            transport=grpc_transport.FirestoreGrpcTransport(
+                channel=grpc.insecure_channel(self.address)
+            )
+        )
+        return client
+
+    def async_client(self, project="fake-project", **kwargs):
+        """Create an async client connected to the server.
+
+        Must be called with an event loop running, which the client is
+        then bound to.
+
+        Args:
+            project (str): The project of the client.
+            kwargs: Other arguments for the client.
+
+        Returns:
+            ~google.cloud.firestore_v1.async_client.AsyncClient: The client.
+        """
+        client = AsyncClient(
+            project=project, credentials=AnonymousCredentials(), **kwargs
+        )
+        client._firestore_api_internal = firestore_async_client.FirestoreAsyncClient(
+            transport=grpc_asyncio_transport.FirestoreGrpcAsyncIOTransport(
+                channel=aio.insecure_channel(self.address)
+            )
+        )
+        return client
+
+
+def _bench(server, operations):
+    client = server.client()
+    collection = client.collection("bench")
+    references = [collection.document("doc-{}".format(i)) for i in range(operations)]
+    data = {"name": "Ada", "score": 1, "tags": ["a", "b"], "nested": {"x": 1.5}}
+
+    def set_all():
+        for reference in references:
+            reference.set(data)
+
+    def get_all():
+        for reference in references:
+            reference.get()
+
+    def query_all():
+        for _ in range(operations):
+            list(collection.where("score", "==", 1).limit(10).stream())
+
+    def batch_get_all():
+        list(client.get_all(references))
+
+    print("{:<16} {:>8} {:>14}".format("operation", "calls", "ms / call"))
+    for name, func, calls in [
+        ("set", set_all, operations),
+        ("get", get_all, operations),
+        ("query", query_all, operations),
+        ("get_all", batch_get_all, 1),
+    ]:
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        print("{:<16} {:>8} {:>14.3f}".format(name, calls, elapsed * 1000 / calls))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--bench", action="store_true")
+    parser.add_argument("--operations", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    fake = FakeFirestore(
+        latency=args.latency_ms / 1000.0, error_rate=args.error_rate, seed=args.seed
+    )
+    with FakeFirestoreServer(fake, port=args.port) as server:
+        if args.bench:
+            _bench(server, args.operations)
+            return
+        print(
+            "Serving on {}; FIRESTORE_EMULATOR_HOST={}".format(
+                server.address, server.address
+            )
+        )
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark parsing and rendering field paths.
+
+Compares the memoized functions of
+:mod:`google.cloud.firestore_v1.field_path` against the previous versions,
+which ran the regular expression tokenizer on every call.
+
+The ``warm`` workloads reuse a handful of paths, as an application does;
+the ``cold`` ones use more distinct paths than the caches hold, so every
+call misses.
+
+    $ python -m benchmarks.field_path --calls 100000
+"""
+
+import argparse
+import contextlib
+import time
+
+from google.auth.credentials import AnonymousCredentials  # type: ignore
+from google.cloud.firestore_v1 import field_path
+from google.cloud.firestore_v1.base_document import DocumentSnapshot
+from google.cloud.firestore_v1.client import Client
+
+
+def legacy_split_field_path(path):
+    """The tokenizer based :func:`~.field_path.split_field_path`."""
+    if not path:
+        return []
+
+    elements = []
+    want_dot = False
+
+    for element in field_path._tokenize_field_path(path):
+        if want_dot:
+            if element != ".":
+                raise ValueError("Invalid path: {}".format(path))
+            else:
+                want_dot = False
+        else:
+            if element == ".":
+                raise ValueError("Invalid path: {}".format(path))
+            elements.append(element)
+            want_dot = True
+
+    if not want_dot or not elements:
+        raise ValueError("Invalid path: {}".format(path))
+
+    return elements
+
+
+def legacy_parse_field_path(api_repr):
+    """The tokenizer based :func:`~.field_path.parse_field_path`."""
+    field_names = []
+    for field_name in legacy_split_field_path(api_repr):
+        if field_name[0] == "`" and field_name[-1] == "`":
+            field_name = field_name[1:-1]
+            field_name = field_name.replace("\\`", "`")
+            field_name = field_name.replace("\\\\", "\\")
+        field_names.append(field_name)
+    return field_names
+
+
+def legacy_render_field_path(field_names):
+    """The regular expression based :func:`~.field_path.render_field_path`."""
+    result = []
+    for field_name in field_names:
+        match = field_path._SIMPLE_FIELD_NAME.match(field_name)
+        if match and match.group(0) == field_name:
+            result.append(field_name)
+        else:
+            replaced = field_name.replace("\\", "\\\\").replace("`", "\\`")
+            result.append("`" + replaced + "`")
+    return ".".join(result)
+
+
+def _legacy_field_path_from_string(cls, path_string):
+    """The uncached :meth:`~.field_path.FieldPath.from_string`."""
+    return cls(*legacy_parse_field_path(path_string.strip()))
+
+
+_LEGACY = {
+    "split_field_path": legacy_split_field_path,
+    "parse_field_path": legacy_parse_field_path,
+    "render_field_path": legacy_render_field_path,
+    "_parse_field_path": legacy_parse_field_path,
+    "_field_path_from_string": _legacy_field_path_from_string,
+}
+
+
+@contextlib.contextmanager
+def _legacy_field_path():
+    """Swap the previous implementations into :mod:`.field_path`."""
+    saved = {name: getattr(field_path, name) for name in _LEGACY}
+    for name, func in _LEGACY.items():
+        setattr(field_path, name, func)
+    try:
+        yield
+    finally:
+        for name, func in saved.items():
+            setattr(field_path, name, func)
+
+
+_WARM_PATHS = [
+    "name",
+    "profile.email",
+    "profile.address.city",
+    "stats.visits",
+    "`first name`",
+    "tags.`a.b`",
+]
+_DATA = {
+    "name": "Ada",
+    "profile": {"email": "ada@example.com", "address": {"city": "London"}},
+    "stats": {"visits": 3},
+    "first name": "Ada",
+    "tags": {"a.b": True},
+}
+
+
+def _cold_paths(count):
+    return ["field_{}.nested_{}".format(i, i % 7) for i in range(count)]
+
+
+def _time(func, args_list, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for args in args_list:
+            func(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def _workloads(calls):
+    warm = (_WARM_PATHS * (calls // len(_WARM_PATHS) + 1))[:calls]
+    cold = _cold_paths(max(calls, 2 * field_path._CACHE_SIZE))[:calls]
+    warm_names = [tuple(legacy_parse_field_path(path)) for path in warm]
+    cold_names = [tuple(legacy_parse_field_path(path)) for path in cold]
+
+    client = Client(project="bench", credentials=AnonymousCredentials())
+    snapshot = DocumentSnapshot(
+        client.document("users", "ada"), _DATA, True, None, None, None
+    )
+    query = client.collection("users")
+
+    # Look the functions up on each call, so that they can be swapped.
+    return [
+        (
+            "split (warm)",
+            lambda path: field_path.split_field_path(path),
+            [(path,) for path in warm],
+        ),
+        (
+            "split (cold)",
+            lambda path: field_path.split_field_path(path),
+            [(path,) for path in cold],
+        ),
+        (
+            "parse (warm)",
+            lambda path: field_path.parse_field_path(path),
+            [(path,) for path in warm],
+        ),
+        (
+            "parse (cold)",
+            lambda path: field_path.parse_field_path(path),
+            [(path,) for path in cold],
+        ),
+        (
+            "render (warm)",
+            lambda names: field_path.render_field_path(names),
+            [(names,) for names in warm_names],
+        ),
+        (
+            "render (cold)",
+            lambda names: field_path.render_field_path(names),
+            [(names,) for names in cold_names],
+        ),
+        (
+            "FieldPath.from_string",
+            field_path.FieldPath.from_string,
+            [(path,) for path in warm],
+        ),
+        (
+            "get_nested_value",
+            field_path.get_nested_value,
+            [(path, _DATA) for path in warm],
+        ),
+        ("DocumentSnapshot.get", snapshot.get, [(path,) for path in warm]),
+        ("Query.order_by", query.order_by, [(path,) for path in warm]),
+    ]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    print(
+        "{:<24} {:>8} {:>14} {:>14} {:>9}".format(
+            "workload", "calls", "legacy (ms)", "cached (ms)", "speedup"
+        )
+    )
+    for name, func, args_list in _workloads(args.calls):
+        with _legacy_field_path():
+            expected = [func(*call_args) for call_args in args_list[:100]]
+            legacy = _time(func, args_list, args.repeat)
+        if name != "Query.order_by":
+            assert [func(*call_args) for call_args in args_list[:100]] == expected
+        cached = _time(func, args_list, args.repeat)
+        print(
+            "{:<24} {:>8} {:>14.2f} {:>14.2f} {:>8.1f}x".format(
+                name, len(args_list), legacy * 1000, cached * 1000, legacy / cached
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark reading snapshot data, copied vs. frozen.
+
+Each ``RunQueryResponse`` is turned into a snapshot with ``frozen=False``
+(:class:`DocumentSnapshot`, which deep-copies the data when it is built and
+on every :meth:`get` / :meth:`to_dict`) or ``frozen=True``
+(:class:`FrozenDocumentSnapshot`, which shares read-only views), then a
+nested field is read ``--reads`` times and :meth:`to_dict` is called once.
+
+    $ python -m benchmarks.frozen_snapshot --docs 500 --reads 10
+"""
+
+import argparse
+import time
+
+from google.auth.credentials import AnonymousCredentials  # type: ignore
+from google.cloud.firestore_v1 import _helpers
+from google.cloud.firestore_v1.base_query import _query_response_to_snapshot
+from google.cloud.firestore_v1.client import Client
+from google.cloud.firestore_v1.types import document
+from google.cloud.firestore_v1.types import firestore
+
+
+def _make_responses(collection, num_docs):
+    _, expected_prefix = collection._parent_info()
+    responses = []
+    for i in range(num_docs):
+        data = {
+            "profile": {
+                "name": {"first": "Ada", "last": "Lovelace-{}".format(i)},
+                "tags": ["tag-{}".format(n) for n in range(20)],
+            },
+            "events": [{"at": n, "kind": "click"} for n in range(20)],
+            "score": i * 0.25,
+        }
+        document_pb = document.Document(
+            name="{}/doc-{}".format(expected_prefix, i),
+            fields=_helpers.encode_dict(data),
+        )
+        responses.append(firestore.RunQueryResponse(document=document_pb))
+    return expected_prefix, responses
+
+
+def _run(collection, expected_prefix, responses, reads, frozen):
+    start = time.perf_counter()
+    for response_pb in responses:
+        snapshot = _query_response_to_snapshot(
+            response_pb, collection, expected_prefix, frozen=frozen
+        )
+        for _ in range(reads):
+            snapshot.get("profile.name")
+            snapshot.get("events")
+        snapshot.to_dict()
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=500)
+    parser.add_argument("--reads", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    client = Client(project="bench", credentials=AnonymousCredentials())
+    collection = client.collection("bench")
+    expected_prefix, responses = _make_responses(collection, args.docs)
+
+    print("{} documents, {} reads each".format(args.docs, args.reads))
+    print("{:<8} {:>10}".format("mode", "time (ms)"))
+    results = {}
+    for frozen in (False, True):
+        results[frozen] = min(
+            _run(collection, expected_prefix, responses, args.reads, frozen)
+            for _ in range(args.repeat)
+        )
+        print(
+            "{:<8} {:>10.1f}".format(
+                "frozen" if frozen else "copied", results[frozen] * 1000
+            )
+        )
+    print("{:<8} {:>9.1f}x".format("gain", results[False] / results[True]))
+
+
+if __name__ == "__main__":
+    main()
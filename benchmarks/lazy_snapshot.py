@@ -0,0 +1,136 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark reading a few fields from wide query results, eager vs. lazy.
+
+Each ``RunQueryResponse`` is turned into a snapshot with ``lazy=False``
+(decode and copy every field) or ``lazy=True`` (:class:`LazyDocumentSnapshot`),
+then 1 or 2 of the document's fields are read. Reports the time taken and the
+memory allocated by the snapshots (parsing the responses from the wire is
+done up front, as the transport does it in both cases).
+
+Note that lazy snapshots keep the parsed ``Document`` message alive, which
+is not counted here.
+
+    $ python -m benchmarks.lazy_snapshot --docs 2000 --fields 200
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from google.auth.credentials import AnonymousCredentials  # type: ignore
+from google.cloud.firestore_v1 import _helpers
+from google.cloud.firestore_v1.base_query import _query_response_to_snapshot
+from google.cloud.firestore_v1.client import Client
+from google.cloud.firestore_v1.types import document
+from google.cloud.firestore_v1.types import firestore
+
+
+def _make_payloads(collection, num_docs, num_fields):
+    _, expected_prefix = collection._parent_info()
+    payloads = []
+    for i in range(num_docs):
+        data = {}
+        for j in range(num_fields):
+            kind = j % 4
+            if kind == 0:
+                data["f{:03d}".format(j)] = i * j
+            elif kind == 1:
+                data["f{:03d}".format(j)] = "value-{}-{}".format(i, j)
+            elif kind == 2:
+                data["f{:03d}".format(j)] = {"x": j, "y": [i, j]}
+            else:
+                data["f{:03d}".format(j)] = [j * 0.5, True, None]
+        document_pb = document.Document(
+            name="{}/doc-{}".format(expected_prefix, i),
+            fields=_helpers.encode_dict(data),
+        )
+        response_pb = firestore.RunQueryResponse(document=document_pb)
+        payloads.append(firestore.RunQueryResponse.serialize(response_pb))
+    return expected_prefix, payloads
+
+
+def _run(collection, expected_prefix, responses, field_paths, lazy):
+    tracemalloc.start()
+    snapshots = []
+    for response_pb in responses:
+        snapshot = _query_response_to_snapshot(
+            response_pb, collection, expected_prefix, lazy=lazy
+        )
+        for field_path in field_paths:
+            snapshot.get(field_path)
+        snapshots.append(snapshot)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    snapshots = None
+
+    # Timed separately, as tracing memory slows everything down.
+    start = time.perf_counter()
+    for response_pb in responses:
+        snapshot = _query_response_to_snapshot(
+            response_pb, collection, expected_prefix, lazy=lazy
+        )
+        for field_path in field_paths:
+            snapshot.get(field_path)
+    elapsed = time.perf_counter() - start
+    return elapsed, retained, peak
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=2000)
+    parser.add_argument("--fields", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    client = Client(project="bench", credentials=AnonymousCredentials())
+    collection = client.collection("bench")
+    expected_prefix, payloads = _make_payloads(collection, args.docs, args.fields)
+    responses = [firestore.RunQueryResponse.deserialize(data) for data in payloads]
+
+    print("{} documents x {} fields".format(args.docs, args.fields))
+    print(
+        "{:<10} {:<6} {:>10} {:>14} {:>12}".format(
+            "fields", "mode", "time (ms)", "retained (MB)", "peak (MB)"
+        )
+    )
+    for field_paths in (["f001"], ["f001", "f002.y"]):
+        results = {}
+        for lazy in (False, True):
+            results[lazy] = _run(
+                collection, expected_prefix, responses, field_paths, lazy
+            )
+            elapsed, retained, peak = results[lazy]
+            print(
+                "{:<10} {:<6} {:>10.1f} {:>14.1f} {:>12.1f}".format(
+                    len(field_paths),
+                    "lazy" if lazy else "eager",
+                    elapsed * 1000,
+                    retained / 1e6,
+                    peak / 1e6,
+                )
+            )
+        print(
+            "{:<10} {:<6} {:>9.1f}x {:>13.1f}x {:>11.1f}x".format(
+                "",
+                "gain",
+                results[False][0] / results[True][0],
+                results[False][1] / results[True][1],
+                results[False][2] / results[True][2],
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
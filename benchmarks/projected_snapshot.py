@@ -0,0 +1,106 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark the memory held by a watch, with and without ``fields``.
+
+A watch on an ordered query receives ``--docs`` order documents. Reports
+the memory the watch retains once its first snapshot is pushed, scaled to
+100k documents, and the time taken to hash each snapshot, as watches key
+their document trees by snapshot. Without ``fields`` the watch keeps a
+full :class:`DocumentSnapshot` per document; with it, a
+:class:`ProjectedDocumentSnapshot` holding those fields and the fields the
+query is ordered by.
+
+    $ python -m benchmarks.projected_snapshot --docs 5000
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from google.auth.credentials import AnonymousCredentials  # type: ignore
+from google.cloud.firestore_v1.base_document import DocumentSnapshot
+from google.cloud.firestore_v1.client import Client
+from google.cloud.firestore_v1.document import DocumentReference
+from google.cloud.firestore_v1.watch import WATCH_TARGET_ID
+from google.cloud.firestore_v1.watch import Watch
+from google.cloud.firestore_v1.watch import _projected_field_paths
+
+from benchmarks.suite import _apply
+from benchmarks.suite import _initial_responses
+from benchmarks.suite import _orders_query
+
+
+class _ProjectedWatch(Watch):
+    """A watch fed with responses directly, without a ``Listen`` stream."""
+
+    def __init__(self, query, fields=None):
+        if fields is not None:
+            orders = [order.field.field_path for order in query._orders]
+            fields = _projected_field_paths(fields, orders)
+        self._init_state(
+            query,
+            query._client,
+            {"target_id": WATCH_TARGET_ID},
+            query._comparator,
+            lambda keys, changes, read_time: None,
+            DocumentSnapshot,
+            DocumentReference,
+            query._sort_key,
+            fields=fields,
+        )
+
+
+def _run(query, responses, fields):
+    gc.collect()
+    tracemalloc.start()
+    watch = _ProjectedWatch(query, fields)
+    _apply(watch, responses)
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    snapshots = watch.doc_tree.keys()
+    start = time.perf_counter()
+    for snapshot in snapshots:
+        hash(snapshot)
+    hash_time = (time.perf_counter() - start) / len(snapshots)
+    return retained, hash_time
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=5000)
+    args = parser.parse_args(argv)
+
+    client = Client(project="bench", credentials=AnonymousCredentials())
+    query = _orders_query(client)
+    responses = _initial_responses(client, args.docs)
+
+    print("{} documents, ordered by status, total".format(args.docs))
+    print("{:<36} {:>22} {:>12}".format("fields", "MB per 100k documents", "hash (us)"))
+    for fields in (None, ["orderId"], ["orderId", "customer", "shipping.method"]):
+        retained, hash_time = _run(query, responses, fields)
+        print(
+            "{:<36} {:>22.1f} {:>12.2f}".format(
+                "(all)" if fields is None else ", ".join(fields),
+                retained * 100000 / args.docs / 1e6,
+                hash_time * 1e6,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark sorting query snapshots with the comparator vs. sort keys.
+
+The comparator encodes both order-by values for every pairwise comparison,
+while ``BaseQuery._sort_key`` computes one natively comparable key per
+snapshot and caches it on the snapshot.
+
+    $ python -m benchmarks.query_sort_key --size 100000
+"""
+
+import argparse
+import functools
+import random
+import time
+
+from google.auth.credentials import AnonymousCredentials  # type: ignore
+from google.cloud.firestore_v1.base_document import DocumentSnapshot
+from google.cloud.firestore_v1.client import Client
+
+
+def _make_snapshots(collection, size, rng):
+    snapshots = []
+    for i in range(size):
+        data = {
+            "score": rng.randint(0, size // 10),
+            "rating": rng.random(),
+            "owner": {"name": "user-{}".format(rng.randint(0, 1000))},
+        }
+        reference = collection.document("doc-{:08d}".format(i))
+        snapshots.append(DocumentSnapshot(reference, data, True, None, None, None))
+    return snapshots
+
+
+def _time(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=1234)
+    args = parser.parse_args(argv)
+
+    client = Client(project="bench", credentials=AnonymousCredentials())
+    collection = client.collection("bench")
+    query = collection.order_by("score", direction="DESCENDING").order_by("rating")
+
+    snapshots = _make_snapshots(collection, args.size, random.Random(args.seed))
+
+    cmp_time = _time(
+        lambda: sorted(snapshots, key=functools.cmp_to_key(query._comparator))
+    )
+    cold_time = _time(lambda: sorted(snapshots, key=query._sort_key))
+    warm_time = _time(lambda: sorted(snapshots, key=query._sort_key))
+
+    print("sorting {} snapshots".format(args.size))
+    print("{:<24} {:>10.1f} ms".format("comparator", cmp_time * 1000))
+    print(
+        "{:<24} {:>10.1f} ms  ({:.1f}x)".format(
+            "sort key (cold)", cold_time * 1000, cmp_time / cold_time
+        )
+    )
+    print(
+        "{:<24} {:>10.1f} ms  ({:.1f}x)".format(
+            "sort key (cached)", warm_time * 1000, cmp_time / warm_time
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,711 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark suite of the client's hot paths, tracking regressions.
+
+Each scenario prepares synthetic documents shaped like user profiles,
+orders (with line items) and telemetry events (with wide metric maps), then
+times one client code path over them: value encoding and decoding, write
+preparation by the document extractors, query protobuf building, snapshot
+sorting, watch change application, ``get_all`` response parsing and commit
+request preparation. No RPC is sent.
+
+Like ``pytest-benchmark``, every scenario is calibrated to run for at least
+``--min-time`` seconds per round, over ``--rounds`` rounds, and summarized
+by the min / max / mean / median / standard deviation of a call. Results
+can be written as JSON. The fastest round of each scenario, the least
+disturbed by other processes, is compared with a stored baseline
+(``benchmarks/baseline.json`` by default): a scenario more than
+``--tolerance`` slower fails the run. The baseline is machine-specific;
+regenerate it on the machine doing the comparison with
+``--save-baseline``.
+
+    $ python -m benchmarks.suite
+    $ python -m benchmarks.suite -k watch -k query --json results.json
+    $ python -m benchmarks.suite --save-baseline
+"""
+
+import argparse
+import collections
+import datetime
+import functools
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import time
+
+from google.auth.credentials import AnonymousCredentials  # type: ignore
+from google.protobuf import timestamp_pb2  # type: ignore
+from google.protobuf.internal import api_implementation  # type: ignore
+
+from google.cloud.firestore_v1 import _helpers
+from google.cloud.firestore_v1 import transforms
+from google.cloud.firestore_v1.base_client import _parse_batch_get
+from google.cloud.firestore_v1.base_client import _reference_info
+from google.cloud.firestore_v1.base_document import DocumentSnapshot
+from google.cloud.firestore_v1.client import Client
+from google.cloud.firestore_v1.document import DocumentReference
+from google.cloud.firestore_v1.types import document
+from google.cloud.firestore_v1.types import firestore
+from google.cloud.firestore_v1.types import write
+from google.cloud.firestore_v1.watch import WATCH_TARGET_ID
+from google.cloud.firestore_v1.watch import Watch
+
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+SCENARIOS = collections.OrderedDict()
+"""Dict[str, Callable[[Client, float], Callable[[], Any]]]: The scenarios.
+
+Each maps a client and a size multiplier to the function timed.
+"""
+
+_EPOCH = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+_CITIES = ("London", "Paris", "Tokyo", "Lagos", "Lima", "Oslo", "Pune")
+_STATUSES = ("pending", "paid", "shipped", "delivered", "returned")
+
+
+def scenario(name):
+    """Register a scenario setup function under ``name``."""
+
+    def decorator(setup):
+        SCENARIOS[name] = setup
+        return setup
+
+    return decorator
+
+
+def _count(size, scale):
+    return max(1, int(size * scale))
+
+
+def _user(i):
+    return {
+        "uid": "user-{:06d}".format(i),
+        "email": "user{}@example.com".format(i),
+        "displayName": "User {}".format(i),
+        "age": 18 + i % 60,
+        "rating": (i % 50) / 10.0,
+        "verified": i % 3 == 0,
+        "createdAt": _EPOCH + datetime.timedelta(minutes=i),
+        "avatar": None,
+        "address": {
+            "street": "{} Main St".format(i),
+            "city": _CITIES[i % len(_CITIES)],
+            "zip": "{:05d}".format(i % 100000),
+            "location": _helpers.GeoPoint(51.5 + i % 10, -0.1 - i % 7),
+        },
+        "tags": ["tag-{}".format((i + n) % 12) for n in range(3)],
+        "preferences": {
+            "theme": "dark" if i % 2 else "light",
+            "notifications": {"email": True, "push": i % 4 == 0},
+        },
+    }
+
+
+def _order(i):
+    items = [
+        {
+            "sku": "sku-{:04d}".format((i * 7 + n) % 500),
+            "quantity": 1 + n % 3,
+            "price": 4.99 + (i + n) % 40,
+            "gift": n == 0 and i % 5 == 0,
+        }
+        for n in range(1 + i % 8)
+    ]
+    return {
+        "orderId": "order-{:06d}".format(i),
+        "customer": "users/user-{:06d}".format(i % 1000),
+        "status": _STATUSES[i % len(_STATUSES)],
+        "items": items,
+        "total": round(sum(item["price"] * item["quantity"] for item in items), 2),
+        "currency": "USD",
+        "placedAt": _EPOCH + datetime.timedelta(hours=i),
+        "shipping": {
+            "method": "express" if i % 4 == 0 else "ground",
+            "address": {"city": _CITIES[i % len(_CITIES)], "country": "GB"},
+        },
+        "receipt": b"%PDF-1.4" + bytes([i % 256]),
+    }
+
+
+def _event(i):
+    return {
+        "device": "device-{:04d}".format(i % 2000),
+        "type": "heartbeat" if i % 10 else "alert",
+        "at": _EPOCH + datetime.timedelta(seconds=i),
+        "metrics": {"m{:02d}".format(n): float((i * n) % 97) for n in range(40)},
+        "labels": {"region": "eu-west", "rack": "r{}".format(i % 16)},
+    }
+
+
+_SHAPES = (("users", _user), ("orders", _order), ("events", _event))
+
+
+def _documents(client, count):
+    """Pairs of document paths and data, cycling through document shapes."""
+    documents = []
+    for i in range(count):
+        collection_id, shape = _SHAPES[i % len(_SHAPES)]
+        path = "{}/documents/{}/doc-{:06d}".format(
+            client._database_string, collection_id, i
+        )
+        documents.append((path, shape(i)))
+    return documents
+
+
+def _timestamp(seconds):
+    return timestamp_pb2.Timestamp(seconds=1577836800 + seconds)
+
+
+def _document_pb(path, data, update_seconds=0):
+    return document.Document(
+        name=path,
+        fields=_helpers.encode_dict(data),
+        create_time=_timestamp(0),
+        update_time=_timestamp(update_seconds),
+    )
+
+
+@scenario("encode.values")
+def _encode_values(client, scale):
+    documents = _documents(client, _count(300, scale))
+
+    def run():
+        for _, data in documents:
+            _helpers.encode_dict(data)
+
+    return run
+
+
+@scenario("decode.values")
+def _decode_values(client, scale):
+    fields = [
+        _document_pb(path, data).fields
+        for path, data in _documents(client, _count(300, scale))
+    ]
+
+    def run():
+        for fields_pb in fields:
+            _helpers.decode_dict(fields_pb, client)
+
+    return run
+
+
+@scenario("write_prep.set")
+def _write_prep_set(client, scale):
+    documents = _documents(client, _count(300, scale))
+
+    def run():
+        for path, data in documents:
+            _helpers.pbs_for_set_no_merge(path, data)
+
+    return run
+
+
+@scenario("write_prep.merge")
+def _write_prep_merge(client, scale):
+    documents = _documents(client, _count(300, scale))
+
+    def run():
+        for path, data in documents:
+            _helpers.pbs_for_set_with_merge(path, data, merge=True)
+
+    return run
+
+
+@scenario("write_prep.update")
+def _write_prep_update(client, scale):
+    updates = [
+        (
+            "{}/documents/orders/doc-{:06d}".format(client._database_string, i),
+            {
+                "status": _STATUSES[i % len(_STATUSES)],
+                "shipping.method": "express",
+                "shipping.address.city": _CITIES[i % len(_CITIES)],
+                "total": transforms.Increment(i % 7),
+                "updatedAt": transforms.SERVER_TIMESTAMP,
+                "tags": transforms.ArrayUnion(["late", "priority"]),
+            },
+        )
+        for i in range(_count(300, scale))
+    ]
+
+    def run():
+        for path, field_updates in updates:
+            _helpers.pbs_for_update(path, field_updates, None)
+
+    return run
+
+
+@scenario("write_prep.transforms")
+def _write_prep_transforms(client, scale):
+    documents = []
+    for path, data in _documents(client, _count(300, scale)):
+        data = dict(data)
+        data["updatedAt"] = transforms.SERVER_TIMESTAMP
+        data["stats"] = {
+            "views": transforms.Increment(1),
+            "sync": {"at": transforms.SERVER_TIMESTAMP},
+        }
+        documents.append((path, data))
+
+    def run():
+        for path, data in documents:
+            _helpers.pbs_for_create(path, data)
+
+    return run
+
+
+@scenario("query.build")
+def _query_build(client, scale):
+    collection = client.collection("orders")
+    count = _count(200, scale)
+
+    def run():
+        for i in range(count):
+            query = (
+                collection.where("status", "==", _STATUSES[i % len(_STATUSES)])
+                .where("total", ">=", 50.0)
+                .order_by("total", direction="DESCENDING")
+                .order_by("placedAt")
+                .start_after({"total": 500.0, "placedAt": _EPOCH})
+                .limit(25)
+            )
+            query._to_protobuf()
+
+    return run
+
+
+def _order_snapshots(client, count):
+    collection = client.collection("orders")
+    return [
+        DocumentSnapshot(
+            collection.document("doc-{:06d}".format(i)),
+            _order(i),
+            True,
+            None,
+            None,
+            None,
+        )
+        for i in range(count)
+    ]
+
+
+def _orders_query(client):
+    return (
+        client.collection("orders")
+        .order_by("status")
+        .order_by("total", direction="DESCENDING")
+    )
+
+
+@scenario("query.sort_comparator")
+def _query_sort_comparator(client, scale):
+    snapshots = _order_snapshots(client, _count(500, scale))
+    key = functools.cmp_to_key(_orders_query(client)._comparator)
+
+    def run():
+        sorted(snapshots, key=key)
+
+    return run
+
+
+@scenario("query.sort_key")
+def _query_sort_key(client, scale):
+    snapshots = _order_snapshots(client, _count(500, scale))
+    query = _orders_query(client)
+
+    def run():
+        # Keys are cached on the snapshots: past the first call, this
+        # measures sorting with cached keys.
+        sorted(snapshots, key=query._sort_key)
+
+    return run
+
+
+class _BenchWatch(Watch):
+    """A watch fed with responses directly, without a ``Listen`` stream."""
+
+    def __init__(self, query):
+        self._init_state(
+            query,
+            query._client,
+            {"target_id": WATCH_TARGET_ID},
+            query._comparator,
+            self._on_snapshot_callback,
+            DocumentSnapshot,
+            DocumentReference,
+            query._sort_key,
+        )
+        self.snapshots = 0
+
+    def _on_snapshot_callback(self, keys, changes, read_time):
+        self.snapshots += 1
+
+
+def _target_change(change_type, read_time=None):
+    target_ids = (
+        []
+        if change_type == firestore.TargetChange.TargetChangeType.NO_CHANGE
+        else [WATCH_TARGET_ID]
+    )
+    return firestore.ListenResponse(
+        target_change=firestore.TargetChange(
+            target_change_type=change_type,
+            target_ids=target_ids,
+            read_time=read_time,
+            resume_token=b"token" if read_time is not None else b"",
+        )
+    )
+
+
+def _document_change(path, data, update_seconds):
+    return firestore.ListenResponse(
+        document_change=write.DocumentChange(
+            document=_document_pb(path, data, update_seconds),
+            target_ids=[WATCH_TARGET_ID],
+        )
+    )
+
+
+def _initial_responses(client, count):
+    change_type = firestore.TargetChange.TargetChangeType
+    prefix = "{}/documents/orders/".format(client._database_string)
+    responses = [_target_change(change_type.ADD)]
+    for i in range(count):
+        responses.append(
+            _document_change(prefix + "doc-{:06d}".format(i), _order(i), 1)
+        )
+    responses.append(_target_change(change_type.CURRENT))
+    responses.append(_target_change(change_type.NO_CHANGE, _timestamp(1)))
+    return responses
+
+
+def _apply(watch, responses):
+    for response in responses:
+        watch.on_snapshot(response)
+
+
+@scenario("watch.initial_snapshot")
+def _watch_initial_snapshot(client, scale):
+    query = _orders_query(client)
+    responses = _initial_responses(client, _count(300, scale))
+
+    def run():
+        _apply(_BenchWatch(query), responses)
+
+    return run
+
+
+@scenario("watch.change_burst")
+def _watch_change_burst(client, scale):
+    query = _orders_query(client)
+    count = _count(300, scale)
+    watch = _BenchWatch(query)
+    _apply(watch, _initial_responses(client, count))
+
+    # Alternate between two bursts, so that each one modifies documents.
+    prefix = "{}/documents/orders/".format(client._database_string)
+    bursts = []
+    for burst in range(2):
+        responses = []
+        for i in range(0, count, 10):
+            data = _order(i)
+            data["status"] = _STATUSES[(i + burst + 1) % len(_STATUSES)]
+            data["total"] += burst + 1
+            responses.append(
+                _document_change(prefix + "doc-{:06d}".format(i), data, burst + 2)
+            )
+        responses.append(
+            _target_change(
+                firestore.TargetChange.TargetChangeType.NO_CHANGE, _timestamp(burst + 2)
+            )
+        )
+        bursts.append(responses)
+    calls = [0]
+
+    def run():
+        _apply(watch, bursts[calls[0] % 2])
+        calls[0] += 1
+
+    return run
+
+
+@scenario("get_all.parse")
+def _get_all_parse(client, scale):
+    count = _count(300, scale)
+    documents = _documents(client, count)
+    references = [
+        client.document(path.split("/documents/", 1)[1]) for path, _ in documents
+    ]
+    _, reference_map = _reference_info(references)
+    responses = []
+    for i, (path, data) in enumerate(documents):
+        if i % 10 == 9:
+            response = firestore.BatchGetDocumentsResponse(
+                missing=path, read_time=_timestamp(1)
+            )
+        else:
+            response = firestore.BatchGetDocumentsResponse(
+                found=_document_pb(path, data), read_time=_timestamp(1)
+            )
+        responses.append(response)
+
+    def run():
+        for response in responses:
+            _parse_batch_get(response, reference_map, client)
+
+    return run
+
+
+def _fill_batch(client, batch, documents):
+    for i, (path, data) in enumerate(documents):
+        reference = client.document(path.split("/documents/", 1)[1])
+        if i % 4 == 3:
+            batch.update(
+                reference, {"status": "archived", "version": transforms.Increment(1)}
+            )
+        elif i % 8 == 6:
+            batch.delete(reference)
+        else:
+            batch.set(reference, data)
+
+
+@scenario("commit.batch_prep")
+def _commit_batch_prep(client, scale):
+    documents = _documents(client, _count(300, scale))
+
+    def run():
+        batch = client.batch()
+        _fill_batch(client, batch, documents)
+        request, _ = batch._prep_commit(None, None)
+        firestore.CommitRequest(request)
+
+    return run
+
+
+@scenario("commit.many_prep")
+def _commit_many_prep(client, scale):
+    documents = _documents(client, _count(300, scale))
+
+    def run():
+        batches = []
+        for start in range(0, len(documents), 20):
+            batch = client.batch()
+            _fill_batch(client, batch, documents[start : start + 20])
+            batches.append(batch)
+        requests, _, _ = client._prep_commit_many(batches)
+        for request in requests:
+            firestore.CommitRequest(request)
+
+    return run
+
+
+def _timed(func, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations
+
+
+def run_scenario(func, rounds=5, min_time=0.1):
+    """Time a scenario function.
+
+    After a warm-up call, the number of calls per round is calibrated so
+    that a round lasts at least ``min_time`` seconds.
+
+    Args:
+        func (Callable[[], Any]): The function timed.
+        rounds (int): The number of rounds.
+        min_time (float): The minimum duration of a round, in seconds.
+
+    Returns:
+        dict: Statistics of the duration of a call, in seconds.
+    """
+    warm_up = _timed(func, 1)
+    iterations = max(1, int(math.ceil(min_time / max(warm_up, 1e-9))))
+    times = [_timed(func, iterations) for _ in range(rounds)]
+    mean = statistics.mean(times)
+    return {
+        "min": min(times),
+        "max": max(times),
+        "mean": mean,
+        "median": statistics.median(times),
+        "stddev": statistics.stdev(times) if rounds > 1 else 0.0,
+        "rounds": rounds,
+        "iterations": iterations,
+        "ops": 1.0 / mean,
+    }
+
+
+def machine_info():
+    """Describe what the benchmarks run on."""
+    return {
+        "python_implementation": platform.python_implementation(),
+        "python_version": platform.python_version(),
+        "protobuf_implementation": api_implementation.Type(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def run_suite(patterns=(), rounds=5, min_time=0.1, scale=1.0, client=None):
+    """Run the scenarios whose name contains one of ``patterns`` (all by default).
+
+    Returns:
+        dict: The results, in the layout of ``pytest-benchmark`` JSON files.
+    """
+    if client is None:
+        client = Client(project="bench", credentials=AnonymousCredentials())
+    benchmarks = []
+    for name, setup in SCENARIOS.items():
+        if patterns and not any(pattern in name for pattern in patterns):
+            continue
+        stats = run_scenario(setup(client, scale), rounds=rounds, min_time=min_time)
+        benchmarks.append(
+            {
+                "name": name,
+                "group": name.split(".", 1)[0],
+                "scale": scale,
+                "stats": stats,
+            }
+        )
+    return {
+        "machine_info": machine_info(),
+        "datetime": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "benchmarks": benchmarks,
+    }
+
+
+def compare(results, baseline, tolerance=0.25):
+    """Compare the fastest rounds of results with a baseline.
+
+    Args:
+        results (dict): Results of :func:`run_suite`.
+        baseline (dict): Stored results of :func:`run_suite`.
+        tolerance (float): The fraction by which a scenario may be slower
+            than its baseline.
+
+    Returns:
+        List[Tuple[str, Optional[float], float, Optional[float], str]]: For
+        each scenario, its name, baseline and current minimum durations,
+        their ratio, and one of ``"new"``, ``"ok"``, ``"faster"`` or ``"slower"``.
+        Scenarios run at another ``scale`` than their baseline are
+        ``"new"``.
+    """
+    baseline_stats = {
+        benchmark["name"]: benchmark for benchmark in baseline.get("benchmarks", ())
+    }
+    rows = []
+    for benchmark in results["benchmarks"]:
+        fastest = benchmark["stats"]["min"]
+        base = baseline_stats.get(benchmark["name"])
+        if base is None or base.get("scale") != benchmark["scale"]:
+            rows.append((benchmark["name"], None, fastest, None, "new"))
+            continue
+        base_min = base["stats"]["min"]
+        ratio = fastest / base_min
+        if ratio > 1.0 + tolerance:
+            status = "slower"
+        elif ratio < 1.0 / (1.0 + tolerance):
+            status = "faster"
+        else:
+            status = "ok"
+        rows.append((benchmark["name"], base_min, fastest, ratio, status))
+    return rows
+
+
+def _format_ms(seconds):
+    return "-" if seconds is None else "{:.3f}".format(seconds * 1000)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "-k",
+        dest="patterns",
+        action="append",
+        default=[],
+        help="Only run scenarios whose name contains this (repeatable).",
+    )
+    parser.add_argument("--list", action="store_true", help="List the scenarios.")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.1)
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--json", help="Write the results to this file.")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Store the results as the baseline instead of comparing.",
+    )
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name in SCENARIOS:
+            print(name)
+        return 0
+
+    results = run_suite(args.patterns, args.rounds, args.min_time, args.scale)
+    if args.json:
+        with open(args.json, "w") as file_obj:
+            json.dump(results, file_obj, indent=2, sort_keys=True)
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as file_obj:
+            json.dump(results, file_obj, indent=2, sort_keys=True)
+            file_obj.write("\n")
+        baseline = {}
+    elif os.path.exists(args.baseline):
+        with open(args.baseline) as file_obj:
+            baseline = json.load(file_obj)
+        if baseline.get("machine_info") != results["machine_info"]:
+            print("warning: the baseline was recorded on another machine setup")
+    else:
+        baseline = {}
+
+    rows = compare(results, baseline, args.tolerance)
+    print(
+        "{:<24} {:>14} {:>14} {:>8}  {}".format(
+            "scenario", "baseline (ms)", "min (ms)", "ratio", "status"
+        )
+    )
+    for name, base_min, fastest, ratio, status in rows:
+        print(
+            "{:<24} {:>14} {:>14} {:>8}  {}".format(
+                name,
+                _format_ms(base_min),
+                _format_ms(fastest),
+                "-" if ratio is None else "{:.2f}".format(ratio),
+                status,
+            )
+        )
+    slower = [row[0] for row in rows if row[4] == "slower"]
+    if slower:
+        print(
+            "{} scenario(s) more than {:.0%} slower than the baseline: {}".format(
+                len(slower), args.tolerance, ", ".join(slower)
+            )
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
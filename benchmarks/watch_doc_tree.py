@@ -0,0 +1,165 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark applying a burst of changes to a watch document tree.
+
+Compares :class:`~google.cloud.firestore_v1.watch.WatchDocTree` against the
+previous dict-based tree, which copied itself on every insert / remove and
+required a full sort of the keys for every pushed snapshot.
+
+    $ python -m benchmarks.watch_doc_tree --sizes 1000 10000 100000
+"""
+
+import argparse
+import collections
+import functools
+import random
+import time
+
+from google.cloud.firestore_v1.watch import WatchDocTree
+
+
+_LegacyEntry = collections.namedtuple("_LegacyEntry", ["value", "index"])
+
+
+class LegacyWatchDocTree(object):
+    """The dict-based tree used before ``WatchDocTree`` kept query order."""
+
+    def __init__(self):
+        self._dict = {}
+        self._index = 0
+
+    def keys(self):
+        return list(self._dict.keys())
+
+    def _copy(self):
+        wdt = LegacyWatchDocTree()
+        wdt._dict = self._dict.copy()
+        wdt._index = self._index
+        return wdt
+
+    def insert(self, key, value):
+        self = self._copy()
+        self._dict[key] = _LegacyEntry(value, self._index)
+        self._index += 1
+        return self
+
+    def find(self, key):
+        return self._dict[key]
+
+    def remove(self, key):
+        self = self._copy()
+        del self._dict[key]
+        return self
+
+    def __len__(self):
+        return len(self._dict)
+
+
+class _Doc(object):
+    """Stand-in for a snapshot ordered by ``score`` then by ``name``."""
+
+    __slots__ = ("name", "score")
+
+    def __init__(self, name, score):
+        self.name = name
+        self.score = score
+
+
+def _comparator(doc1, doc2):
+    if doc1.score != doc2.score:
+        return -1 if doc1.score < doc2.score else 1
+    return (doc1.name > doc2.name) - (doc1.name < doc2.name)
+
+
+def _make_docs(size, rng):
+    return [_Doc("doc-{:08d}".format(i), rng.random()) for i in range(size)]
+
+
+def _make_changes(docs, num_changes, rng):
+    changes = []
+    for old in rng.sample(docs, min(num_changes, len(docs))):
+        changes.append((old, _Doc(old.name, rng.random())))
+    return changes
+
+
+def _bench_legacy(docs, changes):
+    tree = LegacyWatchDocTree()
+    # Fill directly: copying on each of the initial inserts is quadratic.
+    for doc in docs:
+        tree._dict[doc] = _LegacyEntry(None, tree._index)
+        tree._index += 1
+
+    start = time.perf_counter()
+    for old, new in changes:
+        tree.find(old)
+        tree = tree.remove(old)
+        tree = tree.insert(new, None)
+        tree.find(new)
+    keys = sorted(tree.keys(), key=functools.cmp_to_key(_comparator))
+    elapsed = time.perf_counter() - start
+    assert len(keys) == len(docs)
+    return elapsed
+
+
+def _bench_tree(docs, changes):
+    tree = WatchDocTree(_comparator)
+    for doc in docs:
+        tree.insert(doc, None)
+
+    start = time.perf_counter()
+    for old, new in changes:
+        tree.find(old)
+        tree = tree.remove(old)
+        tree = tree.insert(new, None)
+        tree.find(new)
+    keys = tree.keys()
+    elapsed = time.perf_counter() - start
+    assert len(keys) == len(docs)
+    return elapsed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1000, 10000, 100000],
+    )
+    parser.add_argument(
+        "--changes", type=int, default=100, help="Modified documents per snapshot."
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=1234)
+    args = parser.parse_args(argv)
+
+    print(
+        "{:>10} {:>8} {:>14} {:>14} {:>9}".format(
+            "docs", "changes", "legacy (ms)", "tree (ms)", "speedup"
+        )
+    )
+    for size in args.sizes:
+        rng = random.Random(args.seed)
+        docs = _make_docs(size, rng)
+        changes = _make_changes(docs, args.changes, rng)
+
+        legacy = min(_bench_legacy(docs, changes) for _ in range(args.repeat))
+        tree = min(_bench_tree(docs, changes) for _ in range(args.repeat))
+        print(
+            "{:>10} {:>8} {:>14.2f} {:>14.2f} {:>8.1f}x".format(
+                size, len(changes), legacy * 1000, tree * 1000, legacy / tree
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -18,29 +18,39 @@
 from google.cloud.firestore_v1 import __version__
 from google.cloud.firestore_v1 import ArrayRemove
 from google.cloud.firestore_v1 import ArrayUnion
+from google.cloud.firestore_v1 import AsyncBulkWriter
 from google.cloud.firestore_v1 import AsyncClient
 from google.cloud.firestore_v1 import AsyncCollectionReference
 from google.cloud.firestore_v1 import AsyncDocumentReference
 from google.cloud.firestore_v1 import AsyncQuery
 from google.cloud.firestore_v1 import async_transactional
 from google.cloud.firestore_v1 import AsyncTransaction
+from google.cloud.firestore_v1 import AsyncWatch
 from google.cloud.firestore_v1 import AsyncWriteBatch
+from google.cloud.firestore_v1 import BulkWriter
+from google.cloud.firestore_v1 import ChannelOptions
 from google.cloud.firestore_v1 import Client
 from google.cloud.firestore_v1 import CollectionGroup
 from google.cloud.firestore_v1 import CollectionReference
+from google.cloud.firestore_v1 import CommitManyError
 from google.cloud.firestore_v1 import DELETE_FIELD
+from google.cloud.firestore_v1 import DocumentCache
 from google.cloud.firestore_v1 import DocumentReference
 from google.cloud.firestore_v1 import DocumentSnapshot
 from google.cloud.firestore_v1 import DocumentTransform
 from google.cloud.firestore_v1 import ExistsOption
+from google.cloud.firestore_v1 import FrozenDocumentSnapshot
 from google.cloud.firestore_v1 import GeoPoint
 from google.cloud.firestore_v1 import Increment
 from google.cloud.firestore_v1 import LastUpdateOption
+from google.cloud.firestore_v1 import LazyDocumentSnapshot
 from google.cloud.firestore_v1 import Maximum
 from google.cloud.firestore_v1 import Minimum
+from google.cloud.firestore_v1 import ProjectedDocumentSnapshot
 from google.cloud.firestore_v1 import Query
 from google.cloud.firestore_v1 import ReadAfterWriteError
 from google.cloud.firestore_v1 import SERVER_TIMESTAMP
+from google.cloud.firestore_v1 import SnapshotDelivery
 from google.cloud.firestore_v1 import Transaction
 from google.cloud.firestore_v1 import transactional
 from google.cloud.firestore_v1 import types
@@ -54,29 +64,39 @@ __all__: List[str] = [
     "__version__",
     "ArrayRemove",
     "ArrayUnion",
+    "AsyncBulkWriter",
     "AsyncClient",
     "AsyncCollectionReference",
     "AsyncDocumentReference",
     "AsyncQuery",
     "async_transactional",
     "AsyncTransaction",
+    "AsyncWatch",
     "AsyncWriteBatch",
+    "BulkWriter",
+    "ChannelOptions",
     "Client",
     "CollectionGroup",
     "CollectionReference",
+    "CommitManyError",
     "DELETE_FIELD",
+    "DocumentCache",
     "DocumentReference",
     "DocumentSnapshot",
     "DocumentTransform",
     "ExistsOption",
+    "FrozenDocumentSnapshot",
     "GeoPoint",
     "Increment",
     "LastUpdateOption",
+    "LazyDocumentSnapshot",
     "Maximum",
     "Minimum",
+    "ProjectedDocumentSnapshot",
     "Query",
     "ReadAfterWriteError",
     "SERVER_TIMESTAMP",
+    "SnapshotDelivery",
     "Transaction",
     "transactional",
     "types",
@@ -33,19 +33,29 @@ from google.cloud.firestore_v1._helpers import LastUpdateOption
 from google.cloud.firestore_v1._helpers import ReadAfterWriteError
 from google.cloud.firestore_v1._helpers import WriteOption
 from google.cloud.firestore_v1.async_batch import AsyncWriteBatch
+from google.cloud.firestore_v1.async_bulk_writer import AsyncBulkWriter
 from google.cloud.firestore_v1.async_client import AsyncClient
 from google.cloud.firestore_v1.async_collection import AsyncCollectionReference
 from google.cloud.firestore_v1.async_document import AsyncDocumentReference
 from google.cloud.firestore_v1.async_query import AsyncQuery
 from google.cloud.firestore_v1.async_transaction import async_transactional
 from google.cloud.firestore_v1.async_transaction import AsyncTransaction
+from google.cloud.firestore_v1.async_watch import AsyncWatch
+from google.cloud.firestore_v1.base_client import CommitManyError
 from google.cloud.firestore_v1.base_document import DocumentSnapshot
+from google.cloud.firestore_v1.base_document import FrozenDocumentSnapshot
+from google.cloud.firestore_v1.base_document import LazyDocumentSnapshot
+from google.cloud.firestore_v1.base_document import ProjectedDocumentSnapshot
 from google.cloud.firestore_v1.batch import WriteBatch
+from google.cloud.firestore_v1.bulk_writer import BulkWriter
+from google.cloud.firestore_v1.channel_pool import ChannelOptions
 from google.cloud.firestore_v1.client import Client
 from google.cloud.firestore_v1.collection import CollectionReference
 from google.cloud.firestore_v1.document import DocumentReference
+from google.cloud.firestore_v1.document_cache import DocumentCache
 from google.cloud.firestore_v1.query import CollectionGroup
 from google.cloud.firestore_v1.query import Query
+from google.cloud.firestore_v1.snapshot_delivery import SnapshotDelivery
 from google.cloud.firestore_v1.transaction import Transaction
 from google.cloud.firestore_v1.transaction import transactional
 from google.cloud.firestore_v1.transforms import ArrayRemove
@@ -112,29 +122,39 @@ __all__: List[str] = [
     "__version__",
     "ArrayRemove",
     "ArrayUnion",
+    "AsyncBulkWriter",
     "AsyncClient",
     "AsyncCollectionReference",
     "AsyncDocumentReference",
     "AsyncQuery",
     "async_transactional",
     "AsyncTransaction",
+    "AsyncWatch",
     "AsyncWriteBatch",
+    "BulkWriter",
+    "ChannelOptions",
     "Client",
     "CollectionGroup",
     "CollectionReference",
+    "CommitManyError",
     "DELETE_FIELD",
+    "DocumentCache",
     "DocumentReference",
     "DocumentSnapshot",
     "DocumentTransform",
     "ExistsOption",
+    "FrozenDocumentSnapshot",
     "GeoPoint",
     "Increment",
     "LastUpdateOption",
+    "LazyDocumentSnapshot",
     "Maximum",
     "Minimum",
+    "ProjectedDocumentSnapshot",
     "Query",
     "ReadAfterWriteError",
     "SERVER_TIMESTAMP",
+    "SnapshotDelivery",
     "Transaction",
     "transactional",
     "types",
@@ -14,7 +14,10 @@
 
 """Common helpers shared across Google Cloud Firestore modules."""
 
+import bisect
 import datetime
+from collections import abc
+from types import MappingProxyType
 
 from google.api_core.datetime_helpers import DatetimeWithNanoseconds  # type: ignore
 from google.api_core import gapic_v1  # type: ignore
@@ -28,6 +31,7 @@ from google.cloud.firestore_v1.types.write import DocumentTransform
 from google.cloud.firestore_v1 import transforms
 from google.cloud.firestore_v1 import types
 from google.cloud.firestore_v1.field_path import FieldPath
+from google.cloud.firestore_v1.field_path import _BAD_PART
 from google.cloud.firestore_v1.field_path import parse_field_path
 from google.cloud.firestore_v1.types import common
 from google.cloud.firestore_v1.types import document
@@ -146,8 +150,8 @@ def encode_value(value) -> types.document.Value:
 
     Args:
         value (Union[NoneType, bool, int, float, datetime.datetime, \
-            str, bytes, dict, ~google.cloud.Firestore.GeoPoint]): A native
-            Python value to convert to a protobuf field.
+            str, bytes, Mapping, ~google.cloud.Firestore.GeoPoint]): A
+            native Python value to convert to a protobuf field.
 
     Returns:
         ~google.cloud.firestore_v1.types.Value: A
@@ -156,67 +160,212 @@ def encode_value(value) -> types.document.Value:
     Raises:
         TypeError: If the ``value`` is not one of the accepted types.
     """
-    if value is None:
-        return document.Value(null_value=struct_pb2.NULL_VALUE)
+    value_pb = document.Value.pb()()
+    _encode_value_pb(value, value_pb)
+    return document.Value.wrap(value_pb)
 
-    # Must come before int since ``bool`` is an integer subtype.
-    if isinstance(value, bool):
-        return document.Value(boolean_value=value)
 
-    if isinstance(value, int):
-        return document.Value(integer_value=value)
+def encode_dict(values_dict) -> dict:
+    """Encode a dictionary into protobuf ``Value``-s.
 
-    if isinstance(value, float):
-        return document.Value(double_value=value)
+    Args:
+        values_dict (dict): The dictionary to encode as protobuf fields.
 
-    if isinstance(value, DatetimeWithNanoseconds):
-        return document.Value(timestamp_value=value.timestamp_pb())
+    Returns:
+        Dict[str, ~google.cloud.firestore_v1.types.Value]: A
+        dictionary of string keys and ``Value`` protobufs as dictionary
+        values.
+    """
+    return {key: encode_value(value) for key, value in values_dict.items()}
 
-    if isinstance(value, datetime.datetime):
-        return document.Value(timestamp_value=_datetime_to_pb_timestamp(value))
 
-    if isinstance(value, str):
-        return document.Value(string_value=value)
+def _encode_value_pb(value, value_pb) -> None:
+    """Encode a native Python value into an empty raw protobuf ``Value``.
 
-    if isinstance(value, bytes):
-        return document.Value(bytes_value=value)
+    The encoder is looked up by the exact type of ``value``; other types
+    (e.g. subclasses) are resolved once by :func:`_resolve_value_pb_encoder`.
+    Nested arrays and maps are written in place, without creating a
+    proto-plus wrapper for each nested ``Value``.
 
-    # NOTE: We avoid doing an isinstance() check for a Document
-    #       here to avoid import cycles.
-    document_path = getattr(value, "_document_path", None)
-    if document_path is not None:
-        return document.Value(reference_value=document_path)
+    Args:
+        value (Any): A native Python value to convert to a protobuf field.
+        value_pb (google.cloud.firestore_v1.document_pb2.Value): The raw
+            protobuf to populate.
+
+    Raises:
+        TypeError: If the ``value`` is not one of the accepted types.
+    """
+    encoder = _VALUE_PB_ENCODERS.get(type(value))
+    if encoder is None:
+        encoder = _resolve_value_pb_encoder(value)
+    encoder(value, value_pb)
+
+
+def _encode_fields_pb(values_dict, fields_pb) -> None:
+    """Encode a dictionary into a raw protobuf map of ``Value``-s.
+
+    Args:
+        values_dict (dict): The dictionary to encode as protobuf fields.
+        fields_pb (google.protobuf.pyext._message.MessageMapContainer): The
+            raw protobuf map to populate.
+    """
+    for key, value in values_dict.items():
+        _encode_value_pb(value, fields_pb[key])
+
+
+def _encode_null_pb(value, value_pb):
+    value_pb.null_value = struct_pb2.NULL_VALUE
+
+
+def _encode_boolean_pb(value, value_pb):
+    value_pb.boolean_value = value
+
+
+def _encode_integer_pb(value, value_pb):
+    value_pb.integer_value = value
+
+
+def _encode_double_pb(value, value_pb):
+    value_pb.double_value = value
+
+
+def _encode_timestamp_with_nanos_pb(value, value_pb):
+    value_pb.timestamp_value.CopyFrom(value.timestamp_pb())
 
-    if isinstance(value, GeoPoint):
-        return document.Value(geo_point_value=value.to_protobuf())
 
-    if isinstance(value, (list, tuple, set, frozenset)):
-        value_list = tuple(encode_value(element) for element in value)
-        value_pb = document.ArrayValue(values=value_list)
-        return document.Value(array_value=value_pb)
+def _encode_datetime_pb(value, value_pb):
+    value_pb.timestamp_value.CopyFrom(_datetime_to_pb_timestamp(value))
 
-    if isinstance(value, dict):
-        value_dict = encode_dict(value)
-        value_pb = document.MapValue(fields=value_dict)
-        return document.Value(map_value=value_pb)
+
+def _encode_string_pb(value, value_pb):
+    value_pb.string_value = value
+
+
+def _encode_bytes_pb(value, value_pb):
+    value_pb.bytes_value = value
+
+
+def _encode_reference_pb(value, value_pb):
+    value_pb.reference_value = value._document_path
+
+
+def _encode_geo_point_pb(value, value_pb):
+    geo_point_pb = value_pb.geo_point_value
+    geo_point_pb.latitude = value.latitude
+    geo_point_pb.longitude = value.longitude
+
+
+def _encode_array_pb(value, value_pb):
+    array_pb = value_pb.array_value
+    array_pb.SetInParent()
+    add_value_pb = array_pb.values.add
+    for element in value:
+        _encode_value_pb(element, add_value_pb())
+
+
+def _encode_map_pb(value, value_pb):
+    map_pb = value_pb.map_value
+    map_pb.SetInParent()
+    _encode_fields_pb(value, map_pb.fields)
+
+
+_VALUE_PB_ENCODERS = {
+    type(None): _encode_null_pb,
+    bool: _encode_boolean_pb,
+    int: _encode_integer_pb,
+    float: _encode_double_pb,
+    DatetimeWithNanoseconds: _encode_timestamp_with_nanos_pb,
+    datetime.datetime: _encode_datetime_pb,
+    str: _encode_string_pb,
+    bytes: _encode_bytes_pb,
+    GeoPoint: _encode_geo_point_pb,
+    list: _encode_array_pb,
+    tuple: _encode_array_pb,
+    set: _encode_array_pb,
+    frozenset: _encode_array_pb,
+    dict: _encode_map_pb,
+    MappingProxyType: _encode_map_pb,
+}
+
+
+def _resolve_value_pb_encoder(value) -> Any:
+    """Find the encoder for a value whose exact type is not registered.
+
+    Mirrors the order of ``isinstance()`` checks used before the dispatch
+    table existed. The result is cached by type when that is safe, so each
+    subclass is only resolved once.
+
+    Args:
+        value (Any): A native Python value to convert to a protobuf field.
+
+    Returns:
+        Callable[[Any, google.cloud.firestore_v1.document_pb2.Value], None]:
+        The encoder for ``value``.
+
+    Raises:
+        TypeError: If the ``value`` is not one of the accepted types.
+    """
+    value_type = type(value)
+
+    # Must come before int since ``bool`` is an integer subtype.
+    for base, encoder in (
+        (bool, _encode_boolean_pb),
+        (int, _encode_integer_pb),
+        (float, _encode_double_pb),
+        (DatetimeWithNanoseconds, _encode_timestamp_with_nanos_pb),
+        (datetime.datetime, _encode_datetime_pb),
+        (str, _encode_string_pb),
+        (bytes, _encode_bytes_pb),
+    ):
+        if isinstance(value, base):
+            _VALUE_PB_ENCODERS[value_type] = encoder
+            return encoder
+
+    # NOTE: We avoid doing an isinstance() check for a Document
+    #       here to avoid import cycles.
+    if getattr(value, "_document_path", None) is not None:
+        # Only cache types which always provide a document path.
+        if isinstance(getattr(value_type, "_document_path", None), property):
+            _VALUE_PB_ENCODERS[value_type] = _encode_reference_pb
+        return _encode_reference_pb
+
+    for base, encoder in (
+        (GeoPoint, _encode_geo_point_pb),
+        ((list, tuple, set, frozenset), _encode_array_pb),
+        (abc.Mapping, _encode_map_pb),
+    ):
+        if isinstance(value, base):
+            if not hasattr(value_type, "_document_path"):
+                _VALUE_PB_ENCODERS[value_type] = encoder
+            return encoder
 
     raise TypeError(
         "Cannot convert to a Firestore Value", value, "Invalid type", type(value)
     )
 
 
-def encode_dict(values_dict) -> dict:
-    """Encode a dictionary into protobuf ``Value``-s.
+_MAP_TYPES = {dict: True, MappingProxyType: True}
+
+
+def _is_map(value) -> bool:
+    """Check if a value is written as a map.
+
+    Any :class:`~collections.abc.Mapping` is, such as the read-only views
+    of frozen and lazy snapshots. The answer is cached by type, as the
+    ``isinstance()`` check against the abstract class is slow.
 
     Args:
-        values_dict (dict): The dictionary to encode as protobuf fields.
+        value (Any): A native Python value.
 
     Returns:
-        Dict[str, ~google.cloud.firestore_v1.types.Value]: A
-        dictionary of string keys and ``Value`` protobufs as dictionary
-        values.
+        bool: Whether ``value`` is a mapping.
     """
-    return {key: encode_value(value) for key, value in values_dict.items()}
+    value_type = type(value)
+    try:
+        return _MAP_TYPES[value_type]
+    except KeyError:
+        is_map = _MAP_TYPES[value_type] = isinstance(value, abc.Mapping)
+        return is_map
 
 
 def reference_value_to_document(reference_value, client) -> Any:
@@ -254,7 +403,7 @@ def reference_value_to_document(reference_value, client) -> Any:
 
 
 def decode_value(
-    value, client
+    value, client, frozen=False
 ) -> Union[None, bool, int, float, list, datetime.datetime, str, bytes, dict, GeoPoint]:
     """Converts a Firestore protobuf ``Value`` to a native Python value.
 
@@ -263,6 +412,8 @@ def decode_value(
             Firestore protobuf to be decoded / parsed / converted.
         client (:class:`~google.cloud.firestore_v1.client.Client`):
             A client that has a document factory.
+        frozen (bool): If :data:`True`, decode maps as read-only
+            :class:`types.MappingProxyType` views and arrays as tuples.
 
     Returns:
         Union[NoneType, bool, int, float, datetime.datetime, \
@@ -273,35 +424,12 @@ def decode_value(
         NotImplementedError: If the ``value_type`` is ``reference_value``.
         ValueError: If the ``value_type`` is unknown.
     """
-    value_type = value._pb.WhichOneof("value_type")
-
-    if value_type == "null_value":
-        return None
-    elif value_type == "boolean_value":
-        return value.boolean_value
-    elif value_type == "integer_value":
-        return value.integer_value
-    elif value_type == "double_value":
-        return value.double_value
-    elif value_type == "timestamp_value":
-        return DatetimeWithNanoseconds.from_timestamp_pb(value._pb.timestamp_value)
-    elif value_type == "string_value":
-        return value.string_value
-    elif value_type == "bytes_value":
-        return value.bytes_value
-    elif value_type == "reference_value":
-        return reference_value_to_document(value.reference_value, client)
-    elif value_type == "geo_point_value":
-        return GeoPoint(value.geo_point_value.latitude, value.geo_point_value.longitude)
-    elif value_type == "array_value":
-        return [decode_value(element, client) for element in value.array_value.values]
-    elif value_type == "map_value":
-        return decode_dict(value.map_value.fields, client)
-    else:
-        raise ValueError("Unknown ``value_type``", value_type)
+    result = [None]
+    _decode_value_pbs(result, ((0, getattr(value, "_pb", value)),), client, frozen)
+    return result[0]
 
 
-def decode_dict(value_fields, client) -> dict:
+def decode_dict(value_fields, client, frozen=False) -> dict:
     """Converts a protobuf map of Firestore ``Value``-s.
 
     Args:
@@ -309,13 +437,107 @@ def decode_dict(value_fields, client) -> dict:
             protobuf map of Firestore ``Value``-s.
         client (:class:`~google.cloud.firestore_v1.client.Client`):
             A client that has a document factory.
+        frozen (bool): If :data:`True`, return a read-only
+            :class:`types.MappingProxyType` view, with nested maps decoded
+            as read-only views and arrays as tuples.
 
     Returns:
         Dict[str, Union[NoneType, bool, int, float, datetime.datetime, \
             str, bytes, dict, ~google.cloud.Firestore.GeoPoint]]: A dictionary
         of native Python values converted from the ``value_fields``.
     """
-    return {key: decode_value(value, client) for key, value in value_fields.items()}
+    # A proto-plus map wraps every value it hands out; read the raw
+    # protobuf map underneath it instead.
+    fields_pb = getattr(value_fields, "_pb", None)
+    if fields_pb is not None:
+        items = fields_pb.items()
+    else:
+        items = [
+            (key, getattr(value, "_pb", value)) for key, value in value_fields.items()
+        ]
+
+    decoded = _decode_value_pbs(dict.fromkeys(value_fields), items, client, frozen)
+    if frozen:
+        return MappingProxyType(decoded)
+    return decoded
+
+
+_VALUE_PB_DECODERS = {
+    "null_value": lambda value_pb, client: None,
+    "boolean_value": lambda value_pb, client: value_pb.boolean_value,
+    "integer_value": lambda value_pb, client: value_pb.integer_value,
+    "double_value": lambda value_pb, client: value_pb.double_value,
+    "timestamp_value": lambda value_pb, client: (
+        DatetimeWithNanoseconds.from_timestamp_pb(value_pb.timestamp_value)
+    ),
+    "string_value": lambda value_pb, client: value_pb.string_value,
+    "bytes_value": lambda value_pb, client: value_pb.bytes_value,
+    "reference_value": lambda value_pb, client: (
+        reference_value_to_document(value_pb.reference_value, client)
+    ),
+    "geo_point_value": lambda value_pb, client: GeoPoint(
+        value_pb.geo_point_value.latitude, value_pb.geo_point_value.longitude
+    ),
+}
+
+
+def _decode_value_pbs(decoded, items, client, frozen=False) -> Union[dict, list]:
+    """Decode raw protobuf ``Value``-s into a container.
+
+    Works on the raw protobuf messages, avoiding the proto-plus wrapper
+    created for every nested ``Value``. Scalars are dispatched on the
+    ``value_type`` oneof; arrays and maps are attached to their parent
+    empty and filled from an explicit stack rather than by recursion.
+
+    Args:
+        decoded (Union[dict, list]): The container to fill. For a ``dict``,
+            the keys should already be present (in order) so that field
+            order is preserved.
+        items (Iterable[Tuple[Union[str, int], \
+            google.cloud.firestore_v1.document_pb2.Value]]): Keys / indexes
+            in ``decoded`` paired with the raw protobuf to decode for them.
+        client (:class:`~google.cloud.firestore_v1.client.Client`):
+            A client that has a document factory.
+        frozen (bool): If :data:`True`, nested maps are attached as
+            :class:`types.MappingProxyType` views and arrays are converted
+            to tuples once they have been filled.
+
+    Returns:
+        Union[dict, list]: The ``decoded`` container.
+
+    Raises:
+        ValueError: If a ``value_type`` is unknown.
+    """
+    decoders = _VALUE_PB_DECODERS
+    pending = [(decoded, items)]
+    # Arrays in the order they were attached: each one after its parent.
+    arrays = []
+    while pending:
+        container, items = pending.pop()
+        for key, value_pb in items:
+            value_type = value_pb.WhichOneof("value_type")
+            decoder = decoders.get(value_type)
+            if decoder is not None:
+                container[key] = decoder(value_pb, client)
+            elif value_type == "map_value":
+                fields_pb = value_pb.map_value.fields
+                child = dict.fromkeys(fields_pb)
+                container[key] = MappingProxyType(child) if frozen else child
+                pending.append((child, fields_pb.items()))
+            elif value_type == "array_value":
+                values_pb = value_pb.array_value.values
+                child = container[key] = [None] * len(values_pb)
+                if frozen:
+                    arrays.append((container, key, child))
+                pending.append((child, enumerate(values_pb)))
+            else:
+                raise ValueError("Unknown ``value_type``", value_type)
+
+    # Freeze nested arrays before the arrays containing them.
+    for container, key, child in reversed(arrays):
+        container[key] = tuple(child)
+
+    return decoded
 
 
 def get_doc_id(document_pb, expected_prefix) -> str:
@@ -365,7 +587,7 @@ def extract_fields(
 
             field_path = FieldPath(*(prefix_path.parts + sub_key.parts))
 
-            if isinstance(value, dict):
+            if _is_map(value):
                 for s_path, s_value in extract_fields(value, field_path):
                     yield s_path, s_value
             else:
@@ -397,12 +619,19 @@ class DocumentExtractor(object):
 
     Handle special values such as ``DELETE_FIELD``, ``SERVER_TIMESTAMP``.
 
+    The document is walked once: each field is sorted into the data or
+    the transforms as it is reached, and the data is encoded into the
+    ``Write`` protobuf returned by :meth:`get_update_pb` at the same time.
+
     Args:
         document_data (dict):
             Property names and values to use for sending a change to
             a document.
     """
 
+    _expand_dots = False
+    """bool: Whether top-level keys are field paths rather than names."""
+
     def __init__(self, document_data) -> None:
         self.document_data = document_data
         self.field_paths = []
@@ -416,43 +645,97 @@ class DocumentExtractor(object):
         self.set_fields = {}
         self.empty_document = False
 
-        prefix_path = FieldPath()
-        iterator = self._get_document_iterator(prefix_path)
+        # ``set_fields``, encoded as the document is walked.
+        self._update_pb = write.Write.pb()()
+        self._encoded_fields = self.set_fields
 
-        for field_path, value in iterator:
+        if not document_data:
+            self.empty_document = True
+        else:
+            self._extract_map(
+                document_data,
+                (),
+                self.set_fields,
+                self._update_pb.update.fields,
+                self._expand_dots,
+            )
 
-            if field_path == prefix_path and value is _EmptyDict:
-                self.empty_document = True
+    def _extract_map(
+        self, data, parts, set_fields, fields_pb, expand_dots=False
+    ) -> None:
+        """Extract the fields of a (nested) map, in key order.
 
-            elif value is transforms.DELETE_FIELD:
-                self.deleted_fields.append(field_path)
+        Args:
+            data (Mapping[str, Any]): The map.
+            parts (Tuple[str, ...]): The field names leading to ``data``.
+            set_fields (dict): Receives the data fields of ``data``.
+            fields_pb (google.protobuf.pyext._message.MessageMapContainer):
+                Receives the data fields of ``data``, encoded.
+            expand_dots (bool): Whether the keys of ``data`` are field
+                paths rather than field names.
+        """
+        for key in sorted(data):
+            if expand_dots:
+                names = FieldPath.from_string(key).parts
+            elif isinstance(key, str) and key:
+                names = (key,)
+            else:
+                raise ValueError(_BAD_PART)
+            self._extract_value(data[key], parts, names, set_fields, fields_pb)
+
+    def _extract_value(self, value, parts, names, set_fields, fields_pb) -> None:
+        """Extract the value of a field, at ``names`` below ``parts``."""
+        name = names[0]
+        parts += (name,)
+
+        if len(names) > 1 or (_is_map(value) and value):
+            added = name not in set_fields
+            nested = {} if added else set_fields[name]
+            nested_pb = fields_pb[name].map_value.fields
+            if len(names) > 1:
+                self._extract_value(value, parts, names[1:], nested, nested_pb)
+            else:
+                self._extract_map(value, parts, nested, nested_pb)
+            if added:
+                # Maps holding only transforms or deletes are left out.
+                if nested:
+                    set_fields[name] = nested
+                else:
+                    del fields_pb[name]
+            return
 
-            elif value is transforms.SERVER_TIMESTAMP:
-                self.server_timestamps.append(field_path)
+        field_path = FieldPath._from_parts(parts)
 
-            elif isinstance(value, transforms.ArrayRemove):
-                self.array_removes[field_path] = value.values
+        if value is transforms.DELETE_FIELD:
+            self.deleted_fields.append(field_path)
 
-            elif isinstance(value, transforms.ArrayUnion):
-                self.array_unions[field_path] = value.values
+        elif value is transforms.SERVER_TIMESTAMP:
+            self.server_timestamps.append(field_path)
 
-            elif isinstance(value, transforms.Increment):
-                self.increments[field_path] = value.value
+        elif isinstance(value, transforms.ArrayRemove):
+            self.array_removes[field_path] = value.values
 
-            elif isinstance(value, transforms.Maximum):
-                self.maximums[field_path] = value.value
+        elif isinstance(value, transforms.ArrayUnion):
+            self.array_unions[field_path] = value.values
 
-            elif isinstance(value, transforms.Minimum):
-                self.minimums[field_path] = value.value
+        elif isinstance(value, transforms.Increment):
+            self.increments[field_path] = value.value
 
-            else:
-                self.field_paths.append(field_path)
-                set_field_value(self.set_fields, field_path, value)
+        elif isinstance(value, transforms.Maximum):
+            self.maximums[field_path] = value.value
 
-    def _get_document_iterator(
-        self, prefix_path: FieldPath
-    ) -> Generator[Tuple[Any, Any], Any, None]:
-        return extract_fields(self.document_data, prefix_path)
+        elif isinstance(value, transforms.Minimum):
+            self.minimums[field_path] = value.value
+
+        else:
+            if _is_map(value):  # An empty map.
+                value = {}
+            self.field_paths.append(field_path)
+            value_pb = fields_pb[name]
+            if name in set_fields:  # The same path, given twice.
+                value_pb.Clear()
+            set_fields[name] = value
+            _encode_value_pb(value, value_pb)
 
     @property
     def has_transforms(self):
@@ -483,20 +766,23 @@ class DocumentExtractor(object):
         self, document_path, exists=None, allow_empty_mask=False
     ) -> types.write.Write:
 
+        update_pb = self._update_pb
+        if update_pb is None or self.set_fields is not self._encoded_fields:
+            update_pb = write.Write.pb()()
+            _encode_fields_pb(self.set_fields, update_pb.update.fields)
+        # The ``Write`` is handed out: encode again if asked for another.
+        self._update_pb = None
+
+        update_pb.update.name = document_path
+
+        update_mask = self._get_update_mask(allow_empty_mask)
+        if update_mask is not None:
+            update_pb.update_mask.CopyFrom(update_mask._pb)
+
         if exists is not None:
-            current_document = common.Precondition(exists=exists)
-        else:
-            current_document = None
-
-        update_pb = write.Write(
-            update=document.Document(
-                name=document_path, fields=encode_dict(self.set_fields)
-            ),
-            update_mask=self._get_update_mask(allow_empty_mask),
-            current_document=current_document,
-        )
+            update_pb.current_document.exists = exists
 
-        return update_pb
+        return write.Write.wrap(update_pb)
 
     def get_field_transform_pbs(
         self, document_path
@@ -581,6 +867,23 @@ class DocumentExtractor(object):
         return transform_pb
 
 
+def _extend_update_transforms(write_pb, field_transform_pbs) -> None:
+    """Append field transforms to the ``update_transforms`` of a ``Write``.
+
+    The raw protobufs are extended: to learn the type of its elements, the
+    proto-plus sequence deep-copies the raw one when it is empty, and with
+    it the whole ``Write``.
+
+    Args:
+        write_pb (google.cloud.firestore_v1.types.Write): The write.
+        field_transform_pbs (List[google.cloud.firestore_v1.types.\
+            DocumentTransform.FieldTransform]): The transforms to append.
+    """
+    write_pb._pb.update_transforms.extend(
+        transform_pb._pb for transform_pb in field_transform_pbs
+    )
+
+
 def pbs_for_create(document_path, document_data) -> List[types.write.Write]:
     """Make ``Write`` protobufs for ``create()`` methods.
 
@@ -602,7 +905,7 @@ def pbs_for_create(document_path, document_data) -> List[types.write.Write]:
 
     if extractor.has_transforms:
         field_transform_pbs = extractor.get_field_transform_pbs(document_path)
-        create_pb.update_transforms.extend(field_transform_pbs)
+        _extend_update_transforms(create_pb, field_transform_pbs)
 
     return [create_pb]
 
@@ -631,7 +934,7 @@ def pbs_for_set_no_merge(document_path, document_data) -> List[types.write.Write
 
     if extractor.has_transforms:
         field_transform_pbs = extractor.get_field_transform_pbs(document_path)
-        set_pb.update_transforms.extend(field_transform_pbs)
+        _extend_update_transforms(set_pb, field_transform_pbs)
 
     return [set_pb]
 
@@ -650,7 +953,7 @@ class DocumentExtractorForMerge(DocumentExtractor):
         self.data_merge = sorted(self.field_paths + self.deleted_fields)
         # TODO: other transforms
         self.transform_merge = self.transform_paths
-        self.merge = sorted(self.data_merge + self.transform_paths)
+        self.merge = sorted(self.data_merge + self.transform_merge)
 
     def _construct_merge_paths(self, merge) -> Generator[Any, Any, None]:
         for merge_field in merge:
@@ -685,31 +988,47 @@ class DocumentExtractorForMerge(DocumentExtractor):
             raise ValueError("Cannot merge specific fields with empty document.")
 
         merge_paths = self._normalize_merge_paths(merge)
+        transform_paths = self.transform_paths
+        transform_path_set = set(transform_paths)
 
         del self.data_merge[:]
         del self.transform_merge[:]
         self.merge = merge_paths
 
+        # ``field_paths`` are in order, so the fields below a merge path
+        # are next to each other.
+        field_parts = [field_path.parts for field_path in self.field_paths]
+        merge_tree = {}
         for merge_path in merge_paths:
 
-            if merge_path in self.transform_paths:
+            if merge_path in transform_path_set:
                 self.transform_merge.append(merge_path)
 
-            for field_path in self.field_paths:
-                if merge_path.eq_or_parent(field_path):
-                    self.data_merge.append(field_path)
+            prefix = merge_path.parts
+            index = bisect.bisect_left(field_parts, prefix)
+            while (
+                index < len(field_parts) and field_parts[index][: len(prefix)] == prefix
+            ):
+                self.data_merge.append(self.field_paths[index])
+                index += 1
+
+            node = merge_tree
+            for part in prefix[:-1]:
+                node = node.setdefault(part, {})
+            node[prefix[-1]] = True
 
         # Clear out data for fields not merged.
-        merged_set_fields = {}
-        for field_path in self.data_merge:
-            value = get_field_value(self.document_data, field_path)
-            set_field_value(merged_set_fields, field_path, value)
-        self.set_fields = merged_set_fields
+        fields_pb = None
+        if self._update_pb is not None:
+            fields_pb = self._update_pb.update.fields
+        self.set_fields = _merge_fields(self.set_fields, fields_pb, merge_tree)
+        self._encoded_fields = self.set_fields
 
+        merge_set = set(merge_paths)
         unmerged_deleted_fields = [
             field_path
             for field_path in self.deleted_fields
-            if field_path not in self.merge
+            if field_path not in merge_set
         ]
         if unmerged_deleted_fields:
             raise ValueError(
@@ -722,7 +1041,7 @@ class DocumentExtractorForMerge(DocumentExtractor):
         for merge_path in self.merge:
             tranform_merge_paths = [
                 transform_path
-                for transform_path in self.transform_paths
+                for transform_path in transform_paths
                 if merge_path.eq_or_parent(transform_path)
             ]
             merged_transform_paths.update(tranform_merge_paths)
@@ -753,15 +1072,48 @@ class DocumentExtractorForMerge(DocumentExtractor):
         self, allow_empty_mask=False
     ) -> Optional[types.common.DocumentMask]:
         # Mask uses dotted / quoted paths.
+        transform_merge = set(self.transform_merge)
         mask_paths = [
             field_path.to_api_repr()
             for field_path in self.merge
-            if field_path not in self.transform_merge
+            if field_path not in transform_merge
         ]
 
         return common.DocumentMask(field_paths=mask_paths)
 
 
+def _merge_fields(set_fields, fields_pb, merge_tree) -> dict:
+    """Keep the data fields within the merge paths.
+
+    Args:
+        set_fields (dict): The data fields of a document.
+        fields_pb (Optional[google.protobuf.pyext._message.MessageMapContainer]):
+            The data fields, encoded. Fields not merged are removed.
+        merge_tree (dict): The field names of the merge paths, nested, with
+            :data:`True` at the end of each path.
+
+    Returns:
+        dict: The data fields within the merge paths.
+    """
+    merged = {}
+    for name, value in set_fields.items():
+        node = merge_tree.get(name)
+        if node is True:
+            merged[name] = value
+            continue
+
+        if node is not None and isinstance(value, dict):
+            nested_pb = None if fields_pb is None else fields_pb[name].map_value.fields
+            nested = _merge_fields(value, nested_pb, node)
+            if nested:
+                merged[name] = nested
+                continue
+
+        if fields_pb is not None:
+            del fields_pb[name]
+    return merged
+
+
 def pbs_for_set_with_merge(
     document_path, document_data, merge
 ) -> List[types.write.Write]:
@@ -785,7 +1137,7 @@ def pbs_for_set_with_merge(
 
     if extractor.transform_paths:
         field_transform_pbs = extractor.get_field_transform_pbs(document_path)
-        set_pb.update_transforms.extend(field_transform_pbs)
+        _extend_update_transforms(set_pb, field_transform_pbs)
 
     return [set_pb]
 
@@ -794,8 +1146,11 @@ class DocumentExtractorForUpdate(DocumentExtractor):
     """ Break document data up into actual data and transforms.
     """
 
+    _expand_dots = True
+
     def __init__(self, document_data) -> None:
-        super(DocumentExtractorForUpdate, self).__init__(document_data)
+        # Check the paths first: the data of conflicting paths cannot be
+        # merged into ``set_fields``.
         self.top_level_paths = sorted(
             [FieldPath.from_string(key) for key in document_data]
         )
@@ -809,21 +1164,19 @@ class DocumentExtractorForUpdate(DocumentExtractor):
                         )
                     )
 
+        super(DocumentExtractorForUpdate, self).__init__(document_data)
+
         for field_path in self.deleted_fields:
             if field_path not in tops:
                 raise ValueError(
                     "Cannot update with nest delete: {}".format(field_path)
                 )
 
-    def _get_document_iterator(
-        self, prefix_path: FieldPath
-    ) -> Generator[Tuple[Any, Any], Any, None]:
-        return extract_fields(self.document_data, prefix_path, expand_dots=True)
-
     def _get_update_mask(self, allow_empty_mask=False) -> types.common.DocumentMask:
+        transform_paths = set(self.transform_paths)
         mask_paths = []
         for field_path in self.top_level_paths:
-            if field_path not in self.transform_paths:
+            if field_path not in transform_paths:
                 mask_paths.append(field_path.to_api_repr())
 
         return common.DocumentMask(field_paths=mask_paths)
@@ -857,7 +1210,7 @@ def pbs_for_update(document_path, field_updates, option) -> List[types.write.Wri
 
     if extractor.has_transforms:
         field_transform_pbs = extractor.get_field_transform_pbs(document_path)
-        update_pb.update_transforms.extend(field_transform_pbs)
+        _extend_update_transforms(update_pb, field_transform_pbs)
 
     return [update_pb]
 
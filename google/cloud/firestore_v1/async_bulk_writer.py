@@ -0,0 +1,120 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Helpers for bulk writes to the Google Cloud Firestore API."""
+
+import asyncio
+
+from google.cloud.firestore_v1.async_transaction import _sleep
+from google.cloud.firestore_v1.base_bulk_writer import BaseBulkWriter
+from google.cloud.firestore_v1.base_transaction import _INITIAL_SLEEP
+
+
+class AsyncBulkWriter(BaseBulkWriter):
+    """Send large numbers of independent writes efficiently.
+
+    Writes are grouped into ``BatchWrite`` requests, each sent from its own
+    task, with at most ``max_in_flight`` requests in flight at a time.
+    Writes which fail with a transient error are retried, with exponential
+    backoff.
+
+    Each write method returns an :class:`asyncio.Future`. Writes still
+    queued are sent by :meth:`flush` and :meth:`close`, which also wait for
+    every write sent so far to complete. As adding a write never blocks,
+    callers writing very large numbers of documents should ``await``
+    :meth:`flush` periodically to bound the number of queued batches.
+
+    .. code-block:: python
+
+       >>> async with client.bulk_writer() as bulk_writer:
+       ...     for doc_id, data in rows:
+       ...         bulk_writer.set(collection.document(doc_id), data)
+
+    See :class:`~google.cloud.firestore_v1.base_bulk_writer.BaseBulkWriter`
+    for the constructor arguments.
+
+    Args:
+        client (:class:`~google.cloud.firestore_v1.async_client.AsyncClient`):
+            The client that created this bulk writer.
+        kwargs: Options for the bulk writer.
+    """
+
+    def __init__(self, client, **kwargs) -> None:
+        super(AsyncBulkWriter, self).__init__(client, **kwargs)
+        self._in_flight = asyncio.Semaphore(self._max_in_flight)
+        self._pending = set()
+
+    def _make_future(self) -> asyncio.Future:
+        return asyncio.get_event_loop().create_future()
+
+    def _send_operations(self, operations) -> None:
+        task = asyncio.ensure_future(self._run_batch(operations))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _wait_for_capacity(self, num_ops: int) -> None:
+        if self._rate_limiter is None:
+            return
+        while True:
+            delay = self._rate_limiter.try_acquire(num_ops)
+            if not delay:
+                return
+            await asyncio.sleep(delay)
+
+    async def _run_batch(self, operations) -> None:
+        """Send a batch of writes, retrying those which fail transiently.
+
+        Args:
+            operations (List[_BulkWriteOperation]): The writes to be sent.
+        """
+        async with self._in_flight:
+            current_sleep = _INITIAL_SLEEP
+            while operations:
+                await self._wait_for_capacity(len(operations))
+                request = self._prep_batch_write(operations)
+                try:
+                    response = await self._client._firestore_api.batch_write(
+                        request=request, metadata=self._client._rpc_metadata,
+                    )
+                except Exception as exc:
+                    operations = self._process_error(operations, exc)
+                else:
+                    operations = self._process_response(operations, response)
+                self._client._invalidate_writes(request["writes"])
+
+                if operations:
+                    current_sleep = await _sleep(current_sleep)
+
+    async def flush(self) -> None:
+        """Send the queued writes and wait for all writes to complete.
+
+        Completing means that the future of each write has its result or
+        exception set: failed writes do not raise from this method.
+        """
+        self._send_batch()
+        while self._pending:
+            await asyncio.wait(list(self._pending))
+
+    async def close(self) -> None:
+        """Flush the bulk writer, then stop accepting writes."""
+        if self._closed:
+            return
+        await self.flush()
+        self._closed = True
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
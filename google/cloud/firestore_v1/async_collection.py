@@ -26,10 +26,12 @@ from google.cloud.firestore_v1 import (
     async_document,
 )
 
+from google.cloud.firestore_v1.async_watch import AsyncWatch
+from google.cloud.firestore_v1.base_query import QueryPage
 from google.cloud.firestore_v1.document import DocumentReference
 
 from typing import AsyncIterator
-from typing import Any, AsyncGenerator, Tuple
+from typing import Any, AsyncGenerator, Callable, Iterable, Tuple
 
 # Types needed only for Type Hints
 from google.cloud.firestore_v1.transaction import Transaction
@@ -179,6 +181,9 @@ class AsyncCollectionReference(BaseCollectionReference):
         transaction: Transaction = None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
         timeout: float = None,
+        lazy: bool = False,
+        frozen: bool = None,
+        resumable: bool = False,
     ) -> AsyncIterator[async_document.DocumentSnapshot]:
         """Read the documents in this collection.
 
@@ -191,7 +196,8 @@ class AsyncCollectionReference(BaseCollectionReference):
            The underlying stream of responses will time out after
            the ``max_rpc_timeout_millis`` value set in the GAPIC
            client configuration for the ``RunQuery`` API.  Snapshots
-           not consumed from the iterator before that point will be lost.
+           not consumed from the iterator before that point will be lost,
+           unless ``resumable`` is :data:`True`.
 
         If a ``transaction`` is used and it already has write operations
         added, this method cannot be used (i.e. read-after-write is not
@@ -205,6 +211,17 @@ class AsyncCollectionReference(BaseCollectionReference):
                 should be retried.  Defaults to a system-specified policy.
             timeout (float): The timeout for this request.  Defaults to a
                 system-specified value.
+            lazy (bool): If :data:`True`, yield
+                :class:`~google.cloud.firestore_v1.base_document.LazyDocumentSnapshot`
+                instances which only decode the fields that are read.
+            frozen (Optional[bool]): If :data:`True`, yield
+                :class:`~google.cloud.firestore_v1.base_document.FrozenDocumentSnapshot`
+                instances whose data is read-only and never copied. Defaults
+                to the client's ``frozen_snapshots`` setting.
+            resumable (bool): If :data:`True`, restart the query after the
+                last document received when the stream fails with a
+                transient error, so that each document is still yielded
+                exactly once.
 
         Yields:
             :class:`~google.cloud.firestore_v1.document.DocumentSnapshot`:
@@ -212,5 +229,110 @@ class AsyncCollectionReference(BaseCollectionReference):
         """
         query, kwargs = self._prep_get_or_stream(retry, timeout)
 
-        async for d in query.stream(transaction=transaction, **kwargs):
+        async for d in query.stream(
+            transaction=transaction,
+            lazy=lazy,
+            frozen=frozen,
+            resumable=resumable,
+            **kwargs,
+        ):
             yield d  # pytype: disable=name-error
+
+    async def paginate(
+        self,
+        page_size: int,
+        start_after: bytes = None,
+        prefetch: bool = False,
+        transaction: Transaction = None,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = None,
+        lazy: bool = False,
+        frozen: bool = None,
+    ) -> AsyncIterator[QueryPage]:
+        """Read the documents in this collection, one page at a time.
+
+        See :meth:`~google.cloud.firestore_v1.async_query.AsyncQuery.paginate`.
+
+        Args:
+            page_size (int): The maximum number of documents in each page.
+            start_after (Optional[bytes]): The ``cursor`` of a page from a
+                previous pagination of this collection.
+            prefetch (bool): If :data:`True`, fetch the next page in a
+                background task while the caller processes the current one.
+            transaction (Optional[:class:`~google.cloud.firestore_v1.transaction.\
+                Transaction`]):
+                An existing transaction that the query will run in.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.  Defaults to a system-specified policy.
+            timeout (float): The timeout for each request.  Defaults to a
+                system-specified value.
+            lazy (bool): If :data:`True`, pages hold
+                :class:`~google.cloud.firestore_v1.base_document.LazyDocumentSnapshot`
+                instances which only decode the fields that are read.
+            frozen (Optional[bool]): If :data:`True`, pages hold
+                :class:`~google.cloud.firestore_v1.base_document.FrozenDocumentSnapshot`
+                instances.  Defaults to the client's ``frozen`` setting.
+
+        Yields:
+            :class:`~google.cloud.firestore_v1.base_query.QueryPage`:
+            The next page of documents in this collection.
+        """
+        query, kwargs = self._prep_get_or_stream(retry, timeout)
+
+        async for page in query.paginate(
+            page_size,
+            start_after=start_after,
+            prefetch=prefetch,
+            transaction=transaction,
+            lazy=lazy,
+            frozen=frozen,
+            **kwargs,
+        ):
+            yield page
+
+    def on_snapshot(
+        self,
+        callback: Callable,
+        changes_only: bool = False,
+        fields: Iterable[str] = None,
+    ) -> AsyncWatch:
+        """Monitor the documents in this collection.
+
+        See :meth:`~google.cloud.firestore_v1.async_query.AsyncQuery.on_snapshot`.
+
+        Args:
+            callback(Callable[[List[:class:`~google.cloud.firestore.document.DocumentSnapshot`], List, datetime.datetime], Any]):
+                a callback to run when a change occurs.
+            changes_only (bool): If True, ``callback`` is only passed the
+                changes and read time of each snapshot.
+            fields (Optional[Iterable[str]]): The only fields kept for
+                each document.
+
+        Returns:
+            :class:`~google.cloud.firestore_v1.async_watch.AsyncWatch`:
+            The started watch.
+        """
+        return self._query().on_snapshot(
+            callback, changes_only=changes_only, fields=fields
+        )
+
+    def listen(
+        self, changes_only: bool = False, fields: Iterable[str] = None
+    ) -> AsyncWatch:
+        """Monitor the documents in this collection, iterating over snapshots.
+
+        See :meth:`~google.cloud.firestore_v1.async_query.AsyncQuery.listen`.
+
+        Args:
+            changes_only (bool): If True, the ``documents`` of each
+                snapshot are None.
+            fields (Optional[Iterable[str]]): The only fields kept for
+                each document.
+
+        Returns:
+            :class:`~google.cloud.firestore_v1.async_watch.AsyncWatch`:
+            An async iterator of
+            :class:`~google.cloud.firestore_v1.async_watch.WatchSnapshot`
+            instances, which stops once the watch is closed.
+        """
+        return self._query().listen(changes_only=changes_only, fields=fields)
@@ -14,6 +14,8 @@
 
 """Classes for representing documents for the Google Cloud Firestore API."""
 
+import functools
+
 from google.api_core import gapic_v1  # type: ignore
 from google.api_core import retry as retries  # type: ignore
 
@@ -25,9 +27,10 @@ from google.cloud.firestore_v1.base_document import (
 
 from google.api_core import exceptions  # type: ignore
 from google.cloud.firestore_v1 import _helpers
+from google.cloud.firestore_v1.async_watch import AsyncWatch
 from google.cloud.firestore_v1.types import write
 from google.protobuf import timestamp_pb2
-from typing import Any, AsyncGenerator, Coroutine, Iterable, Union
+from typing import Any, AsyncGenerator, Callable, Coroutine, Iterable, Union
 
 
 class AsyncDocumentReference(BaseDocumentReference):
@@ -310,9 +313,12 @@ class AsyncDocumentReference(BaseDocumentReference):
         """
         request, kwargs = self._prep_delete(option, retry, timeout)
 
-        commit_response = await self._client._firestore_api.commit(
-            request=request, metadata=self._client._rpc_metadata, **kwargs,
-        )
+        try:
+            commit_response = await self._client._firestore_api.commit(
+                request=request, metadata=self._client._rpc_metadata, **kwargs,
+            )
+        finally:
+            self._client._invalidate_writes(request["writes"])
 
         return commit_response.commit_time
 
@@ -322,6 +328,8 @@ class AsyncDocumentReference(BaseDocumentReference):
         transaction=None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
         timeout: float = None,
+        lazy: bool = False,
+        frozen: bool = None,
     ) -> Union[DocumentSnapshot, Coroutine[Any, Any, DocumentSnapshot]]:
         """Retrieve a snapshot of the current document.
 
@@ -344,6 +352,13 @@ class AsyncDocumentReference(BaseDocumentReference):
                 should be retried.  Defaults to a system-specified policy.
             timeout (float): The timeout for this request.  Defaults to a
                 system-specified value.
+            lazy (bool): If :data:`True`, return a
+                :class:`~google.cloud.firestore_v1.base_document.LazyDocumentSnapshot`
+                which only decodes the fields that are read.
+            frozen (Optional[bool]): If :data:`True`, return a
+                :class:`~google.cloud.firestore_v1.base_document.FrozenDocumentSnapshot`
+                whose data is read-only and never copied. Defaults to the
+                client's ``frozen_snapshots`` setting.
 
         Returns:
             :class:`~google.cloud.firestore_v1.base_document.DocumentSnapshot`:
@@ -355,30 +370,48 @@ class AsyncDocumentReference(BaseDocumentReference):
         """
         request, kwargs = self._prep_get(field_paths, transaction, retry, timeout)
 
-        firestore_api = self._client._firestore_api
+        cache = self._get_cache(field_paths, transaction)
+        found = False
+        if cache is not None:
+            version = cache.version
+            found, document_pb = cache.lookup(self._document_path)
+
+        if not found:
+            document_pb = await self._fetch(request, kwargs, transaction)
+            if cache is not None:
+                cache.store(self._document_path, document_pb, version, reference=self)
+
+        return self._snapshot_from_pb(document_pb, lazy=lazy, frozen=frozen)
+
+    async def _fetch(self, request: dict, kwargs: dict, transaction=None):
+        """Fetch the document for :meth:`get`.
+
+        Outside of a transaction, the read is shared with concurrent
+        identical reads or merged into a batch, if the client does so.
+
+        Returns:
+            Optional[google.cloud.firestore_v1.types.Document]: The
+            document, or :data:`None` if it does not exist.
+        """
+        client = self._client
+        if transaction is None and client._batch_getter is not None:
+            return await client._batch_getter.get(
+                self._document_path, request["mask"], kwargs
+            )
+        if transaction is None and client._single_flight is not None:
+            return await client._single_flight.do(
+                self._single_flight_key(request, kwargs),
+                functools.partial(self._get_document, request, kwargs),
+            )
+        return await self._get_document(request, kwargs)
+
+    async def _get_document(self, request: dict, kwargs: dict):
         try:
-            document_pb = await firestore_api.get_document(
+            return await self._client._firestore_api.get_document(
                 request=request, metadata=self._client._rpc_metadata, **kwargs,
             )
         except exceptions.NotFound:
-            data = None
-            exists = False
-            create_time = None
-            update_time = None
-        else:
-            data = _helpers.decode_dict(document_pb.fields, self._client)
-            exists = True
-            create_time = document_pb.create_time
-            update_time = document_pb.update_time
-
-        return DocumentSnapshot(
-            reference=self,
-            data=data,
-            exists=exists,
-            read_time=None,  # No server read_time available
-            create_time=create_time,
-            update_time=update_time,
-        )
+            return None
 
     async def collections(
         self,
@@ -411,3 +444,93 @@ class AsyncDocumentReference(BaseDocumentReference):
 
         async for collection_id in iterator:
             yield self.collection(collection_id)
+
+    def on_snapshot(
+        self,
+        callback: Callable,
+        changes_only: bool = False,
+        fields: Iterable[str] = None,
+    ) -> AsyncWatch:
+        """Watch this document.
+
+        This starts a watch on this document in a task of the running event
+        loop, so it must be called from a coroutine. The provided callback
+        is run on each snapshot; if it is a coroutine function, the watch
+        awaits it before reading further changes.
+
+        Args:
+            callback(Callable[[List[:class:`~google.cloud.firestore.document.DocumentSnapshot`], List, datetime.datetime], Any]):
+                a callback to run when a change occurs
+            changes_only (bool): If True, ``callback`` is only passed the
+                changes (with the change to this document, if any) and read
+                time of each snapshot; the current snapshot of the document
+                is returned on request by
+                :meth:`~google.cloud.firestore_v1.watch.Watch.documents`.
+            fields (Optional[Iterable[str]]): If passed, the watch keeps
+                only these fields of the document, in a compact
+                :class:`~google.cloud.firestore_v1.base_document.ProjectedDocumentSnapshot`.
+
+        Example:
+
+        .. code-block:: python
+
+            from google.cloud import firestore_v1
+
+            db = firestore_v1.AsyncClient()
+
+            async def on_snapshot(document_snapshot, changes, read_time):
+                for doc in document_snapshot:
+                    print(u'{} => {}'.format(doc.id, doc.to_dict()))
+
+            doc_ref = db.collection(u'users').document(u'alovelace')
+
+            # Watch this document
+            doc_watch = doc_ref.on_snapshot(on_snapshot)
+
+            # Terminate this watch
+            doc_watch.unsubscribe()
+        """
+        return AsyncWatch.for_document(
+            self,
+            callback,
+            DocumentSnapshot,
+            AsyncDocumentReference,
+            changes_only=changes_only,
+            fields=fields,
+        )
+
+    def listen(
+        self, changes_only: bool = False, fields: Iterable[str] = None
+    ) -> AsyncWatch:
+        """Watch this document, iterating over its snapshots.
+
+        Must be called from a coroutine, see :meth:`on_snapshot`.
+
+        Example:
+
+        .. code-block:: python
+
+            async for snapshot in doc_ref.listen():
+                for doc in snapshot.documents:
+                    print(u'{} => {}'.format(doc.id, doc.to_dict()))
+
+        Args:
+            changes_only (bool): If True, the ``documents`` of each
+                snapshot are None; see :meth:`on_snapshot`.
+            fields (Optional[Iterable[str]]): The only fields kept for
+                each document; see :meth:`on_snapshot`.
+
+        Returns:
+            :class:`~google.cloud.firestore_v1.async_watch.AsyncWatch`:
+            An async iterator of
+            :class:`~google.cloud.firestore_v1.async_watch.WatchSnapshot`
+            instances, which stops once the watch is closed.
+        """
+        return AsyncWatch.for_document(
+            self,
+            None,
+            DocumentSnapshot,
+            AsyncDocumentReference,
+            changes_only=changes_only,
+            fields=fields,
+        )
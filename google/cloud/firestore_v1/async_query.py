@@ -19,20 +19,32 @@ a :class:`~google.cloud.firestore_v1.collection.Collection` and that can be
 a more common way to create a query than direct usage of the constructor.
 """
 
+import asyncio
+import functools
+
 from google.api_core import gapic_v1  # type: ignore
 from google.api_core import retry as retries  # type: ignore
 
 from google.cloud.firestore_v1.base_query import (
     BaseCollectionGroup,
     BaseQuery,
+    QueryPage,
     QueryPartition,
-    _query_response_to_snapshot,
-    _collection_group_query_response_to_snapshot,
+    _MAX_RESUME_ATTEMPTS,
+    _PARALLEL_STREAM_BUFFER,
+    _PARTITION_DONE,
+    _PartitionError,
+    _RESUMABLE_ERRORS,
+    _encode_page_cursor,
     _enum_from_direction,
 )
 
 from google.cloud.firestore_v1 import async_document
-from typing import AsyncGenerator
+from google.cloud.firestore_v1.async_watch import AsyncWatch
+from google.cloud.firestore_v1.base_transaction import _INITIAL_SLEEP
+from google.cloud.firestore_v1.base_transaction import _MAX_SLEEP
+from google.cloud.firestore_v1.base_transaction import _MULTIPLIER
+from typing import AsyncGenerator, Callable, Iterable
 
 # Types needed only for Type Hints
 from google.cloud.firestore_v1.transaction import Transaction
@@ -161,18 +173,49 @@ class AsyncQuery(BaseQuery):
                 )
             self._limit_to_last = False
 
-        result = self.stream(transaction=transaction, retry=retry, timeout=timeout)
-        result = [d async for d in result]
+        if transaction is None and self._client._single_flight is not None:
+            result = await self._get_shared(retry, timeout)
+        else:
+            result = self.stream(transaction=transaction, retry=retry, timeout=timeout)
+            result = [d async for d in result]
         if is_limited_to_last:
             result = list(reversed(result))
 
         return result
 
+    async def _get_shared(
+        self, retry: retries.Retry = gapic_v1.method.DEFAULT, timeout: float = None,
+    ) -> list:
+        """Run the query for :meth:`get`, sharing the ``RunQuery`` RPC with
+        concurrent identical calls.
+
+        The responses are shared, while each caller gets its own snapshots.
+        """
+        request, expected_prefix, kwargs = self._prep_stream(None, retry, timeout)
+        responses = await self._client._single_flight.do(
+            self._single_flight_key(request, kwargs),
+            functools.partial(self._run_query, request, kwargs),
+        )
+        snapshots = [
+            self._response_to_snapshot(response, expected_prefix)
+            for response in responses
+        ]
+        return [snapshot for snapshot in snapshots if snapshot is not None]
+
+    async def _run_query(self, request: dict, kwargs: dict) -> list:
+        response_iterator = await self._client._firestore_api.run_query(
+            request=request, metadata=self._client._rpc_metadata, **kwargs,
+        )
+        return [response async for response in response_iterator]
+
     async def stream(
         self,
         transaction=None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
         timeout: float = None,
+        lazy: bool = False,
+        frozen: bool = None,
+        resumable: bool = False,
     ) -> AsyncGenerator[async_document.DocumentSnapshot, None]:
         """Read the documents in the collection that match this query.
 
@@ -185,7 +228,8 @@ class AsyncQuery(BaseQuery):
            The underlying stream of responses will time out after
            the ``max_rpc_timeout_millis`` value set in the GAPIC
            client configuration for the ``RunQuery`` API.  Snapshots
-           not consumed from the iterator before that point will be lost.
+           not consumed from the iterator before that point will be lost,
+           unless ``resumable`` is :data:`True`.
 
         If a ``transaction`` is used and it already has write operations
         added, this method cannot be used (i.e. read-after-write is not
@@ -199,11 +243,38 @@ class AsyncQuery(BaseQuery):
                 should be retried.  Defaults to a system-specified policy.
             timeout (float): The timeout for this request.  Defaults to a
                 system-specified value.
+            lazy (bool): If :data:`True`, yield
+                :class:`~google.cloud.firestore_v1.base_document.LazyDocumentSnapshot`
+                instances which only decode the fields that are read.
+            frozen (Optional[bool]): If :data:`True`, yield
+                :class:`~google.cloud.firestore_v1.base_document.FrozenDocumentSnapshot`
+                instances whose data is read-only and never copied. Defaults
+                to the client's ``frozen_snapshots`` setting.
+            resumable (bool): If :data:`True`, restart the query after the
+                last document received when the stream fails with a
+                transient error, adjusting its limit and offset, so that
+                each document is still yielded exactly once. When the query
+                selects fields, the fields it is ordered by are selected
+                as well.
 
         Yields:
             :class:`~google.cloud.firestore_v1.async_document.DocumentSnapshot`:
             The next document that fulfills the query.
         """
+        if resumable:
+            stream_kwargs = {
+                "transaction": transaction,
+                "retry": retry,
+                "timeout": timeout,
+                "lazy": lazy,
+                "frozen": frozen,
+            }
+            async for snapshot in _resumable_stream(
+                self, _MAX_RESUME_ATTEMPTS, stream_kwargs
+            ):
+                yield snapshot
+            return
+
         request, expected_prefix, kwargs = self._prep_stream(
             transaction, retry, timeout,
         )
@@ -213,17 +284,196 @@ class AsyncQuery(BaseQuery):
         )
 
         async for response in response_iterator:
-            if self._all_descendants:
-                snapshot = _collection_group_query_response_to_snapshot(
-                    response, self._parent
-                )
-            else:
-                snapshot = _query_response_to_snapshot(
-                    response, self._parent, expected_prefix
-                )
+            snapshot = self._response_to_snapshot(
+                response, expected_prefix, lazy=lazy, frozen=frozen
+            )
             if snapshot is not None:
                 yield snapshot
 
+    async def paginate(
+        self,
+        page_size: int,
+        start_after: bytes = None,
+        prefetch: bool = False,
+        transaction=None,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = None,
+        lazy: bool = False,
+        frozen: bool = None,
+    ) -> AsyncGenerator[QueryPage, None]:
+        """Read the documents matching this query, one page at a time.
+
+        Each page is fetched with its own ``RunQuery`` request, limited to
+        ``page_size`` documents and starting after the last document of
+        the previous page, so no server stream stays open between pages.
+        The limit and offset of this query apply across all pages.
+
+        Each page carries a serialized ``cursor``: passing it back as
+        ``start_after`` continues the pagination after that page, e.g. in
+        another process, and the limit of this query still applies. When
+        the query selects fields, the fields it is ordered by are selected
+        as well, as each page starts after their values in the last
+        document of the previous page.
+
+        Args:
+            page_size (int): The maximum number of documents in each page.
+            start_after (Optional[bytes]): The ``cursor`` of a page from a
+                previous pagination of this query.
+            prefetch (bool): If :data:`True`, fetch the next page in a
+                background task while the caller processes the current one.
+            transaction
+                (Optional[:class:`~google.cloud.firestore_v1.async_transaction.AsyncTransaction`]):
+                An existing transaction that this query will run in.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.  Defaults to a system-specified policy.
+            timeout (float): The timeout for each request.  Defaults to a
+                system-specified value.
+            lazy (bool): If :data:`True`, pages hold
+                :class:`~google.cloud.firestore_v1.base_document.LazyDocumentSnapshot`
+                instances which only decode the fields that are read.
+            frozen (Optional[bool]): If :data:`True`, pages hold
+                :class:`~google.cloud.firestore_v1.base_document.FrozenDocumentSnapshot`
+                instances whose data is read-only and never copied. Defaults
+                to the client's ``frozen_snapshots`` setting.
+
+        Yields:
+            :class:`~google.cloud.firestore_v1.base_query.QueryPage`:
+            The next non-empty page of documents.
+
+        Raises:
+            ValueError: If ``page_size`` is not positive, the query uses
+                ``limit_to_last``, or ``start_after`` does not match the
+                orders of the query.
+        """
+        orders, cursor, num_fetched = self._prep_paginate(page_size, start_after)
+        stream_kwargs = {
+            "transaction": transaction,
+            "retry": retry,
+            "timeout": timeout,
+            "lazy": lazy,
+            "frozen": frozen,
+        }
+
+        async def fetch(page_query):
+            return [snapshot async for snapshot in page_query.stream(**stream_kwargs)]
+
+        page_query = self._page_query(orders, cursor, page_size, num_fetched)
+        next_page = None
+        try:
+            while page_query is not None:
+                if next_page is not None:
+                    snapshots = await next_page
+                    next_page = None
+                else:
+                    snapshots = await fetch(page_query)
+                if not snapshots:
+                    return
+
+                num_fetched += len(snapshots)
+                cursor = self._page_cursor(snapshots[-1], orders)
+                if len(snapshots) < page_query._limit:
+                    page_query = None
+                else:
+                    page_query = self._page_query(
+                        orders, cursor, page_size, num_fetched
+                    )
+                if prefetch and page_query is not None:
+                    next_page = asyncio.ensure_future(fetch(page_query))
+
+                yield QueryPage(snapshots, _encode_page_cursor(cursor, num_fetched))
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+    def on_snapshot(
+        self,
+        callback: Callable,
+        changes_only: bool = False,
+        fields: Iterable[str] = None,
+    ) -> AsyncWatch:
+        """Monitor the documents in this collection that match this query.
+
+        This starts a watch on this query in a task of the running event
+        loop, so it must be called from a coroutine. The provided callback
+        is run on each snapshot of the documents; if it is a coroutine
+        function, the watch awaits it before reading further changes.
+
+        Args:
+            callback(Callable[[List[:class:`~google.cloud.firestore.document.DocumentSnapshot`], List, datetime.datetime], Any]):
+                a callback to run when a change occurs.
+            changes_only (bool): If True, ``callback`` is only passed the
+                changes and read time of each snapshot; the ordered
+                documents are built on request by
+                :meth:`~google.cloud.firestore_v1.watch.Watch.documents`.
+            fields (Optional[Iterable[str]]): If passed, the watch keeps
+                only these fields of each document (and those the query is
+                ordered by), in a compact
+                :class:`~google.cloud.firestore_v1.base_document.ProjectedDocumentSnapshot`.
+
+        Example:
+
+        .. code-block:: python
+
+            from google.cloud import firestore_v1
+
+            db = firestore_v1.AsyncClient()
+            query_ref = db.collection(u'users').where("user", "==", u'Ada')
+
+            async def on_snapshot(docs, changes, read_time):
+                for doc in docs:
+                    print(u'{} => {}'.format(doc.id, doc.to_dict()))
+
+            # Watch this query
+            query_watch = query_ref.on_snapshot(on_snapshot)
+
+            # Terminate this watch
+            query_watch.unsubscribe()
+        """
+        return AsyncWatch.for_query(
+            self,
+            callback,
+            async_document.DocumentSnapshot,
+            async_document.AsyncDocumentReference,
+            changes_only=changes_only,
+            fields=fields,
+        )
+
+    def listen(
+        self, changes_only: bool = False, fields: Iterable[str] = None
+    ) -> AsyncWatch:
+        """Monitor the documents matching this query, iterating over snapshots.
+
+        Must be called from a coroutine, see :meth:`on_snapshot`.
+
+        Example:
+
+        .. code-block:: python
+
+            async for snapshot in query_ref.listen():
+                for doc in snapshot.documents:
+                    print(u'{} => {}'.format(doc.id, doc.to_dict()))
+
+        Args:
+            changes_only (bool): If True, the ``documents`` of each
+                snapshot are None; see :meth:`on_snapshot`.
+            fields (Optional[Iterable[str]]): The only fields kept for
+                each document; see :meth:`on_snapshot`.
+
+        Returns:
+            :class:`~google.cloud.firestore_v1.async_watch.AsyncWatch`:
+            An async iterator of
+            :class:`~google.cloud.firestore_v1.async_watch.WatchSnapshot`
+            instances, which stops once the watch is closed.
+        """
+        return AsyncWatch.for_query(
+            self,
+            None,
+            async_document.DocumentSnapshot,
+            async_document.AsyncDocumentReference,
+            changes_only=changes_only,
+            fields=fields,
+        )
+
 
 class AsyncCollectionGroup(AsyncQuery, BaseCollectionGroup):
     """Represents a Collection Group in the Firestore API.
@@ -300,3 +550,178 @@ class AsyncCollectionGroup(AsyncQuery, BaseCollectionGroup):
             start_at = cursor
 
         yield QueryPartition(self, start_at, None)
+
+    async def parallel_stream(
+        self,
+        partition_count,
+        max_workers=None,
+        ordered=False,
+        max_buffered=_PARALLEL_STREAM_BUFFER,
+        max_attempts=_MAX_RESUME_ATTEMPTS,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = None,
+        lazy: bool = False,
+        frozen: bool = None,
+    ) -> AsyncGenerator[async_document.DocumentSnapshot, None]:
+        """Read the documents matching this query, streaming partitions in parallel.
+
+        The query is split with :meth:`get_partitions`, then up to
+        ``max_workers`` partitions are streamed concurrently, each from its
+        own task. Snapshots are handed over through bounded queues, so
+        tasks pause while the caller is behind. When a partition's stream
+        fails with a transient error, it is restarted after the last
+        snapshot it delivered.
+
+        Equality filters and projections are supported; inequality
+        filters, orders, limits and offsets are not.
+
+        Args:
+            partition_count (int): The desired maximum number of
+                partitions; see :meth:`get_partitions`.
+            max_workers (Optional[int]): The maximum number of partitions
+                streamed at once. Defaults to all of them.
+            ordered (bool): If :data:`True`, yield the snapshots in
+                document name order, one partition after the other. Otherwise
+                yield them in the order in which they arrive.
+            max_buffered (int): The maximum number of snapshots held in
+                memory, per partition when ``ordered`` is :data:`True`.
+            max_attempts (int): The maximum number of consecutive attempts
+                at streaming a partition without receiving a snapshot.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.  Defaults to a system-specified policy.
+            timeout (float): The timeout for each request.  Defaults to a
+                system-specified value.
+            lazy (bool): If :data:`True`, yield
+                :class:`~google.cloud.firestore_v1.base_document.LazyDocumentSnapshot`
+                instances which only decode the fields that are read.
+            frozen (Optional[bool]): If :data:`True`, yield
+                :class:`~google.cloud.firestore_v1.base_document.FrozenDocumentSnapshot`
+                instances whose data is read-only and never copied. Defaults
+                to the client's ``frozen_snapshots`` setting.
+
+        Yields:
+            :class:`~google.cloud.firestore_v1.async_document.DocumentSnapshot`:
+            The next document that fulfills the query.
+
+        Raises:
+            ValueError: If the query has orders, a limit or an offset.
+        """
+        partitions = [
+            partition
+            async for partition in self._prep_parallel_stream().get_partitions(
+                partition_count, retry=retry, timeout=timeout
+            )
+        ]
+        queries = self._partition_queries(partitions)
+        if ordered:
+            queues = [asyncio.Queue(max_buffered) for _ in queries]
+        else:
+            queues = [asyncio.Queue(max_buffered)] * len(queries)
+
+        stream_kwargs = {
+            "retry": retry,
+            "timeout": timeout,
+            "lazy": lazy,
+            "frozen": frozen,
+        }
+        # Workers take partitions in order, so with ``ordered`` the
+        # partition being drained is always being streamed (or done).
+        pending = iter(zip(queries, queues))
+        num_workers = min(max_workers or len(queries), len(queries))
+        workers = [
+            asyncio.ensure_future(
+                _stream_partitions(pending, max_attempts, stream_kwargs)
+            )
+            for _ in range(num_workers)
+        ]
+        try:
+            if ordered:
+                for partition_queue in queues:
+                    async for snapshot in _drain_partitions(partition_queue, 1):
+                        yield snapshot
+            else:
+                async for snapshot in _drain_partitions(queues[0], len(queries)):
+                    yield snapshot
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+
+async def _stream_partitions(pending, max_attempts, stream_kwargs):
+    """Stream partitions taken from ``pending`` until none are left."""
+    for query, partition_queue in pending:
+        await _stream_partition(query, partition_queue, max_attempts, stream_kwargs)
+
+
+async def _resumable_stream(query, max_attempts, stream_kwargs):
+    """Stream a query, restarting it after transient errors.
+
+    Args:
+        query (AsyncQuery): The query to stream.
+        max_attempts (int): The maximum number of consecutive attempts at
+            streaming without receiving a snapshot.
+        stream_kwargs (dict): Keyword arguments for :meth:`AsyncQuery.stream`.
+
+    Yields:
+        :class:`~google.cloud.firestore_v1.async_document.DocumentSnapshot`:
+        The next document that fulfills the query.
+    """
+    query = query._with_order_fields()
+    resumed = query
+    last_snapshot = None
+    num_delivered = 0
+    attempts = 0
+    delays = None
+    while resumed is not None:
+        attempts += 1
+        try:
+            async for snapshot in resumed.stream(**stream_kwargs):
+                last_snapshot = snapshot
+                num_delivered += 1
+                attempts = 0
+                delays = None
+                yield snapshot
+            return
+        except _RESUMABLE_ERRORS:
+            if attempts >= max_attempts:
+                raise
+            if delays is None:
+                delays = retries.exponential_sleep_generator(
+                    _INITIAL_SLEEP, _MAX_SLEEP, _MULTIPLIER
+                )
+            await asyncio.sleep(next(delays))
+            resumed = query._resume_after(last_snapshot, num_delivered)
+
+
+async def _stream_partition(query, partition_queue, max_attempts, stream_kwargs):
+    """Stream one partition into a queue, resuming after transient errors.
+
+    The queue receives each snapshot, then either ``_PARTITION_DONE`` or
+    a ``_PartitionError``.
+    """
+    try:
+        async for snapshot in _resumable_stream(query, max_attempts, stream_kwargs):
+            await partition_queue.put(snapshot)
+    except asyncio.CancelledError:
+        raise
+    except Exception as exc:
+        await partition_queue.put(_PartitionError(exc))
+    else:
+        await partition_queue.put(_PARTITION_DONE)
+
+
+async def _drain_partitions(partition_queue, num_partitions):
+    """Yield the snapshots queued for one or more partitions.
+
+    Raises:
+        Exception: The error which ended one of the partitions.
+    """
+    while num_partitions:
+        item = await partition_queue.get()
+        if item is _PARTITION_DONE:
+            num_partitions -= 1
+        elif isinstance(item, _PartitionError):
+            raise item.error
+        else:
+            yield item
@@ -0,0 +1,250 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Python client for Google Cloud Firestore Watch, on an asyncio event loop.
+
+Unlike :class:`~google.cloud.firestore_v1.watch.Watch`, which runs each
+listener on its own background threads, an :class:`AsyncWatch` is a single
+task reading the ``Listen`` stream of the ``grpc_asyncio`` transport.
+"""
+
+import asyncio
+import collections
+import inspect
+import logging
+
+from google.api_core import retry as retries  # type: ignore
+from grpc import aio  # type: ignore
+
+from google.cloud.firestore_v1.base_transaction import _INITIAL_SLEEP
+from google.cloud.firestore_v1.base_transaction import _MAX_SLEEP
+from google.cloud.firestore_v1.base_transaction import _MULTIPLIER
+from google.cloud.firestore_v1.watch import Watch
+from google.cloud.firestore_v1.watch import _maybe_wrap_exception
+from google.cloud.firestore_v1.watch import _should_recover
+from google.cloud.firestore_v1.watch import _should_terminate
+
+
+_LOGGER = logging.getLogger(__name__)
+
+WatchSnapshot = collections.namedtuple(
+    "WatchSnapshot", ["documents", "changes", "read_time"]
+)
+"""A consistent view of the watched documents.
+
+Attributes:
+    documents (Optional[List[DocumentSnapshot]]): The documents, in query
+        order, or None for a watch created with ``changes_only``.
+    changes (List[DocumentChange]): The changes since the previous
+        snapshot.
+    read_time (datetime.datetime): The time at which the snapshot was
+        obtained.
+"""
+
+
+class AsyncWatch(Watch):
+    """Listens to a document or query from the current event loop.
+
+    The watch is read by a task of the running event loop, so it must be
+    created from a coroutine. Snapshots are passed to ``snapshot_callback``
+    when one is given, and otherwise yielded by iterating the watch::
+
+        async for snapshot in query.listen():
+            ...
+
+    A stream which fails with a recoverable error is reopened after an
+    exponential backoff, resuming from the last snapshot delivered.
+
+    When iterating, the snapshots pushed while the consumer is busy are
+    merged as by a coalescing
+    :class:`~google.cloud.firestore_v1.snapshot_delivery.SnapshotDelivery`:
+    the next snapshot yielded has the documents and read time of the
+    latest one and the changes of all, in order. A slow consumer therefore
+    holds up a single snapshot rather than a queue of them.
+
+    Args:
+        document_reference: The document or query being watched.
+        firestore (~.firestore_v1.async_client.AsyncClient): The client
+            listening.
+        target (dict): The ``Target`` to listen to.
+        comparator (Callable[[DocumentSnapshot, DocumentSnapshot], int]):
+            Orders the documents of the target.
+        snapshot_callback (Optional[Callable]): Called with the
+            ``documents``, ``changes`` and ``read_time`` of each snapshot.
+            If it returns an awaitable, the watch awaits it before reading
+            further responses.
+        document_snapshot_cls: The class of the document snapshots.
+        document_reference_cls: The class of the document references.
+        sort_key: Optional key function ordering documents consistently
+            with ``comparator``, used instead of it when passed.
+        changes_only (bool): If True, ``snapshot_callback`` is called with
+            ``changes`` and ``read_time`` only, and the ``documents`` of the
+            snapshots yielded are None: :meth:`documents` builds them on
+            request.
+        fields (Optional[Tuple[Tuple[str, ...], ...]]): If passed, the
+            field paths (as field names) kept for each document.
+    """
+
+    def __init__(
+        self,
+        document_reference,
+        firestore,
+        target,
+        comparator,
+        snapshot_callback,
+        document_snapshot_cls,
+        document_reference_cls,
+        sort_key=None,
+        changes_only=False,
+        fields=None,
+    ):
+        self._init_state(
+            document_reference,
+            firestore,
+            target,
+            comparator,
+            self._on_push,
+            document_snapshot_cls,
+            document_reference_cls,
+            sort_key,
+            changes_only,
+            fields=fields,
+        )
+        self._callback = snapshot_callback
+        self._pending = collections.deque()
+        # The snapshot not yet yielded, merged with those pushed since.
+        self._unread = None
+        self._ready = asyncio.Event()
+        self._closed = False
+        self._error = None
+        self._call = None
+        self._delays = None
+        self._task = asyncio.ensure_future(self._run())
+
+    @property
+    def is_active(self):
+        """bool: True until this watch is closed or fails."""
+        return not self._closed
+
+    def close(self, reason=None):
+        """Stop listening.
+
+        This method is idempotent. Additional calls will have no effect.
+
+        Args:
+            reason (Any): The reason to close this. If None, this is
+                considered an "intentional" shutdown. Otherwise it is raised
+                by iterations of the watch.
+        """
+        if self._closed:
+            return
+        if reason is not None and not isinstance(reason, Exception):
+            reason = RuntimeError(reason)
+        self._finish(reason)
+        self._task.cancel()
+
+    async def aclose(self):
+        """Stop listening, and wait for the listen task to finish."""
+        self.close()
+        await asyncio.wait([self._task])
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while self._unread is None:
+            if self._closed:
+                if self._error is not None:
+                    raise self._error
+                raise StopAsyncIteration
+            self._ready.clear()
+            await self._ready.wait()
+        snapshot, self._unread = self._unread, None
+        return snapshot
+
+    def _on_push(self, *snapshot):
+        self._pending.append(snapshot)
+
+    async def _run(self):
+        try:
+            while True:
+                try:
+                    await self._listen()
+                except Exception as exc:
+                    exc = _maybe_wrap_exception(exc)
+                    if _should_terminate(exc) or not _should_recover(exc):
+                        raise exc
+                    _LOGGER.debug("Listen stream failed, resuming: %s", exc)
+
+                if self._delays is None:
+                    self._delays = retries.exponential_sleep_generator(
+                        _INITIAL_SLEEP, _MAX_SLEEP, _MULTIPLIER
+                    )
+                await asyncio.sleep(next(self._delays))
+        except Exception as exc:
+            _LOGGER.debug("Listen stream terminated: %s", exc)
+            self._finish(exc)
+        finally:
+            self._finish(None)
+
+    async def _listen(self):
+        """Read one ``Listen`` stream, until the server ends it."""
+        self._call = call = self._api.transport.listen(
+            metadata=self._firestore._rpc_metadata
+        )
+        await call.write(self._get_rpc_request())
+        while True:
+            response = await call.read()
+            if response is aio.EOF:
+                return
+
+            # The stream is healthy again: restart the backoff.
+            self._delays = None
+            self.on_snapshot(response)
+            await self._deliver()
+
+    async def _deliver(self):
+        while self._pending:
+            snapshot = self._pending.popleft()
+            if self._callback is None:
+                if self._changes_only:
+                    snapshot = (None,) + snapshot
+                self._push_unread(*snapshot)
+            else:
+                result = self._callback(*snapshot)
+                if inspect.isawaitable(result):
+                    await result
+
+    def _push_unread(self, documents, changes, read_time):
+        """Make a snapshot the next one yielded, merging it if need be."""
+        if self._unread is None:
+            self._unread = WatchSnapshot(documents, list(changes), read_time)
+        else:
+            # The changes of each snapshot lead from the documents of the
+            # previous one, so the concatenation leads to ``documents``.
+            self._unread.changes.extend(changes)
+            self._unread = self._unread._replace(
+                documents=documents, read_time=read_time
+            )
+        self._ready.set()
+
+    def _finish(self, error):
+        if self._closed:
+            return
+        self._closed = True
+        self._error = error
+        if self._call is not None:
+            self._call.cancel()
+            self._call = None
+        self._ready.set()
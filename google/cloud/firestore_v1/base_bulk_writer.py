@@ -0,0 +1,442 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Helpers for bulk writes to the Google Cloud Firestore API."""
+
+import time
+
+import grpc  # type: ignore
+
+from google.api_core import exceptions  # type: ignore
+
+from google.cloud.firestore_v1 import _helpers
+
+# Types needed only for Type Hints
+from google.cloud.firestore_v1.document import DocumentReference
+from google.cloud.firestore_v1.types import write
+
+from typing import Any, List, Union
+
+
+_MAX_BATCH_SIZE: int = 20
+"""int: Default number of writes sent in each ``BatchWrite`` request."""
+_MAX_BATCH_WRITE_SIZE: int = 500
+"""int: The most writes the server accepts in a single ``BatchWrite`` request."""
+_MAX_IN_FLIGHT: int = 10
+"""int: Default number of ``BatchWrite`` requests sent concurrently."""
+_MAX_ATTEMPTS: int = 10
+"""int: Default number of attempts made for each write."""
+_INITIAL_OPS_PER_SECOND: int = 500
+"""int: Initial write rate, following the 500/50/5 ramp-up rule."""
+_OPS_PER_SECOND_MULTIPLIER: float = 1.5
+"""float: Growth of the write rate after each :data:`_RAMP_UP_PERIOD`."""
+_RAMP_UP_PERIOD: float = 5 * 60.0
+"""float: Seconds between increases of the write rate."""
+_MAX_OPS_PER_SECOND: int = 10000
+"""int: Default ceiling for the write rate."""
+_RETRYABLE_CODES = frozenset(
+    (
+        grpc.StatusCode.ABORTED,
+        grpc.StatusCode.DEADLINE_EXCEEDED,
+        grpc.StatusCode.INTERNAL,
+        grpc.StatusCode.RESOURCE_EXHAUSTED,
+        grpc.StatusCode.UNAVAILABLE,
+    )
+)
+_GRPC_STATUS_CODES = {code.value[0]: code for code in grpc.StatusCode}
+_CLOSED_ERR: str = "Cannot add writes to a closed bulk writer."
+_BAD_BATCH_SIZE_TEMPLATE: str = "``max_batch_size`` must be between 1 and {:d}."
+
+
+class RateLimiter(object):
+    """Token bucket limiting the number of writes sent per second.
+
+    The capacity starts at ``initial_ops_per_second`` and is multiplied by
+    ``multiplier`` every ``ramp_up_period`` seconds, up to
+    ``max_ops_per_second``. With the defaults this follows the "500/50/5"
+    rule for ramping up traffic to Cloud Firestore: start at 500 operations
+    per second, then increase by 50% every 5 minutes.
+
+    Args:
+        initial_ops_per_second (int): The initial capacity.
+        max_ops_per_second (int): The maximum capacity.
+        multiplier (float): Growth of the capacity after each period.
+        ramp_up_period (float): Seconds between increases of the capacity.
+        clock (Callable[[], float]): Source of the current time, in seconds.
+    """
+
+    def __init__(
+        self,
+        initial_ops_per_second: int = _INITIAL_OPS_PER_SECOND,
+        max_ops_per_second: int = _MAX_OPS_PER_SECOND,
+        multiplier: float = _OPS_PER_SECOND_MULTIPLIER,
+        ramp_up_period: float = _RAMP_UP_PERIOD,
+        clock=time.monotonic,
+    ) -> None:
+        self._initial_ops_per_second = initial_ops_per_second
+        self._max_ops_per_second = max_ops_per_second
+        self._multiplier = multiplier
+        self._ramp_up_period = ramp_up_period
+        self._clock = clock
+        self._start_time = self._last_refill = clock()
+        self._available = float(initial_ops_per_second)
+
+    @property
+    def ops_per_second(self) -> float:
+        """float: The current capacity, in operations per second."""
+        periods = int((self._clock() - self._start_time) // self._ramp_up_period)
+        return self._capacity_after(periods)
+
+    def _capacity_after(self, periods: int) -> float:
+        capacity = float(self._initial_ops_per_second)
+        for _ in range(periods):
+            capacity *= self._multiplier
+            if capacity >= self._max_ops_per_second:
+                return float(self._max_ops_per_second)
+        return capacity
+
+    def try_acquire(self, num_ops: int) -> float:
+        """Take ``num_ops`` tokens from the bucket, if available.
+
+        Args:
+            num_ops (int): The number of operations about to be sent.
+
+        Returns:
+            float: ``0.0`` if the tokens were taken, otherwise the number of
+            seconds to wait before enough tokens are available.
+        """
+        capacity = self.ops_per_second
+        now = self._clock()
+        elapsed = now - self._last_refill
+        self._available = min(capacity, self._available + elapsed * capacity)
+        self._last_refill = now
+
+        # Never wait for more tokens than the bucket can hold.
+        num_ops = min(num_ops, capacity)
+        if self._available >= num_ops:
+            self._available -= num_ops
+            return 0.0
+        return (num_ops - self._available) / capacity
+
+
+class _BulkWriteOperation(object):
+    """A single write queued in a bulk writer.
+
+    Args:
+        write_pb (google.cloud.firestore_v1.types.Write): The write.
+        future (Union[concurrent.futures.Future, asyncio.Future]): Resolved
+            with the write's result.
+    """
+
+    __slots__ = ("write_pb", "future", "attempts")
+
+    def __init__(self, write_pb: write.Write, future) -> None:
+        self.write_pb = write_pb
+        self.future = future
+        self.attempts = 0
+
+
+class BaseBulkWriter(object):
+    """Send large numbers of independent writes efficiently.
+
+    Writes are grouped into ``BatchWrite`` requests, several of which are
+    sent concurrently. Unlike :class:`~google.cloud.firestore_v1.batch.WriteBatch`,
+    writes are not applied atomically nor in order: each write succeeds
+    or fails on its own, and those which fail with a transient error are
+    retried. The rate of writes is ramped up gradually, see
+    :class:`RateLimiter`.
+
+    Each write method returns a future, resolved with the
+    :class:`~google.cloud.firestore_v1.types.WriteResult` of the write or
+    with the :class:`~google.api_core.exceptions.GoogleAPICallError` that
+    made it fail.
+
+    Args:
+        client (:class:`~google.cloud.firestore_v1.client.Client`):
+            The client that created this bulk writer.
+        max_batch_size (Optional[int]): The number of writes sent in each
+            ``BatchWrite`` request, at most 500.
+        max_in_flight (Optional[int]): The number of ``BatchWrite``
+            requests sent concurrently.
+        max_attempts (Optional[int]): The number of attempts made for each
+            write before its future fails.
+        throttle (Optional[bool]): If :data:`False`, do not limit the rate
+            of writes.
+        initial_ops_per_second (Optional[int]): The initial rate of writes.
+        max_ops_per_second (Optional[int]): The maximum rate of writes.
+    """
+
+    def __init__(
+        self,
+        client,
+        max_batch_size: int = _MAX_BATCH_SIZE,
+        max_in_flight: int = _MAX_IN_FLIGHT,
+        max_attempts: int = _MAX_ATTEMPTS,
+        throttle: bool = True,
+        initial_ops_per_second: int = _INITIAL_OPS_PER_SECOND,
+        max_ops_per_second: int = _MAX_OPS_PER_SECOND,
+    ) -> None:
+        if not 0 < max_batch_size <= _MAX_BATCH_WRITE_SIZE:
+            raise ValueError(_BAD_BATCH_SIZE_TEMPLATE.format(_MAX_BATCH_WRITE_SIZE))
+        self._client = client
+        self._max_batch_size = max_batch_size
+        self._max_in_flight = max_in_flight
+        self._max_attempts = max_attempts
+        if throttle:
+            self._rate_limiter = RateLimiter(
+                initial_ops_per_second=initial_ops_per_second,
+                max_ops_per_second=max_ops_per_second,
+            )
+        else:
+            self._rate_limiter = None
+        self._operations = []
+        self._document_paths = set()
+        self._closed = False
+
+    def _make_future(self) -> Any:
+        """Create the future returned for a write.
+
+        This method intended to be over-ridden by subclasses.
+        """
+        raise NotImplementedError
+
+    def _send_operations(self, operations: List[_BulkWriteOperation]) -> None:
+        """Start sending a batch of writes.
+
+        This method intended to be over-ridden by subclasses.
+
+        Args:
+            operations (List[_BulkWriteOperation]): The writes to be sent.
+        """
+        raise NotImplementedError
+
+    def _add_write_pb(self, document_path: str, write_pb: write.Write) -> Any:
+        """Queue a ``Write`` protobuf, sending the current batch if needed.
+
+        A ``BatchWrite`` request may not contain more than one write for the
+        same document, so a second write to a document starts a new batch.
+
+        Args:
+            document_path (str): The path of the document being written.
+            write_pb (google.cloud.firestore_v1.types.Write): The write.
+
+        Returns:
+            Union[concurrent.futures.Future, asyncio.Future]: The future for
+            the result of the write.
+
+        Raises:
+            ValueError: If the bulk writer has been closed.
+        """
+        if self._closed:
+            raise ValueError(_CLOSED_ERR)
+
+        if document_path in self._document_paths:
+            self._send_batch()
+
+        operation = _BulkWriteOperation(write_pb, self._make_future())
+        self._operations.append(operation)
+        self._document_paths.add(document_path)
+
+        if len(self._operations) >= self._max_batch_size:
+            self._send_batch()
+
+        return operation.future
+
+    def _send_batch(self) -> None:
+        """Send the queued writes, if any."""
+        operations = self._operations
+        if operations:
+            self._operations = []
+            self._document_paths = set()
+            self._send_operations(operations)
+
+    def create(self, reference: DocumentReference, document_data: dict) -> Any:
+        """Queue a write to create a document.
+
+        If the document given by ``reference`` already exists, then the
+        returned future fails with
+        :class:`~google.api_core.exceptions.AlreadyExists`.
+
+        Args:
+            reference (:class:`~google.cloud.firestore_v1.document.DocumentReference`):
+                A document reference to be created.
+            document_data (dict): Property names and values to use for
+                creating a document.
+
+        Returns:
+            Union[concurrent.futures.Future, asyncio.Future]: The future for
+            the result of the write.
+        """
+        document_path = reference._document_path
+        (write_pb,) = _helpers.pbs_for_create(document_path, document_data)
+        return self._add_write_pb(document_path, write_pb)
+
+    def set(
+        self,
+        reference: DocumentReference,
+        document_data: dict,
+        merge: Union[bool, list] = False,
+    ) -> Any:
+        """Queue a write to replace a document.
+
+        See
+        :meth:`google.cloud.firestore_v1.document.DocumentReference.set` for
+        more information on how ``option`` determines how the change is
+        applied.
+
+        Args:
+            reference (:class:`~google.cloud.firestore_v1.document.DocumentReference`):
+                A document reference that will have values set.
+            document_data (dict):
+                Property names and values to use for replacing a document.
+            merge (Optional[bool] or Optional[List<apispec>]):
+                If True, apply merging instead of overwriting the state
+                of the document.
+
+        Returns:
+            Union[concurrent.futures.Future, asyncio.Future]: The future for
+            the result of the write.
+        """
+        document_path = reference._document_path
+        if merge is not False:
+            (write_pb,) = _helpers.pbs_for_set_with_merge(
+                document_path, document_data, merge
+            )
+        else:
+            (write_pb,) = _helpers.pbs_for_set_no_merge(document_path, document_data)
+        return self._add_write_pb(document_path, write_pb)
+
+    def update(
+        self,
+        reference: DocumentReference,
+        field_updates: dict,
+        option: _helpers.WriteOption = None,
+    ) -> Any:
+        """Queue a write to update a document.
+
+        See
+        :meth:`google.cloud.firestore_v1.document.DocumentReference.update`
+        for more information on ``field_updates`` and ``option``.
+
+        Args:
+            reference (:class:`~google.cloud.firestore_v1.document.DocumentReference`):
+                A document reference that will be updated.
+            field_updates (dict):
+                Field names or paths to update and values to update with.
+            option (Optional[:class:`~google.cloud.firestore_v1.client.WriteOption`]):
+                A write option to make assertions / preconditions on the server
+                state of the document before applying changes.
+
+        Returns:
+            Union[concurrent.futures.Future, asyncio.Future]: The future for
+            the result of the write.
+        """
+        if option.__class__.__name__ == "ExistsOption":
+            raise ValueError("you must not pass an explicit write option to " "update.")
+        document_path = reference._document_path
+        (write_pb,) = _helpers.pbs_for_update(document_path, field_updates, option)
+        return self._add_write_pb(document_path, write_pb)
+
+    def delete(
+        self, reference: DocumentReference, option: _helpers.WriteOption = None
+    ) -> Any:
+        """Queue a write to delete a document.
+
+        See
+        :meth:`google.cloud.firestore_v1.document.DocumentReference.delete`
+        for more information on how ``option`` determines how the change is
+        applied.
+
+        Args:
+            reference (:class:`~google.cloud.firestore_v1.document.DocumentReference`):
+                A document reference that will be deleted.
+            option (Optional[:class:`~google.cloud.firestore_v1.client.WriteOption`]):
+                A write option to make assertions / preconditions on the server
+                state of the document before applying changes.
+
+        Returns:
+            Union[concurrent.futures.Future, asyncio.Future]: The future for
+            the result of the write.
+        """
+        document_path = reference._document_path
+        write_pb = _helpers.pb_for_delete(document_path, option)
+        return self._add_write_pb(document_path, write_pb)
+
+    def _prep_batch_write(self, operations: List[_BulkWriteOperation]) -> dict:
+        """Shared setup for async/sync ``BatchWrite`` requests."""
+        for operation in operations:
+            operation.attempts += 1
+        return {
+            "database": self._client._database_string,
+            "writes": [operation.write_pb for operation in operations],
+        }
+
+    def _process_response(
+        self, operations: List[_BulkWriteOperation], response
+    ) -> List[_BulkWriteOperation]:
+        """Resolve the futures of writes using a ``BatchWriteResponse``.
+
+        Args:
+            operations (List[_BulkWriteOperation]): The writes sent.
+            response (~google.cloud.firestore_v1.types.BatchWriteResponse):
+                The response, with a result and a status for each write.
+
+        Returns:
+            List[_BulkWriteOperation]: The writes which should be retried.
+        """
+        to_retry = []
+        write_results = response.write_results
+        for operation, write_result, status in zip(
+            operations, write_results, response._pb.status
+        ):
+            code = _GRPC_STATUS_CODES.get(status.code, status.code)
+            if code == grpc.StatusCode.OK:
+                if not operation.future.done():
+                    operation.future.set_result(write_result)
+            else:
+                error = exceptions.from_grpc_status(code, status.message)
+                self._fail_or_retry(operation, error, to_retry)
+        return to_retry
+
+    def _process_error(
+        self, operations: List[_BulkWriteOperation], error: Exception
+    ) -> List[_BulkWriteOperation]:
+        """Handle a ``BatchWrite`` request which failed as a whole.
+
+        Args:
+            operations (List[_BulkWriteOperation]): The writes sent.
+            error (Exception): The error raised by the request.
+
+        Returns:
+            List[_BulkWriteOperation]: The writes which should be retried.
+        """
+        to_retry = []
+        for operation in operations:
+            self._fail_or_retry(operation, error, to_retry)
+        return to_retry
+
+    def _fail_or_retry(
+        self,
+        operation: _BulkWriteOperation,
+        error: Exception,
+        to_retry: List[_BulkWriteOperation],
+    ) -> None:
+        code = getattr(error, "grpc_status_code", None)
+        if operation.future.done():
+            # Cancelled by the caller.
+            return
+        if code in _RETRYABLE_CODES and operation.attempts < self._max_attempts:
+            to_retry.append(operation)
+        else:
+            operation.future.set_exception(error)
@@ -24,11 +24,14 @@ In the hierarchy of API concepts
   :class:`~google.cloud.firestore_v1.document.DocumentReference`
 """
 
+import collections
+import functools
 import os
 import grpc  # type: ignore
 
 import google.api_core.client_options  # type: ignore
 import google.api_core.path_template  # type: ignore
+from google.api_core import exceptions  # type: ignore
 from google.api_core import retry as retries  # type: ignore
 from google.api_core.gapic_v1 import client_info  # type: ignore
 from google.cloud.client import ClientWithProject  # type: ignore
@@ -37,11 +40,13 @@ from google.cloud.firestore_v1 import _helpers
 from google.cloud.firestore_v1 import __version__
 from google.cloud.firestore_v1 import types
 from google.cloud.firestore_v1.base_document import DocumentSnapshot
+from google.cloud.firestore_v1.base_document import _snapshot_class_and_data
 
 from google.cloud.firestore_v1.field_path import render_field_path
 from typing import (
     Any,
     AsyncGenerator,
+    Coroutine,
     Generator,
     Iterable,
     List,
@@ -55,7 +60,10 @@ from google.cloud.firestore_v1.base_collection import BaseCollectionReference
 from google.cloud.firestore_v1.base_document import BaseDocumentReference
 from google.cloud.firestore_v1.base_transaction import BaseTransaction
 from google.cloud.firestore_v1.base_batch import BaseWriteBatch
+from google.cloud.firestore_v1.base_bulk_writer import BaseBulkWriter
 from google.cloud.firestore_v1.base_query import BaseQuery
+from google.cloud.firestore_v1.channel_pool import ChannelOptions
+from google.cloud.firestore_v1.document_cache import DocumentCache
 
 
 DEFAULT_DATABASE = "(default)"
@@ -70,6 +78,16 @@ _ACTIVE_TXN: str = "There is already an active transaction."
 _INACTIVE_TXN: str = "There is no active transaction."
 _CLIENT_INFO: Any = client_info.ClientInfo(client_library_version=__version__)
 _FIRESTORE_EMULATOR_HOST: str = "FIRESTORE_EMULATOR_HOST"
+_BAD_CHUNK_SIZE: str = "Chunk size must be positive, got {!r}."
+_GET_ALL_CHUNK_SIZE: int = 1000
+_GET_ALL_MAX_IN_FLIGHT: int = 10
+_BAD_BATCH_GET_WINDOW: str = "``batch_get_window`` must be positive, got {!r}."
+_BAD_MAX_IN_FLIGHT: str = "``max_in_flight`` must be positive, got {!r}."
+_MAX_COMMIT_WRITES: int = 500
+"""int: The most writes the server accepts in a single ``Commit`` request."""
+_COMMIT_MANY_MAX_IN_FLIGHT: int = 10
+_COMMIT_MANY_MAX_ATTEMPTS: int = 5
+_RETRYABLE_COMMIT_ERRORS = (exceptions.Aborted, exceptions.ServiceUnavailable)
 
 
 class BaseClient(ClientWithProject):
@@ -98,6 +116,25 @@ class BaseClient(ClientWithProject):
         client_options (Union[dict, google.api_core.client_options.ClientOptions]):
             Client options used to set user options on the client. API Endpoint
             should be set through client_options.
+        frozen_snapshots (Optional[bool]): If :data:`True`, methods that
+            return document snapshots default to
+            :class:`~google.cloud.firestore_v1.base_document.FrozenDocumentSnapshot`
+            instances, whose data is read-only and never copied.
+        document_cache (Optional[~google.cloud.firestore_v1.document_cache.DocumentCache]):
+            A cache serving document reads, invalidated by the writes of
+            this client.
+        coalesce_reads (Optional[bool]): If :data:`True`, concurrent identical
+            document and query reads outside of a transaction share a single
+            RPC and its result.
+        batch_get_window (Optional[float]): If set, single-document reads
+            outside of a transaction started within this many seconds of
+            each other are sent as one ``BatchGetDocuments`` RPC.
+        channel_options (Optional[~google.cloud.firestore_v1.channel_pool.ChannelOptions]):
+            Settings of the gRPC channels of the client, including the size
+            of its channel pool. Ignored when connecting to the emulator.
+
+    Raises:
+        ValueError: If ``batch_get_window`` is not positive.
     """
 
     SCOPE = (
@@ -109,6 +146,9 @@ class BaseClient(ClientWithProject):
     _firestore_api_internal = None
     _database_string_internal = None
     _rpc_metadata_internal = None
+    _single_flight = None
+    _batch_getter = None
+    _listen_multiplexer = None
 
     def __init__(
         self,
@@ -117,6 +157,11 @@ class BaseClient(ClientWithProject):
         database=DEFAULT_DATABASE,
         client_info=_CLIENT_INFO,
         client_options=None,
+        frozen_snapshots=False,
+        document_cache=None,
+        coalesce_reads=False,
+        batch_get_window=None,
+        channel_options=None,
     ) -> None:
         # NOTE: This API has no use for the _http argument, but sending it
         #       will have no impact since the _http() @property only lazily
@@ -136,10 +181,40 @@ class BaseClient(ClientWithProject):
         self._client_options = client_options
 
         self._database = database
+        self._frozen_snapshots = frozen_snapshots
+        self._document_cache = document_cache
+        if batch_get_window is not None and batch_get_window <= 0:
+            raise ValueError(_BAD_BATCH_GET_WINDOW.format(batch_get_window))
+        if channel_options is None:
+            channel_options = ChannelOptions()
+        self._channel_options = channel_options
         self._emulator_host = os.getenv(_FIRESTORE_EMULATOR_HOST)
 
-    def _firestore_api_helper(self, transport, client_class, client_module) -> Any:
+    @property
+    def document_cache(self) -> Optional[DocumentCache]:
+        """Optional[~google.cloud.firestore_v1.document_cache.DocumentCache]:
+        The cache serving document reads, if any."""
+        return self._document_cache
+
+    def _invalidate_writes(self, write_pbs: Iterable[types.write.Write]) -> None:
+        """Drop the documents changed by some writes from the document cache.
+
+        Args:
+            write_pbs (Iterable[google.cloud.firestore_v1.types.Write]): The
+                writes sent by this client, committed or not.
+        """
+        if self._document_cache is not None:
+            self._document_cache.invalidate_writes(write_pbs)
+
+    def _firestore_api_helper(
+        self, transport, client_class, client_module, pool_class
+    ) -> Any:
         """Lazy-loading getter GAPIC Firestore API.
+
+        Args:
+            pool_class (type): The channel pool used when the client's
+                ``channel_options`` allow more than one channel.
+
         Returns:
             The GAPIC client with the credentials of the current client.
         """
@@ -150,11 +225,16 @@ class BaseClient(ClientWithProject):
             if self._emulator_host is not None:
                 channel = self._emulator_channel()
             else:
-                channel = transport.create_channel(
+                create_channel = functools.partial(
+                    transport.create_channel,
                     self._target,
                     credentials=self._credentials,
-                    options={"grpc.keepalive_time_ms": 30000}.items(),
+                    options=self._channel_options.grpc_options(),
                 )
+                if self._channel_options.pool_size > 1:
+                    channel = pool_class(create_channel, self._channel_options)
+                else:
+                    channel = create_channel()
 
             self._transport = transport(host=self._target, channel=channel)
 
@@ -402,19 +482,32 @@ class BaseClient(ClientWithProject):
         transaction: BaseTransaction = None,
         retry: retries.Retry = None,
         timeout: float = None,
-    ) -> Tuple[dict, dict, dict]:
-        """Shared setup for async/sync :meth:`get_all`."""
-        document_paths, reference_map = _reference_info(references)
+        chunk_size: int = _GET_ALL_CHUNK_SIZE,
+    ) -> Tuple[List[dict], dict, dict]:
+        """Shared setup for async/sync :meth:`get_all`.
+
+        Duplicate references are only requested once, and the documents are
+        split into requests of at most ``chunk_size`` documents each.
+        """
+        if chunk_size <= 0:
+            raise ValueError(_BAD_CHUNK_SIZE.format(chunk_size))
+
+        _, reference_map = _reference_info(references)
+        document_paths = list(reference_map)
         mask = _get_doc_mask(field_paths)
-        request = {
-            "database": self._database_string,
-            "documents": document_paths,
-            "mask": mask,
-            "transaction": _helpers.get_transaction_id(transaction),
-        }
+        transaction_id = _helpers.get_transaction_id(transaction)
+        requests = [
+            {
+                "database": self._database_string,
+                "documents": document_paths[index : index + chunk_size],
+                "mask": mask,
+                "transaction": transaction_id,
+            }
+            for index in range(0, len(document_paths), chunk_size)
+        ]
         kwargs = _helpers.make_retry_timeout_kwargs(retry, timeout)
 
-        return request, reference_map, kwargs
+        return requests, reference_map, kwargs
 
     def get_all(
         self,
@@ -423,6 +516,11 @@ class BaseClient(ClientWithProject):
         transaction: BaseTransaction = None,
         retry: retries.Retry = None,
         timeout: float = None,
+        lazy: bool = False,
+        frozen: bool = None,
+        chunk_size: int = _GET_ALL_CHUNK_SIZE,
+        max_in_flight: int = _GET_ALL_MAX_IN_FLIGHT,
+        ordered: bool = False,
     ) -> Union[
         AsyncGenerator[DocumentSnapshot, Any], Generator[DocumentSnapshot, Any, Any]
     ]:
@@ -448,6 +546,57 @@ class BaseClient(ClientWithProject):
     def batch(self) -> BaseWriteBatch:
         raise NotImplementedError
 
+    def _prep_commit_many(
+        self,
+        batches: List[BaseWriteBatch],
+        max_in_flight: int = _COMMIT_MANY_MAX_IN_FLIGHT,
+        retry: retries.Retry = None,
+        timeout: float = None,
+    ) -> Tuple[List[dict], List[int], dict]:
+        """Shared setup for async/sync :meth:`commit_many`.
+
+        The writes of each batch are split into ``Commit`` requests of at
+        most :data:`_MAX_COMMIT_WRITES` writes each. Empty batches send no
+        request.
+
+        Returns:
+            Tuple[List[dict], List[int], dict]: The requests, the number of
+            requests of each batch, and the retry and timeout arguments.
+        """
+        if max_in_flight <= 0:
+            raise ValueError(_BAD_MAX_IN_FLIGHT.format(max_in_flight))
+
+        requests = []
+        request_counts = []
+        for batch in batches:
+            write_pbs = batch._write_pbs
+            batch_requests = [
+                {
+                    "database": self._database_string,
+                    "writes": write_pbs[index : index + _MAX_COMMIT_WRITES],
+                    "transaction": None,
+                }
+                for index in range(0, len(write_pbs), _MAX_COMMIT_WRITES)
+            ]
+            requests.extend(batch_requests)
+            request_counts.append(len(batch_requests))
+        kwargs = _helpers.make_retry_timeout_kwargs(retry, timeout)
+
+        return requests, request_counts, kwargs
+
+    def commit_many(
+        self,
+        batches: Iterable[BaseWriteBatch],
+        max_in_flight: int = _COMMIT_MANY_MAX_IN_FLIGHT,
+        max_attempts: int = _COMMIT_MANY_MAX_ATTEMPTS,
+        retry: retries.Retry = None,
+        timeout: float = None,
+    ) -> Union[list, Coroutine[Any, Any, list]]:
+        raise NotImplementedError
+
+    def bulk_writer(self, **kwargs) -> BaseBulkWriter:
+        raise NotImplementedError
+
     def transaction(self, **kwargs) -> BaseTransaction:
         raise NotImplementedError
 
@@ -479,6 +628,206 @@ def _reference_info(references: list) -> Tuple[list, dict]:
     return document_paths, reference_map
 
 
+def _remaining_request(request: dict, received: set) -> dict:
+    """Narrow a ``BatchGetDocuments`` request to the documents not received.
+
+    Helper for retrying a chunk of
+    :meth:`~google.cloud.firestore_v1.client.Client.get_all`.
+
+    Args:
+        request (dict): The request which was interrupted.
+        received (Set[str]): Fully-qualified paths of the documents already
+            received for ``request``.
+
+    Returns:
+        Optional[dict]: The request for the remaining documents, or
+        :data:`None` if every document has been received.
+    """
+    remaining = [path for path in request["documents"] if path not in received]
+    if not remaining:
+        return None
+    return dict(request, documents=remaining)
+
+
+class CommitManyError(Exception):
+    """Raised when a request of ``commit_many`` fails.
+
+    The batches whose requests all succeeded are committed, emptied and
+    given their ``write_results`` and ``commit_time``; the other batches
+    keep their writes. A batch of more than 500 writes which was not
+    committed may still have had some of its requests applied.
+
+    Args:
+        errors (Dict[int, Exception]): The error of each failed batch, by
+            index in ``batches``.
+        committed (List[int]): The indices of the batches committed.
+        unsent (List[int]): The indices of the batches which did not fail,
+            but were not committed as requests were dropped.
+        write_results (List[google.cloud.firestore_v1.types.WriteResult]):
+            The write results of the committed batches, in order.
+    """
+
+    def __init__(self, errors, committed, unsent, write_results):
+        self.errors = errors
+        self.committed = committed
+        self.unsent = unsent
+        self.write_results = write_results
+        super(CommitManyError, self).__init__(
+            "Batches {} failed and batches {} were not sent; "
+            "batches {} were committed".format(sorted(errors), unsent, committed)
+        )
+
+    @property
+    def failed(self) -> List[int]:
+        """List[int]: The indices of the batches which failed."""
+        return sorted(self.errors)
+
+
+def _finish_commit_many(
+    batches: List[BaseWriteBatch], request_counts: List[int], outcomes: list
+) -> list:
+    """Record the results of :meth:`~.client.Client.commit_many` on its batches.
+
+    Each batch whose requests all succeeded is emptied, and receives the
+    write results and the last commit time of its requests.
+
+    Args:
+        batches (List[.BaseWriteBatch]): The batches committed.
+        request_counts (List[int]): The number of requests of each batch.
+        outcomes (list): The outcome of each request, in order: its
+            :class:`~google.cloud.firestore_v1.types.CommitResponse`, its
+            error, or :data:`None` if it was not sent.
+
+    Returns:
+        List[google.cloud.firestore_v1.types.WriteResult]: The write
+        results of all the batches, in order.
+
+    Raises:
+        CommitManyError: If a request did not succeed, once the other
+        batches are recorded.
+    """
+    results = []
+    committed = []
+    errors = {}
+    unsent = []
+    outcomes = iter(outcomes)
+    for index, (batch, request_count) in enumerate(zip(batches, request_counts)):
+        batch_outcomes = [next(outcomes) for _ in range(request_count)]
+        error = None
+        sent = True
+        for outcome in batch_outcomes:
+            if isinstance(outcome, Exception):
+                error = error or outcome
+            elif outcome is None:
+                sent = False
+        if error is not None:
+            errors[index] = error
+            continue
+        if not sent:
+            unsent.append(index)
+            continue
+        batch_results = []
+        for commit_response in batch_outcomes:
+            batch_results.extend(commit_response.write_results)
+            batch.commit_time = commit_response.commit_time
+        batch._write_pbs = []
+        batch.write_results = batch_results
+        results.extend(batch_results)
+        committed.append(index)
+    if errors or unsent:
+        cause = next(iter(errors.values()), None)
+        raise CommitManyError(errors, committed, unsent, results) from cause
+    return results
+
+
+class _OrderedSnapshots(object):
+    """Reassemble the results of ``get_all`` in the order of the references.
+
+    Snapshots may arrive in any order. Each one is kept only until every
+    position of its document in ``references`` has been released, and
+    positions are released as soon as all the snapshots before them have
+    arrived.
+
+    Args:
+        references (List[.DocumentReference, ...]): The references passed
+            to ``get_all``, possibly with duplicates.
+        client (:class:`~google.cloud.firestore_v1.client.Client`):
+            The client ``get_all`` was called on.
+        lazy (bool): If :data:`True`, make the placeholders for missing
+            documents :class:`LazyDocumentSnapshot` instances, as the other
+            snapshots.
+        frozen (Optional[bool]): If :data:`True`, make the placeholders
+            :class:`FrozenDocumentSnapshot` instances. Defaults to the
+            client's ``frozen_snapshots`` setting.
+    """
+
+    def __init__(
+        self, references: list, client, lazy: bool = False, frozen: bool = None
+    ) -> None:
+        self._references = references
+        self._client = client
+        self._lazy = lazy
+        self._frozen = frozen
+        self._paths = [reference._document_path for reference in references]
+        self._remaining = collections.Counter(self._paths)
+        self._pending: dict = {}
+        self._next = 0
+
+    def add(self, snapshot: DocumentSnapshot) -> List[DocumentSnapshot]:
+        """Add a snapshot which has arrived.
+
+        Args:
+            snapshot (.DocumentSnapshot): The snapshot of one of the
+                referenced documents.
+
+        Returns:
+            List[.DocumentSnapshot]: The snapshots for the next positions
+            in ``references`` which can now be released, if any.
+        """
+        self._pending[snapshot.reference._document_path] = snapshot
+        ready = []
+        while self._next < len(self._paths):
+            path = self._paths[self._next]
+            if path not in self._pending:
+                break
+            ready.append(self._release(path))
+        return ready
+
+    def missing(self) -> List[DocumentSnapshot]:
+        """Release the remaining positions once all snapshots have arrived.
+
+        Returns:
+            List[.DocumentSnapshot]: The snapshots for the remaining
+            positions, with a non-existent placeholder for any document
+            the server did not return.
+        """
+        ready = []
+        while self._next < len(self._paths):
+            path = self._paths[self._next]
+            if path not in self._pending:
+                snapshot_class, data = _snapshot_class_and_data(
+                    None, self._client, lazy=self._lazy, frozen=self._frozen
+                )
+                self._pending[path] = snapshot_class(
+                    self._references[self._next],
+                    data,
+                    exists=False,
+                    read_time=None,
+                    create_time=None,
+                    update_time=None,
+                )
+            ready.append(self._release(path))
+        return ready
+
+    def _release(self, path: str) -> DocumentSnapshot:
+        snapshot = self._pending[path]
+        self._next += 1
+        self._remaining[path] -= 1
+        if not self._remaining[path]:
+            del self._pending[path]
+        return snapshot
+
+
 def _get_reference(document_path: str, reference_map: dict) -> BaseDocumentReference:
     """Get a document reference from a dictionary.
 
@@ -509,6 +858,8 @@ def _parse_batch_get(
     get_doc_response: types.BatchGetDocumentsResponse,
     reference_map: dict,
     client: BaseClient,
+    lazy: bool = False,
+    frozen: bool = None,
 ) -> DocumentSnapshot:
     """Parse a `BatchGetDocumentsResponse` protobuf.
 
@@ -521,6 +872,10 @@ def _parse_batch_get(
             document references.
         client (:class:`~google.cloud.firestore_v1.client.Client`):
             A client that has a document factory.
+        lazy (bool): If :data:`True`, return a :class:`LazyDocumentSnapshot`.
+        frozen (Optional[bool]): If :data:`True`, return a
+            :class:`FrozenDocumentSnapshot`. Defaults to the client's
+            ``frozen_snapshots`` setting.
 
     Returns:
        [.DocumentSnapshot]: The retrieved snapshot.
@@ -532,8 +887,10 @@ def _parse_batch_get(
     result_type = get_doc_response._pb.WhichOneof("result")
     if result_type == "found":
         reference = _get_reference(get_doc_response.found.name, reference_map)
-        data = _helpers.decode_dict(get_doc_response.found.fields, client)
-        snapshot = DocumentSnapshot(
+        snapshot_class, data = _snapshot_class_and_data(
+            get_doc_response.found, client, lazy=lazy, frozen=frozen
+        )
+        snapshot = snapshot_class(
             reference,
             data,
             exists=True,
@@ -543,9 +900,12 @@ def _parse_batch_get(
         )
     elif result_type == "missing":
         reference = _get_reference(get_doc_response.missing, reference_map)
-        snapshot = DocumentSnapshot(
+        snapshot_class, data = _snapshot_class_and_data(
+            None, client, lazy=lazy, frozen=frozen
+        )
+        snapshot = snapshot_class(
             reference,
-            None,
+            data,
             exists=False,
             read_time=get_doc_response.read_time,
             create_time=None,
@@ -34,7 +34,7 @@ from typing import (
 
 # Types needed only for Type Hints
 from google.cloud.firestore_v1.base_document import DocumentSnapshot
-from google.cloud.firestore_v1.base_query import BaseQuery
+from google.cloud.firestore_v1.base_query import BaseQuery, QueryPage
 from google.cloud.firestore_v1.transaction import Transaction
 
 _AUTO_ID_CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
@@ -434,9 +434,25 @@ class BaseCollectionReference(object):
         transaction: Transaction = None,
         retry: retries.Retry = None,
         timeout: float = None,
+        lazy: bool = False,
+        frozen: bool = None,
+        resumable: bool = False,
     ) -> Union[Iterator[DocumentSnapshot], AsyncIterator[DocumentSnapshot]]:
         raise NotImplementedError
 
+    def paginate(
+        self,
+        page_size: int,
+        start_after: bytes = None,
+        prefetch: bool = False,
+        transaction: Transaction = None,
+        retry: retries.Retry = None,
+        timeout: float = None,
+        lazy: bool = False,
+        frozen: bool = None,
+    ) -> Union[Iterator[QueryPage], AsyncIterator[QueryPage]]:
+        raise NotImplementedError
+
     def on_snapshot(self, callback) -> NoReturn:
         raise NotImplementedError
 
@@ -15,12 +15,15 @@
 """Classes for representing documents for the Google Cloud Firestore API."""
 
 import copy
+from collections import abc
 
+from google.api_core import datetime_helpers  # type: ignore
 from google.api_core import retry as retries  # type: ignore
 
 from google.cloud.firestore_v1 import _helpers
 from google.cloud.firestore_v1 import field_path as field_path_module
 from google.cloud.firestore_v1.types import common
+from google.protobuf import timestamp_pb2
 
 # Types needed only for Type Hints
 from google.cloud.firestore_v1.types import firestore
@@ -28,6 +31,9 @@ from google.cloud.firestore_v1.types import write
 from typing import Any, Dict, Iterable, NoReturn, Union, Tuple
 
 
+_NANOS_PER_SECOND: int = 10 ** 9
+
+
 class BaseDocumentReference(object):
     """A reference to a document in a Firestore database.
 
@@ -293,12 +299,73 @@ class BaseDocumentReference(object):
 
         return request, kwargs
 
+    def _get_cache(self, field_paths: Iterable[str] = None, transaction=None):
+        """The client's document cache, if it can serve a :meth:`get`.
+
+        Only whole-document reads outside of a transaction are cached.
+        """
+        if field_paths is not None or transaction is not None:
+            return None
+        return self._client._document_cache
+
+    def _single_flight_key(self, request: dict, kwargs: dict) -> tuple:
+        """Identifies the :meth:`get` calls which may share a ``GetDocument``.
+
+        Args:
+            request (dict): The request from :meth:`_prep_get`.
+            kwargs (dict): The retry / timeout arguments from :meth:`_prep_get`.
+        """
+        mask = request["mask"]
+        field_paths = None if mask is None else tuple(mask.field_paths)
+        return (
+            "get",
+            self._document_path,
+            field_paths,
+            kwargs.get("retry"),
+            kwargs.get("timeout"),
+        )
+
+    def _snapshot_from_pb(
+        self, document_pb, lazy: bool = False, frozen: bool = None
+    ) -> "DocumentSnapshot":
+        """Shared result handling for async/sync :meth:`get`.
+
+        Args:
+            document_pb (Optional[google.cloud.firestore_v1.types.Document]):
+                The fetched document, or :data:`None` if it does not exist.
+            lazy (bool): If :data:`True`, return a :class:`LazyDocumentSnapshot`.
+            frozen (Optional[bool]): If :data:`True`, return a
+                :class:`FrozenDocumentSnapshot`.
+        """
+        if document_pb is None:
+            exists = False
+            create_time = None
+            update_time = None
+        else:
+            exists = True
+            create_time = document_pb.create_time
+            update_time = document_pb.update_time
+
+        snapshot_class, data = _snapshot_class_and_data(
+            document_pb, self._client, lazy=lazy, frozen=frozen
+        )
+        return snapshot_class(
+            self,
+            data,
+            exists=exists,
+            read_time=None,  # No server read_time available
+            create_time=create_time,
+            update_time=update_time,
+        )
+
     def get(
         self,
         field_paths: Iterable[str] = None,
         transaction=None,
         retry: retries.Retry = None,
         timeout: float = None,
+        lazy: bool = False,
+        frozen: bool = None,
     ) -> "DocumentSnapshot":
         raise NotImplementedError
 
@@ -348,6 +415,9 @@ class DocumentSnapshot(object):
             The time that this document was last updated.
     """
 
+    # ``(orders, key)`` pair cached by ``BaseQuery._sort_key``.
+    _sort_key_cache = None
+
     def __init__(
         self, reference, data, exists, read_time, create_time, update_time
     ) -> None:
@@ -491,6 +561,383 @@ class DocumentSnapshot(object):
         return copy.deepcopy(self._data)
 
 
+class FrozenDocumentSnapshot(DocumentSnapshot):
+    """A document snapshot whose data is read-only.
+
+    The data is decoded once, with maps as read-only
+    :class:`types.MappingProxyType` views and arrays as tuples, so it can
+    be shared with callers instead of being copied by every call to
+    :meth:`get` and :meth:`to_dict`.
+
+    Instances are returned by methods such as
+    :meth:`~google.cloud.firestore_v1.query.Query.stream` when called
+    with ``frozen=True``, or by default for a client created with
+    ``frozen_snapshots=True``.
+
+    Args:
+        reference (:class:`~google.cloud.firestore_v1.document.DocumentReference`):
+            A document reference corresponding to the document that contains
+            the data in this snapshot.
+        data (Optional[Mapping[str, Any]]):
+            The read-only data retrieved in the snapshot, as returned by
+            :func:`~google.cloud.firestore_v1._helpers.decode_dict` with
+            ``frozen=True``.
+        exists (bool):
+            Indicates if the document existed at the time the snapshot was
+            retrieved.
+        read_time (:class:`google.protobuf.timestamp_pb2.Timestamp`):
+            The time that this snapshot was read from the server.
+        create_time (:class:`google.protobuf.timestamp_pb2.Timestamp`):
+            The time that this document was created.
+        update_time (:class:`google.protobuf.timestamp_pb2.Timestamp`):
+            The time that this document was last updated.
+    """
+
+    def __init__(
+        self, reference, data, exists, read_time, create_time, update_time
+    ) -> None:
+        self._reference = reference
+        self._data = data
+        self._exists = exists
+        self.read_time = read_time
+        self.create_time = create_time
+        self.update_time = update_time
+
+    def get(self, field_path: str) -> Any:
+        """Get a value from the snapshot data.
+
+        See :meth:`DocumentSnapshot.get` for more information on field paths.
+
+        Args:
+            field_path (str): A field path (``.``-delimited list of
+                field names).
+
+        Returns:
+            Any or None:
+                The (read-only) value stored for the ``field_path`` or
+                None if snapshot document does not exist.
+
+        Raises:
+            KeyError: If the ``field_path`` does not match nested data
+                in the snapshot.
+        """
+        if not self._exists:
+            return None
+        return field_path_module.get_nested_value(field_path, self._data)
+
+    def to_dict(self, mutable: bool = False) -> Union[abc.Mapping, None]:
+        """Retrieve the data contained in this snapshot.
+
+        Args:
+            mutable (bool): If :data:`True`, return a copy of the data as
+                (nested) ``dict``-s and ``list``-s which may be modified.
+
+        Returns:
+            Mapping[str, Any] or None:
+                A read-only view of the data in the snapshot, or a mutable
+                copy if ``mutable`` is :data:`True`. Returns None if
+                reference does not exist.
+        """
+        if not self._exists:
+            return None
+        if mutable:
+            return _thaw_value(self._data)
+        return self._data
+
+
+class LazyDocumentSnapshot(FrozenDocumentSnapshot):
+    """A document snapshot which decodes its fields on demand.
+
+    Rather than decoding every field up front, the raw ``Document``
+    protobuf is kept and each field is only decoded the first time it is
+    read, via :meth:`get` or :meth:`to_dict`. As for
+    :class:`FrozenDocumentSnapshot`, decoded values are cached and returned
+    without copying, so they are read-only: maps are returned as read-only
+    :class:`~collections.abc.Mapping` views and arrays as tuples.
+
+    Instances are returned by methods such as
+    :meth:`~google.cloud.firestore_v1.query.Query.stream` when called
+    with ``lazy=True``.
+
+    Args:
+        reference (:class:`~google.cloud.firestore_v1.document.DocumentReference`):
+            A document reference corresponding to the document that contains
+            the data in this snapshot.
+        document_pb (Optional[google.cloud.firestore_v1.document_pb2.Document]):
+            The raw protobuf for the document, or :data:`None` if the
+            document does not exist.
+        exists (bool):
+            Indicates if the document existed at the time the snapshot was
+            retrieved.
+        read_time (:class:`google.protobuf.timestamp_pb2.Timestamp`):
+            The time that this snapshot was read from the server.
+        create_time (:class:`google.protobuf.timestamp_pb2.Timestamp`):
+            The time that this document was created.
+        update_time (:class:`google.protobuf.timestamp_pb2.Timestamp`):
+            The time that this document was last updated.
+    """
+
+    def __init__(
+        self, reference, document_pb, exists, read_time, create_time, update_time
+    ) -> None:
+        if document_pb is not None:
+            data = _LazyFieldsView(document_pb.fields, reference._client)
+        else:
+            data = None
+        super(LazyDocumentSnapshot, self).__init__(
+            reference, data, exists, read_time, create_time, update_time
+        )
+
+
+class ProjectedDocumentSnapshot(DocumentSnapshot):
+    """A compact snapshot holding some of the fields of a document.
+
+    Watches started with ``fields`` keep one for each document they
+    watch, so that a listener on a large collection holds only the data it
+    needs. Only the requested fields are decoded and kept; the document is
+    kept as its path rather than a reference, which is created when
+    :attr:`reference` is read, and its timestamps as integer nanoseconds.
+    Two projected snapshots are equal when they hold the same version of
+    the same document, i.e. have the same name and update time.
+
+    Args:
+        client (:class:`~google.cloud.firestore_v1.client.Client`):
+            The client which creates the reference to the document.
+        document_pb (google.cloud.firestore_v1.document_pb2.Document): The
+            raw protobuf for the document.
+        field_paths (Iterable[Tuple[str, ...]]): The field paths to keep,
+            as the field names of each path.
+    """
+
+    _exists = True
+
+    def __init__(self, client, document_pb, field_paths) -> None:
+        self._owner = client
+        self._name = document_pb.name
+        self._data = _project_fields(document_pb.fields, field_paths, client)
+        self._create_nanos = _timestamp_nanos(document_pb.create_time)
+        self._update_nanos = _timestamp_nanos(document_pb.update_time)
+        self._sort_key_cache = None
+        self.read_time = None
+
+    def __eq__(self, other):
+        if not isinstance(other, ProjectedDocumentSnapshot):
+            return NotImplemented
+        return self._name == other._name and self._update_nanos == other._update_nanos
+
+    def __hash__(self):
+        # Watches key their document trees by snapshot: hash the stored
+        # name and time instead of building a reference and a datetime.
+        return hash((self._name, self._update_nanos))
+
+    @property
+    def _client(self):
+        return self._owner
+
+    @property
+    def _reference(self):
+        return self._owner.document(self._name)
+
+    @property
+    def id(self):
+        """The document identifier (within its collection).
+
+        Returns:
+            str: The last component of the path of the document.
+        """
+        return self._name.rpartition("/")[2]
+
+    @property
+    def reference(self):
+        """Document reference corresponding to document that owns this data.
+
+        A new reference is created each time this is read.
+
+        Returns:
+            :class:`~google.cloud.firestore_v1.document.DocumentReference`:
+            A document reference corresponding to this document.
+        """
+        return self._reference
+
+    @property
+    def create_time(self):
+        """google.api_core.datetime_helpers.DatetimeWithNanoseconds: The
+        time that this document was created."""
+        return _nanos_datetime(self._create_nanos)
+
+    @property
+    def update_time(self):
+        """google.api_core.datetime_helpers.DatetimeWithNanoseconds: The
+        time that this document was last updated."""
+        return _nanos_datetime(self._update_nanos)
+
+
+def _project_fields(fields_pb, field_paths, client) -> Dict[str, Any]:
+    """Decode some of the fields of a document.
+
+    Args:
+        fields_pb (google.protobuf.pyext._message.MessageMapContainer): A
+            raw protobuf map of Firestore ``Value``-s.
+        field_paths (Iterable[Tuple[str, ...]]): The field paths to decode,
+            as the field names of each path.
+        client (:class:`~google.cloud.firestore_v1.client.Client`):
+            A client that has a document factory.
+
+    Returns:
+        Dict[str, Any]: The decoded fields, nested as in the document.
+        Paths missing from the document are left out.
+    """
+    data: Dict[str, Any] = {}
+    for field_names in field_paths:
+        container_pb = fields_pb
+        for field_name in field_names[:-1]:
+            value_pb = container_pb.get(field_name)
+            if value_pb is None or value_pb.WhichOneof("value_type") != "map_value":
+                break
+            container_pb = value_pb.map_value.fields
+        else:
+            value_pb = container_pb.get(field_names[-1])
+            if value_pb is not None:
+                nested = data
+                for field_name in field_names[:-1]:
+                    nested = nested.setdefault(field_name, {})
+                nested[field_names[-1]] = _helpers.decode_value(value_pb, client)
+    return data
+
+
+def _timestamp_nanos(timestamp_pb) -> int:
+    """Convert a raw protobuf ``Timestamp`` to nanoseconds since the epoch."""
+    return timestamp_pb.seconds * _NANOS_PER_SECOND + timestamp_pb.nanos
+
+
+def _nanos_datetime(nanos) -> datetime_helpers.DatetimeWithNanoseconds:
+    """Convert nanoseconds since the epoch to a datetime, as in snapshots."""
+    seconds, nanos = divmod(nanos, _NANOS_PER_SECOND)
+    return datetime_helpers.DatetimeWithNanoseconds.from_timestamp_pb(
+        timestamp_pb2.Timestamp(seconds=seconds, nanos=nanos)
+    )
+
+
+class _LazyFieldsView(abc.Mapping):
+    """Read-only mapping over a protobuf map of Firestore ``Value``-s.
+
+    Values are decoded the first time they are looked up, then cached.
+
+    Args:
+        fields_pb (google.protobuf.pyext._message.MessageMapContainer): A
+            raw protobuf map of Firestore ``Value``-s.
+        client (:class:`~google.cloud.firestore_v1.client.Client`):
+            A client that has a document factory.
+    """
+
+    __slots__ = ("_fields_pb", "_client", "_decoded")
+
+    def __init__(self, fields_pb, client) -> None:
+        self._fields_pb = fields_pb
+        self._client = client
+        self._decoded = {}
+
+    def __getitem__(self, key) -> Any:
+        try:
+            return self._decoded[key]
+        except KeyError:
+            pass
+
+        if key not in self._fields_pb:
+            raise KeyError(key)
+
+        value = _decode_lazy_value(self._fields_pb[key], self._client)
+        self._decoded[key] = value
+        return value
+
+    def __iter__(self):
+        return iter(self._fields_pb)
+
+    def __len__(self) -> int:
+        return len(self._fields_pb)
+
+    def __repr__(self):
+        return "{}({!r})".format(type(self).__name__, dict(self))
+
+
+def _decode_lazy_value(value_pb, client) -> Any:
+    """Decode a raw protobuf ``Value`` for a :class:`_LazyFieldsView`.
+
+    Args:
+        value_pb (google.cloud.firestore_v1.document_pb2.Value): A raw
+            Firestore protobuf to be decoded.
+        client (:class:`~google.cloud.firestore_v1.client.Client`):
+            A client that has a document factory.
+
+    Returns:
+        Any: A native Python value, with maps left undecoded in a
+        :class:`_LazyFieldsView` and arrays converted to tuples.
+    """
+    value_type = value_pb.WhichOneof("value_type")
+    if value_type == "map_value":
+        return _LazyFieldsView(value_pb.map_value.fields, client)
+    if value_type == "array_value":
+        return tuple(
+            _decode_lazy_value(element_pb, client)
+            for element_pb in value_pb.array_value.values
+        )
+    return _helpers.decode_value(value_pb, client)
+
+
+def _thaw_value(value) -> Any:
+    """Copy a read-only value into (nested) ``dict``-s and ``list``-s.
+
+    Args:
+        value (Any): A value decoded with ``frozen=True`` or read from a
+            :class:`LazyDocumentSnapshot`.
+
+    Returns:
+        Any: A mutable copy of ``value``. Values other than maps and arrays
+        are returned as is.
+    """
+    if isinstance(value, abc.Mapping):
+        return {key: _thaw_value(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw_value(item) for item in value]
+    return value
+
+
+def _snapshot_class_and_data(
+    document_pb, client, lazy: bool = False, frozen: bool = None
+) -> Tuple[type, Any]:
+    """Pick the snapshot class for a document and prepare its data.
+
+    Args:
+        document_pb (Optional[google.cloud.firestore_v1.types.Document]): The
+            document returned by the server, or :data:`None` if it does
+            not exist.
+        client (:class:`~google.cloud.firestore_v1.client.Client`):
+            A client that has a document factory.
+        lazy (bool): If :data:`True`, use :class:`LazyDocumentSnapshot`.
+        frozen (Optional[bool]): If :data:`True`, use
+            :class:`FrozenDocumentSnapshot`. Defaults to the
+            ``frozen_snapshots`` setting of ``client``.
+
+    Returns:
+        Tuple[type, Any]: The snapshot class and the ``data`` to pass to it.
+    """
+    if lazy:
+        snapshot_class = LazyDocumentSnapshot
+    elif client._frozen_snapshots if frozen is None else frozen:
+        snapshot_class = FrozenDocumentSnapshot
+    else:
+        snapshot_class = DocumentSnapshot
+
+    if document_pb is None:
+        data = None
+    elif lazy:
+        data = document_pb._pb
+    else:
+        frozen = snapshot_class is FrozenDocumentSnapshot
+        data = _helpers.decode_dict(document_pb.fields, client, frozen=frozen)
+    return snapshot_class, data
+
+
 def _get_document_path(client, path: Tuple[str]) -> str:
     """Convert a path tuple into a full path string.
 
@@ -21,6 +21,7 @@ a more common way to create a query than direct usage of the constructor.
 import copy
 import math
 
+from google.api_core import exceptions  # type: ignore
 from google.api_core import retry as retries  # type: ignore
 from google.protobuf import wrappers_pb2
 
@@ -32,17 +33,23 @@ from google.cloud.firestore_v1.types import StructuredQuery
 from google.cloud.firestore_v1.types import query
 from google.cloud.firestore_v1.types import Cursor
 from google.cloud.firestore_v1.types import RunQueryResponse
+from google.cloud.firestore_v1.order import descending_sort_key
+from google.cloud.firestore_v1.order import DescendingKey
 from google.cloud.firestore_v1.order import Order
+from google.cloud.firestore_v1.order import value_sort_key
 from typing import Any, Dict, Iterable, NoReturn, Optional, Tuple, Union
 
 # Types needed only for Type Hints
 from google.cloud.firestore_v1.base_document import DocumentSnapshot
+from google.cloud.firestore_v1.base_document import _snapshot_class_and_data
+from google.cloud.firestore_v1.base_document import _thaw_value
 
 _BAD_DIR_STRING: str
 _BAD_OP_NAN_NULL: str
 _BAD_OP_STRING: str
 _COMPARISON_OPERATORS: Dict[str, Any]
 _EQ_OP: str
+_INEQUALITY_OPERATORS: Tuple[Any, ...]
 _INVALID_CURSOR_TRANSFORM: str
 _INVALID_WHERE_TRANSFORM: str
 _MISMATCH_CURSOR_W_ORDER_BY: str
@@ -65,6 +72,10 @@ _COMPARISON_OPERATORS = {
     "not-in": _operator_enum.NOT_IN,
     "array_contains_any": _operator_enum.ARRAY_CONTAINS_ANY,
 }
+_INEQUALITY_OPERATORS = tuple(
+    _COMPARISON_OPERATORS[op_string]
+    for op_string in ("<", "<=", "!=", ">=", ">", "not-in")
+)
 _BAD_OP_STRING = "Operator string {!r} is invalid. Valid choices are: {}."
 _BAD_OP_NAN_NULL = 'Only an equality filter ("==") can be used with None or NaN values'
 _INVALID_WHERE_TRANSFORM = "Transforms cannot be used as where values."
@@ -83,6 +94,19 @@ _NO_ORDERS_FOR_CURSOR = (
     "come from fields set in ``order_by()``."
 )
 _MISMATCH_CURSOR_W_ORDER_BY = "The cursor {!r} does not match the order fields {!r}."
+_BAD_PARALLEL_STREAM = "Can't stream partitions of a query with {}."
+_BAD_PAGE_SIZE = "Page size must be positive, got {!r}."
+_BAD_PAGE_CURSOR = "The page cursor does not match the orders of this query."
+_PAGINATE_LIMIT_TO_LAST = (
+    "Queries that include limit_to_last() constraints cannot be paginated."
+)
+_PARALLEL_STREAM_BUFFER = 1000
+_MAX_RESUME_ATTEMPTS = 5
+_RESUMABLE_ERRORS = (
+    exceptions.DeadlineExceeded,
+    exceptions.InternalServerError,
+    exceptions.ServiceUnavailable,
+)
 
 
 class BaseQuery(object):
@@ -700,26 +724,34 @@ class BaseQuery(object):
                 _has_snapshot_cursor = True
 
         if _has_snapshot_cursor:
-            should_order = [
-                _enum_from_op_string(key)
-                for key in _COMPARISON_OPERATORS
-                if key not in (_EQ_OP, "array_contains")
-            ]
-            order_keys = [order.field.field_path for order in orders]
-            for filter_ in self._field_filters:
-                field = filter_.field.field_path
-                if filter_.op in should_order and field not in order_keys:
-                    orders.append(self._make_order(field, "ASCENDING"))
-            if not orders:
-                orders.append(self._make_order("__name__", "ASCENDING"))
-            else:
-                order_keys = [order.field.field_path for order in orders]
-                if "__name__" not in order_keys:
-                    direction = orders[-1].direction  # enum?
-                    orders.append(self._make_order("__name__", direction))
+            self._add_implicit_orders(orders)
 
         return orders
 
+    def _add_implicit_orders(self, orders: list) -> None:
+        """Helper: make explicit the orders the backend applies implicitly.
+
+        Fields with inequality filters are ordered first, and document
+        names last, so that a snapshot determines a unique cursor.
+        """
+        should_order = [
+            _enum_from_op_string(key)
+            for key in _COMPARISON_OPERATORS
+            if key not in (_EQ_OP, "array_contains")
+        ]
+        order_keys = [order.field.field_path for order in orders]
+        for filter_ in self._field_filters:
+            field = filter_.field.field_path
+            if filter_.op in should_order and field not in order_keys:
+                orders.append(self._make_order(field, "ASCENDING"))
+        if not orders:
+            orders.append(self._make_order("__name__", "ASCENDING"))
+        else:
+            order_keys = [order.field.field_path for order in orders]
+            if "__name__" not in order_keys:
+                direction = orders[-1].direction  # enum?
+                orders.append(self._make_order("__name__", direction))
+
     def _normalize_cursor(self, cursor, orders) -> Optional[Tuple[Any, Any]]:
         """Helper: convert cursor to a list of values based on orders."""
         if cursor is None:
@@ -735,6 +767,9 @@ class BaseQuery(object):
         if isinstance(document_fields, document.DocumentSnapshot):
             snapshot = document_fields
             document_fields = snapshot.to_dict()
+            if not isinstance(document_fields, dict):
+                # Frozen snapshots return read-only views.
+                document_fields = _thaw_value(document_fields)
             document_fields["__name__"] = snapshot.reference
 
         if isinstance(document_fields, dict):
@@ -828,11 +863,237 @@ class BaseQuery(object):
 
         return request, expected_prefix, kwargs
 
+    def _single_flight_key(self, request: dict, kwargs: dict) -> tuple:
+        """Identifies the :meth:`get` calls which may share a ``RunQuery``.
+
+        Args:
+            request (dict): The request from :meth:`_prep_stream`.
+            kwargs (dict): The retry / timeout arguments from :meth:`_prep_stream`.
+        """
+        query_pb = request["structured_query"]._pb
+        return (
+            "query",
+            request["parent"],
+            query_pb.SerializeToString(deterministic=True),
+            kwargs.get("retry"),
+            kwargs.get("timeout"),
+        )
+
+    def _response_to_snapshot(
+        self,
+        response_pb: RunQueryResponse,
+        expected_prefix: str,
+        lazy: bool = False,
+        frozen: bool = None,
+    ) -> Optional[document.DocumentSnapshot]:
+        """Shared result handling for async / sync :meth:`stream`."""
+        if self._all_descendants:
+            return _collection_group_query_response_to_snapshot(
+                response_pb, self._parent, lazy=lazy, frozen=frozen
+            )
+        return _query_response_to_snapshot(
+            response_pb, self._parent, expected_prefix, lazy=lazy, frozen=frozen,
+        )
+
     def stream(
-        self, transaction=None, retry: retries.Retry = None, timeout: float = None,
+        self,
+        transaction=None,
+        retry: retries.Retry = None,
+        timeout: float = None,
+        lazy: bool = False,
+        frozen: bool = None,
+        resumable: bool = False,
     ) -> NoReturn:
         raise NotImplementedError
 
+    def _with_order_fields(self) -> "BaseQuery":
+        """Helper: this query, selecting the fields it is ordered by.
+
+        :meth:`_resume_after` starts after the last snapshot received, so
+        a resumable stream needs the values of those fields even if its
+        projection left them out.
+
+        Returns:
+            BaseQuery: This query if it has no projection, else a copy
+            whose projection also selects the fields it is ordered by.
+        """
+        if self._projection is None:
+            return self
+
+        orders = list(self._orders)
+        self._add_implicit_orders(orders)
+        return self.__class__(
+            self._parent,
+            projection=self._projection_with_orders(orders),
+            field_filters=self._field_filters,
+            orders=self._orders,
+            limit=self._limit,
+            limit_to_last=self._limit_to_last,
+            offset=self._offset,
+            start_at=self._start_at,
+            end_at=self._end_at,
+            all_descendants=self._all_descendants,
+        )
+
+    def _resume_after(
+        self, last_snapshot: Optional[DocumentSnapshot], num_delivered: int
+    ) -> Optional["BaseQuery"]:
+        """Build a query for the rest of an interrupted stream.
+
+        The snapshots must come from :meth:`_with_order_fields`, so that
+        they hold the values of the fields the query is ordered by.
+
+        Args:
+            last_snapshot (Optional[DocumentSnapshot]): The last snapshot
+                delivered from the stream of this query, if any.
+            num_delivered (int): The number of snapshots delivered.
+
+        Returns:
+            Optional[BaseQuery]: A query starting after ``last_snapshot``,
+            with the limit reduced and the offset dropped accordingly, or
+            :data:`None` if the limit has already been reached.
+        """
+        if last_snapshot is None:
+            return self
+
+        if self._limit is not None and num_delivered >= self._limit:
+            return None
+
+        query = self.start_after(last_snapshot)
+        if self._limit is not None:
+            query = query.limit(self._limit - num_delivered)
+        if self._offset:
+            query = query.offset(0)
+        return query
+
+    def paginate(
+        self,
+        page_size: int,
+        start_after: bytes = None,
+        prefetch: bool = False,
+        transaction=None,
+        retry: retries.Retry = None,
+        timeout: float = None,
+        lazy: bool = False,
+        frozen: bool = None,
+    ) -> NoReturn:
+        raise NotImplementedError
+
+    def _prep_paginate(
+        self, page_size: int, start_after: Optional[bytes]
+    ) -> Tuple[list, Optional[list], int]:
+        """Shared setup for async / sync :meth:`paginate`.
+
+        Args:
+            page_size (int): The maximum number of documents in each page.
+            start_after (Optional[bytes]): The ``cursor`` of a page from a
+                previous pagination of this query.
+
+        Returns:
+            Tuple[list, Optional[list], int]: The orders used for every
+            page, the values of the cursor to start after, if any, and the
+            number of documents fetched before it.
+
+        Raises:
+            ValueError: If ``page_size`` is not positive, the query uses
+                ``limit_to_last``, or ``start_after`` does not match the
+                orders of the query.
+        """
+        if page_size <= 0:
+            raise ValueError(_BAD_PAGE_SIZE.format(page_size))
+
+        if self._limit_to_last:
+            raise ValueError(_PAGINATE_LIMIT_TO_LAST)
+
+        orders = list(self._orders)
+        self._add_implicit_orders(orders)
+
+        cursor = None
+        num_fetched = 0
+        if start_after is not None:
+            cursor_pb = Cursor.deserialize(start_after)
+            if len(cursor_pb.values) != len(orders) + 1:
+                raise ValueError(_BAD_PAGE_CURSOR)
+            cursor = [
+                _helpers.decode_value(value, self._client) for value in cursor_pb.values
+            ]
+            num_fetched = cursor.pop()
+        return orders, cursor, num_fetched
+
+    def _page_query(
+        self, orders: list, cursor: Optional[list], page_size: int, num_fetched: int
+    ) -> Optional["BaseQuery"]:
+        """Build the query for the next page of :meth:`paginate`.
+
+        Args:
+            orders (list): The orders returned by :meth:`_prep_paginate`.
+            cursor (Optional[list]): The values to start after, or
+                :data:`None` for the first page.
+            page_size (int): The maximum number of documents in the page.
+            num_fetched (int): The number of documents in previous pages.
+
+        Returns:
+            Optional[BaseQuery]: The query for the page, or :data:`None`
+            if the limit of this query has been reached.
+        """
+        limit = page_size
+        if self._limit is not None:
+            limit = min(limit, self._limit - num_fetched)
+            if limit <= 0:
+                return None
+
+        return self.__class__(
+            self._parent,
+            projection=self._projection_with_orders(orders),
+            field_filters=self._field_filters,
+            orders=tuple(orders),
+            limit=limit,
+            offset=self._offset if cursor is None else None,
+            start_at=self._start_at if cursor is None else (cursor, False),
+            end_at=self._end_at,
+            all_descendants=self._all_descendants,
+        )
+
+    def _projection_with_orders(
+        self, orders: list
+    ) -> Optional[StructuredQuery.Projection]:
+        """Helper: the projection, selecting the fields of ``orders`` as well.
+
+        A cursor built from a snapshot needs the values of the fields the
+        query is ordered by, so the queries whose snapshots are used as
+        cursors select them even if the caller did not.
+
+        Args:
+            orders (list): The orders of the query.
+
+        Returns:
+            Optional[google.cloud.firestore_v1.types.StructuredQuery.Projection]:
+            The projection, or :data:`None` if the query has none.
+        """
+        if self._projection is None:
+            return None
+
+        fields = list(self._projection.fields)
+        selected = [
+            tuple(field_path_module.parse_field_path(field.field_path))
+            for field in fields
+        ]
+        for order in orders:
+            field_path = order.field.field_path
+            if field_path == "__name__":
+                continue
+            parts = tuple(field_path_module.parse_field_path(field_path))
+            if any(parts[: len(prefix)] == prefix for prefix in selected):
+                continue
+            fields.append(query.StructuredQuery.FieldReference(field_path=field_path))
+            selected.append(parts)
+        return query.StructuredQuery.Projection(fields=fields)
+
+    def _page_cursor(self, snapshot: DocumentSnapshot, orders: list) -> list:
+        """Helper: the cursor values which start after ``snapshot``."""
+        values, _ = self._normalize_cursor((snapshot, False), orders)
+        return values
+
     def on_snapshot(self, callback) -> NoReturn:
         raise NotImplementedError
 
@@ -878,10 +1139,76 @@ class BaseQuery(object):
 
             if comp != 0:
                 # 1 == Ascending, -1 == Descending
-                return orderBy.direction * comp
+                direction = orderBy.direction
+                if direction == StructuredQuery.Direction.DESCENDING:
+                    direction = -1
+                return direction * comp
 
         return 0
 
+    def _sort_key(self, doc) -> Tuple:
+        """Compute a sort key ordering ``doc`` as :meth:`_comparator` does.
+
+        The key holds a :func:`~google.cloud.firestore_v1.order.value_sort_key`
+        for each "order by" field, followed by the document path using the
+        direction of the last order (the implicit ``__name__`` ordering).  It
+        is computed once and cached on the snapshot, so sorting snapshots
+        with ``sorted(docs, key=query._sort_key)`` encodes no values.
+
+        Args:
+            doc (:class:`~google.cloud.firestore_v1.base_document.DocumentSnapshot`):
+                The snapshot to compute a key for.
+
+        Returns:
+            tuple: A natively comparable sort key.
+
+        Raises:
+            ValueError: If ``doc`` is missing a field used for ordering.
+        """
+        # Read the raw protobufs: this runs once per snapshot being sorted.
+        orders = tuple(
+            (order._pb.field.field_path, order._pb.direction) for order in self._orders
+        )
+        cached = doc._sort_key_cache
+        if cached is not None and cached[0] == orders:
+            return cached[1]
+
+        descending = StructuredQuery.Direction.DESCENDING
+        data = doc._data
+        key = []
+        for field_path, direction in orders:
+            if field_path == "__name__":
+                value_key = doc.reference._path
+                if direction == descending:
+                    value_key = DescendingKey(value_key)
+            else:
+                try:
+                    if field_path in data:
+                        value = data[field_path]
+                    else:
+                        value = field_path_module.get_nested_value(field_path, data)
+                except KeyError:
+                    raise ValueError(
+                        "Can only compare fields that exist in the "
+                        "DocumentSnapshot. Please include the fields you are "
+                        "ordering on in your select() call."
+                    )
+                value_key = value_sort_key(value)
+                if direction == descending:
+                    value_key = descending_sort_key(value_key)
+
+            key.append(value_key)
+
+        # Add implicit sorting by name, using the last specified direction.
+        name_key = doc.reference._path
+        if orders and orders[-1][1] == descending:
+            name_key = DescendingKey(name_key)
+        key.append(name_key)
+
+        key = tuple(key)
+        doc._sort_key_cache = (orders, key)
+        return key
+
 
 def _enum_from_op_string(op_string: str) -> int:
     """Convert a string representation of a binary operator to an enum.
@@ -995,12 +1322,18 @@ def _cursor_pb(cursor_pair: Tuple[list, bool]) -> Optional[Cursor]:
     """
     if cursor_pair is not None:
         data, before = cursor_pair
-        value_pbs = [_helpers.encode_value(value) for value in data]
-        return query.Cursor(values=value_pbs, before=before)
+        cursor_pb = query.Cursor.pb()(before=before)
+        for value in data:
+            _helpers._encode_value_pb(value, cursor_pb.values.add())
+        return query.Cursor.wrap(cursor_pb)
 
 
 def _query_response_to_snapshot(
-    response_pb: RunQueryResponse, collection, expected_prefix: str
+    response_pb: RunQueryResponse,
+    collection,
+    expected_prefix: str,
+    lazy: bool = False,
+    frozen: bool = None,
 ) -> Optional[document.DocumentSnapshot]:
     """Parse a query response protobuf to a document snapshot.
 
@@ -1012,6 +1345,11 @@ def _query_response_to_snapshot(
         expected_prefix (str): The expected prefix for fully-qualified
             document names returned in the query results. This can be computed
             directly from ``collection`` via :meth:`_parent_info`.
+        lazy (bool): If :data:`True`, return a
+            :class:`~google.cloud.firestore_v1.base_document.LazyDocumentSnapshot`.
+        frozen (Optional[bool]): If :data:`True`, return a
+            :class:`~google.cloud.firestore_v1.base_document.FrozenDocumentSnapshot`.
+            Defaults to the client's ``frozen_snapshots`` setting.
 
     Returns:
         Optional[:class:`~google.cloud.firestore.document.DocumentSnapshot`]:
@@ -1023,8 +1361,10 @@ def _query_response_to_snapshot(
 
     document_id = _helpers.get_doc_id(response_pb.document, expected_prefix)
     reference = collection.document(document_id)
-    data = _helpers.decode_dict(response_pb.document.fields, collection._client)
-    snapshot = document.DocumentSnapshot(
+    snapshot_class, data = _snapshot_class_and_data(
+        response_pb.document, collection._client, lazy=lazy, frozen=frozen
+    )
+    snapshot = snapshot_class(
         reference,
         data,
         exists=True,
@@ -1036,7 +1376,7 @@ def _query_response_to_snapshot(
 
 
 def _collection_group_query_response_to_snapshot(
-    response_pb: RunQueryResponse, collection
+    response_pb: RunQueryResponse, collection, lazy: bool = False, frozen: bool = None
 ) -> Optional[document.DocumentSnapshot]:
     """Parse a query response protobuf to a document snapshot.
 
@@ -1045,6 +1385,11 @@ def _collection_group_query_response_to_snapshot(
             firestore.RunQueryResponse): A
         collection (:class:`~google.cloud.firestore_v1.collection.CollectionReference`):
             A reference to the collection that initiated the query.
+        lazy (bool): If :data:`True`, return a
+            :class:`~google.cloud.firestore_v1.base_document.LazyDocumentSnapshot`.
+        frozen (Optional[bool]): If :data:`True`, return a
+            :class:`~google.cloud.firestore_v1.base_document.FrozenDocumentSnapshot`.
+            Defaults to the client's ``frozen_snapshots`` setting.
 
     Returns:
         Optional[:class:`~google.cloud.firestore.document.DocumentSnapshot`]:
@@ -1054,8 +1399,10 @@ def _collection_group_query_response_to_snapshot(
     if not response_pb._pb.HasField("document"):
         return None
     reference = collection._client.document(response_pb.document.name)
-    data = _helpers.decode_dict(response_pb.document.fields, collection._client)
-    snapshot = document.DocumentSnapshot(
+    snapshot_class, data = _snapshot_class_and_data(
+        response_pb.document, collection._client, lazy=lazy, frozen=frozen
+    )
+    snapshot = snapshot_class(
         reference,
         data,
         exists=True,
@@ -1156,6 +1503,137 @@ class BaseCollectionGroup(BaseQuery):
     ) -> NoReturn:
         raise NotImplementedError
 
+    def _prep_parallel_stream(self) -> "BaseCollectionGroup":
+        """Check that this query can be streamed in partitions.
+
+        ``PartitionQuery`` does not accept filters or projections, so the
+        partitions are computed for a copy of this query which keeps only
+        its cursors; :meth:`QueryPartition.query` adds the rest back.
+
+        Returns:
+            BaseCollectionGroup: The query to be partitioned.
+
+        Raises:
+            ValueError: If the query has orders, a limit or an offset, which
+                cannot be applied across independent partitions, or an
+                inequality filter, which would need its field ordered before
+                the document names the partitions are bounded by.
+        """
+        if self._orders:
+            raise ValueError(_BAD_PARALLEL_STREAM.format("orders"))
+
+        for filter_ in self._field_filters:
+            if (
+                isinstance(filter_, query.StructuredQuery.FieldFilter)
+                and filter_.op in _INEQUALITY_OPERATORS
+            ):
+                raise ValueError(_BAD_PARALLEL_STREAM.format("inequality filters"))
+
+        if self._limit is not None:
+            raise ValueError(_BAD_PARALLEL_STREAM.format("limit"))
+
+        if self._offset:
+            raise ValueError(_BAD_PARALLEL_STREAM.format("offset"))
+
+        return type(self)(
+            self._parent,
+            start_at=self._start_at,
+            end_at=self._end_at,
+            all_descendants=self._all_descendants,
+        )
+
+    def _partition_queries(self, partitions: Iterable["QueryPartition"]) -> list:
+        """Build a query for each partition of this query.
+
+        Args:
+            partitions (Iterable[QueryPartition]): Partitions of the query
+                returned by :meth:`_prep_parallel_stream`.
+
+        Returns:
+            List[BaseCollectionGroup]: This query, bounded to each partition.
+        """
+        return [
+            QueryPartition(self, partition.start_at, partition.end_at).query()
+            for partition in partitions
+        ]
+
+    def parallel_stream(
+        self,
+        partition_count,
+        max_workers=None,
+        ordered=False,
+        max_buffered=_PARALLEL_STREAM_BUFFER,
+        max_attempts=_MAX_RESUME_ATTEMPTS,
+        retry: retries.Retry = None,
+        timeout: float = None,
+        lazy: bool = False,
+        frozen: bool = None,
+    ) -> NoReturn:
+        raise NotImplementedError
+
+
+class _PartitionError(object):
+    """Queued in place of a snapshot when streaming a partition fails."""
+
+    __slots__ = ("error",)
+
+    def __init__(self, error):
+        self.error = error
+
+
+_PARTITION_DONE = object()
+
+
+class QueryPage(object):
+    """A page of documents from :meth:`~google.cloud.firestore_v1.query.Query.paginate`.
+
+    Iterating over a page yields its document snapshots.
+
+    Args:
+        snapshots (List[DocumentSnapshot]): The documents in the page.
+        cursor (bytes): Serialized cursor pointing after the last document
+            in the page.
+    """
+
+    def __init__(self, snapshots, cursor):
+        self._snapshots = snapshots
+        self._cursor = cursor
+
+    @property
+    def snapshots(self):
+        """List[DocumentSnapshot]: The documents in the page."""
+        return self._snapshots
+
+    @property
+    def cursor(self):
+        """bytes: Checkpoint for the pagination.
+
+        Passing it as ``start_after`` to ``paginate()`` on the same query
+        continues with the documents after this page. It also records the
+        number of documents in this page and the previous ones, so that the
+        limit of the query applies across the whole pagination.
+        """
+        return self._cursor
+
+    def __iter__(self):
+        return iter(self._snapshots)
+
+    def __len__(self):
+        return len(self._snapshots)
+
+    def __getitem__(self, index):
+        return self._snapshots[index]
+
+
+def _encode_page_cursor(values: list, num_fetched: int) -> bytes:
+    """Helper: serialize cursor values for :attr:`QueryPage.cursor`.
+
+    The number of documents fetched is stored after the cursor values.
+    """
+    values = list(values) + [num_fetched]
+    cursor_pb = Cursor(values=[_helpers.encode_value(value) for value in values])
+    return Cursor.serialize(cursor_pb)
+
 
 class QueryPartition:
     """Represents a bounded partition of a collection group query.
@@ -1191,16 +1669,22 @@ class QueryPartition:
     def query(self):
         """Generate a new query using this partition's bounds.
 
+        The filters and projection of the original query are kept. The
+        first and last partitions keep the original query's start and end
+        cursors, respectively.
+
         Returns:
             BaseQuery: Copy of the original query with start and end bounds set by the
                 cursors from this partition.
         """
         query = self._query
-        start_at = ([self.start_at], True) if self.start_at else None
-        end_at = ([self.end_at], True) if self.end_at else None
+        start_at = ([self.start_at], True) if self.start_at else query._start_at
+        end_at = ([self.end_at], True) if self.end_at else query._end_at
 
         return type(query)(
             query._parent,
+            projection=query._projection,
+            field_filters=query._field_filters,
             all_descendants=query._all_descendants,
             orders=query._PARTITION_QUERY_ORDER,
             start_at=start_at,
@@ -54,9 +54,12 @@ class WriteBatch(BaseWriteBatch):
         """
         request, kwargs = self._prep_commit(retry, timeout)
 
-        commit_response = self._client._firestore_api.commit(
-            request=request, metadata=self._client._rpc_metadata, **kwargs,
-        )
+        try:
+            commit_response = self._client._firestore_api.commit(
+                request=request, metadata=self._client._rpc_metadata, **kwargs,
+            )
+        finally:
+            self._client._invalidate_writes(request["writes"])
 
         self._write_pbs = []
         self.write_results = results = list(commit_response.write_results)
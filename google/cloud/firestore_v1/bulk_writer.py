@@ -0,0 +1,137 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Helpers for bulk writes to the Google Cloud Firestore API."""
+
+import concurrent.futures
+import threading
+import time
+
+from google.cloud.firestore_v1.base_bulk_writer import BaseBulkWriter
+from google.cloud.firestore_v1.base_transaction import _INITIAL_SLEEP
+from google.cloud.firestore_v1.transaction import _sleep
+
+
+class BulkWriter(BaseBulkWriter):
+    """Send large numbers of independent writes efficiently.
+
+    Writes are grouped into ``BatchWrite`` requests which are sent from a
+    pool of ``max_in_flight`` threads. Writes which fail with a transient
+    error are retried, with exponential backoff. When ``max_in_flight``
+    requests are already in flight, adding a write which fills a batch
+    blocks until one of them completes.
+
+    Each write method returns a :class:`concurrent.futures.Future`. Writes
+    still queued are sent by :meth:`flush` and :meth:`close`, which also
+    wait for every write sent so far to complete.
+
+    .. code-block:: python
+
+       >>> with client.bulk_writer() as bulk_writer:
+       ...     for doc_id, data in rows:
+       ...         bulk_writer.set(collection.document(doc_id), data)
+
+    See :class:`~google.cloud.firestore_v1.base_bulk_writer.BaseBulkWriter`
+    for the constructor arguments.
+
+    Args:
+        client (:class:`~google.cloud.firestore_v1.client.Client`):
+            The client that created this bulk writer.
+        kwargs: Options for the bulk writer.
+    """
+
+    def __init__(self, client, **kwargs) -> None:
+        super(BulkWriter, self).__init__(client, **kwargs)
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._max_in_flight, thread_name_prefix="BulkWriter"
+        )
+        self._in_flight = threading.BoundedSemaphore(self._max_in_flight)
+        self._lock = threading.Lock()
+        self._pending = set()
+
+    def _make_future(self) -> concurrent.futures.Future:
+        return concurrent.futures.Future()
+
+    def _send_operations(self, operations) -> None:
+        self._in_flight.acquire()
+        batch_future = self._executor.submit(self._run_batch, operations)
+        with self._lock:
+            self._pending.add(batch_future)
+        batch_future.add_done_callback(self._batch_done)
+
+    def _batch_done(self, batch_future) -> None:
+        with self._lock:
+            self._pending.discard(batch_future)
+        self._in_flight.release()
+
+    def _wait_for_capacity(self, num_ops: int) -> None:
+        if self._rate_limiter is None:
+            return
+        while True:
+            with self._lock:
+                delay = self._rate_limiter.try_acquire(num_ops)
+            if not delay:
+                return
+            time.sleep(delay)
+
+    def _run_batch(self, operations) -> None:
+        """Send a batch of writes, retrying those which fail transiently.
+
+        Args:
+            operations (List[_BulkWriteOperation]): The writes to be sent.
+        """
+        current_sleep = _INITIAL_SLEEP
+        while operations:
+            self._wait_for_capacity(len(operations))
+            request = self._prep_batch_write(operations)
+            try:
+                response = self._client._firestore_api.batch_write(
+                    request=request, metadata=self._client._rpc_metadata,
+                )
+            except Exception as exc:
+                operations = self._process_error(operations, exc)
+            else:
+                operations = self._process_response(operations, response)
+            self._client._invalidate_writes(request["writes"])
+
+            if operations:
+                current_sleep = _sleep(current_sleep)
+
+    def flush(self) -> None:
+        """Send the queued writes and wait for all writes to complete.
+
+        Completing means that the future of each write has its result or
+        exception set: failed writes do not raise from this method.
+        """
+        self._send_batch()
+        while True:
+            with self._lock:
+                pending = list(self._pending)
+            if not pending:
+                return
+            concurrent.futures.wait(pending)
+
+    def close(self) -> None:
+        """Flush the bulk writer, then stop accepting writes."""
+        if self._closed:
+            return
+        self.flush()
+        self._closed = True
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
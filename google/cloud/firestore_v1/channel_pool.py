@@ -0,0 +1,348 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Pools of gRPC channels used by a Google Cloud Firestore client.
+
+A single channel multiplexes every RPC of a client over one HTTP/2
+connection, which servers typically limit to 100 concurrent streams. A
+client created with :class:`ChannelOptions` whose ``pool_size`` is greater
+than one spreads its RPCs over up to that many channels instead.
+"""
+
+import asyncio
+import functools
+import threading
+
+import grpc  # type: ignore
+from grpc import aio  # type: ignore
+
+from typing import Any, Callable, List
+
+
+LEAST_LOADED: str = "least_loaded"
+"""str: Send each RPC on the channel with the fewest RPCs in flight."""
+ROUND_ROBIN: str = "round_robin"
+"""str: Send RPCs on each channel in turn."""
+_SELECTIONS = (LEAST_LOADED, ROUND_ROBIN)
+_KEEPALIVE_TIME_MS: int = 30000
+_MAX_CONCURRENT_STREAMS: int = 100
+_BAD_POOL_SIZE: str = "``pool_size`` must be positive, got {!r}."
+_BAD_SELECTION: str = "``selection`` must be one of {!r}, got {!r}."
+_BAD_MAX_CONCURRENT_STREAMS: str = "``max_concurrent_streams`` must be positive, got {!r}."
+
+
+class ChannelOptions(object):
+    """Settings of the gRPC channels of a client.
+
+    Pass an instance as the ``channel_options`` of a
+    :class:`~google.cloud.firestore_v1.client.Client` or
+    :class:`~google.cloud.firestore_v1.async_client.AsyncClient`.
+
+    Channels beyond the first are opened on demand, once every open channel
+    has ``max_concurrent_streams`` RPCs in flight. Long-lived bidirectional
+    streams, such as the ``Listen`` streams of
+    :meth:`~google.cloud.firestore_v1.query.Query.on_snapshot`, are spread
+    over the open channels separately from other RPCs, so that they do not
+    pile up on the connection unary calls are sent on.
+
+    Args:
+        pool_size (Optional[int]): The maximum number of channels. Defaults
+            to a single channel.
+        selection (Optional[str]): How RPCs are assigned to channels, either
+            :data:`LEAST_LOADED` (the default) or :data:`ROUND_ROBIN`.
+        max_concurrent_streams (Optional[int]): The number of RPCs in
+            flight on a channel before another channel is opened.
+        max_send_message_length (Optional[int]): The largest request
+            message allowed, in bytes. Defaults to the gRPC default.
+        max_receive_message_length (Optional[int]): The largest response
+            message allowed, in bytes. Defaults to the gRPC default.
+        keepalive_time_ms (Optional[int]): The interval between keepalive
+            pings, in milliseconds.
+        keepalive_timeout_ms (Optional[int]): How long to wait for a
+            keepalive ping to be acknowledged, in milliseconds. Defaults to
+            the gRPC default.
+
+    Raises:
+        ValueError: If ``pool_size`` or ``max_concurrent_streams`` is not
+            positive, or ``selection`` is unknown.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 1,
+        selection: str = LEAST_LOADED,
+        max_concurrent_streams: int = _MAX_CONCURRENT_STREAMS,
+        max_send_message_length: int = None,
+        max_receive_message_length: int = None,
+        keepalive_time_ms: int = _KEEPALIVE_TIME_MS,
+        keepalive_timeout_ms: int = None,
+    ) -> None:
+        if pool_size < 1:
+            raise ValueError(_BAD_POOL_SIZE.format(pool_size))
+        if selection not in _SELECTIONS:
+            raise ValueError(_BAD_SELECTION.format(_SELECTIONS, selection))
+        if max_concurrent_streams < 1:
+            raise ValueError(_BAD_MAX_CONCURRENT_STREAMS.format(max_concurrent_streams))
+
+        self.pool_size = pool_size
+        self.selection = selection
+        self.max_concurrent_streams = max_concurrent_streams
+        self.max_send_message_length = max_send_message_length
+        self.max_receive_message_length = max_receive_message_length
+        self.keepalive_time_ms = keepalive_time_ms
+        self.keepalive_timeout_ms = keepalive_timeout_ms
+
+    def grpc_options(self) -> List[tuple]:
+        """The gRPC channel arguments for these settings.
+
+        Returns:
+            List[Tuple[str, Any]]: The ``options`` to create a channel with.
+        """
+        options = [("grpc.keepalive_time_ms", self.keepalive_time_ms)]
+        if self.keepalive_timeout_ms is not None:
+            options.append(("grpc.keepalive_timeout_ms", self.keepalive_timeout_ms))
+        if self.max_send_message_length is not None:
+            options.append(
+                ("grpc.max_send_message_length", self.max_send_message_length)
+            )
+        if self.max_receive_message_length is not None:
+            options.append(
+                ("grpc.max_receive_message_length", self.max_receive_message_length)
+            )
+        if self.pool_size > 1:
+            # Channels with the same arguments share their connection
+            # unless each has its own subchannel pool.
+            options.append(("grpc.use_local_subchannel_pool", 1))
+        return options
+
+
+class _BaseChannelPool(object):
+    """Shared channel selection of :class:`ChannelPool` and
+    :class:`AsyncChannelPool`.
+
+    Args:
+        create_channel (Callable[[], Any]): Opens a channel.
+        options (ChannelOptions): The settings of the pool.
+    """
+
+    def __init__(self, create_channel: Callable[[], Any], options: ChannelOptions):
+        self._create_channel = create_channel
+        self._options = options
+        self._lock = threading.Lock()
+        self._channels = [create_channel()]
+        self._active = [0]
+        self._streams = [0]
+        self._next = 0
+
+    @property
+    def channels(self) -> list:
+        """list: The channels opened so far."""
+        return list(self._channels)
+
+    @property
+    def active(self) -> List[int]:
+        """List[int]: The number of RPCs in flight on each open channel."""
+        with self._lock:
+            return list(self._active)
+
+    def _acquire(self, long_lived: bool) -> int:
+        """Pick the channel of a new RPC.
+
+        Args:
+            long_lived (bool): Whether the RPC is a bidirectional stream.
+
+        Returns:
+            int: The index of the channel, whose load now includes the RPC.
+        """
+        with self._lock:
+            index = self._select(long_lived)
+            if (
+                self._active[index] >= self._options.max_concurrent_streams
+                and len(self._channels) < self._options.pool_size
+            ):
+                index = len(self._channels)
+                self._channels.append(self._create_channel())
+                self._active.append(0)
+                self._streams.append(0)
+                self._next = index + 1
+            self._active[index] += 1
+            if long_lived:
+                self._streams[index] += 1
+            return index
+
+    def _select(self, long_lived: bool) -> int:
+        count = len(self._channels)
+        if self._options.selection == ROUND_ROBIN:
+            index = self._next % count
+        else:
+            # Start from the channel after the last one picked, so that
+            # ties are broken in turn.
+            order = [(self._next + offset) % count for offset in range(count)]
+            if long_lived:
+                index = min(order, key=lambda i: (self._streams[i], self._active[i]))
+            else:
+                index = min(order, key=self._active.__getitem__)
+        self._next = index + 1
+        return index
+
+    def _release(self, index: int, long_lived: bool) -> None:
+        """Remove a finished RPC from the load of its channel."""
+        with self._lock:
+            self._active[index] -= 1
+            if long_lived:
+                self._streams[index] -= 1
+
+    def _multi_callable(self, kind: str, args: tuple, kwargs: dict):
+        raise NotImplementedError
+
+    def unary_unary(self, *args, **kwargs):
+        return self._multi_callable("unary_unary", args, kwargs)
+
+    def unary_stream(self, *args, **kwargs):
+        return self._multi_callable("unary_stream", args, kwargs)
+
+    def stream_unary(self, *args, **kwargs):
+        return self._multi_callable("stream_unary", args, kwargs)
+
+    def stream_stream(self, *args, **kwargs):
+        return self._multi_callable("stream_stream", args, kwargs)
+
+
+class _PooledMultiCallable(object):
+    """A method of the service, invoked on a channel picked by a pool.
+
+    Args:
+        pool (_BaseChannelPool): The pool of channels.
+        kind (str): The name of the channel method creating the callable
+            for one channel, e.g. ``"unary_stream"``.
+        args (tuple): Positional arguments for ``kind``.
+        kwargs (dict): Keyword arguments for ``kind``.
+    """
+
+    def __init__(self, pool: _BaseChannelPool, kind: str, args: tuple, kwargs: dict):
+        self._pool = pool
+        self._kind = kind
+        self._args = args
+        self._kwargs = kwargs
+        self._long_lived = kind == "stream_stream"
+        self._callables: dict = {}
+
+    def _callable(self, index: int):
+        callable_ = self._callables.get(index)
+        if callable_ is None:
+            channel = self._pool._channels[index]
+            callable_ = getattr(channel, self._kind)(*self._args, **self._kwargs)
+            self._callables[index] = callable_
+        return callable_
+
+    def _invoke(self, name: str, blocking: bool, args: tuple, kwargs: dict):
+        index = self._pool._acquire(self._long_lived)
+        release = functools.partial(self._pool._release, index, self._long_lived)
+        try:
+            call = getattr(self._callable(index), name)(*args, **kwargs)
+        except BaseException:
+            release()
+            raise
+        if blocking:
+            release()
+        else:
+            self._on_done(call, release)
+        return call
+
+    def _on_done(self, call, release: Callable[[], None]) -> None:
+        raise NotImplementedError
+
+
+class _MultiCallable(_PooledMultiCallable):
+    def __call__(self, *args, **kwargs):
+        blocking = self._kind.endswith("_unary")
+        return self._invoke("__call__", blocking, args, kwargs)
+
+    def with_call(self, *args, **kwargs):
+        return self._invoke("with_call", True, args, kwargs)
+
+    def future(self, *args, **kwargs):
+        return self._invoke("future", False, args, kwargs)
+
+    def _on_done(self, call, release: Callable[[], None]) -> None:
+        if not call.add_callback(release):
+            # The RPC already terminated.
+            release()
+
+
+class _AsyncMultiCallable(_PooledMultiCallable):
+    def __call__(self, *args, **kwargs):
+        return self._invoke("__call__", False, args, kwargs)
+
+    def _on_done(self, call, release: Callable[[], None]) -> None:
+        call.add_done_callback(lambda _: release())
+
+
+class ChannelPool(_BaseChannelPool, grpc.Channel):
+    """A :class:`grpc.Channel` sending RPCs over several channels.
+
+    Args:
+        create_channel (Callable[[], grpc.Channel]): Opens a channel.
+        options (ChannelOptions): The settings of the pool.
+    """
+
+    def _multi_callable(self, kind: str, args: tuple, kwargs: dict):
+        return _MultiCallable(self, kind, args, kwargs)
+
+    def subscribe(self, callback, try_to_connect=False):
+        self._channels[0].subscribe(callback, try_to_connect=try_to_connect)
+
+    def unsubscribe(self, callback):
+        self._channels[0].unsubscribe(callback)
+
+    def close(self):
+        for channel in self.channels:
+            channel.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+class AsyncChannelPool(_BaseChannelPool, aio.Channel):
+    """A :class:`grpc.aio.Channel` sending RPCs over several channels.
+
+    Args:
+        create_channel (Callable[[], grpc.aio.Channel]): Opens a channel.
+        options (ChannelOptions): The settings of the pool.
+    """
+
+    def _multi_callable(self, kind: str, args: tuple, kwargs: dict):
+        return _AsyncMultiCallable(self, kind, args, kwargs)
+
+    async def close(self, grace=None):
+        await asyncio.gather(*[channel.close(grace) for channel in self.channels])
+
+    def get_state(self, try_to_connect=False):
+        return self._channels[0].get_state(try_to_connect=try_to_connect)
+
+    async def wait_for_state_change(self, last_observed_state):
+        await self._channels[0].wait_for_state_change(last_observed_state)
+
+    async def channel_ready(self):
+        await asyncio.gather(*[channel.channel_ready() for channel in self.channels])
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
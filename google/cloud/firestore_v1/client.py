@@ -24,6 +24,11 @@ In the hierarchy of API concepts
   :class:`~google.cloud.firestore_v1.document.DocumentReference`
 """
 
+import concurrent.futures
+import queue
+import threading
+import time
+
 from google.api_core import gapic_v1  # type: ignore
 from google.api_core import retry as retries  # type: ignore
 
@@ -31,15 +36,41 @@ from google.cloud.firestore_v1.base_client import (
     BaseClient,
     DEFAULT_DATABASE,
     _CLIENT_INFO,
+    _COMMIT_MANY_MAX_ATTEMPTS,
+    _COMMIT_MANY_MAX_IN_FLIGHT,
+    _GET_ALL_CHUNK_SIZE,
+    _GET_ALL_MAX_IN_FLIGHT,
+    _OrderedSnapshots,
+    _RETRYABLE_COMMIT_ERRORS,
+    _finish_commit_many,
     _parse_batch_get,
     _path_helper,
+    _remaining_request,
+)
+from google.cloud.firestore_v1.base_query import (
+    _MAX_RESUME_ATTEMPTS,
+    _PARALLEL_STREAM_BUFFER,
+    _PARTITION_DONE,
+    _PartitionError,
+    _RESUMABLE_ERRORS,
 )
+from google.cloud.firestore_v1.base_transaction import _INITIAL_SLEEP
+from google.cloud.firestore_v1.base_transaction import _MAX_SLEEP
+from google.cloud.firestore_v1.base_transaction import _MULTIPLIER
 
 from google.cloud.firestore_v1.query import CollectionGroup
+from google.cloud.firestore_v1.query import _drain_partitions
+from google.cloud.firestore_v1.query import _put_until_stopped
 from google.cloud.firestore_v1.batch import WriteBatch
+from google.cloud.firestore_v1.bulk_writer import BulkWriter
 from google.cloud.firestore_v1.collection import CollectionReference
 from google.cloud.firestore_v1.document import DocumentReference
+from google.cloud.firestore_v1.channel_pool import ChannelPool
+from google.cloud.firestore_v1.listen_multiplexer import ListenMultiplexer
+from google.cloud.firestore_v1.single_flight import BatchGetter
+from google.cloud.firestore_v1.single_flight import SingleFlight
 from google.cloud.firestore_v1.transaction import Transaction
+from google.cloud.firestore_v1.transaction import _sleep
 from google.cloud.firestore_v1.services.firestore import client as firestore_client
 from google.cloud.firestore_v1.services.firestore.transports import (
     grpc as firestore_grpc_transport,
@@ -76,6 +107,29 @@ class Client(BaseClient):
         client_options (Union[dict, google.api_core.client_options.ClientOptions]):
             Client options used to set user options on the client. API Endpoint
             should be set through client_options.
+        frozen_snapshots (Optional[bool]): If :data:`True`, methods that
+            return document snapshots default to
+            :class:`~google.cloud.firestore_v1.base_document.FrozenDocumentSnapshot`
+            instances, whose data is read-only and never copied.
+        document_cache (Optional[~google.cloud.firestore_v1.document_cache.DocumentCache]):
+            A cache serving document reads, invalidated by the writes of
+            this client.
+        coalesce_reads (Optional[bool]): If :data:`True`, concurrent identical
+            document and query reads outside of a transaction share a single
+            RPC and its result.
+        batch_get_window (Optional[float]): If set, single-document reads
+            outside of a transaction started within this many seconds of
+            each other are sent as one ``BatchGetDocuments`` RPC.
+        channel_options (Optional[~google.cloud.firestore_v1.channel_pool.ChannelOptions]):
+            Settings of the gRPC channels of the client, including the size
+            of its channel pool. Ignored when connecting to the emulator.
+        listen_streams (Optional[int]): If set, the watches started by
+            ``on_snapshot`` share at most this many ``Listen`` streams,
+            instead of opening one stream and thread each.
+
+    Raises:
+        ValueError: If ``batch_get_window`` or ``listen_streams`` is not
+            positive.
     """
 
     def __init__(
@@ -85,6 +139,12 @@ class Client(BaseClient):
         database=DEFAULT_DATABASE,
         client_info=_CLIENT_INFO,
         client_options=None,
+        frozen_snapshots=False,
+        document_cache=None,
+        coalesce_reads=False,
+        batch_get_window=None,
+        channel_options=None,
+        listen_streams=None,
     ) -> None:
         super(Client, self).__init__(
             project=project,
@@ -92,7 +152,21 @@ class Client(BaseClient):
             database=database,
             client_info=client_info,
             client_options=client_options,
+            frozen_snapshots=frozen_snapshots,
+            document_cache=document_cache,
+            coalesce_reads=coalesce_reads,
+            batch_get_window=batch_get_window,
+            channel_options=channel_options,
         )
+        self._single_flight = SingleFlight() if coalesce_reads else None
+        if batch_get_window is None:
+            self._batch_getter = None
+        else:
+            self._batch_getter = BatchGetter(self, batch_get_window)
+        if listen_streams is None:
+            self._listen_multiplexer = None
+        else:
+            self._listen_multiplexer = ListenMultiplexer(self, listen_streams)
 
     @property
     def _firestore_api(self):
@@ -105,6 +179,7 @@ class Client(BaseClient):
             firestore_grpc_transport.FirestoreGrpcTransport,
             firestore_client.FirestoreClient,
             firestore_client,
+            ChannelPool,
         )
 
     @property
@@ -212,18 +287,26 @@ class Client(BaseClient):
         transaction: Transaction = None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
         timeout: float = None,
+        lazy: bool = False,
+        frozen: bool = None,
+        chunk_size: int = _GET_ALL_CHUNK_SIZE,
+        max_in_flight: int = _GET_ALL_MAX_IN_FLIGHT,
+        ordered: bool = False,
     ) -> Generator[DocumentSnapshot, Any, None]:
         """Retrieve a batch of documents.
 
         .. note::
 
-           Documents returned by this method are not guaranteed to be
-           returned in the same order that they are given in ``references``.
-
-        .. note::
+           Unless ``ordered`` is :data:`True`, documents returned by this
+           method are not guaranteed to be returned in the same order that
+           they are given in ``references``, and if multiple ``references``
+           refer to the same document, only one result is returned for it.
 
-           If multiple ``references`` refer to the same document, the server
-           will only return one result.
+        The documents are requested in chunks of ``chunk_size``; when there
+        is more than one chunk, up to ``max_in_flight`` chunks are fetched
+        concurrently in background threads and their documents are yielded
+        as they arrive. A chunk interrupted by a transient error is retried
+        for the documents it has not returned yet.
 
         See :meth:`~google.cloud.firestore_v1.client.Client.field_path` for
         more information on **field paths**.
@@ -244,23 +327,54 @@ class Client(BaseClient):
                 retrieved in.
             retry (google.api_core.retry.Retry): Designation of what errors, if any,
                 should be retried.  Defaults to a system-specified policy.
-            timeout (float): The timeout for this request.  Defaults to a
+            timeout (float): The timeout for each request.  Defaults to a
                 system-specified value.
+            lazy (bool): If :data:`True`, yield
+                :class:`~google.cloud.firestore_v1.base_document.LazyDocumentSnapshot`
+                instances which only decode the fields that are read.
+            frozen (Optional[bool]): If :data:`True`, yield
+                :class:`~google.cloud.firestore_v1.base_document.FrozenDocumentSnapshot`
+                instances whose data is read-only and never copied. Defaults
+                to the client's ``frozen_snapshots`` setting.
+            chunk_size (int): The maximum number of documents requested by
+                each ``BatchGetDocuments`` call.
+            max_in_flight (int): The maximum number of chunks fetched at once.
+            ordered (bool): If :data:`True`, yield exactly one snapshot for
+                each of ``references``, in the same order (a non-existent
+                snapshot for a missing document). Each snapshot is yielded
+                as soon as it and all the snapshots before it have arrived.
 
         Yields:
             .DocumentSnapshot: The next document snapshot that fulfills the
             query, or :data:`None` if the document does not exist.
+
+        Raises:
+            ValueError: If ``chunk_size`` is not positive.
         """
-        request, reference_map, kwargs = self._prep_get_all(
-            references, field_paths, transaction, retry, timeout
+        if ordered:
+            references = list(references)
+        requests, reference_map, kwargs = self._prep_get_all(
+            references, field_paths, transaction, retry, timeout, chunk_size
         )
-
-        response_iterator = self._firestore_api.batch_get_documents(
-            request=request, metadata=self._rpc_metadata, **kwargs,
+        snapshots = _get_all_chunks(
+            self,
+            requests,
+            reference_map,
+            kwargs,
+            {"lazy": lazy, "frozen": frozen},
+            max_in_flight,
         )
-
-        for get_doc_response in response_iterator:
-            yield _parse_batch_get(get_doc_response, reference_map, self)
+        if not ordered:
+            yield from snapshots
+            return
+
+        reassembly = _OrderedSnapshots(references, self, lazy=lazy, frozen=frozen)
+        try:
+            for snapshot in snapshots:
+                yield from reassembly.add(snapshot)
+        finally:
+            snapshots.close()
+        yield from reassembly.missing()
 
     def collections(
         self, retry: retries.Retry = gapic_v1.method.DEFAULT, timeout: float = None,
@@ -296,6 +410,107 @@ class Client(BaseClient):
         """
         return WriteBatch(self)
 
+    def commit_many(
+        self,
+        batches: Iterable[WriteBatch],
+        max_in_flight: int = _COMMIT_MANY_MAX_IN_FLIGHT,
+        max_attempts: int = _COMMIT_MANY_MAX_ATTEMPTS,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = None,
+    ) -> list:
+        """Commit many batches, sending several ``Commit`` requests at once.
+
+        Up to ``max_in_flight`` requests are sent concurrently from worker
+        threads. A batch of more than 500 writes is split into several
+        requests, which are not applied atomically with each other. A
+        request failing with
+        :class:`~google.api_core.exceptions.Aborted` or
+        :class:`~google.api_core.exceptions.ServiceUnavailable` is sent
+        again after a randomized, exponentially growing delay, up to
+        ``max_attempts`` times in all.
+
+        Each batch whose requests all succeed is emptied and its
+        ``write_results`` and ``commit_time`` are set, as by
+        :meth:`~google.cloud.firestore_v1.batch.WriteBatch.commit`.
+        If a request fails, the requests not sent yet are dropped, and
+        once the requests in flight complete a
+        :class:`~google.cloud.firestore_v1.base_client.CommitManyError` is
+        raised, naming the batches committed, failed and not sent. The
+        batches not committed keep their writes.
+
+        Args:
+            batches (Iterable[:class:`~google.cloud.firestore_v1.batch.WriteBatch`]):
+                The batches to commit.
+            max_in_flight (int): The maximum number of requests sent at once.
+            max_attempts (int): The number of attempts made for each request.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.  Defaults to a system-specified policy.
+            timeout (float): The timeout for each request.  Defaults to a
+                system-specified value.
+
+        Returns:
+            List[:class:`google.cloud.proto.firestore.v1.write.WriteResult`, ...]:
+            The write results of all the batches, in the order of
+            ``batches`` and of the changes within each batch.
+
+        Raises:
+            ValueError: If ``max_in_flight`` is not positive.
+            ~google.cloud.firestore_v1.base_client.CommitManyError: If a
+                request fails.
+        """
+        batches = list(batches)
+        requests, request_counts, kwargs = self._prep_commit_many(
+            batches, max_in_flight, retry, timeout
+        )
+        if len(requests) <= 1:
+            outcomes = []
+            for request in requests:
+                try:
+                    outcomes.append(
+                        _commit_request(self, request, kwargs, max_attempts)
+                    )
+                except Exception as error:
+                    outcomes.append(error)
+            return _finish_commit_many(batches, request_counts, outcomes)
+
+        failed = threading.Event()
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(max_in_flight, len(requests)),
+            thread_name_prefix="Client.commit_many",
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _commit_request_unless_failed,
+                    self,
+                    request,
+                    kwargs,
+                    max_attempts,
+                    failed,
+                )
+                for request in requests
+            ]
+        outcomes = [future.exception() or future.result() for future in futures]
+        return _finish_commit_many(batches, request_counts, outcomes)
+
+    def bulk_writer(self, **kwargs) -> BulkWriter:
+        """Get a bulk writer instance from this client.
+
+        See :class:`~google.cloud.firestore_v1.base_bulk_writer.BaseBulkWriter`
+        for more information on the constructor arguments.
+
+        Args:
+            kwargs (Dict[str, Any]): The keyword arguments (other than
+                ``client``) to pass along to the
+                :class:`~google.cloud.firestore_v1.bulk_writer.BulkWriter`
+                constructor.
+
+        Returns:
+            :class:`~google.cloud.firestore_v1.bulk_writer.BulkWriter`:
+            A bulk writer to be used for sending large numbers of
+            independent writes.
+        """
+        return BulkWriter(self, **kwargs)
+
     def transaction(self, **kwargs) -> Transaction:
         """Get a transaction that uses this client.
 
@@ -313,3 +528,151 @@ class Client(BaseClient):
             A transaction attached to this client.
         """
         return Transaction(self, **kwargs)
+
+
+def _get_all_chunks(
+    client, requests, reference_map, kwargs, parse_kwargs, max_in_flight
+):
+    """Fetch the chunks of :meth:`Client.get_all`.
+
+    A single chunk is fetched inline. Otherwise up to ``max_in_flight``
+    chunks are fetched at once in worker threads, and their snapshots are
+    yielded as they arrive.
+
+    Yields:
+        .DocumentSnapshot: The next document snapshot received.
+    """
+    if len(requests) <= 1:
+        for request in requests:
+            yield from _get_all_chunk(
+                client, request, reference_map, kwargs, parse_kwargs
+            )
+        return
+
+    results = queue.Queue(_PARALLEL_STREAM_BUFFER)
+    stopped = threading.Event()
+    executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_in_flight, thread_name_prefix="Client.get_all"
+    )
+    try:
+        for request in requests:
+            executor.submit(
+                _stream_chunk,
+                _get_all_chunk(client, request, reference_map, kwargs, parse_kwargs),
+                results,
+                stopped,
+            )
+        yield from _drain_partitions(results, len(requests))
+    finally:
+        stopped.set()
+        executor.shutdown(wait=False)
+
+
+def _get_all_chunk(client, request, reference_map, kwargs, parse_kwargs):
+    """Fetch one chunk of :meth:`Client.get_all`, retrying transient errors.
+
+    After an error, only the documents of the chunk which have not been
+    received yet are requested again.
+
+    Args:
+        client (Client): The client making the requests.
+        request (dict): The ``BatchGetDocuments`` request for the chunk.
+        reference_map (Dict[str, .DocumentReference]): A mapping of
+            fully-qualified document paths to document references.
+        kwargs (dict): Retry and timeout arguments for each request.
+        parse_kwargs (dict): Keyword arguments for ``_parse_batch_get``.
+
+    Yields:
+        .DocumentSnapshot: The next document snapshot in the chunk.
+    """
+    received = set()
+    attempts = 0
+    delays = None
+    while request is not None:
+        attempts += 1
+        try:
+            response_iterator = client._firestore_api.batch_get_documents(
+                request=request, metadata=client._rpc_metadata, **kwargs,
+            )
+            for get_doc_response in response_iterator:
+                snapshot = _parse_batch_get(
+                    get_doc_response, reference_map, client, **parse_kwargs
+                )
+                received.add(snapshot.reference._document_path)
+                attempts = 0
+                delays = None
+                yield snapshot
+            return
+        except _RESUMABLE_ERRORS:
+            if attempts >= _MAX_RESUME_ATTEMPTS:
+                raise
+            if delays is None:
+                delays = retries.exponential_sleep_generator(
+                    _INITIAL_SLEEP, _MAX_SLEEP, _MULTIPLIER
+                )
+            time.sleep(next(delays))
+            request = _remaining_request(request, received)
+
+
+def _commit_request(client, request, kwargs, max_attempts):
+    """Send one ``Commit`` request of :meth:`Client.commit_many`.
+
+    Args:
+        client (Client): The client making the request.
+        request (dict): The ``Commit`` request.
+        kwargs (dict): Retry and timeout arguments for the request.
+        max_attempts (int): The number of attempts made for the request.
+
+    Returns:
+        ~google.cloud.firestore_v1.types.CommitResponse: The response.
+    """
+    current_sleep = _INITIAL_SLEEP
+    attempts = 0
+    while True:
+        attempts += 1
+        try:
+            return client._firestore_api.commit(
+                request=request, metadata=client._rpc_metadata, **kwargs,
+            )
+        except _RETRYABLE_COMMIT_ERRORS:
+            if attempts >= max_attempts:
+                raise
+        finally:
+            client._invalidate_writes(request["writes"])
+        current_sleep = _sleep(current_sleep)
+
+
+def _commit_request_unless_failed(client, request, kwargs, max_attempts, failed):
+    """Send a ``Commit`` request of :meth:`Client.commit_many`.
+
+    The request is dropped if another one has failed in the meantime.
+
+    Args:
+        failed (threading.Event): Set when a request fails.
+    """
+    if failed.is_set():
+        return None
+    try:
+        return _commit_request(client, request, kwargs, max_attempts)
+    except Exception:
+        failed.set()
+        raise
+
+
+def _stream_chunk(snapshots, results, stopped):
+    """Queue the snapshots of one chunk of :meth:`Client.get_all`.
+
+    Runs in a worker thread. The queue receives each snapshot, then either
+    ``_PARTITION_DONE`` or a ``_PartitionError``.
+    """
+    if stopped.is_set():
+        return
+
+    try:
+        for snapshot in snapshots:
+            if not _put_until_stopped(results, snapshot, stopped):
+                return
+    except Exception as exc:
+        _put_until_stopped(results, _PartitionError(exc), stopped)
+    else:
+        _put_until_stopped(results, _PARTITION_DONE, stopped)
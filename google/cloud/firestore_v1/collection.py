@@ -22,9 +22,11 @@ from google.cloud.firestore_v1.base_collection import (
     _item_to_document_ref,
 )
 from google.cloud.firestore_v1 import query as query_mod
+from google.cloud.firestore_v1.base_query import QueryPage
+from google.cloud.firestore_v1.snapshot_delivery import SnapshotDelivery
 from google.cloud.firestore_v1.watch import Watch
 from google.cloud.firestore_v1 import document
-from typing import Any, Callable, Generator, Tuple
+from typing import Any, Callable, Generator, Iterable, Tuple
 
 # Types needed only for Type Hints
 from google.cloud.firestore_v1.transaction import Transaction
@@ -173,6 +175,9 @@ class CollectionReference(BaseCollectionReference):
         transaction: Transaction = None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
         timeout: float = None,
+        lazy: bool = False,
+        frozen: bool = None,
+        resumable: bool = False,
     ) -> Generator[document.DocumentSnapshot, Any, None]:
         """Read the documents in this collection.
 
@@ -185,7 +190,8 @@ class CollectionReference(BaseCollectionReference):
            The underlying stream of responses will time out after
            the ``max_rpc_timeout_millis`` value set in the GAPIC
            client configuration for the ``RunQuery`` API.  Snapshots
-           not consumed from the iterator before that point will be lost.
+           not consumed from the iterator before that point will be lost,
+           unless ``resumable`` is :data:`True`.
 
         If a ``transaction`` is used and it already has write operations
         added, this method cannot be used (i.e. read-after-write is not
@@ -199,6 +205,17 @@ class CollectionReference(BaseCollectionReference):
                 should be retried.  Defaults to a system-specified policy.
             timeout (float): The timeout for this request.  Defaults to a
                 system-specified value.
+            lazy (bool): If :data:`True`, yield
+                :class:`~google.cloud.firestore_v1.base_document.LazyDocumentSnapshot`
+                instances which only decode the fields that are read.
+            frozen (Optional[bool]): If :data:`True`, yield
+                :class:`~google.cloud.firestore_v1.base_document.FrozenDocumentSnapshot`
+                instances whose data is read-only and never copied. Defaults
+                to the client's ``frozen_snapshots`` setting.
+            resumable (bool): If :data:`True`, restart the query after the
+                last document received when the stream fails with a
+                transient error, so that each document is still yielded
+                exactly once.
 
         Yields:
             :class:`~google.cloud.firestore_v1.document.DocumentSnapshot`:
@@ -206,9 +223,72 @@ class CollectionReference(BaseCollectionReference):
         """
         query, kwargs = self._prep_get_or_stream(retry, timeout)
 
-        return query.stream(transaction=transaction, **kwargs)
+        return query.stream(
+            transaction=transaction,
+            lazy=lazy,
+            frozen=frozen,
+            resumable=resumable,
+            **kwargs,
+        )
+
+    def paginate(
+        self,
+        page_size: int,
+        start_after: bytes = None,
+        prefetch: bool = False,
+        transaction: Transaction = None,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = None,
+        lazy: bool = False,
+        frozen: bool = None,
+    ) -> Generator[QueryPage, Any, None]:
+        """Read the documents in this collection, one page at a time.
+
+        See :meth:`~google.cloud.firestore_v1.query.Query.paginate`.
+
+        Args:
+            page_size (int): The maximum number of documents in each page.
+            start_after (Optional[bytes]): The ``cursor`` of a page from a
+                previous pagination of this collection.
+            prefetch (bool): If :data:`True`, fetch the next page in a
+                background thread while the caller processes the current one.
+            transaction (Optional[:class:`~google.cloud.firestore_v1.transaction.\
+                Transaction`]):
+                An existing transaction that the query will run in.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.  Defaults to a system-specified policy.
+            timeout (float): The timeout for each request.  Defaults to a
+                system-specified value.
+            lazy (bool): If :data:`True`, pages hold
+                :class:`~google.cloud.firestore_v1.base_document.LazyDocumentSnapshot`
+                instances which only decode the fields that are read.
+            frozen (Optional[bool]): If :data:`True`, pages hold
+                :class:`~google.cloud.firestore_v1.base_document.FrozenDocumentSnapshot`
+                instances.  Defaults to the client's ``frozen`` setting.
 
-    def on_snapshot(self, callback: Callable) -> Watch:
+        Yields:
+            :class:`~google.cloud.firestore_v1.base_query.QueryPage`:
+            The next page of documents in this collection.
+        """
+        query, kwargs = self._prep_get_or_stream(retry, timeout)
+
+        return query.paginate(
+            page_size,
+            start_after=start_after,
+            prefetch=prefetch,
+            transaction=transaction,
+            lazy=lazy,
+            frozen=frozen,
+            **kwargs,
+        )
+
+    def on_snapshot(
+        self,
+        callback: Callable,
+        changes_only: bool = False,
+        delivery: SnapshotDelivery = None,
+        fields: Iterable[str] = None,
+    ) -> Watch:
         """Monitor the documents in this collection.
 
         This starts a watch on this collection using a background thread. The
@@ -217,6 +297,22 @@ class CollectionReference(BaseCollectionReference):
         Args:
             callback (Callable[[:class:`~google.cloud.firestore.collection.CollectionSnapshot`], NoneType]):
                 a callback to run when a change occurs.
+            changes_only (bool): If True, ``callback`` is only passed the
+                :class:`~google.cloud.firestore_v1.watch.DocumentChange` list
+                and read time of each snapshot, so that its cost does not
+                grow with the number of documents watched. The ordered
+                documents are built on request by
+                :meth:`~google.cloud.firestore_v1.watch.Watch.documents`.
+            delivery (Optional[:class:`~google.cloud.firestore_v1.snapshot_delivery.SnapshotDelivery`]):
+                If passed, ``callback`` is called from the thread of
+                ``delivery``, which queues or merges the snapshots pushed
+                while it runs, rather than from the thread reading the
+                stream.
+            fields (Optional[Iterable[str]]): If passed, the watch keeps
+                only these fields of each document (and those the query is
+                ordered by), in a compact
+                :class:`~google.cloud.firestore_v1.base_document.ProjectedDocumentSnapshot`,
+                rather than a full snapshot of each document.
 
         Example:
             from google.cloud import firestore_v1
@@ -239,4 +335,7 @@ class CollectionReference(BaseCollectionReference):
             callback,
             document.DocumentSnapshot,
             document.DocumentReference,
+            changes_only=changes_only,
+            delivery=delivery,
+            fields=fields,
         )
@@ -14,6 +14,8 @@
 
 """Classes for representing documents for the Google Cloud Firestore API."""
 
+import functools
+
 from google.api_core import gapic_v1  # type: ignore
 from google.api_core import retry as retries  # type: ignore
 
@@ -26,6 +28,7 @@ from google.cloud.firestore_v1.base_document import (
 from google.api_core import exceptions  # type: ignore
 from google.cloud.firestore_v1 import _helpers
 from google.cloud.firestore_v1.types import write
+from google.cloud.firestore_v1.snapshot_delivery import SnapshotDelivery
 from google.cloud.firestore_v1.watch import Watch
 from google.protobuf import timestamp_pb2
 from typing import Any, Callable, Generator, Iterable
@@ -311,9 +314,12 @@ class DocumentReference(BaseDocumentReference):
         """
         request, kwargs = self._prep_delete(option, retry, timeout)
 
-        commit_response = self._client._firestore_api.commit(
-            request=request, metadata=self._client._rpc_metadata, **kwargs,
-        )
+        try:
+            commit_response = self._client._firestore_api.commit(
+                request=request, metadata=self._client._rpc_metadata, **kwargs,
+            )
+        finally:
+            self._client._invalidate_writes(request["writes"])
 
         return commit_response.commit_time
 
@@ -323,6 +329,8 @@ class DocumentReference(BaseDocumentReference):
         transaction=None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
         timeout: float = None,
+        lazy: bool = False,
+        frozen: bool = None,
     ) -> DocumentSnapshot:
         """Retrieve a snapshot of the current document.
 
@@ -345,6 +353,13 @@ class DocumentReference(BaseDocumentReference):
                 should be retried.  Defaults to a system-specified policy.
             timeout (float): The timeout for this request.  Defaults to a
                 system-specified value.
+            lazy (bool): If :data:`True`, return a
+                :class:`~google.cloud.firestore_v1.base_document.LazyDocumentSnapshot`
+                which only decodes the fields that are read.
+            frozen (Optional[bool]): If :data:`True`, return a
+                :class:`~google.cloud.firestore_v1.base_document.FrozenDocumentSnapshot`
+                whose data is read-only and never copied. Defaults to the
+                client's ``frozen_snapshots`` setting.
 
         Returns:
             :class:`~google.cloud.firestore_v1.base_document.DocumentSnapshot`:
@@ -356,30 +371,48 @@ class DocumentReference(BaseDocumentReference):
         """
         request, kwargs = self._prep_get(field_paths, transaction, retry, timeout)
 
-        firestore_api = self._client._firestore_api
+        cache = self._get_cache(field_paths, transaction)
+        found = False
+        if cache is not None:
+            version = cache.version
+            found, document_pb = cache.lookup(self._document_path)
+
+        if not found:
+            document_pb = self._fetch(request, kwargs, transaction)
+            if cache is not None:
+                cache.store(self._document_path, document_pb, version, reference=self)
+
+        return self._snapshot_from_pb(document_pb, lazy=lazy, frozen=frozen)
+
+    def _fetch(self, request: dict, kwargs: dict, transaction=None):
+        """Fetch the document for :meth:`get`.
+
+        Outside of a transaction, the read is shared with concurrent
+        identical reads or merged into a batch, if the client does so.
+
+        Returns:
+            Optional[google.cloud.firestore_v1.types.Document]: The
+            document, or :data:`None` if it does not exist.
+        """
+        client = self._client
+        if transaction is None and client._batch_getter is not None:
+            return client._batch_getter.get(
+                self._document_path, request["mask"], kwargs
+            )
+        if transaction is None and client._single_flight is not None:
+            return client._single_flight.do(
+                self._single_flight_key(request, kwargs),
+                functools.partial(self._get_document, request, kwargs),
+            )
+        return self._get_document(request, kwargs)
+
+    def _get_document(self, request: dict, kwargs: dict):
         try:
-            document_pb = firestore_api.get_document(
+            return self._client._firestore_api.get_document(
                 request=request, metadata=self._client._rpc_metadata, **kwargs,
             )
         except exceptions.NotFound:
-            data = None
-            exists = False
-            create_time = None
-            update_time = None
-        else:
-            data = _helpers.decode_dict(document_pb.fields, self._client)
-            exists = True
-            create_time = document_pb.create_time
-            update_time = document_pb.update_time
-
-        return DocumentSnapshot(
-            reference=self,
-            data=data,
-            exists=exists,
-            read_time=None,  # No server read_time available
-            create_time=create_time,
-            update_time=update_time,
-        )
+            return None
 
     def collections(
         self,
@@ -413,7 +446,13 @@ class DocumentReference(BaseDocumentReference):
         for collection_id in iterator:
             yield self.collection(collection_id)
 
-    def on_snapshot(self, callback: Callable) -> Watch:
+    def on_snapshot(
+        self,
+        callback: Callable,
+        changes_only: bool = False,
+        delivery: SnapshotDelivery = None,
+        fields: Iterable[str] = None,
+    ) -> Watch:
         """Watch this document.
 
         This starts a watch on this document using a background thread. The
@@ -422,6 +461,21 @@ class DocumentReference(BaseDocumentReference):
         Args:
             callback(Callable[[:class:`~google.cloud.firestore.document.DocumentSnapshot`], NoneType]):
                 a callback to run when a change occurs
+            changes_only (bool): If True, ``callback`` is only passed the
+                :class:`~google.cloud.firestore_v1.watch.DocumentChange` list
+                (with the change to this document, if any) and read time of
+                each snapshot. The current snapshot of the document is
+                returned on request by
+                :meth:`~google.cloud.firestore_v1.watch.Watch.documents`.
+            delivery (Optional[:class:`~google.cloud.firestore_v1.snapshot_delivery.SnapshotDelivery`]):
+                If passed, ``callback`` is called from the thread of
+                ``delivery``, which queues or merges the snapshots pushed
+                while it runs, rather than from the thread reading the
+                stream.
+            fields (Optional[Iterable[str]]): If passed, the watch keeps
+                only these fields of the document, in a compact
+                :class:`~google.cloud.firestore_v1.base_document.ProjectedDocumentSnapshot`,
+                rather than a full snapshot.
 
         Example:
 
@@ -445,4 +499,12 @@ class DocumentReference(BaseDocumentReference):
             # Terminate this watch
             doc_watch.unsubscribe()
         """
-        return Watch.for_document(self, callback, DocumentSnapshot, DocumentReference)
+        return Watch.for_document(
+            self,
+            callback,
+            DocumentSnapshot,
+            DocumentReference,
+            changes_only=changes_only,
+            delivery=delivery,
+            fields=fields,
+        )
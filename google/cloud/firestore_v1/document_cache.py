@@ -0,0 +1,433 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Client-side cache of documents read by a Google Cloud Firestore client."""
+
+import collections
+import functools
+import threading
+import time
+
+from google.cloud.firestore_v1 import _helpers
+from google.cloud.firestore_v1.types import document
+
+from typing import Any, Iterable, List, Optional, Tuple
+
+
+_MAX_ENTRIES: int = 1000
+"""int: Default number of documents kept in a cache."""
+_MAX_BYTES: int = 10 * 1024 * 1024
+"""int: Default size bound of a cache, in bytes of encoded documents."""
+_TTL: float = 60.0
+"""float: Default number of seconds a cached document is served for."""
+_BAD_MAX_ENTRIES: str = "``max_entries`` must be positive, got {!r}."
+_BAD_MAX_BYTES: str = "``max_bytes`` must be positive, got {!r}."
+_BAD_TTL: str = "``ttl`` must be positive or None, got {!r}."
+_WATCH_STARTING = object()
+"""Placeholder for the listener of an entry while it starts."""
+
+
+class _CacheEntry(object):
+    """A cached document.
+
+    Args:
+        document_pb (Optional[google.cloud.firestore_v1.types.Document]):
+            The document, or :data:`None` if it does not exist.
+        size (int): The approximate memory used by the entry, in bytes.
+        expires (Optional[float]): When the entry expires, according to
+            the cache's clock.
+    """
+
+    __slots__ = ("document_pb", "size", "expires", "watch")
+
+    def __init__(self, document_pb, size, expires) -> None:
+        self.document_pb = document_pb
+        self.size = size
+        self.expires = expires
+        self.watch = None
+
+    @property
+    def active_watch(self):
+        """Optional[~google.cloud.firestore_v1.watch.Watch]: The started
+        listener of the entry, if any."""
+        if self.watch is _WATCH_STARTING:
+            return None
+        return self.watch
+
+
+class DocumentCache(object):
+    """Read-through cache for the documents fetched by a client.
+
+    Pass an instance as the ``document_cache`` of a
+    :class:`~google.cloud.firestore_v1.client.Client` or
+    :class:`~google.cloud.firestore_v1.async_client.AsyncClient` to serve
+    :meth:`~google.cloud.firestore_v1.document.DocumentReference.get`
+    from memory. Only whole-document reads outside of a transaction use the
+    cache; non-existent documents are cached as well.
+
+    Documents are evicted in least-recently-used order once the cache holds
+    more than ``max_entries`` documents or ``max_bytes`` of encoded document
+    data, and are refetched once they are older than ``ttl`` seconds. Every
+    write committed by the client invalidates the documents it touches.
+
+    With ``watch``, each cached document is also kept up to date by a
+    listener on the document (see
+    :meth:`~google.cloud.firestore_v1.document.DocumentReference.on_snapshot`),
+    until it is evicted. This is only supported by
+    :class:`~google.cloud.firestore_v1.client.Client`, and is usually
+    combined with ``ttl=None``.
+
+    Args:
+        max_entries (int): The maximum number of cached documents.
+        max_bytes (int): The maximum size of the cached documents, in bytes.
+        ttl (Optional[float]): Seconds a document is served from the cache
+            before it is fetched again, or :data:`None` to never expire.
+        watch (bool): If :data:`True`, listen to changes of each cached
+            document.
+        clock (Callable[[], float]): Source of the current time, in seconds.
+
+    Raises:
+        ValueError: If ``max_entries``, ``max_bytes`` or ``ttl`` is not
+            positive.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = _MAX_ENTRIES,
+        max_bytes: int = _MAX_BYTES,
+        ttl: Optional[float] = _TTL,
+        watch: bool = False,
+        clock=time.monotonic,
+    ) -> None:
+        if max_entries <= 0:
+            raise ValueError(_BAD_MAX_ENTRIES.format(max_entries))
+        if max_bytes <= 0:
+            raise ValueError(_BAD_MAX_BYTES.format(max_bytes))
+        if ttl is not None and ttl <= 0:
+            raise ValueError(_BAD_TTL.format(ttl))
+
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._watch = watch
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: collections.OrderedDict = collections.OrderedDict()
+        self._num_bytes = 0
+        self._version = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @property
+    def watch(self) -> bool:
+        """bool: Whether cached documents are kept up to date by listeners."""
+        return self._watch
+
+    @property
+    def hits(self) -> int:
+        """int: The number of reads served from the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """int: The number of reads which had to fetch the document."""
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        """int: The number of documents evicted because of the size bounds
+        or because they expired."""
+        return self._evictions
+
+    @property
+    def invalidations(self) -> int:
+        """int: The number of documents dropped because they were written."""
+        return self._invalidations
+
+    @property
+    def num_bytes(self) -> int:
+        """int: The approximate size of the cached documents, in bytes."""
+        return self._num_bytes
+
+    @property
+    def version(self) -> int:
+        """int: Token to read before fetching a document to :meth:`store`.
+
+        Increases whenever documents are invalidated, so that a read which
+        overlapped a write never caches what it fetched.
+        """
+        return self._version
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, document_path: str) -> bool:
+        return document_path in self._entries
+
+    def lookup(self, document_path: str) -> Tuple[bool, Any]:
+        """Look up a document.
+
+        Args:
+            document_path (str): The fully-qualified path of the document.
+
+        Returns:
+            Tuple[bool, Optional[google.cloud.firestore_v1.types.Document]]:
+            Whether the document was cached, and if so the document, or
+            :data:`None` if it does not exist.
+        """
+        watches = []
+        with self._lock:
+            entry = self._entries.get(document_path)
+            if entry is not None and self._expired(entry):
+                self._evictions += 1
+                watches = self._remove(document_path)
+                entry = None
+
+            if entry is None:
+                self._misses += 1
+                found, document_pb = False, None
+            else:
+                self._hits += 1
+                self._entries.move_to_end(document_path)
+                found, document_pb = True, entry.document_pb
+
+        _unsubscribe(watches)
+        return found, document_pb
+
+    def store(
+        self, document_path: str, document_pb, version: int, reference=None
+    ) -> bool:
+        """Cache a fetched document.
+
+        Args:
+            document_path (str): The fully-qualified path of the document.
+            document_pb (Optional[google.cloud.firestore_v1.types.Document]):
+                The document, or :data:`None` if it does not exist.
+            version (int): The :attr:`version` read before fetching the
+                document.
+            reference (Optional[~google.cloud.firestore_v1.document.DocumentReference]):
+                The reference used to listen to the document, if ``watch``.
+
+        Returns:
+            bool: :data:`True` if the document was cached. A document is not
+            cached if some documents were invalidated while it was fetched,
+            if it is older than the cached one, or if it is too large.
+        """
+        with self._lock:
+            if version != self._version:
+                return False
+            stored = self._put(document_path, document_pb)
+            watches = self._evict()
+            entry = self._entries.get(document_path)
+            start_watch = (
+                stored
+                and self._watch
+                and reference is not None
+                and entry is not None
+                and entry.watch is None
+            )
+            if start_watch:
+                # Mark the entry first: ``on_snapshot`` may call back at once.
+                entry.watch = _WATCH_STARTING
+
+        _unsubscribe(watches)
+        if start_watch:
+            self._start_watch(document_path, reference)
+        return stored
+
+    def invalidate(self, document_paths: Iterable[str]) -> None:
+        """Drop documents which may have changed.
+
+        Args:
+            document_paths (Iterable[str]): Fully-qualified paths of the
+                documents.
+        """
+        watches = []
+        with self._lock:
+            self._version += 1
+            for document_path in document_paths:
+                if document_path in self._entries:
+                    self._invalidations += 1
+                    watches.extend(self._remove(document_path))
+
+        _unsubscribe(watches)
+
+    def invalidate_writes(self, write_pbs: Iterable[Any]) -> None:
+        """Drop the documents changed by some writes.
+
+        Args:
+            write_pbs (Iterable[google.cloud.firestore_v1.types.Write]): The
+                writes, committed or not.
+        """
+        self.invalidate(_written_paths(write_pbs))
+
+    def clear(self) -> None:
+        """Drop every cached document."""
+        with self._lock:
+            self._version += 1
+            watches = [entry.active_watch for entry in self._entries.values()]
+            self._entries.clear()
+            self._num_bytes = 0
+
+        _unsubscribe(watch for watch in watches if watch is not None)
+
+    def _expired(self, entry: _CacheEntry) -> bool:
+        return entry.expires is not None and entry.expires <= self._clock()
+
+    def _put(self, document_path: str, document_pb) -> bool:
+        """Add or replace an entry.  Must be called with the lock held."""
+        size = _entry_size(document_path, document_pb)
+        if size > self._max_bytes:
+            return False
+
+        entry = self._entries.get(document_path)
+        if entry is None:
+            entry = self._entries[document_path] = _CacheEntry(None, 0, None)
+        elif _older(document_pb, entry.document_pb):
+            return False
+
+        self._num_bytes += size - entry.size
+        entry.document_pb = document_pb
+        entry.size = size
+        entry.expires = None if self._ttl is None else self._clock() + self._ttl
+        self._entries.move_to_end(document_path)
+        return True
+
+    def _remove(self, document_path: str) -> List[Any]:
+        """Remove an entry.  Must be called with the lock held.
+
+        Returns:
+            List[~google.cloud.firestore_v1.watch.Watch]: The listener of
+            the entry, to be unsubscribed once the lock is released.
+        """
+        entry = self._entries.pop(document_path)
+        self._num_bytes -= entry.size
+        if entry.active_watch is None:
+            return []
+        return [entry.active_watch]
+
+    def _evict(self) -> List[Any]:
+        """Evict entries beyond the bounds.  Must be called with the lock held.
+
+        Returns:
+            List[~google.cloud.firestore_v1.watch.Watch]: The listeners of
+            the evicted entries.
+        """
+        watches = []
+        while (
+            len(self._entries) > self._max_entries or self._num_bytes > self._max_bytes
+        ):
+            document_path = next(iter(self._entries))
+            self._evictions += 1
+            watches.extend(self._remove(document_path))
+        return watches
+
+    def _start_watch(self, document_path: str, reference) -> None:
+        callback = functools.partial(self._on_snapshot, document_path)
+        watch = reference.on_snapshot(callback)
+        with self._lock:
+            entry = self._entries.get(document_path)
+            if entry is not None and entry.watch is _WATCH_STARTING:
+                entry.watch = watch
+                watch = None
+
+        # The entry went away while the listener was starting.
+        _unsubscribe([watch] if watch is not None else [])
+
+    def _on_snapshot(self, document_path: str, snapshots, changes, read_time) -> None:
+        """Refresh a cached document from its listener."""
+        document_pb = None
+        for snapshot in snapshots:
+            document_pb = document.Document(
+                name=document_path,
+                fields=_helpers.encode_dict(snapshot._data),
+                create_time=snapshot.create_time,
+                update_time=snapshot.update_time,
+            )
+
+        with self._lock:
+            if document_path not in self._entries:
+                return
+            if _entry_size(document_path, document_pb) > self._max_bytes:
+                self._evictions += 1
+                watches = self._remove(document_path)
+            else:
+                self._put(document_path, document_pb)
+                watches = self._evict()
+
+        _unsubscribe(watches)
+
+
+def _entry_size(document_path: str, document_pb) -> int:
+    """Approximate the memory used by a cached document, in bytes."""
+    size = len(document_path)
+    if document_pb is not None:
+        size += type(document_pb).pb(document_pb).ByteSize()
+    return size
+
+
+def _older(document_pb, cached_pb) -> bool:
+    """Whether a fetched document is older than the cached one."""
+    if document_pb is None or cached_pb is None:
+        return False
+    return document_pb.update_time < cached_pb.update_time
+
+
+def _written_paths(write_pbs: Iterable[Any]) -> List[str]:
+    """Get the paths of the documents changed by some writes.
+
+    Args:
+        write_pbs (Iterable[google.cloud.firestore_v1.types.Write]): The
+            writes.
+
+    Returns:
+        List[str]: The fully-qualified paths of the written documents.
+    """
+    document_paths = []
+    for write_pb in write_pbs:
+        operation = write_pb._pb.WhichOneof("operation")
+        if operation == "update":
+            document_paths.append(write_pb.update.name)
+        elif operation == "delete":
+            document_paths.append(write_pb.delete)
+        elif operation == "transform":
+            document_paths.append(write_pb.transform.document)
+    return document_paths
+
+
+def _unsubscribe(watches: Iterable[Any]) -> Optional[threading.Thread]:
+    """Unsubscribe listeners of documents which are no longer cached.
+
+    Closing a listener joins its threads, so this happens in a background
+    thread: it may be called from a listener's own callback.
+
+    Returns:
+        Optional[threading.Thread]: The thread unsubscribing the listeners,
+        if any.
+    """
+    watches = list(watches)
+    if not watches:
+        return None
+
+    def unsubscribe_all():
+        for watch in watches:
+            watch.unsubscribe()
+
+    thread = threading.Thread(
+        target=unsubscribe_all, name="DocumentCache.unsubscribe", daemon=True
+    )
+    thread.start()
+    return thread
@@ -16,8 +16,10 @@
 
 from collections import abc
 
+import functools
 import re
 from typing import Iterable
+from typing import Tuple
 
 
 _FIELD_PATH_MISSING_TOP = "{!r} is not contained in the data"
@@ -26,6 +28,8 @@ _FIELD_PATH_WRONG_TYPE = (
     "The data at {!r} is not a dictionary, so it cannot contain the key {!r}"
 )
 
+_BAD_PART = "One or more components is not a string or is empty."
+
 _FIELD_PATH_DELIMITER = "."
 _BACKSLASH = "\\"
 _ESCAPED_BACKSLASH = _BACKSLASH * 2
@@ -42,6 +46,9 @@ PATH_ELEMENT_TOKENS = [
 TOKENS_PATTERN = "|".join("(?P<{}>{})".format(*pair) for pair in PATH_ELEMENT_TOKENS)
 TOKENS_REGEX = re.compile(TOKENS_PATTERN)
 
+_CACHE_SIZE: int = 4096
+"""int: Maximum number of field paths remembered by each parsing cache."""
+
 
 def _tokenize_field_path(path: str):
     """Lex a field path into tokens (including dots).
@@ -64,6 +71,13 @@ def _tokenize_field_path(path: str):
         raise ValueError("Path {} not consumed, residue: {}".format(path, path[pos:]))
 
 
+def _is_simple_field_name(field_name: str) -> bool:
+    """Check that a field name matches ``[_a-zA-Z][_a-zA-Z0-9]*``."""
+    # An ASCII identifier; the name encodes to as many bytes as it has
+    # characters only if it is all ASCII (``str.isascii`` needs 3.7).
+    return field_name.isidentifier() and len(field_name.encode()) == len(field_name)
+
+
 def split_field_path(path: str):
     """Split a field path into valid elements (without dots).
 
@@ -75,8 +89,19 @@ def split_field_path(path: str):
         ValueError: if the path does not match the elements-interspersed-
                     with-dots pattern.
     """
+    return list(_split_field_path(path))
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _split_field_path(path: str) -> Tuple[str, ...]:
+    """Memoized :func:`split_field_path`, returning a tuple."""
     if not path:
-        return []
+        return ()
+
+    # Fast path: only simple field names, which need no tokenizing.
+    elements = path.split(_FIELD_PATH_DELIMITER)
+    if all(map(_is_simple_field_name, elements)):
+        return tuple(elements)
 
     elements = []
     want_dot = False
@@ -96,7 +121,7 @@ def split_field_path(path: str):
     if not want_dot or not elements:
         raise ValueError("Invalid path: {}".format(path))
 
-    return elements
+    return tuple(elements)
 
 
 def parse_field_path(api_repr: str):
@@ -115,17 +140,23 @@ def parse_field_path(api_repr: str):
     Returns:
         List[str, ...]: The list of field names in the field path.
     """
+    return list(_parse_field_path(api_repr))
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _parse_field_path(api_repr: str) -> Tuple[str, ...]:
+    """Memoized :func:`parse_field_path`, returning a tuple."""
     # code dredged back up from
     # https://github.com/googleapis/google-cloud-python/pull/5109/files
     field_names = []
-    for field_name in split_field_path(api_repr):
+    for field_name in _split_field_path(api_repr):
         # non-simple field name
         if field_name[0] == "`" and field_name[-1] == "`":
             field_name = field_name[1:-1]
             field_name = field_name.replace(_ESCAPED_BACKTICK, _BACKTICK)
             field_name = field_name.replace(_ESCAPED_BACKSLASH, _BACKSLASH)
         field_names.append(field_name)
-    return field_names
+    return tuple(field_names)
 
 
 def render_field_path(field_names: Iterable[str]):
@@ -154,11 +185,16 @@ def render_field_path(field_names: Iterable[str]):
     Returns:
         str: The ``.``-delimited field path.
     """
+    return _render_field_path(tuple(field_names))
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _render_field_path(field_names: Tuple[str, ...]) -> str:
+    """Memoized :func:`render_field_path`, taking a tuple."""
     result = []
 
     for field_name in field_names:
-        match = _SIMPLE_FIELD_NAME.match(field_name)
-        if match and match.group(0) == field_name:
+        if _is_simple_field_name(field_name):
             result.append(field_name)
         else:
             replaced = field_name.replace(_BACKSLASH, _ESCAPED_BACKSLASH).replace(
@@ -226,7 +262,7 @@ def get_nested_value(field_path: str, data: dict):
     Raises:
         KeyError: If the ``field_path`` does not match nested data.
     """
-    field_names = parse_field_path(field_path)
+    field_names = _parse_field_path(field_path)
 
     nested_data = data
     for index, field_name in enumerate(field_names):
@@ -260,17 +296,36 @@ class FieldPath(object):
     must be quoted using backticks, with internal backticks and backslashes
     escaped with a backslash.
 
+    Instances are immutable. Those created from strings by
+    :meth:`from_api_repr` and :meth:`from_string` are shared: parsing the
+    same string again returns the same instance.
+
     Args:
         parts: (one or more strings)
             Indicating path of the key to be used.
     """
 
+    __slots__ = ("_parts", "_hash")
+
     def __init__(self, *parts):
         for part in parts:
             if not isinstance(part, str) or not part:
-                error = "One or more components is not a string or is empty."
-                raise ValueError(error)
-        self.parts = tuple(parts)
+                raise ValueError(_BAD_PART)
+        self._parts = parts
+        self._hash = None
+
+    @classmethod
+    def _from_parts(cls, parts):
+        """Create an instance from a tuple of already validated parts."""
+        field_path = cls.__new__(cls)
+        field_path._parts = parts
+        field_path._hash = None
+        return field_path
+
+    @property
+    def parts(self):
+        """Tuple[str, ...]: The field names of the path."""
+        return self._parts
 
     @classmethod
     def from_api_repr(cls, api_repr: str):
@@ -284,10 +339,7 @@ class FieldPath(object):
         Raises:
             ValueError if the parsing fails
         """
-        api_repr = api_repr.strip()
-        if not api_repr:
-            raise ValueError("Field path API representation cannot be empty.")
-        return cls(*parse_field_path(api_repr))
+        return _field_path_from_api_repr(cls, api_repr)
 
     @classmethod
     def from_string(cls, path_string: str):
@@ -304,20 +356,7 @@ class FieldPath(object):
         Returns:
             (:class:`FieldPath`) An instance parsed from ``path_string``.
         """
-        try:
-            return cls.from_api_repr(path_string)
-        except ValueError:
-            elements = path_string.split(".")
-            for element in elements:
-                if not element:
-                    raise ValueError("Empty element")
-                if _LEADING_ALPHA_INVALID.match(element):
-                    raise ValueError(
-                        "Non-alphanum char in element with leading alpha: {}".format(
-                            element
-                        )
-                    )
-            return FieldPath(*elements)
+        return _field_path_from_string(cls, path_string)
 
     def __repr__(self):
         paths = ""
@@ -327,7 +366,9 @@ class FieldPath(object):
         return "FieldPath({})".format(paths)
 
     def __hash__(self):
-        return hash(self.to_api_repr())
+        if self._hash is None:
+            self._hash = hash(self.to_api_repr())
+        return self._hash
 
     def __eq__(self, other):
         if isinstance(other, FieldPath):
@@ -389,3 +430,31 @@ class FieldPath(object):
         Returns: A special sentinel value to refer to the ID of a document.
         """
         return "__name__"
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _field_path_from_api_repr(cls, api_repr: str) -> FieldPath:
+    """Memoized :meth:`FieldPath.from_api_repr`."""
+    api_repr = api_repr.strip()
+    if not api_repr:
+        raise ValueError("Field path API representation cannot be empty.")
+    return cls(*_parse_field_path(api_repr))
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _field_path_from_string(cls, path_string: str) -> FieldPath:
+    """Memoized :meth:`FieldPath.from_string`."""
+    try:
+        return _field_path_from_api_repr(cls, path_string)
+    except ValueError:
+        elements = path_string.split(".")
+        for element in elements:
+            if not element:
+                raise ValueError("Empty element")
+            if _LEADING_ALPHA_INVALID.match(element):
+                raise ValueError(
+                    "Non-alphanum char in element with leading alpha: {}".format(
+                        element
+                    )
+                )
+        return FieldPath(*elements)
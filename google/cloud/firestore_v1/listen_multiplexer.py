@@ -0,0 +1,392 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Sharing of ``Listen`` streams between the watches of a client.
+
+Each :class:`~google.cloud.firestore_v1.watch.Watch` opens its own
+``Listen`` stream, read by its own background thread. A client created
+with ``listen_streams`` instead adds the target of each watch to one of at
+most that many shared streams, and routes the responses of a stream to the
+watches of the targets they name.
+"""
+
+import itertools
+import logging
+import queue
+import threading
+
+from google.api_core import retry as retries  # type: ignore
+
+from google.cloud.firestore_v1.base_transaction import _INITIAL_SLEEP
+from google.cloud.firestore_v1.base_transaction import _MAX_SLEEP
+from google.cloud.firestore_v1.base_transaction import _MULTIPLIER
+from google.cloud.firestore_v1.types import firestore
+from google.cloud.firestore_v1.watch import Watch
+from google.cloud.firestore_v1.watch import _maybe_wrap_exception
+from google.cloud.firestore_v1.watch import _should_recover
+from google.cloud.firestore_v1.watch import _should_terminate
+
+from typing import List
+
+
+_LOGGER = logging.getLogger(__name__)
+
+_BAD_MAX_STREAMS: str = "``max_streams`` must be positive, got {!r}."
+_STREAM_THREAD_NAME: str = "Thread-ListenStream"
+_NO_CHANGE = firestore.TargetChange.TargetChangeType.NO_CHANGE
+_REMOVE = firestore.TargetChange.TargetChangeType.REMOVE
+
+
+class MultiplexedWatch(Watch):
+    """A watch whose target shares a ``Listen`` stream with other watches.
+
+    Created by :meth:`ListenMultiplexer.watch`. Snapshots are delivered on
+    the thread reading the shared stream.
+    """
+
+    def __init__(
+        self,
+        stream,
+        document_reference,
+        firestore,
+        target,
+        comparator,
+        snapshot_callback,
+        document_snapshot_cls,
+        document_reference_cls,
+        sort_key=None,
+        changes_only=False,
+        delivery=None,
+        fields=None,
+    ):
+        self._init_state(
+            document_reference,
+            firestore,
+            target,
+            comparator,
+            snapshot_callback,
+            document_snapshot_cls,
+            document_reference_cls,
+            sort_key,
+            changes_only,
+            delivery,
+            fields,
+        )
+        self._stream = stream
+        self._closed = False
+
+    @property
+    def is_active(self):
+        """bool: True until the target of this watch is removed."""
+        return not self._closed
+
+    def close(self, reason=None):
+        """Remove the target of this watch from its stream.
+
+        This method is idempotent. Additional calls will have no effect.
+
+        Args:
+            reason (Any): The reason to close this. If None, this is
+                considered an "intentional" shutdown. Otherwise it is
+                logged: the stream, and the other watches on it, go on.
+        """
+        if reason is not None:
+            _LOGGER.error("Closing watch of target %s: %s", self._target_id, reason)
+        self._stream.remove(self)
+
+    def _on_delivery_error(self, exc):
+        self.close(reason=exc)
+
+    def _set_closed(self):
+        self._closed = True
+        if self._delivery is not None:
+            self._delivery.close()
+
+
+class _ListenStream(object):
+    """A ``Listen`` stream carrying the targets of several watches.
+
+    The stream is read by its own thread, which reopens it after
+    recoverable errors, adding every target again with its resume token.
+
+    Args:
+        multiplexer (ListenMultiplexer): The multiplexer owning the stream,
+            whose lock guards the state of the stream.
+    """
+
+    def __init__(self, multiplexer) -> None:
+        self._multiplexer = multiplexer
+        self._client = multiplexer._client
+        self._lock = multiplexer._lock
+        self.watches: dict = {}
+        self._requests = None
+        self._call = None
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(name=_STREAM_THREAD_NAME, target=self._run)
+        self._thread.daemon = True
+
+    def add(self, watch: MultiplexedWatch) -> None:
+        """Add the target of a watch. Call with the lock held."""
+        self.watches[watch._target_id] = watch
+        if self._requests is not None:
+            self._requests.put(watch._get_rpc_request())
+        if not self._thread.is_alive() and not self._stopped.is_set():
+            self._thread.start()
+
+    def remove(self, watch: MultiplexedWatch, send: bool = True) -> None:
+        """Remove the target of a watch, unless it is already removed.
+
+        Args:
+            watch (MultiplexedWatch): The watch to remove.
+            send (bool): Whether to ask the server to remove the target.
+        """
+        with self._lock:
+            if self.watches.pop(watch._target_id, None) is None:
+                return
+            watch._set_closed()
+            if not self.watches:
+                self._stop()
+            elif send and self._requests is not None:
+                self._requests.put(
+                    firestore.ListenRequest(
+                        database=self._client._database_string,
+                        remove_target=watch._target_id,
+                    )
+                )
+
+    def _stop(self) -> None:
+        """Close the stream. Call with the lock held."""
+        self._stopped.set()
+        self._multiplexer._streams.remove(self)
+        for watch in self.watches.values():
+            watch._set_closed()
+        self.watches.clear()
+        if self._requests is not None:
+            self._requests.put(None)
+        if self._call is not None:
+            self._call.cancel()
+
+    @staticmethod
+    def _request_iterator(initial, requests):
+        for request in initial:
+            yield request
+        while True:
+            request = requests.get()
+            if request is None:
+                return
+            yield request
+
+    def _run(self) -> None:
+        delays = None
+        while True:
+            with self._lock:
+                if self._stopped.is_set():
+                    return
+                if self._requests is not None:
+                    # End the request iterator of the previous stream.
+                    self._requests.put(None)
+                self._requests = requests = queue.Queue()
+                initial = [watch._get_rpc_request() for watch in self.watches.values()]
+                self._call = call = self._client._firestore_api._transport.listen(
+                    self._request_iterator(initial, requests),
+                    metadata=self._client._rpc_metadata,
+                )
+
+            try:
+                for response in call:
+                    # The stream is healthy again: restart the backoff.
+                    delays = None
+                    self._route(response)
+            except Exception as exc:
+                exc = _maybe_wrap_exception(exc)
+                if self._stopped.is_set():
+                    return
+                if _should_terminate(exc) or not _should_recover(exc):
+                    self._fail(exc)
+                    return
+                _LOGGER.debug("Listen stream failed, resuming: %s", exc)
+
+            if delays is None:
+                delays = retries.exponential_sleep_generator(
+                    _INITIAL_SLEEP, _MAX_SLEEP, _MULTIPLIER
+                )
+            if self._stopped.wait(next(delays)):
+                return
+
+    def _route(self, response) -> None:
+        """Pass a response to the watches of the targets it names."""
+        response_pb = response._pb
+        kind = response_pb.WhichOneof("response_type")
+        removed = False
+        consistent = False
+        if kind == "target_change":
+            change_pb = response_pb.target_change
+            target_ids = change_pb.target_ids
+            removed = change_pb.target_change_type == _REMOVE
+            consistent = (
+                not target_ids
+                and change_pb.target_change_type == _NO_CHANGE
+                and change_pb.HasField("read_time")
+            )
+        elif kind == "document_change":
+            change_pb = response_pb.document_change
+            target_ids = list(change_pb.target_ids) + list(change_pb.removed_target_ids)
+        elif kind == "filter":
+            target_ids = [response_pb.filter.target_id]
+        elif kind is not None:
+            # A document delete or remove.
+            target_ids = getattr(response_pb, kind).removed_target_ids
+        else:
+            target_ids = ()
+
+        with self._lock:
+            if target_ids:
+                watches = [
+                    self.watches[target_id]
+                    for target_id in target_ids
+                    if target_id in self.watches
+                ]
+            else:
+                # No target IDs: the response concerns every target.
+                watches = list(self.watches.values())
+
+        if consistent:
+            # Every target is consistent at ``read_time``: decode the
+            # response once, rather than once per watch.
+            read_time = response.target_change.read_time
+            resume_token = change_pb.resume_token
+
+            def deliver(watch):
+                if watch.current:
+                    watch.push(read_time, resume_token)
+
+        else:
+
+            def deliver(watch):
+                watch.on_snapshot(response)
+
+        for watch in watches:
+            try:
+                deliver(watch)
+            except Exception as exc:
+                _LOGGER.error("Closing watch of target %s: %s", watch._target_id, exc)
+                self.remove(watch, send=not removed)
+
+    def _fail(self, exc: Exception) -> None:
+        """Close the stream, and its watches, after a terminal error."""
+        _LOGGER.error("Listen stream terminated: %s", exc)
+        with self._lock:
+            if not self._stopped.is_set():
+                self._stop()
+
+
+class ListenMultiplexer(object):
+    """Shares ``Listen`` streams between the watches of a client.
+
+    The target of each watch gets its own target ID and is added to the
+    open stream with the fewest targets, or to a new stream while fewer
+    than ``max_streams`` are open. Removing a target removes it from its
+    stream, and a stream without targets is closed.
+
+    Args:
+        client (:class:`~google.cloud.firestore_v1.client.Client`):
+            The client listening.
+        max_streams (Optional[int]): The maximum number of streams open at
+            once.
+
+    Raises:
+        ValueError: If ``max_streams`` is not positive.
+    """
+
+    def __init__(self, client, max_streams: int = 1) -> None:
+        if max_streams < 1:
+            raise ValueError(_BAD_MAX_STREAMS.format(max_streams))
+        self._client = client
+        self._max_streams = max_streams
+        self._lock = threading.Lock()
+        self._streams: list = []
+        self._target_ids = itertools.count(1)
+
+    @property
+    def targets(self) -> List[int]:
+        """List[int]: The number of targets on each open stream."""
+        with self._lock:
+            return [len(stream.watches) for stream in self._streams]
+
+    def watch(
+        self,
+        document_reference,
+        target,
+        comparator,
+        snapshot_callback,
+        document_snapshot_cls,
+        document_reference_cls,
+        sort_key=None,
+        changes_only=False,
+        delivery=None,
+        fields=None,
+    ) -> MultiplexedWatch:
+        """Start a watch on a shared stream.
+
+        Args:
+            document_reference: The document or query being watched.
+            target (dict): The ``Target`` to listen to, without its
+                ``target_id``.
+            comparator (Callable[[DocumentSnapshot, DocumentSnapshot], int]):
+                Orders the documents of the target.
+            snapshot_callback (Callable): Called with the ``documents``,
+                ``changes`` and ``read_time`` of each snapshot.
+            document_snapshot_cls: The class of the document snapshots.
+            document_reference_cls: The class of the document references.
+            sort_key: Optional key function ordering documents consistently
+                with ``comparator``.
+            changes_only (bool): If True, ``snapshot_callback`` is called
+                with ``changes`` and ``read_time`` only.
+            delivery (Optional[~.firestore_v1.snapshot_delivery.SnapshotDelivery]):
+                Calls ``snapshot_callback`` from a thread of its own.
+            fields (Optional[Tuple[Tuple[str, ...], ...]]): The field paths
+                kept for each document, if not all.
+
+        Returns:
+            MultiplexedWatch: The started watch.
+        """
+        with self._lock:
+            target["target_id"] = next(self._target_ids)
+            if len(self._streams) < self._max_streams:
+                stream = _ListenStream(self)
+                self._streams.append(stream)
+            else:
+                stream = min(self._streams, key=lambda stream: len(stream.watches))
+            watch = MultiplexedWatch(
+                stream,
+                document_reference,
+                self._client,
+                target,
+                comparator,
+                snapshot_callback,
+                document_snapshot_cls,
+                document_reference_cls,
+                sort_key=sort_key,
+                changes_only=changes_only,
+                delivery=delivery,
+                fields=fields,
+            )
+            stream.add(watch)
+        return watch
+
+    def close(self) -> None:
+        """Close every stream, removing the targets of all watches."""
+        with self._lock:
+            for stream in list(self._streams):
+                stream._stop()
@@ -12,10 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections import abc
+import datetime
 from enum import Enum
+from google.api_core.datetime_helpers import DatetimeWithNanoseconds  # type: ignore
+from google.cloud._helpers import _datetime_to_pb_timestamp  # type: ignore
 from google.cloud.firestore_v1._helpers import decode_value
+from google.cloud.firestore_v1._helpers import GeoPoint
 import math
-from typing import Any
+from typing import Any, Tuple
 
 
 class TypeOrder(Enum):
@@ -206,3 +211,138 @@ class Order(object):
         # in Python 3, so this is an equivalent suggested by
         # https://docs.python.org/3.0/whatsnew/3.0.html#ordering-comparisons
         return (left > right) - (left < right)
+
+
+_NULL_ORDER = TypeOrder.NULL.value
+_BOOLEAN_ORDER = TypeOrder.BOOLEAN.value
+_NUMBER_ORDER = TypeOrder.NUMBER.value
+_TIMESTAMP_ORDER = TypeOrder.TIMESTAMP.value
+_STRING_ORDER = TypeOrder.STRING.value
+_BLOB_ORDER = TypeOrder.BLOB.value
+_REF_ORDER = TypeOrder.REF.value
+_GEO_POINT_ORDER = TypeOrder.GEO_POINT.value
+_ARRAY_ORDER = TypeOrder.ARRAY.value
+_OBJECT_ORDER = TypeOrder.OBJECT.value
+
+
+def value_sort_key(value) -> Tuple:
+    """Compute a natively comparable sort key for a native Python value.
+
+    Keys of two values compare the same way :meth:`Order.compare` compares
+    the encoded values, so ``sorted(values, key=value_sort_key)`` follows
+    the ordering of the backend without encoding each value to a protobuf
+    for every comparison.
+
+    Args:
+        value (Union[NoneType, bool, int, float, datetime.datetime, \
+            str, bytes, dict, ~google.cloud.Firestore.GeoPoint]): A native
+            Python value, as stored in a document snapshot.
+
+    Returns:
+        tuple: The sort key, starting with the :class:`TypeOrder` of
+        ``value``.
+
+    Raises:
+        TypeError: If the ``value`` is not one of the accepted types.
+    """
+    if value is None:
+        return (_NULL_ORDER,)
+
+    # Must come before int since ``bool`` is an integer subtype.
+    if isinstance(value, bool):
+        return (_BOOLEAN_ORDER, value)
+
+    if isinstance(value, int):
+        return (_NUMBER_ORDER, 1, value)
+
+    if isinstance(value, float):
+        # NaN sorts before every other number, and equal to itself.
+        if math.isnan(value):
+            return (_NUMBER_ORDER, 0)
+        return (_NUMBER_ORDER, 1, value)
+
+    if isinstance(value, DatetimeWithNanoseconds):
+        timestamp_pb = value.timestamp_pb()
+        return (_TIMESTAMP_ORDER, timestamp_pb.seconds, timestamp_pb.nanos)
+
+    if isinstance(value, datetime.datetime):
+        timestamp_pb = _datetime_to_pb_timestamp(value)
+        return (_TIMESTAMP_ORDER, timestamp_pb.seconds, timestamp_pb.nanos)
+
+    if isinstance(value, str):
+        return (_STRING_ORDER, value)
+
+    if isinstance(value, bytes):
+        return (_BLOB_ORDER, value)
+
+    document_path = getattr(value, "_document_path", None)
+    if document_path is not None:
+        return (_REF_ORDER, tuple(document_path.split("/")))
+
+    if isinstance(value, GeoPoint):
+        return (_GEO_POINT_ORDER, value.latitude, value.longitude)
+
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return (_ARRAY_ORDER, tuple(value_sort_key(element) for element in value))
+
+    # Read-only snapshots hold their maps in other mapping types.
+    if isinstance(value, abc.Mapping):
+        return (
+            _OBJECT_ORDER,
+            tuple((key, value_sort_key(value[key])) for key in sorted(value)),
+        )
+
+    raise TypeError("Cannot compute a sort key", value, "Invalid type", type(value))
+
+
+# Keys of these types hold only numbers, so negating every element of the key
+# inverts its ordering.
+_NEGATABLE_ORDERS = frozenset(
+    [_NULL_ORDER, _BOOLEAN_ORDER, _NUMBER_ORDER, _TIMESTAMP_ORDER, _GEO_POINT_ORDER]
+)
+
+
+def descending_sort_key(key) -> Tuple:
+    """Invert a key returned by :func:`value_sort_key`.
+
+    Keys of numeric types are negated element-wise, so they still compare
+    natively; other payloads are wrapped in a :class:`DescendingKey`.
+
+    Args:
+        key (tuple): A key returned by :func:`value_sort_key`.
+
+    Returns:
+        tuple: A key sorting in the opposite order.
+    """
+    type_order = key[0]
+    if type_order in _NEGATABLE_ORDERS:
+        return tuple(-element for element in key)
+    return (-type_order, DescendingKey(key[1:]))
+
+
+class DescendingKey(object):
+    """Wrap a sort key so that it sorts in descending order.
+
+    Args:
+        key (Any): The wrapped sort key.
+    """
+
+    __slots__ = ("key",)
+
+    def __init__(self, key) -> None:
+        self.key = key
+
+    def __eq__(self, other):
+        if not isinstance(other, DescendingKey):
+            return NotImplemented
+        return self.key == other.key
+
+    def __lt__(self, other):
+        if not isinstance(other, DescendingKey):
+            return NotImplemented
+        return other.key < self.key
+
+    def __gt__(self, other):
+        if not isinstance(other, DescendingKey):
+            return NotImplemented
+        return self.key < other.key
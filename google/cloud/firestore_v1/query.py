@@ -19,23 +19,39 @@ a :class:`~google.cloud.firestore_v1.collection.Collection` and that can be
 a more common way to create a query than direct usage of the constructor.
 """
 
+import concurrent.futures
+import functools
+import queue
+import threading
+import time
+
 from google.api_core import gapic_v1  # type: ignore
 from google.api_core import retry as retries  # type: ignore
 
 from google.cloud.firestore_v1.base_query import (
     BaseCollectionGroup,
     BaseQuery,
+    QueryPage,
     QueryPartition,
-    _query_response_to_snapshot,
-    _collection_group_query_response_to_snapshot,
+    _MAX_RESUME_ATTEMPTS,
+    _PARALLEL_STREAM_BUFFER,
+    _PARTITION_DONE,
+    _PartitionError,
+    _RESUMABLE_ERRORS,
+    _encode_page_cursor,
     _enum_from_direction,
 )
 
 from google.cloud.firestore_v1 import document
+from google.cloud.firestore_v1.base_transaction import _INITIAL_SLEEP
+from google.cloud.firestore_v1.base_transaction import _MAX_SLEEP
+from google.cloud.firestore_v1.base_transaction import _MULTIPLIER
+from google.cloud.firestore_v1.snapshot_delivery import SnapshotDelivery
 from google.cloud.firestore_v1.watch import Watch
 from typing import Any
 from typing import Callable
 from typing import Generator
+from typing import Iterable
 
 
 class Query(BaseQuery):
@@ -160,17 +176,48 @@ class Query(BaseQuery):
                 )
             self._limit_to_last = False
 
-        result = self.stream(transaction=transaction, retry=retry, timeout=timeout)
+        if transaction is None and self._client._single_flight is not None:
+            result = self._get_shared(retry, timeout)
+        else:
+            result = self.stream(transaction=transaction, retry=retry, timeout=timeout)
         if is_limited_to_last:
             result = reversed(list(result))
 
         return list(result)
 
+    def _get_shared(
+        self, retry: retries.Retry = gapic_v1.method.DEFAULT, timeout: float = None,
+    ) -> list:
+        """Run the query for :meth:`get`, sharing the ``RunQuery`` RPC with
+        concurrent identical calls.
+
+        The responses are shared, while each caller gets its own snapshots.
+        """
+        request, expected_prefix, kwargs = self._prep_stream(None, retry, timeout)
+        responses = self._client._single_flight.do(
+            self._single_flight_key(request, kwargs),
+            functools.partial(self._run_query, request, kwargs),
+        )
+        snapshots = [
+            self._response_to_snapshot(response, expected_prefix)
+            for response in responses
+        ]
+        return [snapshot for snapshot in snapshots if snapshot is not None]
+
+    def _run_query(self, request: dict, kwargs: dict) -> list:
+        response_iterator = self._client._firestore_api.run_query(
+            request=request, metadata=self._client._rpc_metadata, **kwargs,
+        )
+        return list(response_iterator)
+
     def stream(
         self,
         transaction=None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
         timeout: float = None,
+        lazy: bool = False,
+        frozen: bool = None,
+        resumable: bool = False,
     ) -> Generator[document.DocumentSnapshot, Any, None]:
         """Read the documents in the collection that match this query.
 
@@ -183,7 +230,8 @@ class Query(BaseQuery):
            The underlying stream of responses will time out after
            the ``max_rpc_timeout_millis`` value set in the GAPIC
            client configuration for the ``RunQuery`` API.  Snapshots
-           not consumed from the iterator before that point will be lost.
+           not consumed from the iterator before that point will be lost,
+           unless ``resumable`` is :data:`True`.
 
         If a ``transaction`` is used and it already has write operations
         added, this method cannot be used (i.e. read-after-write is not
@@ -197,11 +245,35 @@ class Query(BaseQuery):
                 should be retried.  Defaults to a system-specified policy.
             timeout (float): The timeout for this request.  Defaults to a
                 system-specified value.
+            lazy (bool): If :data:`True`, yield
+                :class:`~google.cloud.firestore_v1.base_document.LazyDocumentSnapshot`
+                instances which only decode the fields that are read.
+            frozen (Optional[bool]): If :data:`True`, yield
+                :class:`~google.cloud.firestore_v1.base_document.FrozenDocumentSnapshot`
+                instances whose data is read-only and never copied. Defaults
+                to the client's ``frozen_snapshots`` setting.
+            resumable (bool): If :data:`True`, restart the query after the
+                last document received when the stream fails with a
+                transient error, adjusting its limit and offset, so that
+                each document is still yielded exactly once. When the query
+                selects fields, the fields it is ordered by are selected
+                as well.
 
         Yields:
             :class:`~google.cloud.firestore_v1.document.DocumentSnapshot`:
             The next document that fulfills the query.
         """
+        if resumable:
+            stream_kwargs = {
+                "transaction": transaction,
+                "retry": retry,
+                "timeout": timeout,
+                "lazy": lazy,
+                "frozen": frozen,
+            }
+            yield from _resumable_stream(self, _MAX_RESUME_ATTEMPTS, stream_kwargs)
+            return
+
         request, expected_prefix, kwargs = self._prep_stream(
             transaction, retry, timeout,
         )
@@ -211,18 +283,122 @@ class Query(BaseQuery):
         )
 
         for response in response_iterator:
-            if self._all_descendants:
-                snapshot = _collection_group_query_response_to_snapshot(
-                    response, self._parent
-                )
-            else:
-                snapshot = _query_response_to_snapshot(
-                    response, self._parent, expected_prefix
-                )
+            snapshot = self._response_to_snapshot(
+                response, expected_prefix, lazy=lazy, frozen=frozen
+            )
             if snapshot is not None:
                 yield snapshot
 
-    def on_snapshot(self, callback: Callable) -> Watch:
+    def paginate(
+        self,
+        page_size: int,
+        start_after: bytes = None,
+        prefetch: bool = False,
+        transaction=None,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = None,
+        lazy: bool = False,
+        frozen: bool = None,
+    ) -> Generator[QueryPage, Any, None]:
+        """Read the documents matching this query, one page at a time.
+
+        Each page is fetched with its own ``RunQuery`` request, limited to
+        ``page_size`` documents and starting after the last document of
+        the previous page, so no server stream stays open between pages.
+        The limit and offset of this query apply across all pages.
+
+        Each page carries a serialized ``cursor``: passing it back as
+        ``start_after`` continues the pagination after that page, e.g. in
+        another process, and the limit of this query still applies. When
+        the query selects fields, the fields it is ordered by are selected
+        as well, as each page starts after their values in the last
+        document of the previous page.
+
+        Args:
+            page_size (int): The maximum number of documents in each page.
+            start_after (Optional[bytes]): The ``cursor`` of a page from a
+                previous pagination of this query.
+            prefetch (bool): If :data:`True`, fetch the next page in a
+                background thread while the caller processes the current one.
+            transaction
+                (Optional[:class:`~google.cloud.firestore_v1.transaction.Transaction`]):
+                An existing transaction that this query will run in.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.  Defaults to a system-specified policy.
+            timeout (float): The timeout for each request.  Defaults to a
+                system-specified value.
+            lazy (bool): If :data:`True`, pages hold
+                :class:`~google.cloud.firestore_v1.base_document.LazyDocumentSnapshot`
+                instances which only decode the fields that are read.
+            frozen (Optional[bool]): If :data:`True`, pages hold
+                :class:`~google.cloud.firestore_v1.base_document.FrozenDocumentSnapshot`
+                instances whose data is read-only and never copied. Defaults
+                to the client's ``frozen_snapshots`` setting.
+
+        Yields:
+            :class:`~google.cloud.firestore_v1.base_query.QueryPage`:
+            The next non-empty page of documents.
+
+        Raises:
+            ValueError: If ``page_size`` is not positive, the query uses
+                ``limit_to_last``, or ``start_after`` does not match the
+                orders of the query.
+        """
+        orders, cursor, num_fetched = self._prep_paginate(page_size, start_after)
+        stream_kwargs = {
+            "transaction": transaction,
+            "retry": retry,
+            "timeout": timeout,
+            "lazy": lazy,
+            "frozen": frozen,
+        }
+
+        def fetch(page_query):
+            return list(page_query.stream(**stream_kwargs))
+
+        executor = None
+        if prefetch:
+            executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="Query.paginate"
+            )
+
+        page_query = self._page_query(orders, cursor, page_size, num_fetched)
+        next_page = None
+        try:
+            while page_query is not None:
+                if next_page is not None:
+                    snapshots = next_page.result()
+                    next_page = None
+                else:
+                    snapshots = fetch(page_query)
+                if not snapshots:
+                    return
+
+                num_fetched += len(snapshots)
+                cursor = self._page_cursor(snapshots[-1], orders)
+                if len(snapshots) < page_query._limit:
+                    page_query = None
+                else:
+                    page_query = self._page_query(
+                        orders, cursor, page_size, num_fetched
+                    )
+                if executor is not None and page_query is not None:
+                    next_page = executor.submit(fetch, page_query)
+
+                yield QueryPage(snapshots, _encode_page_cursor(cursor, num_fetched))
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+    def on_snapshot(
+        self,
+        callback: Callable,
+        changes_only: bool = False,
+        delivery: SnapshotDelivery = None,
+        fields: Iterable[str] = None,
+    ) -> Watch:
         """Monitor the documents in this collection that match this query.
 
         This starts a watch on this query using a background thread. The
@@ -231,6 +407,22 @@ class Query(BaseQuery):
         Args:
             callback(Callable[[:class:`~google.cloud.firestore.query.QuerySnapshot`], NoneType]):
                 a callback to run when a change occurs.
+            changes_only (bool): If True, ``callback`` is only passed the
+                :class:`~google.cloud.firestore_v1.watch.DocumentChange` list
+                and read time of each snapshot, so that its cost does not
+                grow with the number of documents watched. The ordered
+                documents are built on request by
+                :meth:`~google.cloud.firestore_v1.watch.Watch.documents`.
+            delivery (Optional[:class:`~google.cloud.firestore_v1.snapshot_delivery.SnapshotDelivery`]):
+                If passed, ``callback`` is called from the thread of
+                ``delivery``, which queues or merges the snapshots pushed
+                while it runs, rather than from the thread reading the
+                stream.
+            fields (Optional[Iterable[str]]): If passed, the watch keeps
+                only these fields of each document (and those the query is
+                ordered by), in a compact
+                :class:`~google.cloud.firestore_v1.base_document.ProjectedDocumentSnapshot`,
+                rather than a full snapshot of each document.
 
         Example:
 
@@ -252,7 +444,13 @@ class Query(BaseQuery):
             query_watch.unsubscribe()
         """
         return Watch.for_query(
-            self, callback, document.DocumentSnapshot, document.DocumentReference
+            self,
+            callback,
+            document.DocumentSnapshot,
+            document.DocumentReference,
+            changes_only=changes_only,
+            delivery=delivery,
+            fields=fields,
         )
 
 
@@ -332,3 +530,191 @@ class CollectionGroup(Query, BaseCollectionGroup):
             start_at = cursor
 
         yield QueryPartition(self, start_at, None)
+
+    def parallel_stream(
+        self,
+        partition_count,
+        max_workers=None,
+        ordered=False,
+        max_buffered=_PARALLEL_STREAM_BUFFER,
+        max_attempts=_MAX_RESUME_ATTEMPTS,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = None,
+        lazy: bool = False,
+        frozen: bool = None,
+    ) -> Generator[document.DocumentSnapshot, Any, None]:
+        """Read the documents matching this query, streaming partitions in parallel.
+
+        The query is split with :meth:`get_partitions`, then each partition
+        is streamed from its own worker thread. Snapshots are handed over
+        through bounded queues, so workers pause while the caller is
+        behind. When a partition's stream fails with a transient error, it
+        is restarted after the last snapshot it delivered.
+
+        Equality filters and projections are supported; inequality
+        filters, orders, limits and offsets are not.
+
+        Args:
+            partition_count (int): The desired maximum number of
+                partitions; see :meth:`get_partitions`.
+            max_workers (Optional[int]): The maximum number of partitions
+                streamed at once. Defaults to all of them.
+            ordered (bool): If :data:`True`, yield the snapshots in
+                document name order, one partition after the other. Otherwise
+                yield them in the order in which they arrive.
+            max_buffered (int): The maximum number of snapshots held in
+                memory, per partition when ``ordered`` is :data:`True`.
+            max_attempts (int): The maximum number of consecutive attempts
+                at streaming a partition without receiving a snapshot.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.  Defaults to a system-specified policy.
+            timeout (float): The timeout for each request.  Defaults to a
+                system-specified value.
+            lazy (bool): If :data:`True`, yield
+                :class:`~google.cloud.firestore_v1.base_document.LazyDocumentSnapshot`
+                instances which only decode the fields that are read.
+            frozen (Optional[bool]): If :data:`True`, yield
+                :class:`~google.cloud.firestore_v1.base_document.FrozenDocumentSnapshot`
+                instances whose data is read-only and never copied. Defaults
+                to the client's ``frozen_snapshots`` setting.
+
+        Yields:
+            :class:`~google.cloud.firestore_v1.document.DocumentSnapshot`:
+            The next document that fulfills the query.
+
+        Raises:
+            ValueError: If the query has orders, a limit or an offset.
+        """
+        partitions = self._prep_parallel_stream().get_partitions(
+            partition_count, retry=retry, timeout=timeout
+        )
+        queries = self._partition_queries(partitions)
+        if ordered:
+            queues = [queue.Queue(max_buffered) for _ in queries]
+        else:
+            queues = [queue.Queue(max_buffered)] * len(queries)
+
+        stopped = threading.Event()
+        stream_kwargs = {
+            "retry": retry,
+            "timeout": timeout,
+            "lazy": lazy,
+            "frozen": frozen,
+        }
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers or len(queries),
+            thread_name_prefix="CollectionGroup.parallel_stream",
+        )
+        try:
+            for partition_query, partition_queue in zip(queries, queues):
+                executor.submit(
+                    _stream_partition,
+                    partition_query,
+                    partition_queue,
+                    stopped,
+                    max_attempts,
+                    stream_kwargs,
+                )
+
+            if ordered:
+                for partition_queue in queues:
+                    yield from _drain_partitions(partition_queue, 1)
+            else:
+                yield from _drain_partitions(queues[0], len(queries))
+        finally:
+            stopped.set()
+            executor.shutdown(wait=False)
+
+
+_QUEUE_POLL_INTERVAL = 0.1
+
+
+def _put_until_stopped(partition_queue, item, stopped) -> bool:
+    """Queue an item, unless the consumer stops first.
+
+    Returns:
+        bool: :data:`False` if the consumer has stopped.
+    """
+    while not stopped.is_set():
+        try:
+            partition_queue.put(item, timeout=_QUEUE_POLL_INTERVAL)
+        except queue.Full:
+            continue
+        return True
+    return False
+
+
+def _resumable_stream(query, max_attempts, stream_kwargs):
+    """Stream a query, restarting it after transient errors.
+
+    Args:
+        query (Query): The query to stream.
+        max_attempts (int): The maximum number of consecutive attempts at
+            streaming without receiving a snapshot.
+        stream_kwargs (dict): Keyword arguments for :meth:`Query.stream`.
+
+    Yields:
+        :class:`~google.cloud.firestore_v1.document.DocumentSnapshot`:
+        The next document that fulfills the query.
+    """
+    query = query._with_order_fields()
+    resumed = query
+    last_snapshot = None
+    num_delivered = 0
+    attempts = 0
+    delays = None
+    while resumed is not None:
+        attempts += 1
+        try:
+            for snapshot in resumed.stream(**stream_kwargs):
+                last_snapshot = snapshot
+                num_delivered += 1
+                attempts = 0
+                delays = None
+                yield snapshot
+            return
+        except _RESUMABLE_ERRORS:
+            if attempts >= max_attempts:
+                raise
+            if delays is None:
+                delays = retries.exponential_sleep_generator(
+                    _INITIAL_SLEEP, _MAX_SLEEP, _MULTIPLIER
+                )
+            time.sleep(next(delays))
+            resumed = query._resume_after(last_snapshot, num_delivered)
+
+
+def _stream_partition(query, partition_queue, stopped, max_attempts, stream_kwargs):
+    """Stream one partition into a queue, resuming after transient errors.
+
+    Runs in a worker thread of :meth:`CollectionGroup.parallel_stream`.
+    The queue receives each snapshot, then either ``_PARTITION_DONE`` or
+    a ``_PartitionError``.
+    """
+    if stopped.is_set():
+        return
+
+    try:
+        for snapshot in _resumable_stream(query, max_attempts, stream_kwargs):
+            if not _put_until_stopped(partition_queue, snapshot, stopped):
+                return
+    except Exception as exc:
+        _put_until_stopped(partition_queue, _PartitionError(exc), stopped)
+    else:
+        _put_until_stopped(partition_queue, _PARTITION_DONE, stopped)
+
+
+def _drain_partitions(partition_queue, num_partitions):
+    """Yield the snapshots queued for one or more partitions.
+
+    Raises:
+        Exception: The error which ended one of the partitions.
+    """
+    while num_partitions:
+        item = partition_queue.get()
+        if item is _PARTITION_DONE:
+            num_partitions -= 1
+        elif isinstance(item, _PartitionError):
+            raise item.error
+        else:
+            yield item
@@ -0,0 +1,319 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Sharing of concurrent identical reads made by a Google Cloud Firestore client.
+
+A client created with ``coalesce_reads=True`` runs concurrent identical
+:meth:`~google.cloud.firestore_v1.document.DocumentReference.get` and
+:meth:`~google.cloud.firestore_v1.query.Query.get` calls as one RPC, and a
+client created with a ``batch_get_window`` merges the single-document reads
+started within that window into one ``BatchGetDocuments`` RPC.
+"""
+
+import asyncio
+import concurrent.futures
+import functools
+import threading
+import time
+
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+
+_MAX_BATCH_SIZE: int = 1000
+"""int: Number of documents after which a batch stops accepting reads."""
+
+
+class SingleFlight(object):
+    """Runs concurrent calls with the same key only once.
+
+    Every caller of :meth:`do` which arrives while a call with the same key
+    is in flight waits for that call, and gets its result or exception.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict = {}
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """Call a function, unless a call with the same key is in flight.
+
+        Args:
+            key (Hashable): Identifies the calls whose results are
+                interchangeable.
+            func (Callable[[], Any]): Computes the result.
+
+        Returns:
+            Any: The result of ``func``, from this call or the one in flight.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = concurrent.futures.Future()
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = func()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class AsyncSingleFlight(object):
+    """Runs concurrent coroutines with the same key only once.
+
+    The shared coroutine runs in its own task, so that it completes for
+    the remaining callers if the caller which started it is cancelled.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict = {}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable]) -> Any:
+        """Await a coroutine, unless one with the same key is in flight.
+
+        Args:
+            key (Hashable): Identifies the calls whose results are
+                interchangeable.
+            func (Callable[[], Awaitable]): Returns a coroutine computing
+                the result.
+
+        Returns:
+            Any: The result of the coroutine returned by ``func``, or of
+            the one in flight.
+        """
+        key = (asyncio.get_event_loop(), key)
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._calls[key] = task
+            task.add_done_callback(functools.partial(self._done, key))
+        return await asyncio.shield(task)
+
+    def _done(self, key: Hashable, task: asyncio.Future) -> None:
+        del self._calls[key]
+        if not task.cancelled():
+            # Retrieve the exception, in case every caller was cancelled.
+            task.exception()
+
+
+class _Batch(object):
+    """Single-document reads to be sent as one ``BatchGetDocuments``.
+
+    Args:
+        mask (Optional[google.cloud.firestore_v1.types.DocumentMask]): The
+            projection shared by the reads.
+        kwargs (dict): The retry / timeout arguments shared by the reads.
+        future_factory (Callable[[], Future]): Creates the future of a
+            read.
+    """
+
+    def __init__(self, mask, kwargs: dict, future_factory: Callable) -> None:
+        self.mask = mask
+        self.kwargs = kwargs
+        self.futures: dict = {}
+        self._future_factory = future_factory
+
+    def add(self, document_path: str):
+        """Add a read of a document, unless it is already in the batch.
+
+        Returns:
+            Future: Resolves to the document, or :data:`None` if it does
+            not exist.
+        """
+        future = self.futures.get(document_path)
+        if future is None:
+            future = self.futures[document_path] = self._future_factory()
+        return future
+
+    def request(self, client) -> dict:
+        """The ``BatchGetDocuments`` request reading every document."""
+        return {
+            "database": client._database_string,
+            "documents": list(self.futures),
+            "mask": self.mask,
+            "transaction": None,
+        }
+
+    def resolve(self, response) -> None:
+        """Resolve the read of the document in a ``BatchGetDocuments`` response."""
+        if response._pb.HasField("found"):
+            document_path = response.found.name
+            document_pb = response.found
+        else:
+            document_path = response.missing
+            document_pb = None
+        future = self.futures.get(document_path)
+        if future is not None and not future.done():
+            future.set_result(document_pb)
+
+    def finish(self, error: Optional[Exception]) -> None:
+        """Resolve the reads not found in the responses.
+
+        Args:
+            error (Optional[Exception]): The error which ended the RPC, if
+                any. Without one, the documents are treated as missing.
+        """
+        for future in self.futures.values():
+            if not future.done():
+                if error is None:
+                    future.set_result(None)
+                else:
+                    future.set_exception(error)
+
+
+def _batch_key(mask, kwargs: dict) -> tuple:
+    """Identifies the reads which may share a ``BatchGetDocuments``."""
+    field_paths = None if mask is None else tuple(mask.field_paths)
+    return field_paths, kwargs.get("retry"), kwargs.get("timeout")
+
+
+class BatchGetter(object):
+    """Merges the single-document reads of a client into batches.
+
+    The first read of a batch waits ``window`` seconds for others to join
+    it, then sends the batch and resolves each read from the responses.
+
+    Args:
+        client (:class:`~google.cloud.firestore_v1.client.Client`):
+            The client sending the reads.
+        window (float): Number of seconds a batch is collected for.
+    """
+
+    def __init__(self, client, window: float) -> None:
+        self._client = client
+        self._window = window
+        self._lock = threading.Lock()
+        self._batches: dict = {}
+
+    def get(self, document_path: str, mask, kwargs: dict):
+        """Read a document as part of a batch.
+
+        Args:
+            document_path (str): The fully-qualified path of the document.
+            mask (Optional[google.cloud.firestore_v1.types.DocumentMask]):
+                The fields to return.
+            kwargs (dict): The retry / timeout arguments of the read.
+
+        Returns:
+            Optional[google.cloud.firestore_v1.types.Document]: The
+            document, or :data:`None` if it does not exist.
+        """
+        key = _batch_key(mask, kwargs)
+        with self._lock:
+            batch = self._batches.get(key)
+            leader = batch is None
+            if leader:
+                batch = self._batches[key] = _Batch(
+                    mask, kwargs, concurrent.futures.Future
+                )
+            future = batch.add(document_path)
+            if len(batch.futures) >= _MAX_BATCH_SIZE:
+                del self._batches[key]
+
+        if leader:
+            time.sleep(self._window)
+            with self._lock:
+                if self._batches.get(key) is batch:
+                    del self._batches[key]
+            self._send(batch)
+
+        return future.result()
+
+    def _send(self, batch: _Batch) -> None:
+        client = self._client
+        error = None
+        try:
+            response_iterator = client._firestore_api.batch_get_documents(
+                request=batch.request(client),
+                metadata=client._rpc_metadata,
+                **batch.kwargs,
+            )
+            for response in response_iterator:
+                batch.resolve(response)
+        except Exception as exc:
+            error = exc
+        batch.finish(error)
+
+
+class AsyncBatchGetter(object):
+    """Merges the single-document reads of an async client into batches.
+
+    A batch is sent by its own task ``window`` seconds after its first
+    read, so that cancelling a read does not affect the others.
+
+    Args:
+        client (:class:`~google.cloud.firestore_v1.async_client.AsyncClient`):
+            The client sending the reads.
+        window (float): Number of seconds a batch is collected for.
+    """
+
+    def __init__(self, client, window: float) -> None:
+        self._client = client
+        self._window = window
+        self._batches: dict = {}
+        self._tasks: set = set()
+
+    async def get(self, document_path: str, mask, kwargs: dict):
+        """Read a document as part of a batch.
+
+        Args:
+            document_path (str): The fully-qualified path of the document.
+            mask (Optional[google.cloud.firestore_v1.types.DocumentMask]):
+                The fields to return.
+            kwargs (dict): The retry / timeout arguments of the read.
+
+        Returns:
+            Optional[google.cloud.firestore_v1.types.Document]: The
+            document, or :data:`None` if it does not exist.
+        """
+        loop = asyncio.get_event_loop()
+        key = (loop, _batch_key(mask, kwargs))
+        batch = self._batches.get(key)
+        if batch is None:
+            batch = self._batches[key] = _Batch(mask, kwargs, loop.create_future)
+            task = asyncio.ensure_future(self._send_later(key, batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        future = batch.add(document_path)
+        if len(batch.futures) >= _MAX_BATCH_SIZE:
+            del self._batches[key]
+        return await asyncio.shield(future)
+
+    async def _send_later(self, key: tuple, batch: _Batch) -> None:
+        await asyncio.sleep(self._window)
+        if self._batches.get(key) is batch:
+            del self._batches[key]
+
+        client = self._client
+        error = None
+        try:
+            response_iterator = await client._firestore_api.batch_get_documents(
+                request=batch.request(client),
+                metadata=client._rpc_metadata,
+                **batch.kwargs,
+            )
+            async for response in response_iterator:
+                batch.resolve(response)
+        except Exception as exc:
+            error = exc
+        batch.finish(error)
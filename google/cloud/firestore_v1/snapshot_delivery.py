@@ -0,0 +1,279 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Delivery of watch snapshots to their callback on a separate thread."""
+
+import collections
+import logging
+import threading
+import time
+
+from typing import Optional
+
+
+_LOGGER = logging.getLogger(__name__)
+
+_MAX_PENDING: int = 100
+"""int: Default number of snapshots waiting for the callback."""
+_DELIVERY_THREAD_NAME: str = "Thread-SnapshotDelivery"
+_BAD_MAX_PENDING: str = "``max_pending`` must be positive, got {!r}."
+_BAD_MIN_INTERVAL: str = "``min_interval`` must not be negative, got {!r}."
+_BAD_MAX_LATENCY: str = "``max_latency`` must be positive or None, got {!r}."
+_BAD_DROP_CHANGES: str = (
+    "A watch with ``changes_only`` requires ``coalesce``: dropping a "
+    "snapshot would lose its changes."
+)
+_ALREADY_BOUND: str = "The delivery is already used by another watch."
+
+
+class _PendingSnapshot(object):
+    """A snapshot waiting for the callback.
+
+    Args:
+        documents (Optional[List[DocumentSnapshot]]): The documents, or None
+            for a watch with ``changes_only``.
+        changes (List[DocumentChange]): The changes since the previous
+            snapshot delivered.
+        read_time (datetime.datetime): The read time of the snapshot.
+        arrived (float): When the oldest of the merged snapshots arrived.
+    """
+
+    __slots__ = ("documents", "changes", "read_time", "arrived")
+
+    def __init__(self, documents, changes, read_time, arrived) -> None:
+        self.documents = documents
+        self.changes = changes
+        self.read_time = read_time
+        self.arrived = arrived
+
+    def merge(self, later) -> None:
+        """Fold a later snapshot into this one.
+
+        The changes of both are kept in order: the indices of each change
+        are relative to the documents left by the changes before it, so
+        the concatenation leads from the documents before this snapshot to
+        the documents of ``later``.
+        """
+        self.documents = later.documents
+        self.changes.extend(later.changes)
+        self.read_time = later.read_time
+
+
+class SnapshotDelivery(object):
+    """Passes the snapshots of a watch to its callback from another thread.
+
+    By default a watch calls its callback on the thread reading the
+    ``Listen`` stream, so a slow callback holds up the stream. Pass an
+    instance as the ``delivery`` of
+    :meth:`~google.cloud.firestore_v1.query.Query.on_snapshot` (or of the
+    ``on_snapshot`` of a document or collection) to call it from a thread
+    of its own instead; each watch needs its own instance.
+
+    While the callback runs, the snapshots pushed meanwhile wait in a
+    queue. With ``coalesce``, they are merged into a single snapshot, with
+    the documents and read time of the latest one and the changes of all,
+    in order. Otherwise at most ``max_pending`` snapshots wait, and the
+    oldest one is dropped to make room for a new one.
+
+    The callback is called at most once every ``min_interval`` seconds,
+    unless the oldest snapshot waiting has waited ``max_latency`` seconds.
+
+    Args:
+        max_pending (int): The maximum number of snapshots waiting for the
+            callback, without ``coalesce``.
+        coalesce (bool): Whether snapshots waiting for the callback are
+            merged rather than queued.
+        min_interval (float): The minimum number of seconds between two
+            calls of the callback.
+        max_latency (Optional[float]): The maximum number of seconds a
+            snapshot waits because of ``min_interval``, or None for no
+            bound.
+
+    Raises:
+        ValueError: If ``max_pending`` or ``max_latency`` is not positive,
+            or ``min_interval`` is negative.
+    """
+
+    def __init__(
+        self,
+        max_pending: int = _MAX_PENDING,
+        coalesce: bool = True,
+        min_interval: float = 0.0,
+        max_latency: Optional[float] = None,
+    ) -> None:
+        if max_pending < 1:
+            raise ValueError(_BAD_MAX_PENDING.format(max_pending))
+        if min_interval < 0:
+            raise ValueError(_BAD_MIN_INTERVAL.format(min_interval))
+        if max_latency is not None and max_latency <= 0:
+            raise ValueError(_BAD_MAX_LATENCY.format(max_latency))
+
+        self._max_pending = 1 if coalesce else max_pending
+        self._coalesce = coalesce
+        self._min_interval = min_interval
+        self._max_latency = max_latency
+        self._cond = threading.Condition()
+        self._pending: collections.deque = collections.deque()
+        self._callback = None
+        self._changes_only = False
+        self._on_error = None
+        self._thread = None
+        self._closed = False
+        self._last_delivery = None
+        self._delivered = 0
+        self._merged = 0
+        self._dropped = 0
+        self._max_queue_depth = 0
+
+    @property
+    def delivered(self) -> int:
+        """int: The number of calls of the callback."""
+        return self._delivered
+
+    @property
+    def merged(self) -> int:
+        """int: The number of snapshots merged into a later one."""
+        return self._merged
+
+    @property
+    def dropped(self) -> int:
+        """int: The number of snapshots dropped because the queue was full."""
+        return self._dropped
+
+    @property
+    def queue_depth(self) -> int:
+        """int: The number of snapshots waiting for the callback."""
+        return len(self._pending)
+
+    @property
+    def max_queue_depth(self) -> int:
+        """int: The largest number of snapshots which waited at once."""
+        return self._max_queue_depth
+
+    def bind(self, callback, changes_only=False, on_error=None):
+        """Attach the delivery to the callback of a watch.
+
+        Args:
+            callback (Callable): The callback of the watch.
+            changes_only (bool): Whether the watch passes only the
+                ``changes`` and ``read_time`` of each snapshot.
+            on_error (Optional[Callable[[Exception], None]]): Called, on
+                the delivery thread, if ``callback`` raises. No further
+                snapshots are delivered.
+
+        Returns:
+            Callable: The function the watch calls with each snapshot, in
+            place of ``callback``.
+
+        Raises:
+            ValueError: If the delivery is already bound, or if
+                ``changes_only`` is passed without ``coalesce``.
+        """
+        if changes_only and not self._coalesce:
+            raise ValueError(_BAD_DROP_CHANGES)
+        with self._cond:
+            if self._callback is not None:
+                raise ValueError(_ALREADY_BOUND)
+            self._callback = callback
+            self._changes_only = changes_only
+            self._on_error = on_error
+        return self.put
+
+    def put(self, *snapshot) -> None:
+        """Queue a snapshot for the callback.
+
+        Args:
+            snapshot: The arguments of the callback: ``documents``,
+                ``changes`` and ``read_time``, or only the last two for a
+                watch with ``changes_only``.
+        """
+        if self._changes_only:
+            snapshot = (None,) + snapshot
+        pending = _PendingSnapshot(*snapshot, time.monotonic())
+
+        with self._cond:
+            if self._closed:
+                return
+            if len(self._pending) < self._max_pending:
+                self._pending.append(pending)
+            elif self._coalesce:
+                self._pending[-1].merge(pending)
+                self._merged += 1
+            else:
+                self._pending.popleft()
+                self._pending.append(pending)
+                self._dropped += 1
+            self._max_queue_depth = max(self._max_queue_depth, len(self._pending))
+
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    name=_DELIVERY_THREAD_NAME, target=self._run
+                )
+                self._thread.daemon = True
+                self._thread.start()
+            self._cond.notify()
+
+    def close(self) -> None:
+        """Stop delivering snapshots, discarding those still waiting.
+
+        This method is idempotent, and may be called from the callback.
+        """
+        with self._cond:
+            self._closed = True
+            self._pending.clear()
+            self._cond.notify()
+
+    def _delay(self, now) -> float:
+        """Seconds until the oldest snapshot waiting may be delivered."""
+        if self._last_delivery is None:
+            return 0.0
+        ready = self._last_delivery + self._min_interval
+        if self._max_latency is not None:
+            ready = min(ready, self._pending[0].arrived + self._max_latency)
+        return ready - now
+
+    def _next(self):
+        """Wait for the next snapshot to deliver, or None once closed."""
+        with self._cond:
+            while not self._closed:
+                if not self._pending:
+                    self._cond.wait()
+                    continue
+                delay = self._delay(time.monotonic())
+                if delay > 0:
+                    self._cond.wait(delay)
+                    continue
+                self._last_delivery = time.monotonic()
+                return self._pending.popleft()
+        return None
+
+    def _run(self) -> None:
+        while True:
+            pending = self._next()
+            if pending is None:
+                return
+
+            if self._changes_only:
+                args = (pending.changes, pending.read_time)
+            else:
+                args = (pending.documents, pending.changes, pending.read_time)
+            try:
+                self._callback(*args)
+            except Exception as exc:
+                _LOGGER.error("Snapshot callback failed: %s", exc)
+                self.close()
+                if self._on_error is not None:
+                    self._on_error(exc)
+                return
+            self._delivered += 1
@@ -139,7 +139,12 @@ class Transaction(batch.WriteBatch, BaseTransaction):
         if not self.in_progress:
             raise ValueError(_CANT_COMMIT)
 
-        commit_response = _commit_with_retry(self._client, self._write_pbs, self._id)
+        try:
+            commit_response = _commit_with_retry(
+                self._client, self._write_pbs, self._id
+            )
+        finally:
+            self._client._invalidate_writes(self._write_pbs)
 
         self._clean_up()
         return list(commit_response.write_results)
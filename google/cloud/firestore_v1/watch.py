@@ -12,8 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import bisect
 import logging
 import collections
+import itertools
 import threading
 from enum import Enum
 import functools
@@ -22,6 +24,8 @@ from google.api_core.bidi import ResumableBidiRpc  # type: ignore
 from google.api_core.bidi import BackgroundConsumer  # type: ignore
 from google.cloud.firestore_v1.types import firestore
 from google.cloud.firestore_v1 import _helpers
+from google.cloud.firestore_v1 import field_path as field_path_module
+from google.cloud.firestore_v1.base_document import ProjectedDocumentSnapshot
 
 from google.api_core import exceptions  # type: ignore
 
@@ -70,46 +74,183 @@ DocTreeEntry = collections.namedtuple("DocTreeEntry", ["value", "index"])
 
 
 class WatchDocTree(object):
-    # TODO: Currently this uses a dict. Other implementations use a rbtree.
-    # The performance of this implementation should be investigated and may
-    # require modifying the underlying datastructure to a rbtree.
-    def __init__(self):
-        self._dict = {}
-        self._index = 0
+    """Documents held by a watch, kept in the order of the watched query.
+
+    Keys are stored in a list of sorted sublists, each holding at most
+    ``2 * _LOAD`` entries, so inserting or removing a key only shifts one
+    short sublist.  A Fenwick tree over the sublist lengths gives the
+    position of any key in ``O(log n)``, which is reported as the
+    ``old_index`` / ``new_index`` of a :class:`DocumentChange`.
+
+    The tree is updated in place; :meth:`insert` and :meth:`remove` return
+    the tree itself so that callers may keep chaining on the result.
+
+    Args:
+        comparator (Optional[Callable[[Any, Any], int]]): A ``cmp``-style
+            function used to order the keys.  If neither ``comparator`` nor
+            ``key`` is passed, keys are kept in insertion order.
+        key (Optional[Callable[[Any], Any]]): A function computing a sort
+            key for each key, used instead of ``comparator`` if passed.
+    """
+
+    _LOAD = 1000
+
+    def __init__(self, comparator=None, key=None):
+        if key is not None:
+            self._make_sort_key = key
+        elif comparator is not None:
+            self._make_sort_key = functools.cmp_to_key(comparator)
+        else:
+            self._make_sort_key = None
+        self._counter = itertools.count()
+        # Maps each key to its sort key, and each key with a value other
+        # than None to its value: watches only store keys.
+        self._entries = {}
+        self._values = {}
+        # Sorted sublists of keys, the matching sort keys, and the largest
+        # sort key of each sublist.
+        self._lists = []
+        self._sort_keys = []
+        self._maxes = []
+        # One-based Fenwick tree over ``len(sublist)``.
+        self._index = [0]
 
     def keys(self):
-        return list(self._dict.keys())
-
-    def _copy(self):
-        wdt = WatchDocTree()
-        wdt._dict = self._dict.copy()
-        wdt._index = self._index
-        self = wdt
-        return self
+        return list(itertools.chain.from_iterable(self._lists))
 
     def insert(self, key, value):
-        self = self._copy()
-        self._dict[key] = DocTreeEntry(value, self._index)
-        self._index += 1
+        if key in self._entries:
+            self.remove(key)
+
+        if self._make_sort_key is None:
+            sort_key = next(self._counter)
+        else:
+            sort_key = self._make_sort_key(key)
+
+        self._entries[key] = sort_key
+        if value is not None:
+            self._values[key] = value
+
+        if not self._lists:
+            self._lists.append([key])
+            self._sort_keys.append([sort_key])
+            self._maxes.append(sort_key)
+            self._rebuild_index()
+            return self
+
+        pos = bisect.bisect_right(self._maxes, sort_key)
+        if pos == len(self._maxes):
+            pos -= 1
+            self._lists[pos].append(key)
+            self._sort_keys[pos].append(sort_key)
+            self._maxes[pos] = sort_key
+        else:
+            idx = bisect.bisect_right(self._sort_keys[pos], sort_key)
+            self._lists[pos].insert(idx, key)
+            self._sort_keys[pos].insert(idx, sort_key)
+
+        if len(self._lists[pos]) > 2 * self._LOAD:
+            self._split(pos)
+        else:
+            self._update_index(pos, 1)
+
         return self
 
     def find(self, key):
-        return self._dict[key]
+        pos, idx = self._locate(key)
+        return DocTreeEntry(self._values.get(key), self._offset(pos) + idx)
 
     def remove(self, key):
-        self = self._copy()
-        del self._dict[key]
+        pos, idx = self._locate(key)
+        del self._entries[key]
+        self._values.pop(key, None)
+        del self._lists[pos][idx]
+        del self._sort_keys[pos][idx]
+
+        if self._lists[pos]:
+            self._maxes[pos] = self._sort_keys[pos][-1]
+            self._update_index(pos, -1)
+        else:
+            del self._lists[pos]
+            del self._sort_keys[pos]
+            del self._maxes[pos]
+            self._rebuild_index()
+
         return self
 
+    def _locate(self, key):
+        """Find the ``(sublist, position)`` of a key known to be stored."""
+        sort_key = self._entries[key]
+        pos = bisect.bisect_left(self._maxes, sort_key)
+        idx = 0
+        if pos < len(self._maxes):
+            idx = bisect.bisect_left(self._sort_keys[pos], sort_key)
+
+        # Walk the run of keys which compare equal to ``sort_key``.
+        while pos < len(self._lists):
+            lst = self._lists[pos]
+            sort_keys = self._sort_keys[pos]
+            while idx < len(lst):
+                if lst[idx] is key or lst[idx] == key:
+                    return pos, idx
+                if sort_key < sort_keys[idx]:
+                    break
+                idx += 1
+            else:
+                pos += 1
+                idx = 0
+                continue
+            break
+
+        # The comparator is not a total order: fall back to a scan.
+        for pos, lst in enumerate(self._lists):
+            if key in lst:
+                return pos, lst.index(key)
+
+        raise KeyError(key)  # pragma: NO COVER
+
+    def _split(self, pos):
+        lst = self._lists[pos]
+        sort_keys = self._sort_keys[pos]
+        half = len(lst) // 2
+        self._lists[pos : pos + 1] = [lst[:half], lst[half:]]
+        self._sort_keys[pos : pos + 1] = [sort_keys[:half], sort_keys[half:]]
+        self._maxes[pos : pos + 1] = [sort_keys[half - 1], sort_keys[-1]]
+        self._rebuild_index()
+
+    def _rebuild_index(self):
+        index = [0] + [len(lst) for lst in self._lists]
+        size = len(index)
+        for i in range(1, size):
+            parent = i + (i & -i)
+            if parent < size:
+                index[parent] += index[i]
+        self._index = index
+
+    def _update_index(self, pos, delta):
+        i = pos + 1
+        size = len(self._index)
+        while i < size:
+            self._index[i] += delta
+            i += i & -i
+
+    def _offset(self, pos):
+        """Total number of keys stored in the sublists before ``pos``."""
+        total = 0
+        i = pos
+        while i > 0:
+            total += self._index[i]
+            i -= i & -i
+        return total
+
     def __iter__(self):
-        for k in self._dict:
-            yield k
+        return itertools.chain.from_iterable(self._lists)
 
     def __len__(self):
-        return len(self._dict)
+        return len(self._entries)
 
     def __contains__(self, k):
-        return k in self._dict
+        return k in self._entries
 
 
 class ChangeType(Enum):
@@ -154,6 +295,28 @@ def document_watch_comparator(doc1, doc2):
     return 0
 
 
+def _projected_field_paths(fields, orders=()):
+    """Parse the field paths kept by a watch started with ``fields``.
+
+    Args:
+        fields (Iterable[str]): The field paths requested.
+        orders (Iterable[str]): The field paths the watched query is
+            ordered by, which are kept as well.
+
+    Returns:
+        Tuple[Tuple[str, ...], ...]: The field names of each path.
+
+    Raises:
+        ValueError: If a field path is invalid.
+    """
+    field_paths = []
+    for field_path in itertools.chain(fields, orders):
+        field_names = tuple(field_path_module.parse_field_path(field_path))
+        if field_names not in field_paths:
+            field_paths.append(field_names)
+    return tuple(field_paths)
+
+
 def _should_recover(exception):
     wrapped = _maybe_wrap_exception(exception)
     return isinstance(wrapped, _RECOVERABLE_STREAM_EXCEPTIONS)
@@ -180,6 +343,10 @@ class Watch(object):
         document_reference_cls,
         BackgroundConsumer=None,  # FBO unit testing
         ResumableBidiRpc=None,  # FBO unit testing
+        sort_key=None,
+        changes_only=False,
+        delivery=None,
+        fields=None,
     ):
         """
         Args:
@@ -198,20 +365,34 @@ class Watch(object):
 
             document_snapshot_cls: instance of DocumentSnapshot
             document_reference_cls: instance of DocumentReference
+            sort_key: Optional key function ordering documents consistently
+                with ``comparator``, used instead of it when passed.
+            changes_only (bool): If True, ``snapshot_callback`` is called
+                with ``changes`` and ``read_time`` only; the ordered
+                documents are built on request by :meth:`documents`.
+            delivery (Optional[~.firestore_v1.snapshot_delivery.SnapshotDelivery]):
+                If passed, ``snapshot_callback`` is called from the thread
+                of ``delivery`` rather than the one reading the stream.
+            fields (Optional[Tuple[Tuple[str, ...], ...]]): If passed, the
+                field paths (as field names) kept for each document, in a
+                :class:`~.firestore_v1.base_document.ProjectedDocumentSnapshot`.
         """
-        self._document_reference = document_reference
-        self._firestore = firestore
-        self._api = firestore._firestore_api
-        self._targets = target
-        self._comparator = comparator
-        self.DocumentSnapshot = document_snapshot_cls
-        self.DocumentReference = document_reference_cls
-        self._snapshot_callback = snapshot_callback
+        self._init_state(
+            document_reference,
+            firestore,
+            target,
+            comparator,
+            snapshot_callback,
+            document_snapshot_cls,
+            document_reference_cls,
+            sort_key,
+            changes_only,
+            delivery,
+            fields,
+        )
         self._closing = threading.Lock()
         self._closed = False
 
-        self.resume_token = None
-
         rpc_request = self._get_rpc_request
 
         if ResumableBidiRpc is None:
@@ -227,10 +408,57 @@ class Watch(object):
 
         self._rpc.add_done_callback(self._on_rpc_done)
 
+        # The server assigns and updates the resume token.
+        if BackgroundConsumer is None:  # FBO unit tests
+            BackgroundConsumer = self.BackgroundConsumer
+
+        self._consumer = BackgroundConsumer(self._rpc, self.on_snapshot)
+        self._consumer.start()
+
+    def _init_state(
+        self,
+        document_reference,
+        firestore,
+        target,
+        comparator,
+        snapshot_callback,
+        document_snapshot_cls,
+        document_reference_cls,
+        sort_key,
+        changes_only=False,
+        delivery=None,
+        fields=None,
+    ):
+        """Set up the snapshot state shared with the asyncio watch."""
+        self._document_reference = document_reference
+        self._firestore = firestore
+        self._api = firestore._firestore_api
+        self._targets = target
+        self._target_id = target["target_id"]
+        self._comparator = comparator
+        if sort_key is None:
+            sort_key = functools.cmp_to_key(comparator)
+        self._sort_key = sort_key
+        self.DocumentSnapshot = document_snapshot_cls
+        self._fields = fields
+        self.DocumentReference = document_reference_cls
+        self._changes_only = changes_only
+        self._delivery = delivery
+        if delivery is not None:
+            snapshot_callback = delivery.bind(
+                snapshot_callback, changes_only, on_error=self._on_delivery_error
+            )
+        self._snapshot_callback = snapshot_callback
+        # Held while a snapshot is applied and delivered, so that
+        # ``documents`` never sees a half-applied snapshot.
+        self._snapshot_lock = threading.RLock()
+
+        self.resume_token = None
+
         # Initialize state for on_snapshot
         # The sorted tree of QueryDocumentSnapshots as sent in the last
         # snapshot. We only look at the keys.
-        self.doc_tree = WatchDocTree()
+        self.doc_tree = WatchDocTree(key=self._sort_key)
 
         # A map of document names to QueryDocumentSnapshots for the last sent
         # snapshot.
@@ -248,13 +476,6 @@ class Watch(object):
         # aren't docs.
         self.has_pushed = False
 
-        # The server assigns and updates the resume token.
-        if BackgroundConsumer is None:  # FBO unit tests
-            BackgroundConsumer = self.BackgroundConsumer
-
-        self._consumer = BackgroundConsumer(self._rpc, self.on_snapshot)
-        self._consumer.start()
-
     def _get_rpc_request(self):
         if self.resume_token is not None:
             self._targets["resume_token"] = self.resume_token
@@ -294,6 +515,8 @@ class Watch(object):
             self._rpc.close()
             self._rpc = None
             self._closed = True
+            if self._delivery is not None:
+                self._delivery.close()
             _LOGGER.debug("Finished stopping manager.")
 
         if reason:
@@ -322,9 +545,28 @@ class Watch(object):
         thread.daemon = True
         thread.start()
 
+    def _on_delivery_error(self, exc):
+        """Close the watch once its callback failed on the delivery thread."""
+        self._on_rpc_done(exc)
+
     def unsubscribe(self):
         self.close()
 
+    def documents(self):
+        """Build the ordered documents of the last snapshot delivered.
+
+        With ``changes_only``, the callback is only passed the changes of
+        each snapshot; this builds the full view, in ``O(n)``, when it is
+        actually needed. It may be called from the callback, or from any
+        other thread. With a ``delivery``, the snapshot pushed last may not
+        have reached the callback yet.
+
+        Returns:
+            List[DocumentSnapshot]: The documents, in query order.
+        """
+        with self._snapshot_lock:
+            return self.doc_tree.keys()
+
     @classmethod
     def for_document(
         cls,
@@ -332,6 +574,9 @@ class Watch(object):
         snapshot_callback,
         snapshot_class_instance,
         reference_class_instance,
+        changes_only=False,
+        delivery=None,
+        fields=None,
     ):
         """
         Creates a watch snapshot listener for a document. snapshot_callback
@@ -345,40 +590,109 @@ class Watch(object):
                 snapshots with to pass to snapshot_callback
             reference_class_instance: instance of DocumentReference to make
                 references
-
+            changes_only: if True, snapshot_callback is only passed the
+                changes and read time of each snapshot
+            delivery: optional SnapshotDelivery calling snapshot_callback
+                from its own thread
+            fields: optional field paths, the only fields of the document
+                kept by the watch
+
+        If the client of ``document_ref`` was created with
+        ``listen_streams``, the watch shares a stream of its
+        :class:`~google.cloud.firestore_v1.listen_multiplexer.ListenMultiplexer`.
         """
+        target = {"documents": {"documents": [document_ref._document_path]}}
+        if fields is not None:
+            fields = _projected_field_paths(fields)
+        options = cls._watch_options(changes_only, delivery, fields)
+        multiplexer = document_ref._client._listen_multiplexer
+        if multiplexer is not None:
+            return multiplexer.watch(
+                document_ref,
+                target,
+                document_watch_comparator,
+                snapshot_callback,
+                snapshot_class_instance,
+                reference_class_instance,
+                **options,
+            )
+
+        target["target_id"] = WATCH_TARGET_ID
         return cls(
             document_ref,
             document_ref._client,
-            {
-                "documents": {"documents": [document_ref._document_path]},
-                "target_id": WATCH_TARGET_ID,
-            },
+            target,
             document_watch_comparator,
             snapshot_callback,
             snapshot_class_instance,
             reference_class_instance,
+            **options,
         )
 
     @classmethod
     def for_query(
-        cls, query, snapshot_callback, snapshot_class_instance, reference_class_instance
+        cls,
+        query,
+        snapshot_callback,
+        snapshot_class_instance,
+        reference_class_instance,
+        changes_only=False,
+        delivery=None,
+        fields=None,
     ):
         parent_path, _ = query._parent._parent_info()
         query_target = firestore.Target.QueryTarget(
             parent=parent_path, structured_query=query._to_protobuf()
         )
+        target = {"query": query_target._pb}
+        if fields is not None:
+            orders = [
+                order.field.field_path
+                for order in query._orders
+                if order.field.field_path != "__name__"
+            ]
+            fields = _projected_field_paths(fields, orders)
+        options = cls._watch_options(changes_only, delivery, fields)
+        multiplexer = query._client._listen_multiplexer
+        if multiplexer is not None:
+            return multiplexer.watch(
+                query,
+                target,
+                query._comparator,
+                snapshot_callback,
+                snapshot_class_instance,
+                reference_class_instance,
+                sort_key=query._sort_key,
+                **options,
+            )
 
+        target["target_id"] = WATCH_TARGET_ID
         return cls(
             query,
             query._client,
-            {"query": query_target._pb, "target_id": WATCH_TARGET_ID},
+            target,
             query._comparator,
             snapshot_callback,
             snapshot_class_instance,
             reference_class_instance,
+            sort_key=query._sort_key,
+            **options,
         )
 
+    @staticmethod
+    def _watch_options(changes_only, delivery, fields=None):
+        """Keyword arguments of the watch, leaving out an unused delivery.
+
+        The asyncio watch delivers snapshots from its own task, and takes
+        no ``delivery``.
+        """
+        options = {"changes_only": changes_only}
+        if delivery is not None:
+            options["delivery"] = delivery
+        if fields is not None:
+            options["fields"] = fields
+        return options
+
     def _on_snapshot_target_change_no_change(self, proto):
         _LOGGER.debug("on_snapshot: target change: NO_CHANGE")
         change = proto.target_change
@@ -393,9 +707,9 @@ class Watch(object):
 
     def _on_snapshot_target_change_add(self, proto):
         _LOGGER.debug("on_snapshot: target change: ADD")
-        target_id = proto.target_change.target_ids[0]
-        if target_id != WATCH_TARGET_ID:
-            raise RuntimeError("Unexpected target ID %s sent by server" % target_id)
+        target_ids = proto.target_change.target_ids
+        if self._target_id not in target_ids:
+            raise RuntimeError("Unexpected target ID %s sent by server" % target_ids[0])
 
     def _on_snapshot_target_change_remove(self, proto):
         _LOGGER.debug("on_snapshot: target change: REMOVE")
@@ -478,10 +792,10 @@ class Watch(object):
             changed = False
             removed = False
 
-            if WATCH_TARGET_ID in target_ids:
+            if self._target_id in target_ids:
                 changed = True
 
-            if WATCH_TARGET_ID in removed_target_ids:
+            if self._target_id in removed_target_ids:
                 removed = True
 
             if changed:
@@ -490,6 +804,13 @@ class Watch(object):
                 # google.cloud.firestore_v1.types.Document
                 document = document_change.document
 
+                if self._fields is not None:
+                    document_pb = document._pb
+                    self.change_map[document_pb.name] = ProjectedDocumentSnapshot(
+                        self._firestore, document_pb, self._fields
+                    )
+                    return
+
                 data = _helpers.decode_dict(document.fields, self._firestore)
 
                 # Create a snapshot. As Document and Query objects can be
@@ -551,26 +872,33 @@ class Watch(object):
         Assembles a new snapshot from the current set of changes and invokes
         the user's callback. Clears the current changes on completion.
         """
+        if self.has_pushed and not self.change_map:
+            # Nothing changed since the last snapshot.
+            self.resume_token = next_resume_token
+            return
+
         deletes, adds, updates = Watch._extract_changes(
             self.doc_map, self.change_map, read_time
         )
 
-        updated_tree, updated_map, appliedChanges = self._compute_snapshot(
-            self.doc_tree, self.doc_map, deletes, adds, updates
-        )
-
-        if not self.has_pushed or len(appliedChanges):
-            # TODO: It is possible in the future we will have the tree order
-            # on insert. For now, we sort here.
-            key = functools.cmp_to_key(self._comparator)
-            keys = sorted(updated_tree.keys(), key=key)
-
-            self._snapshot_callback(keys, appliedChanges, read_time)
-            self.has_pushed = True
+        with self._snapshot_lock:
+            updated_tree, updated_map, appliedChanges = self._compute_snapshot(
+                self.doc_tree, self.doc_map, deletes, adds, updates
+            )
+            self.doc_tree = updated_tree
+            self.doc_map = updated_map
+            self.change_map.clear()
+
+            if not self.has_pushed or len(appliedChanges):
+                if self._changes_only:
+                    # Leave building the full view to ``documents``.
+                    self._snapshot_callback(appliedChanges, read_time)
+                else:
+                    # The tree keeps its keys in query order.
+                    keys = updated_tree.keys()
+                    self._snapshot_callback(keys, appliedChanges, read_time)
+                self.has_pushed = True
 
-        self.doc_tree = updated_tree
-        self.doc_map = updated_map
-        self.change_map.clear()
         self.resume_token = next_resume_token
 
     @staticmethod
@@ -674,7 +1002,7 @@ class Watch(object):
         # keep incrementing.
         appliedChanges = []
 
-        key = functools.cmp_to_key(self._comparator)
+        key = self._sort_key
 
         # Deletes are sorted based on the order of the existing document.
         delete_changes = sorted(delete_changes)
@@ -266,6 +266,94 @@ class Test_encode_value(unittest.TestCase):
         with self.assertRaises(TypeError):
             self._call_fut(value)
 
+    def test_subclasses(self):
+        from google.cloud.firestore_v1._helpers import _VALUE_PB_ENCODERS
+        from google.cloud.firestore_v1.types.document import ArrayValue
+        from google.cloud.firestore_v1.types.document import MapValue
+
+        class MyInt(int):
+            pass
+
+        class MyList(list):
+            pass
+
+        class MyDict(dict):
+            pass
+
+        for _ in range(2):
+            self.assertEqual(self._call_fut(MyInt(7)), _value_pb(integer_value=7))
+            self.assertEqual(
+                self._call_fut(MyList([u"a"])),
+                _value_pb(
+                    array_value=ArrayValue(values=[_value_pb(string_value=u"a")])
+                ),
+            )
+            self.assertEqual(
+                self._call_fut(MyDict(b=None)),
+                _value_pb(map_value=MapValue(fields={"b": _value_pb(null_value=0)})),
+            )
+
+        self.assertIn(MyInt, _VALUE_PB_ENCODERS)
+        self.assertIn(MyList, _VALUE_PB_ENCODERS)
+        self.assertIn(MyDict, _VALUE_PB_ENCODERS)
+
+    def test_empty_containers(self):
+        from google.cloud.firestore_v1.types.document import ArrayValue
+        from google.cloud.firestore_v1.types.document import MapValue
+
+        self.assertEqual(self._call_fut([]), _value_pb(array_value=ArrayValue()))
+        self.assertEqual(self._call_fut({}), _value_pb(map_value=MapValue()))
+
+    def test_reference_attribute_not_cached(self):
+        from google.cloud.firestore_v1._helpers import _VALUE_PB_ENCODERS
+
+        class Reference(object):
+            def __init__(self, document_path):
+                self._document_path = document_path
+
+        value = Reference(u"projects/p/databases/d/documents/c/d")
+        result = self._call_fut(value)
+        self.assertEqual(result, _value_pb(reference_value=value._document_path))
+        self.assertNotIn(Reference, _VALUE_PB_ENCODERS)
+
+        with self.assertRaises(TypeError):
+            self._call_fut(Reference(None))
+
+    def test_container_with_document_path_not_cached(self):
+        from google.cloud.firestore_v1._helpers import _VALUE_PB_ENCODERS
+        from google.cloud.firestore_v1.types.document import MapValue
+
+        class MaybeReference(dict):
+            _document_path = None
+
+        result = self._call_fut(MaybeReference())
+        self.assertEqual(result, _value_pb(map_value=MapValue()))
+        self.assertNotIn(MaybeReference, _VALUE_PB_ENCODERS)
+
+    def test_mappings(self):
+        import collections
+        import types
+        from google.cloud.firestore_v1._helpers import _VALUE_PB_ENCODERS
+        from google.cloud.firestore_v1._helpers import _encode_map_pb
+        from google.cloud.firestore_v1.types.document import MapValue
+
+        expected = _value_pb(
+            map_value=MapValue(
+                fields={
+                    "a": _value_pb(
+                        map_value=MapValue(fields={"b": _value_pb(integer_value=1)})
+                    )
+                }
+            )
+        )
+        nested = types.MappingProxyType({"b": 1})
+        self.assertEqual(
+            self._call_fut(types.MappingProxyType({"a": nested})), expected
+        )
+        value = collections.OrderedDict(a=collections.ChainMap({"b": 1}))
+        self.assertEqual(self._call_fut(value), expected)
+        self.assertIs(_VALUE_PB_ENCODERS[collections.ChainMap], _encode_map_pb)
+
 
 class Test_encode_dict(unittest.TestCase):
     @staticmethod
@@ -535,6 +623,58 @@ class Test_decode_value(unittest.TestCase):
 
         value_pb._pb.WhichOneof.assert_called_once_with("value_type")
 
+    def test_raw_protobuf(self):
+        from google.cloud.firestore_v1.types import document
+
+        array_pb = document.ArrayValue(
+            values=[_value_pb(integer_value=1), _value_pb(string_value=u"two")]
+        )
+        value = _value_pb(array_value=array_pb)
+        self.assertEqual(self._call_fut(value._pb), [1, u"two"])
+
+    def test_deeply_nested(self):
+        from google.cloud.firestore_v1.types import document
+
+        depth = 64
+        value_pb = _value_pb(integer_value=depth)._pb
+        for level in range(depth):
+            if level % 2:
+                wrapper = document.MapValue()._pb
+                wrapper.fields["nested"].CopyFrom(value_pb)
+                value_pb = document.Value(map_value=wrapper)._pb
+            else:
+                wrapper = document.ArrayValue()._pb
+                wrapper.values.add().CopyFrom(value_pb)
+                value_pb = document.Value(array_value=wrapper)._pb
+
+        result = self._call_fut(value_pb)
+        for level in reversed(range(depth)):
+            result = result["nested"] if level % 2 else result[0]
+        self.assertEqual(result, depth)
+
+    def test_nested_unset_value_type(self):
+        from google.cloud.firestore_v1.types import document
+
+        map_pb = document.MapValue(fields={"bad": _value_pb()})
+        with self.assertRaises(ValueError):
+            self._call_fut(_value_pb(map_value=map_pb))
+
+    def test_frozen(self):
+        from types import MappingProxyType
+        from google.cloud.firestore_v1._helpers import decode_value
+        from google.cloud.firestore_v1._helpers import encode_value
+
+        value = encode_value([1, [2, {"x": [3]}], {"y": {"z": 4}}])
+        result = decode_value(value, mock.sentinel.client, frozen=True)
+
+        self.assertEqual(result, (1, (2, {"x": (3,)}), {"y": {"z": 4}}))
+        self.assertIsInstance(result[1], tuple)
+        self.assertIsInstance(result[1][1], MappingProxyType)
+        self.assertIsInstance(result[1][1]["x"], tuple)
+        self.assertIsInstance(result[2]["y"], MappingProxyType)
+        with self.assertRaises(TypeError):
+            result[2]["y"]["z"] = 5
+
 
 class Test_decode_dict(unittest.TestCase):
     @staticmethod
@@ -606,6 +746,41 @@ class Test_decode_dict(unittest.TestCase):
         }
         self.assertEqual(self._call_fut(value_fields), expected)
 
+    def test_proto_plus_map(self):
+        from google.cloud.firestore_v1.types.document import Document
+
+        fields = {
+            "zeta": _value_pb(integer_value=1),
+            "alpha": _value_pb(string_value=u"two"),
+            "mu": _value_pb(boolean_value=True),
+        }
+        document_pb = Document(fields=fields)
+
+        result = self._call_fut(document_pb.fields)
+        self.assertEqual(result, {"zeta": 1, "alpha": u"two", "mu": True})
+        self.assertEqual(list(result), list(document_pb._pb.fields))
+
+    def test_raw_protobuf_map(self):
+        from google.cloud.firestore_v1.types.document import Document
+
+        document_pb = Document(fields={"a": _value_pb(double_value=2.5)})
+        self.assertEqual(self._call_fut(document_pb._pb.fields), {"a": 2.5})
+
+    def test_frozen(self):
+        from types import MappingProxyType
+        from google.cloud.firestore_v1._helpers import decode_dict
+        from google.cloud.firestore_v1._helpers import encode_dict
+        from google.cloud.firestore_v1.types.document import Document
+
+        document_pb = Document(fields=encode_dict({"a": {"b": [1, [2]]}, "c": 3}))
+        result = decode_dict(document_pb.fields, mock.sentinel.client, frozen=True)
+
+        self.assertIsInstance(result, MappingProxyType)
+        self.assertEqual(result, {"a": {"b": (1, (2,))}, "c": 3})
+        self.assertIsInstance(result["a"], MappingProxyType)
+        with self.assertRaises(TypeError):
+            result["c"] = 4
+
 
 class Test_get_doc_id(unittest.TestCase):
     @staticmethod
@@ -727,6 +902,16 @@ class Test_extract_fields(unittest.TestCase):
         iterator = self._call_fut(document_data, prefix_path, expand_dots=True)
         self.assertEqual(list(iterator), expected)
 
+    def test_w_mapping_value(self):
+        import types
+
+        document_data = {"a": types.MappingProxyType({"b": 1})}
+        prefix_path = _make_field_path()
+        expected = [(_make_field_path("a", "b"), 1)]
+
+        iterator = self._call_fut(document_data, prefix_path)
+        self.assertEqual(list(iterator), expected)
+
 
 class Test_set_field_value(unittest.TestCase):
     @staticmethod
@@ -1270,6 +1455,55 @@ class TestDocumentExtractor(unittest.TestCase):
         self.assertEqual(update_pb.update.fields, encode_dict(document_data))
         self.assertFalse(update_pb._pb.HasField("current_document"))
 
+    def test_ctor_w_invalid_nested_key(self):
+        document_data = {"a": {"": 1}}
+
+        with self.assertRaises(ValueError):
+            self._make_one(document_data)
+
+    def test_ctor_w_nested_transforms_only(self):
+        from google.cloud.firestore_v1.transforms import SERVER_TIMESTAMP
+
+        document_data = {"a": {"b": SERVER_TIMESTAMP}, "c": 1}
+        document_path = (
+            "projects/project-id/databases/(default)/" "documents/document-id"
+        )
+
+        inst = self._make_one(document_data)
+
+        self.assertEqual(inst.set_fields, {"c": 1})
+        update_pb = inst.get_update_pb(document_path)
+        self.assertEqual(list(update_pb.update.fields), ["c"])
+
+    def test_get_update_pb_twice(self):
+        from google.cloud.firestore_v1._helpers import encode_dict
+
+        document_data = {"a": {"b": 1}, "c": [2]}
+        inst = self._make_one(document_data)
+        document_path = (
+            "projects/project-id/databases/(default)/" "documents/document-id"
+        )
+
+        first = inst.get_update_pb(document_path)
+        second = inst.get_update_pb(document_path)
+
+        self.assertIsNot(second, first)
+        self.assertEqual(first, second)
+        self.assertEqual(second.update.fields, encode_dict(document_data))
+
+    def test_get_update_pb_after_set_fields_replaced(self):
+        from google.cloud.firestore_v1._helpers import encode_dict
+
+        inst = self._make_one({"a": 1})
+        inst.set_fields = {"b": 2}
+        document_path = (
+            "projects/project-id/databases/(default)/" "documents/document-id"
+        )
+
+        update_pb = inst.get_update_pb(document_path)
+
+        self.assertEqual(update_pb.update.fields, encode_dict({"b": 2}))
+
     def test_get_field_transform_pbs_miss(self):
         document_data = {"a": 1}
         inst = self._make_one(document_data)
@@ -1699,6 +1933,14 @@ class Test_pbs_for_set_no_merge(unittest.TestCase):
         # Exercise #5944
         self._helper(do_transform=True, empty_val=True)
 
+    def test_w_read_only_data(self):
+        document_path = _make_ref_string(u"little", u"town", u"of", u"ham")
+        expected_pbs = self._call_fut(document_path, _NESTED_DATA)
+
+        for document_data in _read_only_data(_NESTED_DATA):
+            write_pbs = self._call_fut(document_path, document_data)
+            self.assertEqual(write_pbs, expected_pbs)
+
 
 class TestDocumentExtractorForMerge(unittest.TestCase):
     @staticmethod
@@ -1767,6 +2009,22 @@ class TestDocumentExtractorForMerge(unittest.TestCase):
         with self.assertRaises(ValueError):
             inst.apply_merge(["nonesuch", "or.this"])
 
+    def test_apply_merge_list_fields_after_get_update_pb(self):
+        from google.cloud.firestore_v1._helpers import encode_dict
+
+        document_data = {"a": {"b": 1, "c": 2}, "d": 3}
+        inst = self._make_one(document_data)
+        document_path = (
+            "projects/project-id/databases/(default)/" "documents/document-id"
+        )
+        inst.get_update_pb(document_path)
+
+        inst.apply_merge(["a.b"])
+
+        self.assertEqual(inst.set_fields, {"a": {"b": 1}})
+        update_pb = inst.get_update_pb(document_path)
+        self.assertEqual(update_pb.update.fields, encode_dict({"a": {"b": 1}}))
+
     def test_apply_merge_list_fields_w_unmerged_delete(self):
         from google.cloud.firestore_v1.transforms import DELETE_FIELD
 
@@ -2039,6 +2297,15 @@ class Test_pbs_for_set_with_merge(unittest.TestCase):
         expected_pbs = [update_pb]
         self.assertEqual(write_pbs, expected_pbs)
 
+    def test_w_read_only_data(self):
+        document_path = _make_ref_string(u"little", u"town", u"of", u"ham")
+
+        for merge in (True, ["a.b", "a.empty", "g"]):
+            expected_pbs = self._call_fut(document_path, _NESTED_DATA, merge)
+            for document_data in _read_only_data(_NESTED_DATA):
+                write_pbs = self._call_fut(document_path, document_data, merge)
+                self.assertEqual(write_pbs, expected_pbs)
+
 
 class TestDocumentExtractorForUpdate(unittest.TestCase):
     @staticmethod
@@ -2102,6 +2369,81 @@ class TestDocumentExtractorForUpdate(unittest.TestCase):
         self.assertEqual(inst.top_level_paths, expected_paths)
         self.assertEqual(inst.set_fields, expected_set_fields)
 
+    def test_ctor_w_conflicting_keys(self):
+        document_data = {"a": {"b": 1}, "a.b": 2}
+
+        with self.assertRaises(ValueError):
+            self._make_one(document_data)
+
+    def test_ctor_w_same_path_twice(self):
+        from google.cloud.firestore_v1._helpers import encode_dict
+
+        document_data = {"a.b": [1], "`a`.b": {"c": 2}}
+        document_path = (
+            "projects/project-id/databases/(default)/" "documents/document-id"
+        )
+
+        inst = self._make_one(document_data)
+
+        self.assertEqual(inst.set_fields, {"a": {"b": [1]}})
+        update_pb = inst.get_update_pb(document_path)
+        self.assertEqual(update_pb.update.fields, encode_dict(inst.set_fields))
+
+
+class Test_merge_fields(unittest.TestCase):
+    @staticmethod
+    def _call_fut(set_fields, fields_pb, merge_tree):
+        from google.cloud.firestore_v1._helpers import _merge_fields
+
+        return _merge_fields(set_fields, fields_pb, merge_tree)
+
+    def test_wo_fields_pb(self):
+        set_fields = {"a": {"b": 1, "c": {"d": 2}}, "e": 3, "f": {"g": 4}}
+        merge_tree = {"a": {"c": True}, "e": True, "f": {"h": True}}
+
+        merged = self._call_fut(set_fields, None, merge_tree)
+
+        self.assertEqual(merged, {"a": {"c": {"d": 2}}, "e": 3})
+
+    def test_w_fields_pb(self):
+        from google.cloud.firestore_v1._helpers import encode_dict
+        from google.cloud.firestore_v1.types import document
+
+        set_fields = {"a": {"b": 1, "c": 2}, "d": 3, "e": 4}
+        document_pb = document.Document(fields=encode_dict(set_fields))._pb
+        merge_tree = {"a": {"b": True}, "e": {"f": True}}
+
+        merged = self._call_fut(set_fields, document_pb.fields, merge_tree)
+
+        self.assertEqual(merged, {"a": {"b": 1}})
+        self.assertEqual(
+            document.Document.wrap(document_pb).fields, encode_dict(merged)
+        )
+
+
+class Test__extend_update_transforms(unittest.TestCase):
+    @staticmethod
+    def _call_fut(write_pb, field_transform_pbs):
+        from google.cloud.firestore_v1._helpers import _extend_update_transforms
+
+        return _extend_update_transforms(write_pb, field_transform_pbs)
+
+    def test_it(self):
+        from google.cloud.firestore_v1.types import write
+
+        server_value = write.DocumentTransform.FieldTransform.ServerValue
+        field_transform_pbs = [
+            write.DocumentTransform.FieldTransform(
+                field_path=field_path, set_to_server_value=server_value.REQUEST_TIME
+            )
+            for field_path in ("a", "b")
+        ]
+        write_pb = write.Write()
+
+        self._call_fut(write_pb, field_transform_pbs)
+
+        self.assertEqual(list(write_pb.update_transforms), field_transform_pbs)
+
 
 class Test_pbs_for_update(unittest.TestCase):
     @staticmethod
@@ -2176,6 +2518,19 @@ class Test_pbs_for_update(unittest.TestCase):
         precondition = common.Precondition(exists=True)
         self._helper(current_document=precondition, do_transform=True)
 
+    def test_w_read_only_data(self):
+        document_path = _make_ref_string(u"toy", u"car", u"onion", u"garlic")
+        field_updates = {"a": _NESTED_DATA["a"], "g": _NESTED_DATA["g"], "x.y": {}}
+        expected_pbs = self._call_fut(document_path, field_updates, None)
+
+        for data in _read_only_data(field_updates):
+            write_pbs = self._call_fut(document_path, data, None)
+            self.assertEqual(write_pbs, expected_pbs)
+            write_pbs = self._call_fut(document_path, {"a": data["a"]}, None)
+            self.assertEqual(
+                write_pbs[0].update.fields["a"], expected_pbs[0].update.fields["a"]
+            )
+
 
 class Test_pb_for_delete(unittest.TestCase):
     @staticmethod
@@ -2424,6 +2779,26 @@ class Test_make_retry_timeout_kwargs(unittest.TestCase):
         self.assertEqual(kwargs, expected)
 
 
+def _read_only_data(data):
+    """Read ``data`` back as a frozen and a lazy snapshot would."""
+    from google.cloud.firestore_v1 import _helpers
+    from google.cloud.firestore_v1.base_document import _LazyFieldsView
+    from google.cloud.firestore_v1.types import document
+
+    document_pb = document.Document(fields=_helpers.encode_dict(data))
+    frozen = _helpers.decode_dict(document_pb.fields, None, frozen=True)
+    lazy = _LazyFieldsView(document_pb._pb.fields, None)
+    # A copy of the top level still holds read-only nested values.
+    return [frozen, lazy, dict(frozen), dict(lazy)]
+
+
+_NESTED_DATA = {
+    "a": {"b": {"c": 1}, "d": [1, {"e": "f"}], "empty": {}},
+    "g": [{"h": True}],
+    "i": "j",
+}
+
+
 def _value_pb(**kwargs):
     from google.cloud.firestore_v1.types.document import Value
 
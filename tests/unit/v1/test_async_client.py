@@ -50,6 +50,9 @@ class TestAsyncClient(aiounittest.AsyncTestCase):
         self.assertEqual(client._database, DEFAULT_DATABASE)
         self.assertIs(client._client_info, _CLIENT_INFO)
         self.assertIsNone(client._emulator_host)
+        self.assertFalse(client._frozen_snapshots)
+        self.assertIsNone(client._single_flight)
+        self.assertIsNone(client._batch_getter)
 
     def test_constructor_with_emulator_host(self):
         from google.cloud.firestore_v1.base_client import _FIRESTORE_EMULATOR_HOST
@@ -75,12 +78,74 @@ class TestAsyncClient(aiounittest.AsyncTestCase):
             database=database,
             client_info=client_info,
             client_options=client_options,
+            frozen_snapshots=True,
         )
         self.assertEqual(client.project, self.PROJECT)
         self.assertEqual(client._credentials, credentials)
         self.assertEqual(client._database, database)
         self.assertIs(client._client_info, client_info)
         self.assertIs(client._client_options, client_options)
+        self.assertTrue(client._frozen_snapshots)
+
+    def test_constructor_w_document_cache(self):
+        from google.cloud.firestore_v1.document_cache import DocumentCache
+
+        document_cache = DocumentCache()
+        client = self._make_one(
+            project=self.PROJECT,
+            credentials=_make_credentials(),
+            document_cache=document_cache,
+        )
+        self.assertIs(client.document_cache, document_cache)
+
+    @mock.patch(
+        "google.cloud.firestore_v1.services.firestore.async_client.FirestoreAsyncClient",
+        autospec=True,
+    )
+    @mock.patch(
+        "google.cloud.firestore_v1.services.firestore.transports.grpc_asyncio."
+        "FirestoreGrpcAsyncIOTransport",
+        autospec=True,
+    )
+    def test__firestore_api_property_w_channel_pool(self, mock_transport, mock_client):
+        from google.cloud.firestore_v1.channel_pool import AsyncChannelPool
+        from google.cloud.firestore_v1.channel_pool import ChannelOptions
+
+        client = self._make_one(
+            project=self.PROJECT,
+            credentials=_make_credentials(),
+            channel_options=ChannelOptions(pool_size=2),
+        )
+
+        self.assertIs(client._firestore_api, mock_client.return_value)
+
+        (_, kwargs) = mock_transport.call_args
+        self.assertIsInstance(kwargs["channel"], AsyncChannelPool)
+
+    def test_constructor_w_coalesce_reads(self):
+        from google.cloud.firestore_v1.single_flight import AsyncBatchGetter
+        from google.cloud.firestore_v1.single_flight import AsyncSingleFlight
+
+        client = self._make_one(
+            project=self.PROJECT,
+            credentials=_make_credentials(),
+            coalesce_reads=True,
+            batch_get_window=0.005,
+        )
+        self.assertIsInstance(client._single_flight, AsyncSingleFlight)
+        self.assertIsInstance(client._batch_getter, AsyncBatchGetter)
+        self.assertIs(client._batch_getter._client, client)
+        self.assertEqual(client._batch_getter._window, 0.005)
+
+    def test_constructor_w_watching_document_cache(self):
+        from google.cloud.firestore_v1.document_cache import DocumentCache
+
+        with self.assertRaises(ValueError):
+            self._make_one(
+                project=self.PROJECT,
+                credentials=_make_credentials(),
+                document_cache=DocumentCache(watch=True),
+            )
 
     def test_constructor_w_client_options(self):
         credentials = _make_credentials()
@@ -255,9 +320,17 @@ class TestAsyncClient(aiounittest.AsyncTestCase):
         return [s async for s in snapshots]
 
     async def _get_all_helper(
-        self, num_snapshots=2, txn_id=None, retry=None, timeout=None
+        self,
+        num_snapshots=2,
+        txn_id=None,
+        retry=None,
+        timeout=None,
+        lazy=False,
+        frozen=None,
     ):
         from google.cloud.firestore_v1 import _helpers
+        from google.cloud.firestore_v1.base_document import FrozenDocumentSnapshot
+        from google.cloud.firestore_v1.base_document import LazyDocumentSnapshot
         from google.cloud.firestore_v1.types import common
         from google.cloud.firestore_v1.async_document import DocumentSnapshot
 
@@ -283,6 +356,10 @@ class TestAsyncClient(aiounittest.AsyncTestCase):
             field_path for field_path in ["a", "b", None][:num_snapshots] if field_path
         ]
         kwargs = _helpers.make_retry_timeout_kwargs(retry, timeout)
+        if lazy:
+            kwargs["lazy"] = True
+        if frozen is not None:
+            kwargs["frozen"] = frozen
 
         if txn_id is not None:
             transaction = client.transaction()
@@ -301,13 +378,19 @@ class TestAsyncClient(aiounittest.AsyncTestCase):
             if data is None:
                 self.assertFalse(snapshot.exists)
             else:
-                self.assertEqual(snapshot._data, data)
+                self.assertEqual(dict(snapshot._data), data)
+                self.assertEqual(isinstance(snapshot, LazyDocumentSnapshot), lazy)
+                self.assertEqual(
+                    isinstance(snapshot, FrozenDocumentSnapshot), lazy or bool(frozen)
+                )
 
         # Verify the call to the mock.
         doc_paths = [document._document_path for document in documents]
         mask = common.DocumentMask(field_paths=field_paths)
 
         kwargs.pop("transaction", None)
+        kwargs.pop("lazy", None)
+        kwargs.pop("frozen", None)
 
         client._firestore_api.batch_get_documents.assert_called_once_with(
             request={
@@ -341,6 +424,13 @@ class TestAsyncClient(aiounittest.AsyncTestCase):
     async def test_get_all_wrong_order(self):
         await self._get_all_helper(num_snapshots=3)
 
+    @pytest.mark.asyncio
+    async def test_get_all_lazy(self):
+        await self._get_all_helper(num_snapshots=3, lazy=True)
+
+    async def test_get_all_frozen(self):
+        await self._get_all_helper(num_snapshots=3, frozen=True)
+
     @pytest.mark.asyncio
     async def test_get_all_unknown_result(self):
         from google.cloud.firestore_v1.base_client import _BAD_DOC_TEMPLATE
@@ -373,6 +463,157 @@ class TestAsyncClient(aiounittest.AsyncTestCase):
             metadata=client._rpc_metadata,
         )
 
+    def _make_chunked_client(self, failures=None):
+        client = self._make_default_one()
+        failures = failures or {}
+        requests = []
+
+        def batch_get_documents(request, metadata, **kwargs):
+            requests.append(request)
+
+            async def responses():
+                for path in request["documents"]:
+                    if failures.get(path):
+                        raise failures[path].pop(0)
+                    yield _make_batch_response(missing=path)
+                if failures.get(None):
+                    raise failures[None].pop(0)
+
+            return responses()
+
+        firestore_api = AsyncMock(spec=["batch_get_documents"])
+        firestore_api.batch_get_documents.side_effect = batch_get_documents
+        client._firestore_api_internal = firestore_api
+        return client, requests
+
+    @pytest.mark.asyncio
+    async def test_get_all_chunked(self):
+        client, requests = self._make_chunked_client()
+        documents = [client.document("pineapple", doc_id) for doc_id in "abcde"]
+
+        snapshots = [
+            snapshot
+            async for snapshot in client.get_all(
+                documents, chunk_size=2, max_in_flight=2
+            )
+        ]
+
+        self.assertEqual(sorted(snapshot.id for snapshot in snapshots), list("abcde"))
+        self.assertEqual(
+            sorted(len(request["documents"]) for request in requests), [1, 2, 2]
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_all_chunked_error(self):
+        from google.api_core import exceptions
+
+        client, _ = self._make_chunked_client()
+        document = client.document("pineapple", "b")
+        failures = {document._document_path: [exceptions.PermissionDenied("no")]}
+        client, _ = self._make_chunked_client(failures)
+        documents = [client.document("pineapple", doc_id) for doc_id in "abc"]
+
+        with self.assertRaises(exceptions.PermissionDenied):
+            [_ async for _ in client.get_all(documents, chunk_size=1)]
+
+    @mock.patch("google.cloud.firestore_v1.async_client._PARALLEL_STREAM_BUFFER", 1)
+    @pytest.mark.asyncio
+    async def test_get_all_chunked_closed_early(self):
+        client, _ = self._make_chunked_client()
+        documents = [client.document("pineapple", doc_id) for doc_id in "abcde"]
+
+        snapshots = client.get_all(documents, chunk_size=1)
+        await snapshots.__anext__()
+        await snapshots.aclose()
+
+    @pytest.mark.asyncio
+    async def test_get_all_ordered(self):
+        client, requests = self._make_chunked_client()
+        ids = ["c", "a", "b", "a", "e", "d", "c"]
+        documents = [client.document("pineapple", doc_id) for doc_id in ids]
+
+        snapshots = [
+            snapshot
+            async for snapshot in client.get_all(documents, chunk_size=2, ordered=True)
+        ]
+
+        self.assertEqual([snapshot.id for snapshot in snapshots], ids)
+        self.assertFalse(any(snapshot.exists for snapshot in snapshots))
+        self.assertEqual(len(requests), 3)
+
+    @pytest.mark.asyncio
+    async def test_get_all_ordered_not_returned(self):
+        client = self._make_default_one()
+        document = client.document("pineapple", "a")
+        firestore_api = AsyncMock(spec=["batch_get_documents"])
+        firestore_api.batch_get_documents.return_value = AsyncIter([])
+        client._firestore_api_internal = firestore_api
+
+        snapshots = [_ async for _ in client.get_all([document], ordered=True)]
+
+        (snapshot,) = snapshots
+        self.assertIs(snapshot.reference, document)
+        self.assertFalse(snapshot.exists)
+
+    @pytest.mark.asyncio
+    async def test_get_all_empty(self):
+        client, requests = self._make_chunked_client()
+
+        self.assertEqual([_ async for _ in client.get_all([])], [])
+        self.assertEqual(requests, [])
+
+    @mock.patch("asyncio.sleep", new_callable=AsyncMock)
+    @pytest.mark.asyncio
+    async def test_get_all_resumes_chunk(self, sleep):
+        from google.api_core import exceptions
+
+        client, _ = self._make_chunked_client()
+        documents = [client.document("pineapple", doc_id) for doc_id in "abc"]
+        failures = {documents[1]._document_path: [exceptions.ServiceUnavailable("")]}
+        client, requests = self._make_chunked_client(failures)
+
+        snapshots = [_ async for _ in client.get_all(documents)]
+
+        self.assertEqual([snapshot.id for snapshot in snapshots], list("abc"))
+        self.assertEqual(
+            requests[1]["documents"],
+            [document._document_path for document in documents[1:]],
+        )
+        sleep.assert_called_once()
+
+    @mock.patch("asyncio.sleep", new_callable=AsyncMock)
+    @pytest.mark.asyncio
+    async def test_get_all_resumes_chunk_after_last(self, sleep):
+        from google.api_core import exceptions
+
+        failures = {None: [exceptions.ServiceUnavailable("")]}
+        client, requests = self._make_chunked_client(failures)
+        documents = [client.document("pineapple", doc_id) for doc_id in "ab"]
+
+        snapshots = [_ async for _ in client.get_all(documents)]
+
+        self.assertEqual([snapshot.id for snapshot in snapshots], list("ab"))
+        self.assertEqual(len(requests), 1)
+
+    @mock.patch("asyncio.sleep", new_callable=AsyncMock)
+    @pytest.mark.asyncio
+    async def test_get_all_resumes_chunk_exhausted(self, sleep):
+        from google.api_core import exceptions
+        from google.cloud.firestore_v1.base_query import _MAX_RESUME_ATTEMPTS
+
+        client, _ = self._make_chunked_client()
+        document = client.document("pineapple", "a")
+        errors = [
+            exceptions.ServiceUnavailable("") for _ in range(_MAX_RESUME_ATTEMPTS)
+        ]
+        client, requests = self._make_chunked_client({document._document_path: errors})
+
+        with self.assertRaises(exceptions.ServiceUnavailable):
+            [_ async for _ in client.get_all([document])]
+
+        self.assertEqual(len(requests), _MAX_RESUME_ATTEMPTS)
+        self.assertEqual(sleep.call_count, _MAX_RESUME_ATTEMPTS - 1)
+
     def test_batch(self):
         from google.cloud.firestore_v1.async_batch import AsyncWriteBatch
 
@@ -382,6 +623,196 @@ class TestAsyncClient(aiounittest.AsyncTestCase):
         self.assertIs(batch._client, client)
         self.assertEqual(batch._write_pbs, [])
 
+    def _make_commit_client(self, failures=None):
+        from google.protobuf import timestamp_pb2
+        from google.cloud.firestore_v1.types import document
+        from google.cloud.firestore_v1.types import firestore
+        from google.cloud.firestore_v1.types import write
+
+        client = self._make_default_one()
+        failures = failures or []
+        requests = []
+
+        def commit(request, metadata, **kwargs):
+            requests.append(request)
+            failure = failures.pop(0) if failures else None
+            if failure is not None:
+                raise failure
+            # Echo the path of each deleted document in its write result.
+            return firestore.CommitResponse(
+                write_results=[
+                    write.WriteResult(
+                        transform_results=[document.Value(string_value=write_pb.delete)]
+                    )
+                    for write_pb in request["writes"]
+                ],
+                commit_time=timestamp_pb2.Timestamp(seconds=len(requests)),
+            )
+
+        firestore_api = AsyncMock(spec=["commit"])
+        firestore_api.commit.side_effect = commit
+        client._firestore_api_internal = firestore_api
+        return client, requests
+
+    @staticmethod
+    def _make_delete_batch(client, doc_ids):
+        batch = client.batch()
+        for doc_id in doc_ids:
+            batch.delete(client.document("pineapple", doc_id))
+        return batch
+
+    @staticmethod
+    def _result_ids(write_results):
+        return [
+            write_result.transform_results[0].string_value.rsplit("/", 1)[1]
+            for write_result in write_results
+        ]
+
+    @pytest.mark.asyncio
+    async def test_commit_many(self):
+        client, requests = self._make_commit_client()
+        all_doc_ids = (["a", "b"], [], ["c", "d", "e"], ["f"])
+        batches = [self._make_delete_batch(client, doc_ids) for doc_ids in all_doc_ids]
+
+        write_results = await client.commit_many(iter(batches), max_in_flight=2)
+
+        self.assertEqual(self._result_ids(write_results), list("abcdef"))
+        self.assertEqual(
+            sorted(len(request["writes"]) for request in requests), [1, 2, 3]
+        )
+        for batch, doc_ids in zip(batches, all_doc_ids):
+            self.assertEqual(batch._write_pbs, [])
+            self.assertEqual(self._result_ids(batch.write_results), doc_ids)
+        self.assertIsNone(batches[1].commit_time)
+        self.assertIsNotNone(batches[0].commit_time)
+
+    @pytest.mark.asyncio
+    async def test_commit_many_splits_large_batch(self):
+        client, requests = self._make_commit_client()
+        doc_ids = ["doc-{:04d}".format(index) for index in range(1201)]
+        batch = self._make_delete_batch(client, doc_ids)
+
+        write_results = await client.commit_many([batch])
+
+        self.assertEqual(self._result_ids(write_results), doc_ids)
+        self.assertEqual(
+            [len(request["writes"]) for request in requests], [500, 500, 201]
+        )
+
+    @pytest.mark.asyncio
+    async def test_commit_many_wo_batches(self):
+        client, requests = self._make_commit_client()
+
+        self.assertEqual(await client.commit_many([]), [])
+        self.assertEqual(requests, [])
+
+    @pytest.mark.asyncio
+    async def test_commit_many_w_bad_max_in_flight(self):
+        client, _ = self._make_commit_client()
+
+        with self.assertRaises(ValueError):
+            await client.commit_many([], max_in_flight=0)
+
+    @pytest.mark.asyncio
+    async def test_commit_many_retries_transient_errors(self):
+        from google.api_core import exceptions
+
+        failures = [exceptions.Aborted(""), exceptions.ServiceUnavailable("")]
+        client, requests = self._make_commit_client(failures)
+        batch = self._make_delete_batch(client, ["a", "b"])
+
+        with mock.patch(
+            "google.cloud.firestore_v1.async_client._sleep", new_callable=AsyncMock
+        ) as _sleep:
+            write_results = await client.commit_many([batch])
+
+        self.assertEqual(self._result_ids(write_results), ["a", "b"])
+        self.assertEqual(len(requests), 3)
+        self.assertEqual(_sleep.call_count, 2)
+
+    @pytest.mark.asyncio
+    async def test_commit_many_retries_exhausted(self):
+        from google.api_core import exceptions
+        from google.cloud.firestore_v1.base_client import CommitManyError
+
+        failures = [exceptions.Aborted("") for _ in range(3)]
+        client, requests = self._make_commit_client(failures)
+        batch = self._make_delete_batch(client, ["a"])
+
+        with mock.patch(
+            "google.cloud.firestore_v1.async_client._sleep", new_callable=AsyncMock
+        ):
+            with self.assertRaises(CommitManyError) as exc_info:
+                await client.commit_many([batch], max_attempts=3)
+
+        self.assertIsInstance(exc_info.exception.__cause__, exceptions.Aborted)
+        self.assertEqual(len(requests), 3)
+        self.assertEqual(len(batch._write_pbs), 1)
+        self.assertIsNone(batch.write_results)
+
+    @pytest.mark.asyncio
+    async def test_commit_many_w_error(self):
+        from google.api_core import exceptions
+        from google.cloud.firestore_v1.base_client import CommitManyError
+
+        client, requests = self._make_commit_client([exceptions.NotFound("")])
+        batches = [self._make_delete_batch(client, [doc_id]) for doc_id in "abc"]
+
+        with self.assertRaises(CommitManyError) as exc_info:
+            await client.commit_many(batches, max_in_flight=1)
+
+        error = exc_info.exception
+        self.assertEqual(error.committed, [])
+        self.assertEqual(error.failed, [0])
+        self.assertEqual(error.unsent, [1, 2])
+        self.assertIsInstance(error.errors[0], exceptions.NotFound)
+        self.assertIs(error.__cause__, error.errors[0])
+        # The requests not sent yet are dropped.
+        self.assertEqual(len(requests), 1)
+        for batch in batches:
+            self.assertEqual(len(batch._write_pbs), 1)
+            self.assertIsNone(batch.write_results)
+
+    @pytest.mark.asyncio
+    async def test_commit_many_w_error_mid_series(self):
+        from google.api_core import exceptions
+        from google.cloud.firestore_v1.base_client import CommitManyError
+
+        failures = [None, exceptions.NotFound("")]
+        client, requests = self._make_commit_client(failures)
+        batches = [self._make_delete_batch(client, [doc_id]) for doc_id in "abc"]
+
+        with self.assertRaises(CommitManyError) as exc_info:
+            await client.commit_many(batches, max_in_flight=1)
+
+        error = exc_info.exception
+        self.assertEqual(error.committed, [0])
+        self.assertEqual(error.failed, [1])
+        self.assertEqual(error.unsent, [2])
+        self.assertEqual(self._result_ids(error.write_results), ["a"])
+        self.assertEqual(len(requests), 2)
+        # The committed batch is emptied, so committing it again is a no-op.
+        self.assertEqual(batches[0]._write_pbs, [])
+        self.assertEqual(self._result_ids(batches[0].write_results), ["a"])
+        self.assertIsNotNone(batches[0].commit_time)
+        for batch in batches[1:]:
+            self.assertEqual(len(batch._write_pbs), 1)
+            self.assertIsNone(batch.write_results)
+
+        write_results = await client.commit_many(batches)
+
+        self.assertEqual(self._result_ids(write_results), ["b", "c"])
+        self.assertEqual(len(requests), 4)
+
+    def test_bulk_writer(self):
+        from google.cloud.firestore_v1.async_bulk_writer import AsyncBulkWriter
+
+        client = self._make_default_one()
+        bulk_writer = client.bulk_writer(max_batch_size=5)
+        self.assertIsInstance(bulk_writer, AsyncBulkWriter)
+        self.assertIs(bulk_writer._client, client)
+        self.assertEqual(bulk_writer._max_batch_size, 5)
+
     def test_transaction(self):
         from google.cloud.firestore_v1.async_transaction import AsyncTransaction
 
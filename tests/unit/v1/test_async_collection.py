@@ -329,7 +329,29 @@ class TestAsyncCollectionReference(aiounittest.AsyncTestCase):
 
         query_class.assert_called_once_with(collection)
         query_instance = query_class.return_value
-        query_instance.stream.assert_called_once_with(transaction=None)
+        query_instance.stream.assert_called_once_with(
+            transaction=None, lazy=False, frozen=None, resumable=False
+        )
+
+    @mock.patch("google.cloud.firestore_v1.async_query.AsyncQuery", autospec=True)
+    @pytest.mark.asyncio
+    async def test_paginate(self, query_class):
+        query_class.return_value.paginate.return_value = AsyncIter(range(2))
+
+        collection = self._make_one("collection")
+        pages = [page async for page in collection.paginate(10, start_after=b"cursor")]
+
+        self.assertEqual(pages, [0, 1])
+        query_class.assert_called_once_with(collection)
+        query_instance = query_class.return_value
+        query_instance.paginate.assert_called_once_with(
+            10,
+            start_after=b"cursor",
+            prefetch=False,
+            transaction=None,
+            lazy=False,
+            frozen=None,
+        )
 
     @mock.patch("google.cloud.firestore_v1.async_query.AsyncQuery", autospec=True)
     @pytest.mark.asyncio
@@ -349,7 +371,12 @@ class TestAsyncCollectionReference(aiounittest.AsyncTestCase):
         query_class.assert_called_once_with(collection)
         query_instance = query_class.return_value
         query_instance.stream.assert_called_once_with(
-            transaction=None, retry=retry, timeout=timeout,
+            transaction=None,
+            retry=retry,
+            timeout=timeout,
+            lazy=False,
+            frozen=None,
+            resumable=False,
         )
 
     @mock.patch("google.cloud.firestore_v1.async_query.AsyncQuery", autospec=True)
@@ -366,7 +393,9 @@ class TestAsyncCollectionReference(aiounittest.AsyncTestCase):
 
         query_class.assert_called_once_with(collection)
         query_instance = query_class.return_value
-        query_instance.stream.assert_called_once_with(transaction=transaction)
+        query_instance.stream.assert_called_once_with(
+            transaction=transaction, lazy=False, frozen=None, resumable=False
+        )
 
 
 def _make_credentials():
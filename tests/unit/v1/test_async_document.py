@@ -12,12 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import pytest
 import collections
 import aiounittest
 
 import mock
-from tests.unit.v1.test__helpers import AsyncMock
+from tests.unit.v1.test__helpers import AsyncIter, AsyncMock
 
 
 class TestAsyncDocumentReference(aiounittest.AsyncTestCase):
@@ -388,9 +389,13 @@ class TestAsyncDocumentReference(aiounittest.AsyncTestCase):
         not_found=False,
         retry=None,
         timeout=None,
+        lazy=False,
+        frozen=None,
     ):
         from google.api_core.exceptions import NotFound
         from google.cloud.firestore_v1 import _helpers
+        from google.cloud.firestore_v1.base_document import FrozenDocumentSnapshot
+        from google.cloud.firestore_v1.base_document import LazyDocumentSnapshot
         from google.cloud.firestore_v1.types import common
         from google.cloud.firestore_v1.types import document
         from google.cloud.firestore_v1.transaction import Transaction
@@ -401,6 +406,7 @@ class TestAsyncDocumentReference(aiounittest.AsyncTestCase):
         firestore_api = AsyncMock(spec=["get_document"])
         response = mock.create_autospec(document.Document)
         response.fields = {}
+        response._pb = document.Document.pb()()
         response.create_time = create_time
         response.update_time = update_time
 
@@ -423,10 +429,18 @@ class TestAsyncDocumentReference(aiounittest.AsyncTestCase):
         kwargs = _helpers.make_retry_timeout_kwargs(retry, timeout)
 
         snapshot = await document.get(
-            field_paths=field_paths, transaction=transaction, **kwargs,
+            field_paths=field_paths,
+            transaction=transaction,
+            lazy=lazy,
+            frozen=frozen,
+            **kwargs,
         )
 
         self.assertIs(snapshot.reference, document)
+        self.assertEqual(isinstance(snapshot, LazyDocumentSnapshot), lazy)
+        self.assertEqual(
+            isinstance(snapshot, FrozenDocumentSnapshot), lazy or bool(frozen)
+        )
         if not_found:
             self.assertIsNone(snapshot._data)
             self.assertFalse(snapshot.exists)
@@ -434,7 +448,7 @@ class TestAsyncDocumentReference(aiounittest.AsyncTestCase):
             self.assertIsNone(snapshot.create_time)
             self.assertIsNone(snapshot.update_time)
         else:
-            self.assertEqual(snapshot.to_dict(), {})
+            self.assertEqual(dict(snapshot.to_dict()), {})
             self.assertTrue(snapshot.exists)
             self.assertIsNone(snapshot.read_time)
             self.assertIs(snapshot.create_time, create_time)
@@ -469,6 +483,22 @@ class TestAsyncDocumentReference(aiounittest.AsyncTestCase):
     async def test_get_default(self):
         await self._get_helper()
 
+    @pytest.mark.asyncio
+    async def test_get_lazy(self):
+        await self._get_helper(lazy=True)
+
+    @pytest.mark.asyncio
+    async def test_get_lazy_not_found(self):
+        await self._get_helper(not_found=True, lazy=True)
+
+    @pytest.mark.asyncio
+    async def test_get_frozen(self):
+        await self._get_helper(frozen=True)
+
+    @pytest.mark.asyncio
+    async def test_get_frozen_not_found(self):
+        await self._get_helper(not_found=True, frozen=True)
+
     @pytest.mark.asyncio
     async def test_get_w_retry_timeout(self):
         from google.api_core.retry import Retry
@@ -494,6 +524,129 @@ class TestAsyncDocumentReference(aiounittest.AsyncTestCase):
     async def test_get_with_transaction(self):
         await self._get_helper(use_transaction=True)
 
+    def _make_cached_client(self, not_found=False):
+        from google.api_core.exceptions import NotFound
+        from google.cloud.firestore_v1 import _helpers
+        from google.cloud.firestore_v1.document_cache import DocumentCache
+        from google.cloud.firestore_v1.types import document
+        from google.protobuf import timestamp_pb2
+
+        firestore_api = AsyncMock(spec=["commit", "get_document"])
+        if not_found:
+            firestore_api.get_document.side_effect = NotFound("testing")
+        else:
+            firestore_api.get_document.return_value = document.Document(
+                fields=_helpers.encode_dict({"a": 1}),
+                create_time=timestamp_pb2.Timestamp(seconds=1),
+                update_time=timestamp_pb2.Timestamp(seconds=2),
+            )
+        firestore_api.commit.return_value = self._make_commit_repsonse()
+        client = _make_client("donut-base")
+        client._firestore_api_internal = firestore_api
+        client._document_cache = DocumentCache()
+        return client, firestore_api
+
+    @pytest.mark.asyncio
+    async def test_get_w_document_cache(self):
+        client, firestore_api = self._make_cached_client()
+        document = self._make_one("where", "we-are", client=client)
+
+        snapshot1 = await document.get()
+        snapshot2 = await document.get(frozen=True)
+
+        self.assertEqual(snapshot1.to_dict(), {"a": 1})
+        self.assertEqual(snapshot2.to_dict(), {"a": 1})
+        self.assertEqual(snapshot2.update_time, snapshot1.update_time)
+        self.assertEqual(firestore_api.get_document.call_count, 1)
+        self.assertEqual(client.document_cache.hits, 1)
+
+        # Projections are not cached.
+        await document.get(field_paths=["a"])
+        self.assertEqual(firestore_api.get_document.call_count, 2)
+
+        # Writes of the client invalidate the cache.
+        await document.delete()
+        await document.get()
+        self.assertEqual(firestore_api.get_document.call_count, 3)
+        self.assertEqual(client.document_cache.invalidations, 1)
+
+    @pytest.mark.asyncio
+    async def test_get_w_document_cache_not_found(self):
+        client, firestore_api = self._make_cached_client(not_found=True)
+        document = self._make_one("where", "we-are", client=client)
+
+        self.assertFalse((await document.get()).exists)
+        self.assertFalse((await document.get()).exists)
+
+        firestore_api.get_document.assert_called_once()
+
+    def _make_coalescing_client(self, **kwargs):
+        from google.cloud.firestore_v1 import _helpers
+        from google.cloud.firestore_v1.async_client import AsyncClient
+        from google.cloud.firestore_v1.types import document
+
+        firestore_api = AsyncMock(spec=["batch_get_documents", "get_document"])
+        firestore_api.get_document.return_value = document.Document(
+            fields=_helpers.encode_dict({"a": 1})
+        )
+        client = AsyncClient(
+            project="donut-base", credentials=_make_credentials(), **kwargs
+        )
+        client._firestore_api_internal = firestore_api
+        return client, firestore_api
+
+    @pytest.mark.asyncio
+    async def test_get_w_coalesce_reads(self):
+        client, firestore_api = self._make_coalescing_client(coalesce_reads=True)
+        document = self._make_one("where", "we-are", client=client)
+
+        snapshot1, snapshot2, snapshot3 = await asyncio.gather(
+            document.get(), document.get(lazy=True), document.get(field_paths=["a"]),
+        )
+
+        self.assertEqual(snapshot1.to_dict(), {"a": 1})
+        self.assertEqual(snapshot2.to_dict(), {"a": 1})
+        self.assertIsNot(snapshot2, snapshot1)
+        self.assertEqual(snapshot3.to_dict(), {"a": 1})
+        # The projected read differs, so it is not shared.
+        self.assertEqual(firestore_api.get_document.call_count, 2)
+
+    @pytest.mark.asyncio
+    async def test_get_w_batch_get_window(self):
+        from google.cloud.firestore_v1 import _helpers
+        from google.cloud.firestore_v1.types import document
+        from google.cloud.firestore_v1.types import firestore
+
+        client, firestore_api = self._make_coalescing_client(batch_get_window=0.001)
+        found = self._make_one("where", "we-are", client=client)
+        missing = self._make_one("where", "we-are-not", client=client)
+        firestore_api.batch_get_documents.return_value = AsyncIter(
+            [
+                firestore.BatchGetDocumentsResponse(
+                    found=document.Document(
+                        name=found._document_path,
+                        fields=_helpers.encode_dict({"b": 2}),
+                    )
+                ),
+                firestore.BatchGetDocumentsResponse(missing=missing._document_path),
+            ]
+        )
+
+        snapshot, missing_snapshot = await asyncio.gather(found.get(), missing.get())
+
+        self.assertEqual(snapshot.to_dict(), {"b": 2})
+        self.assertFalse(missing_snapshot.exists)
+        firestore_api.batch_get_documents.assert_called_once_with(
+            request={
+                "database": client._database_string,
+                "documents": [found._document_path, missing._document_path],
+                "mask": None,
+                "transaction": None,
+            },
+            metadata=client._rpc_metadata,
+        )
+        firestore_api.get_document.assert_not_called()
+
     @pytest.mark.asyncio
     async def _collections_helper(self, page_size=None, retry=None, timeout=None):
         from google.cloud.firestore_v1 import _helpers
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import pytest
 import types
 import aiounittest
@@ -105,6 +106,48 @@ class TestAsyncQuery(aiounittest.AsyncTestCase):
         timeout = 123.0
         await self._get_helper(retry=retry, timeout=timeout)
 
+    @pytest.mark.asyncio
+    async def test_get_w_coalesce_reads(self):
+        from google.cloud.firestore_v1.async_client import AsyncClient
+        from google.cloud.firestore_v1.types import firestore
+
+        firestore_api = AsyncMock(spec=["run_query"])
+        client = AsyncClient(
+            project="project-project",
+            credentials=_make_credentials(),
+            coalesce_reads=True,
+        )
+        client._firestore_api_internal = firestore_api
+        parent = client.collection("dee")
+        _, expected_prefix = parent._parent_info()
+        name = "{}/sleep".format(expected_prefix)
+        response_pbs = [
+            _make_query_response(name=name, data={"snooze": 10}),
+            firestore.RunQueryResponse(),
+        ]
+        firestore_api.run_query.side_effect = lambda **kwargs: AsyncIter(response_pbs)
+
+        query = self._make_one(parent).where("snooze", "==", 10)
+        returned, returned_again = await asyncio.gather(
+            query.get(timeout=5.0), parent.where("snooze", "==", 10).get(timeout=5.0)
+        )
+
+        self.assertEqual(
+            [snapshot.to_dict() for snapshot in returned], [{"snooze": 10}]
+        )
+        self.assertEqual(returned[0].reference._path, ("dee", "sleep"))
+        self.assertIsNot(returned_again[0], returned[0])
+        self.assertEqual(returned_again[0].to_dict(), {"snooze": 10})
+        firestore_api.run_query.assert_called_once_with(
+            request={
+                "parent": parent._parent_info()[0],
+                "structured_query": query._to_protobuf(),
+                "transaction": None,
+            },
+            metadata=client._rpc_metadata,
+            timeout=5.0,
+        )
+
     @pytest.mark.asyncio
     async def test_get_limit_to_last(self):
         from google.cloud import firestore
@@ -164,8 +207,10 @@ class TestAsyncQuery(aiounittest.AsyncTestCase):
             metadata=client._rpc_metadata,
         )
 
-    async def _stream_helper(self, retry=None, timeout=None):
+    async def _stream_helper(self, retry=None, timeout=None, lazy=False, frozen=None):
         from google.cloud.firestore_v1 import _helpers
+        from google.cloud.firestore_v1.base_document import FrozenDocumentSnapshot
+        from google.cloud.firestore_v1.base_document import LazyDocumentSnapshot
 
         # Create a minimal fake GAPIC.
         firestore_api = AsyncMock(spec=["run_query"])
@@ -188,14 +233,18 @@ class TestAsyncQuery(aiounittest.AsyncTestCase):
         # Execute the query and check the response.
         query = self._make_one(parent)
 
-        get_response = query.stream(**kwargs)
+        get_response = query.stream(lazy=lazy, frozen=frozen, **kwargs)
 
         self.assertIsInstance(get_response, types.AsyncGeneratorType)
         returned = [x async for x in get_response]
         self.assertEqual(len(returned), 1)
         snapshot = returned[0]
         self.assertEqual(snapshot.reference._path, ("dee", "sleep"))
-        self.assertEqual(snapshot.to_dict(), data)
+        self.assertEqual(dict(snapshot.to_dict()), data)
+        self.assertEqual(isinstance(snapshot, LazyDocumentSnapshot), lazy)
+        self.assertEqual(
+            isinstance(snapshot, FrozenDocumentSnapshot), lazy or bool(frozen)
+        )
 
         # Verify the mock call.
         parent_path, _ = parent._parent_info()
@@ -213,6 +262,13 @@ class TestAsyncQuery(aiounittest.AsyncTestCase):
     async def test_stream_simple(self):
         await self._stream_helper()
 
+    @pytest.mark.asyncio
+    async def test_stream_lazy(self):
+        await self._stream_helper(lazy=True)
+
+    async def test_stream_frozen(self):
+        await self._stream_helper(frozen=True)
+
     @pytest.mark.asyncio
     async def test_stream_w_retry_timeout(self):
         from google.api_core.retry import Retry
@@ -469,6 +525,195 @@ class TestAsyncQuery(aiounittest.AsyncTestCase):
             metadata=client._rpc_metadata,
         )
 
+    def _make_resumable_client(self, *streams):
+        firestore_api = AsyncMock(spec=["run_query"])
+        firestore_api.run_query.side_effect = streams
+        client = _make_client()
+        client._firestore_api_internal = firestore_api
+        return client
+
+    @staticmethod
+    async def _interrupted(responses, error):
+        for response in responses:
+            yield response
+        raise error
+
+    @mock.patch("asyncio.sleep", new_callable=AsyncMock)
+    async def test_stream_resumable(self, sleep):
+        from google.api_core import exceptions
+
+        client = self._make_resumable_client()
+        parent = client.collection("dee")
+        _, expected_prefix = parent._parent_info()
+        response_a = _make_query_response(
+            name="{}/a".format(expected_prefix), data={"n": 1}
+        )
+        response_b = _make_query_response(
+            name="{}/b".format(expected_prefix), data={"n": 2}
+        )
+        client._firestore_api.run_query.side_effect = [
+            self._interrupted([response_a], exceptions.ServiceUnavailable("down")),
+            AsyncIter([response_b]),
+        ]
+        query = self._make_one(parent).order_by("n").limit(5).offset(1)
+
+        snapshots = [i async for i in query.stream(frozen=True, resumable=True)]
+
+        self.assertEqual([snapshot.id for snapshot in snapshots], ["a", "b"])
+        sleep.assert_called_once()
+        expected = query.start_after(snapshots[0]).limit(4).offset(0)
+        request = client._firestore_api.run_query.call_args[1]["request"]
+        self.assertEqual(request["structured_query"], expected._to_protobuf())
+
+    @mock.patch("asyncio.sleep", new_callable=AsyncMock)
+    async def test_stream_resumable_w_projection(self, sleep):
+        from google.api_core import exceptions
+
+        client = self._make_resumable_client()
+        parent = client.collection("dee")
+        _, expected_prefix = parent._parent_info()
+        response_a = _make_query_response(
+            name="{}/a".format(expected_prefix), data={"a": 0, "n": 1}
+        )
+        response_b = _make_query_response(
+            name="{}/b".format(expected_prefix), data={"a": 0, "n": 2}
+        )
+        client._firestore_api.run_query.side_effect = [
+            self._interrupted([response_a], exceptions.ServiceUnavailable("down")),
+            AsyncIter([response_b]),
+        ]
+        query = self._make_one(parent).select(["a"]).order_by("n")
+
+        snapshots = [i async for i in query.stream(resumable=True)]
+
+        self.assertEqual([snapshot.id for snapshot in snapshots], ["a", "b"])
+        with_orders = query.select(["a", "n"])
+        first, second = [
+            call[1]["request"]["structured_query"]
+            for call in client._firestore_api.run_query.call_args_list
+        ]
+        self.assertEqual(first, with_orders._to_protobuf())
+        expected = with_orders.start_after(snapshots[0])
+        self.assertEqual(second, expected._to_protobuf())
+
+    @mock.patch("asyncio.sleep", new_callable=AsyncMock)
+    async def test_stream_resumable_exhausted(self, sleep):
+        from google.api_core import exceptions
+
+        error = exceptions.DeadlineExceeded("slow")
+        client = self._make_resumable_client(*[error] * 5)
+        query = self._make_one(client.collection("dee"))
+
+        with self.assertRaises(exceptions.DeadlineExceeded):
+            [i async for i in query.stream(resumable=True)]
+
+        self.assertEqual(client._firestore_api.run_query.call_count, 5)
+        self.assertEqual(sleep.call_count, 4)
+
+    @mock.patch("asyncio.sleep", new_callable=AsyncMock)
+    async def test_stream_resumable_at_limit(self, sleep):
+        from google.api_core import exceptions
+
+        client = self._make_resumable_client()
+        parent = client.collection("dee")
+        _, expected_prefix = parent._parent_info()
+        response = _make_query_response(
+            name="{}/a".format(expected_prefix), data={"n": 1}
+        )
+        client._firestore_api.run_query.side_effect = [
+            self._interrupted([response], exceptions.InternalServerError("oops")),
+        ]
+        query = self._make_one(parent).limit(1)
+
+        snapshots = [i async for i in query.stream(resumable=True)]
+
+        self.assertEqual([snapshot.id for snapshot in snapshots], ["a"])
+        client._firestore_api.run_query.assert_called_once()
+
+    def _make_paginated(self, *pages):
+        client = self._make_resumable_client()
+        parent = client.collection("dee")
+        _, expected_prefix = parent._parent_info()
+        streams = []
+        for page in pages:
+            streams.append(
+                AsyncIter(
+                    [
+                        _make_query_response(
+                            name="{}/{}".format(expected_prefix, doc_id), data={"n": 1},
+                        )
+                        for doc_id in page
+                    ]
+                )
+            )
+        client._firestore_api.run_query.side_effect = streams
+        return client, parent
+
+    @staticmethod
+    def _structured_queries(client):
+        return [
+            call[1]["request"]["structured_query"]
+            for call in client._firestore_api.run_query.call_args_list
+        ]
+
+    async def test_paginate(self):
+        client, parent = self._make_paginated(["a", "b"], ["c"])
+        query = self._make_one(parent)
+
+        pages = [page async for page in query.paginate(2)]
+
+        self.assertEqual([[s.id for s in page] for page in pages], [["a", "b"], ["c"]])
+        by_name = query.order_by("__name__")
+        self.assertEqual(
+            self._structured_queries(client),
+            [
+                by_name.limit(2)._to_protobuf(),
+                by_name.limit(2)
+                .start_after({"__name__": parent.document("b")})
+                ._to_protobuf(),
+            ],
+        )
+
+    async def test_paginate_w_projection(self):
+        client, parent = self._make_paginated(["a", "b"], ["c"])
+        query = self._make_one(parent).select(["a"]).order_by("n")
+
+        pages = [page async for page in query.paginate(2)]
+
+        self.assertEqual([[s.id for s in page] for page in pages], [["a", "b"], ["c"]])
+        structured_query = self._structured_queries(client)[1]
+        self.assertEqual(
+            [field.field_path for field in structured_query.select.fields], ["a", "n"]
+        )
+
+    async def test_paginate_last_page_full(self):
+        client, parent = self._make_paginated(["a", "b"], [])
+        query = self._make_one(parent)
+
+        pages = [page async for page in query.paginate(2)]
+
+        self.assertEqual(len(pages), 1)
+        self.assertEqual(client._firestore_api.run_query.call_count, 2)
+
+    async def test_paginate_prefetch(self):
+        client, parent = self._make_paginated(["a", "b"], ["c", "d"], ["e"])
+        query = self._make_one(parent)
+
+        pages = [page async for page in query.paginate(2, prefetch=True)]
+
+        self.assertEqual(
+            [[s.id for s in page] for page in pages], [["a", "b"], ["c", "d"], ["e"]]
+        )
+
+    async def test_paginate_prefetch_closed_early(self):
+        client, parent = self._make_paginated(["a", "b"], ["c", "d"], ["e"])
+        query = self._make_one(parent)
+
+        iterator = query.paginate(2, prefetch=True)
+        page = await iterator.__anext__()
+        self.assertEqual(len(page), 2)
+        await iterator.aclose()
+
 
 class TestCollectionGroup(aiounittest.AsyncTestCase):
     @staticmethod
@@ -596,6 +841,166 @@ class TestCollectionGroup(aiounittest.AsyncTestCase):
         with pytest.raises(ValueError):
             [i async for i in query.get_partitions(2)]
 
+    async def test_parallel_stream_w_orders(self):
+        client = _make_client()
+        query = self._make_one(client.collection("charles")).order_by("a")
+        with pytest.raises(ValueError):
+            [i async for i in query.parallel_stream(2)]
+
+    async def test_parallel_stream_w_limit(self):
+        client = _make_client()
+        query = self._make_one(client.collection("charles")).limit(10)
+        with pytest.raises(ValueError):
+            [i async for i in query.parallel_stream(2)]
+
+    async def test_parallel_stream_w_offset(self):
+        client = _make_client()
+        query = self._make_one(client.collection("charles")).offset(10)
+        with pytest.raises(ValueError):
+            [i async for i in query.parallel_stream(2)]
+
+    async def test_parallel_stream_w_inequality_filter(self):
+        client = _make_client()
+        query = self._make_one(client.collection("charles")).where("a", ">", 1)
+        with pytest.raises(ValueError, match="inequality filters"):
+            [i async for i in query.parallel_stream(2)]
+
+    async def test_parallel_stream_unordered(self):
+        client, fake = _make_partitioned_client()
+        query = self._make_one(client.collection("charles"))
+
+        snapshots = [i async for i in query.parallel_stream(2, max_workers=2)]
+
+        self.assertEqual(sorted(snapshot.id for snapshot in snapshots), _DOC_IDS)
+        self.assertEqual(len(fake.requests), 3)
+
+    async def test_parallel_stream_ordered(self):
+        client, fake = _make_partitioned_client()
+        query = self._make_one(client.collection("charles"))
+
+        snapshots = [
+            i
+            async for i in query.parallel_stream(
+                2, max_workers=2, ordered=True, max_buffered=1
+            )
+        ]
+
+        self.assertEqual([snapshot.id for snapshot in snapshots], _DOC_IDS)
+
+    async def test_parallel_stream_w_filter(self):
+        client, fake = _make_partitioned_client()
+        query = self._make_one(client.collection("charles")).where("a", "==", 1)
+
+        [i async for i in query.parallel_stream(2)]
+
+        partition_request = client._firestore_api.partition_query.call_args[1]
+        structured_query = partition_request["request"]["structured_query"]
+        self.assertFalse(structured_query._pb.HasField("where"))
+        for structured_query in fake.requests:
+            self.assertTrue(structured_query._pb.HasField("where"))
+
+    @mock.patch("asyncio.sleep", new_callable=AsyncMock)
+    async def test_parallel_stream_resumed(self, sleep):
+        from google.api_core import exceptions
+
+        client, fake = _make_partitioned_client()
+        fake.failures["c"] = [exceptions.ServiceUnavailable("down")]
+        query = self._make_one(client.collection("charles"))
+
+        snapshots = [i async for i in query.parallel_stream(2, ordered=True)]
+
+        self.assertEqual([snapshot.id for snapshot in snapshots], _DOC_IDS)
+        sleep.assert_called_once()
+        self.assertEqual(len(fake.requests), 4)
+        (resumed,) = [
+            structured_query
+            for structured_query in fake.requests
+            if structured_query.start_at.values and not structured_query.start_at.before
+        ]
+        self.assertTrue(resumed.start_at.values[0].reference_value.endswith("/b"))
+
+    @mock.patch("asyncio.sleep", new_callable=AsyncMock)
+    async def test_parallel_stream_resume_exhausted(self, sleep):
+        from google.api_core import exceptions
+
+        client, fake = _make_partitioned_client()
+        error = exceptions.DeadlineExceeded("slow")
+        fake.failures["a"] = [error, error, error]
+        query = self._make_one(client.collection("charles"))
+
+        with self.assertRaises(exceptions.DeadlineExceeded):
+            [i async for i in query.parallel_stream(2, ordered=True, max_attempts=3)]
+
+        self.assertEqual(sleep.call_count, 2)
+
+    async def test_parallel_stream_error(self):
+        from google.api_core import exceptions
+
+        client, fake = _make_partitioned_client()
+        fake.failures["a"] = [exceptions.PermissionDenied("nope")]
+        query = self._make_one(client.collection("charles"))
+
+        with self.assertRaises(exceptions.PermissionDenied):
+            [i async for i in query.parallel_stream(2, max_workers=1)]
+
+    async def test_parallel_stream_closed_early(self):
+        client, fake = _make_partitioned_client()
+        query = self._make_one(client.collection("charles"))
+
+        iterator = query.parallel_stream(2, ordered=True, max_buffered=1)
+        snapshot = await iterator.__anext__()
+        self.assertEqual(snapshot.id, "a")
+        await iterator.aclose()
+
+
+_DOC_IDS = ["a", "b", "c", "d", "e"]
+
+
+class _FakePartitionedFirestore(object):
+    """Serve ``RunQuery`` for documents ``_DOC_IDS``, honouring cursors."""
+
+    def __init__(self, client):
+        self.client = client
+        self.requests = []
+        self.failures = {}
+
+    def run_query(self, request, metadata, **kwargs):
+        structured_query = request["structured_query"]
+        self.requests.append(structured_query)
+        return self._responses(structured_query)
+
+    async def _responses(self, structured_query):
+        start_at = structured_query.start_at
+        end_at = structured_query.end_at
+        for doc_id in _DOC_IDS:
+            name = self.client.document("charles", doc_id)._document_path
+            if start_at.values:
+                start = start_at.values[0].reference_value
+                if name < start or (name == start and not start_at.before):
+                    continue
+            if end_at.values and name >= end_at.values[0].reference_value:
+                continue
+            failures = self.failures.get(doc_id)
+            if failures:
+                raise failures.pop(0)
+            yield _make_query_response(name=name, data={"a": 1})
+
+
+def _make_partitioned_client():
+    # Partitions are [start, b), [b, d) and [d, end).
+    client = _make_client()
+    fake = _FakePartitionedFirestore(client)
+    firestore_api = AsyncMock(spec=["partition_query", "run_query"])
+    firestore_api.partition_query.return_value = AsyncIter(
+        [
+            _make_cursor_pb(([client.document("charles", "b")], False)),
+            _make_cursor_pb(([client.document("charles", "d")], False)),
+        ]
+    )
+    firestore_api.run_query.side_effect = fake.run_query
+    client._firestore_api_internal = firestore_api
+    return client, fake
+
 
 def _make_client(project="project-project"):
     from google.cloud.firestore_v1.async_client import AsyncClient
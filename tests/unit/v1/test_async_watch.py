@@ -0,0 +1,502 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import itertools
+
+import aiounittest
+import mock
+import pytest
+
+from google.api_core import exceptions
+from grpc import aio  # type: ignore
+
+from google.cloud.firestore_v1.types import document
+from google.cloud.firestore_v1.types import firestore
+from google.cloud.firestore_v1.types import write
+from google.protobuf import timestamp_pb2
+from tests.unit.v1.test__helpers import _make_credentials
+
+
+class TestAsyncWatch(aiounittest.AsyncTestCase):
+    def _make_client(self, *calls):
+        from google.cloud.firestore_v1.async_client import AsyncClient
+
+        client = AsyncClient(project="project", credentials=_make_credentials())
+        firestore_api = mock.Mock(spec=["transport"])
+        firestore_api.transport.listen.side_effect = list(calls)
+        client._firestore_api_internal = firestore_api
+        return client
+
+    @staticmethod
+    def _no_backoff():
+        return mock.patch(
+            "google.cloud.firestore_v1.async_watch.retries.exponential_sleep_generator",
+            return_value=itertools.repeat(0),
+        )
+
+    @pytest.mark.asyncio
+    async def test_listen_query(self):
+        from google.cloud.firestore_v1.async_document import AsyncDocumentReference
+        from google.cloud.firestore_v1.async_watch import AsyncWatch
+        from google.cloud.firestore_v1.async_watch import WatchSnapshot
+        from google.cloud.firestore_v1.watch import ChangeType
+
+        call = _FakeCall(
+            [
+                _target_change("ADD"),
+                _document_change("users/b", 2, seconds=1),
+                _document_change("users/a", 1, seconds=1),
+                _target_change("CURRENT"),
+                _target_change("NO_CHANGE", resume_token=b"token", seconds=2),
+            ]
+        )
+        client = self._make_client(call)
+        query = client.collection("users").order_by("n")
+
+        watch = query.listen()
+        self.assertIsInstance(watch, AsyncWatch)
+        self.assertTrue(watch.is_active)
+
+        snapshot = await watch.__anext__()
+        self.assertIsInstance(snapshot, WatchSnapshot)
+        self.assertEqual([doc.id for doc in snapshot.documents], ["a", "b"])
+        self.assertIsInstance(snapshot.documents[0].reference, AsyncDocumentReference)
+        self.assertEqual(snapshot.documents[0].to_dict(), {"n": 1})
+        self.assertEqual(
+            [change.type for change in snapshot.changes], [ChangeType.ADDED] * 2
+        )
+        self.assertEqual(snapshot.read_time.timestamp(), 2)
+        self.assertEqual(watch.resume_token, b"token")
+
+        request = call.requests[0]
+        self.assertEqual(request.database, client._database_string)
+        self.assertEqual(
+            request.add_target.query.structured_query, query._to_protobuf()
+        )
+        client._firestore_api.transport.listen.assert_called_once_with(
+            metadata=client._rpc_metadata
+        )
+
+        await watch.aclose()
+        self.assertFalse(watch.is_active)
+        self.assertTrue(call.cancelled)
+        with self.assertRaises(StopAsyncIteration):
+            await watch.__anext__()
+        snapshots = [snapshot async for snapshot in watch]
+        self.assertEqual(snapshots, [])
+
+    @pytest.mark.asyncio
+    async def test_listen_collection(self):
+        call = _FakeCall(
+            [_target_change("CURRENT"), _target_change("NO_CHANGE", seconds=1)]
+        )
+        client = self._make_client(call)
+        collection = client.collection("users")
+
+        watch = collection.listen()
+        snapshot = await watch.__anext__()
+        self.assertEqual(snapshot.documents, [])
+        self.assertEqual(
+            call.requests[0].add_target.query.structured_query,
+            collection._query()._to_protobuf(),
+        )
+        await watch.aclose()
+
+    @pytest.mark.asyncio
+    async def test_listen_document(self):
+        call = _FakeCall(
+            [
+                _document_change("users/a", 1, seconds=1),
+                _target_change("CURRENT"),
+                _target_change("NO_CHANGE", seconds=1),
+            ]
+        )
+        client = self._make_client(call)
+        document_ref = client.document("users", "a")
+
+        watch = document_ref.listen()
+        snapshot = await watch.__anext__()
+        self.assertEqual([doc.id for doc in snapshot.documents], ["a"])
+        self.assertEqual(
+            list(call.requests[0].add_target.documents.documents),
+            [document_ref._document_path],
+        )
+        await watch.aclose()
+
+    @pytest.mark.asyncio
+    async def test_on_snapshot_coroutine_callback(self):
+        call = _FakeCall(
+            [
+                _document_change("users/a", 1, seconds=1),
+                _target_change("CURRENT"),
+                _target_change("NO_CHANGE", seconds=1),
+                _document_change("users/a", 2, seconds=2),
+                _target_change("NO_CHANGE", seconds=2),
+            ]
+        )
+        client = self._make_client(call)
+        received = []
+        done = asyncio.Event()
+
+        async def callback(docs, changes, read_time):
+            await asyncio.sleep(0)
+            received.append([doc.to_dict() for doc in docs])
+            if len(received) == 2:
+                done.set()
+
+        watch = client.document("users", "a").on_snapshot(callback)
+        await done.wait()
+        self.assertEqual(received, [[{"n": 1}], [{"n": 2}]])
+        watch.unsubscribe()
+        self.assertFalse(watch.is_active)
+
+    @pytest.mark.asyncio
+    async def test_on_snapshot_query_and_collection(self):
+        calls = [
+            _FakeCall(
+                [_target_change("CURRENT"), _target_change("NO_CHANGE", seconds=1)]
+            )
+            for _ in range(2)
+        ]
+        client = self._make_client(*calls)
+        received = []
+        done = asyncio.Event()
+
+        def callback(docs, changes, read_time):
+            received.append(docs)
+            if len(received) == 2:
+                done.set()
+
+        collection = client.collection("users")
+        watches = [
+            collection.on_snapshot(callback),
+            collection.where("n", ">", 1).on_snapshot(callback),
+        ]
+        await done.wait()
+        self.assertEqual(received, [[], []])
+        for watch in watches:
+            await watch.aclose()
+
+    @pytest.mark.asyncio
+    async def test_listen_changes_only(self):
+        from google.cloud.firestore_v1.watch import ChangeType
+
+        read = asyncio.Event()
+        call = _FakeCall(
+            [
+                _document_change("users/b", 2, seconds=1),
+                _document_change("users/a", 1, seconds=1),
+                _target_change("CURRENT"),
+                _target_change("NO_CHANGE", seconds=1),
+                read,
+                _document_change("users/c", 3, seconds=2),
+                _target_change("NO_CHANGE", seconds=2),
+            ]
+        )
+        client = self._make_client(call)
+
+        watch = client.collection("users").order_by("n").listen(changes_only=True)
+        snapshot = await watch.__anext__()
+        self.assertIsNone(snapshot.documents)
+        self.assertEqual([change.new_index for change in snapshot.changes], [0, 1])
+        read.set()
+        snapshot = await watch.__anext__()
+        self.assertIsNone(snapshot.documents)
+        self.assertEqual(
+            [(change.type, change.new_index) for change in snapshot.changes],
+            [(ChangeType.ADDED, 2)],
+        )
+        self.assertEqual(snapshot.read_time.timestamp(), 2)
+        self.assertEqual([doc.id for doc in watch.documents()], ["a", "b", "c"])
+        await watch.aclose()
+
+    @pytest.mark.asyncio
+    async def test_listen_w_slow_consumer(self):
+        from google.cloud.firestore_v1.watch import ChangeType
+
+        call = _FakeCall(
+            [
+                _document_change("users/b", 2, seconds=1),
+                _document_change("users/a", 1, seconds=1),
+                _target_change("CURRENT"),
+                _target_change("NO_CHANGE", seconds=1),
+                _document_change("users/c", 3, seconds=2),
+                _target_change("NO_CHANGE", seconds=2),
+                _document_change("users/a", 4, seconds=3),
+                _target_change("NO_CHANGE", seconds=3),
+            ]
+        )
+        client = self._make_client(call)
+
+        watch = client.collection("users").order_by("n").listen()
+        # Three snapshots are pushed before the consumer gets to any.
+        await call.drained.wait()
+        self.assertIsNotNone(watch._unread)
+
+        snapshot = await watch.__anext__()
+        self.assertEqual([doc.id for doc in snapshot.documents], ["b", "c", "a"])
+        self.assertEqual(
+            [(change.type, change.document.id) for change in snapshot.changes],
+            [
+                (ChangeType.ADDED, "a"),
+                (ChangeType.ADDED, "b"),
+                (ChangeType.ADDED, "c"),
+                (ChangeType.MODIFIED, "a"),
+            ],
+        )
+        self.assertEqual(snapshot.read_time.timestamp(), 3)
+        self.assertIsNone(watch._unread)
+
+        await watch.aclose()
+        with self.assertRaises(StopAsyncIteration):
+            await watch.__anext__()
+
+    @pytest.mark.asyncio
+    async def test_listen_w_fields(self):
+        from google.cloud.firestore_v1.base_document import ProjectedDocumentSnapshot
+
+        call = _FakeCall(
+            [
+                _document_change("users/b", 2, seconds=1),
+                _document_change("users/a", 1, seconds=1),
+                _target_change("CURRENT"),
+                _target_change("NO_CHANGE", seconds=1),
+            ]
+        )
+        client = self._make_client(call)
+
+        watch = client.collection("users").order_by("n").listen(fields=["missing"])
+        snapshot = await watch.__anext__()
+        self.assertEqual([doc.id for doc in snapshot.documents], ["a", "b"])
+        for doc in snapshot.documents:
+            self.assertIsInstance(doc, ProjectedDocumentSnapshot)
+        self.assertEqual(snapshot.documents[1].to_dict(), {"n": 2})
+        self.assertEqual(snapshot.documents[1].update_time.timestamp(), 1)
+        await watch.aclose()
+
+    @pytest.mark.asyncio
+    async def test_on_snapshot_changes_only(self):
+        calls = [
+            _FakeCall(
+                [
+                    _document_change("users/a", 1, seconds=1),
+                    _target_change("CURRENT"),
+                    _target_change("NO_CHANGE", seconds=1),
+                ]
+            )
+            for _ in range(2)
+        ]
+        client = self._make_client(*calls)
+        received = []
+        done = asyncio.Event()
+
+        def callback(changes, read_time):
+            received.append([change.document.id for change in changes])
+            if len(received) == 2:
+                done.set()
+
+        watches = [
+            client.document("users", "a").on_snapshot(callback, changes_only=True),
+            client.collection("users").on_snapshot(callback, changes_only=True),
+        ]
+        await done.wait()
+        self.assertEqual(received, [["a"], ["a"]])
+        for watch in watches:
+            self.assertEqual([doc.id for doc in watch.documents()], ["a"])
+            await watch.aclose()
+
+    @pytest.mark.asyncio
+    async def test_resume_after_recoverable_errors(self):
+        first = _FakeCall(
+            [
+                _target_change("CURRENT"),
+                _target_change("NO_CHANGE", resume_token=b"token-1", seconds=1),
+                exceptions.ServiceUnavailable("unavailable"),
+            ]
+        )
+        second = _FakeCall([aio.EOF])
+        third = _FakeCall(
+            [
+                _document_change("users/a", 1, seconds=2),
+                _target_change("NO_CHANGE", resume_token=b"token-2", seconds=2),
+            ]
+        )
+        client = self._make_client(first, second, third)
+
+        with self._no_backoff() as sleep_generator:
+            watch = client.collection("users").listen()
+            snapshot = await watch.__anext__()
+            self.assertEqual(snapshot.documents, [])
+            snapshot = await watch.__anext__()
+
+        self.assertEqual([doc.id for doc in snapshot.documents], ["a"])
+        self.assertEqual(watch.resume_token, b"token-2")
+        self.assertEqual(first.requests[0].add_target.resume_token, b"")
+        self.assertEqual(second.requests[0].add_target.resume_token, b"token-1")
+        self.assertEqual(third.requests[0].add_target.resume_token, b"token-1")
+        # The backoff restarts once the first stream delivered responses,
+        # and continues over the empty second stream.
+        sleep_generator.assert_called_once()
+        await watch.aclose()
+        self.assertTrue(third.cancelled)
+
+    @pytest.mark.asyncio
+    async def test_terminating_error(self):
+        call = _FakeCall([exceptions.PermissionDenied("denied")])
+        client = self._make_client(call)
+
+        watch = client.collection("users").listen()
+        with self.assertRaises(exceptions.PermissionDenied):
+            await watch.__anext__()
+        self.assertFalse(watch.is_active)
+        with self.assertRaises(exceptions.PermissionDenied):
+            await watch.__anext__()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_by_server(self):
+        call = _FakeCall([exceptions.Cancelled("cancelled")])
+        client = self._make_client(call)
+
+        watch = client.collection("users").listen()
+        with self.assertRaises(exceptions.Cancelled):
+            await watch.__anext__()
+
+    @pytest.mark.asyncio
+    async def test_target_removed(self):
+        call = _FakeCall([_target_change("REMOVE")])
+        client = self._make_client(call)
+
+        watch = client.collection("users").listen()
+        with self.assertRaises(RuntimeError):
+            await watch.__anext__()
+
+    @pytest.mark.asyncio
+    async def test_unknown_response_closes(self):
+        response = mock.Mock(spec=[])
+        call = _FakeCall([response])
+        client = self._make_client(call)
+
+        watch = client.collection("users").listen()
+        with self.assertRaises(ValueError):
+            await watch.__anext__()
+        self.assertTrue(call.cancelled)
+
+    @pytest.mark.asyncio
+    async def test_callback_error(self):
+        call = _FakeCall(
+            [_target_change("CURRENT"), _target_change("NO_CHANGE", seconds=1)]
+        )
+        client = self._make_client(call)
+        error = KeyError("oops")
+
+        def callback(docs, changes, read_time):
+            raise error
+
+        watch = client.collection("users").on_snapshot(callback)
+        await asyncio.wait([watch._task])
+        self.assertFalse(watch.is_active)
+        self.assertIs(watch._error, error)
+
+    @pytest.mark.asyncio
+    async def test_close_w_reason(self):
+        client = self._make_client(_FakeCall([]))
+
+        watch = client.collection("users").listen()
+        watch.close(reason="going away")
+        watch.close(reason="ignored")
+        with self.assertRaises(RuntimeError) as raised:
+            await watch.__anext__()
+        self.assertEqual(str(raised.exception), "going away")
+        await asyncio.wait([watch._task])
+        self.assertTrue(watch._task.cancelled())
+
+    @pytest.mark.asyncio
+    async def test_close_w_exception(self):
+        client = self._make_client(_FakeCall([]))
+        error = ValueError("bad")
+
+        watch = client.collection("users").listen()
+        await asyncio.sleep(0)
+        watch.close(reason=error)
+        with self.assertRaises(ValueError):
+            await watch.__anext__()
+
+
+class _FakeCall(object):
+    """A ``Listen`` call returning ``responses``, then waiting forever.
+
+    An :class:`asyncio.Event` in ``responses`` holds back those after it
+    until it is set.
+    """
+
+    def __init__(self, responses):
+        self._responses = list(responses)
+        self.requests = []
+        self.cancelled = False
+        self.drained = asyncio.Event()
+
+    async def write(self, request):
+        self.requests.append(request)
+
+    async def read(self):
+        while self._responses and isinstance(self._responses[0], asyncio.Event):
+            await self._responses.pop(0).wait()
+        if not self._responses:
+            self.drained.set()
+            await asyncio.Event().wait()
+        response = self._responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    def cancel(self):
+        self.cancelled = True
+
+
+def _timestamp(seconds):
+    return timestamp_pb2.Timestamp(seconds=seconds)
+
+
+def _target_change(change_type, resume_token=b"", seconds=None):
+    from google.cloud.firestore_v1.watch import WATCH_TARGET_ID
+
+    change_type = firestore.TargetChange.TargetChangeType[change_type]
+    target_ids = [] if change_type == 0 else [WATCH_TARGET_ID]
+    read_time = None if seconds is None else _timestamp(seconds)
+    return firestore.ListenResponse(
+        target_change=firestore.TargetChange(
+            target_change_type=change_type,
+            target_ids=target_ids,
+            resume_token=resume_token,
+            read_time=read_time,
+        )
+    )
+
+
+def _document_change(path, value, seconds):
+    from google.cloud.firestore_v1.watch import WATCH_TARGET_ID
+
+    name = "projects/project/databases/(default)/documents/" + path
+    return firestore.ListenResponse(
+        document_change=write.DocumentChange(
+            document=document.Document(
+                name=name,
+                fields={"n": document.Value(integer_value=value)},
+                create_time=_timestamp(seconds),
+                update_time=_timestamp(seconds),
+            ),
+            target_ids=[WATCH_TARGET_ID],
+        )
+    )
@@ -0,0 +1,308 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import mock
+
+
+class TestRateLimiter(unittest.TestCase):
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.firestore_v1.base_bulk_writer import RateLimiter
+
+        return RateLimiter
+
+    def _make_one(self, **kwargs):
+        self.now = 1000.0
+        return self._get_target_class()(clock=lambda: self.now, **kwargs)
+
+    def test_defaults(self):
+        limiter = self._make_one()
+        self.assertEqual(limiter.ops_per_second, 500)
+        self.now += 5 * 60
+        self.assertEqual(limiter.ops_per_second, 750)
+        self.now += 5 * 60
+        self.assertEqual(limiter.ops_per_second, 1125)
+
+    def test_ramp_up_capped(self):
+        limiter = self._make_one(
+            initial_ops_per_second=10, max_ops_per_second=20, ramp_up_period=1.0
+        )
+        self.now += 1
+        self.assertEqual(limiter.ops_per_second, 15)
+        self.now += 1
+        self.assertEqual(limiter.ops_per_second, 20)
+        self.now += 100
+        self.assertEqual(limiter.ops_per_second, 20)
+
+    def test_try_acquire(self):
+        limiter = self._make_one(initial_ops_per_second=10)
+        self.assertEqual(limiter.try_acquire(6), 0.0)
+        self.assertEqual(limiter.try_acquire(4), 0.0)
+        self.assertAlmostEqual(limiter.try_acquire(5), 0.5)
+
+        # Tokens are refilled over time, up to the capacity.
+        self.now += 0.5
+        self.assertEqual(limiter.try_acquire(5), 0.0)
+        self.now += 60
+        self.assertEqual(limiter.try_acquire(10), 0.0)
+        self.assertAlmostEqual(limiter.try_acquire(1), 0.1)
+
+    def test_try_acquire_more_than_capacity(self):
+        limiter = self._make_one(initial_ops_per_second=10)
+        self.assertEqual(limiter.try_acquire(50), 0.0)
+        self.assertAlmostEqual(limiter.try_acquire(50), 1.0)
+
+
+class TestBaseBulkWriter(unittest.TestCase):
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.firestore_v1.base_bulk_writer import BaseBulkWriter
+
+        class _BulkWriter(BaseBulkWriter):
+            def __init__(self, *args, **kwargs):
+                super(_BulkWriter, self).__init__(*args, **kwargs)
+                self.sent = []
+
+            def _make_future(self):
+                import concurrent.futures
+
+                return concurrent.futures.Future()
+
+            def _send_operations(self, operations):
+                self.sent.append(operations)
+
+        return _BulkWriter
+
+    def _make_one(self, *args, **kwargs):
+        klass = self._get_target_class()
+        return klass(*args, **kwargs)
+
+    def test_constructor(self):
+        from google.cloud.firestore_v1.base_bulk_writer import RateLimiter
+
+        bulk_writer = self._make_one(mock.sentinel.client)
+        self.assertIs(bulk_writer._client, mock.sentinel.client)
+        self.assertEqual(bulk_writer._max_batch_size, 20)
+        self.assertEqual(bulk_writer._max_in_flight, 10)
+        self.assertEqual(bulk_writer._max_attempts, 10)
+        self.assertIsInstance(bulk_writer._rate_limiter, RateLimiter)
+        self.assertEqual(bulk_writer._rate_limiter.ops_per_second, 500)
+        self.assertEqual(bulk_writer._operations, [])
+        self.assertFalse(bulk_writer._closed)
+
+    def test_constructor_explicit(self):
+        bulk_writer = self._make_one(
+            mock.sentinel.client,
+            max_batch_size=500,
+            max_in_flight=3,
+            max_attempts=1,
+            throttle=False,
+        )
+        self.assertEqual(bulk_writer._max_batch_size, 500)
+        self.assertEqual(bulk_writer._max_in_flight, 3)
+        self.assertEqual(bulk_writer._max_attempts, 1)
+        self.assertIsNone(bulk_writer._rate_limiter)
+
+    def test_constructor_bad_batch_size(self):
+        with self.assertRaises(ValueError):
+            self._make_one(mock.sentinel.client, max_batch_size=0)
+        with self.assertRaises(ValueError):
+            self._make_one(mock.sentinel.client, max_batch_size=501)
+
+    def test_abstract_methods(self):
+        from google.cloud.firestore_v1.base_bulk_writer import BaseBulkWriter
+
+        bulk_writer = BaseBulkWriter(mock.sentinel.client)
+        with self.assertRaises(NotImplementedError):
+            bulk_writer._make_future()
+        with self.assertRaises(NotImplementedError):
+            bulk_writer._send_operations([])
+
+    def test_write_methods(self):
+        from google.cloud.firestore_v1 import _helpers
+
+        client = _make_client()
+        bulk_writer = self._make_one(client)
+        documents = [client.document("col", str(i)) for i in range(5)]
+        option = client.write_option(exists=True)
+
+        futures = [
+            bulk_writer.create(documents[0], {"a": 1}),
+            bulk_writer.set(documents[1], {"b": 2}),
+            bulk_writer.set(documents[2], {"c": 3}, merge=True),
+            bulk_writer.update(documents[3], {"d": 4}),
+            bulk_writer.delete(documents[4], option=option),
+        ]
+
+        self.assertEqual(len(set(futures)), 5)
+        self.assertEqual(bulk_writer.sent, [])
+        expected = [
+            _helpers.pbs_for_create(documents[0]._document_path, {"a": 1})[0],
+            _helpers.pbs_for_set_no_merge(documents[1]._document_path, {"b": 2})[0],
+            _helpers.pbs_for_set_with_merge(
+                documents[2]._document_path, {"c": 3}, True
+            )[0],
+            _helpers.pbs_for_update(documents[3]._document_path, {"d": 4}, None)[0],
+            _helpers.pb_for_delete(documents[4]._document_path, option),
+        ]
+        self.assertEqual(
+            [operation.write_pb for operation in bulk_writer._operations], expected
+        )
+        self.assertEqual(
+            [operation.future for operation in bulk_writer._operations], futures
+        )
+
+    def test_update_w_exists_option(self):
+        client = _make_client()
+        bulk_writer = self._make_one(client)
+        option = client.write_option(exists=True)
+        with self.assertRaises(ValueError):
+            bulk_writer.update(client.document("a", "b"), {"c": 1}, option=option)
+
+    def test_batch_full(self):
+        client = _make_client()
+        bulk_writer = self._make_one(client, max_batch_size=2)
+        for i in range(5):
+            bulk_writer.delete(client.document("col", str(i)))
+
+        self.assertEqual([len(batch) for batch in bulk_writer.sent], [2, 2])
+        self.assertEqual(len(bulk_writer._operations), 1)
+        bulk_writer._send_batch()
+        self.assertEqual([len(batch) for batch in bulk_writer.sent], [2, 2, 1])
+        self.assertEqual(bulk_writer._operations, [])
+        self.assertEqual(bulk_writer._document_paths, set())
+
+        # Nothing left to send.
+        bulk_writer._send_batch()
+        self.assertEqual(len(bulk_writer.sent), 3)
+
+    def test_same_document_starts_new_batch(self):
+        client = _make_client()
+        bulk_writer = self._make_one(client)
+        document = client.document("col", "doc")
+        bulk_writer.set(document, {"a": 1})
+        bulk_writer.delete(client.document("col", "other"))
+        bulk_writer.update(document, {"a": 2})
+
+        self.assertEqual(len(bulk_writer.sent), 1)
+        self.assertEqual(len(bulk_writer.sent[0]), 2)
+        self.assertEqual(len(bulk_writer._operations), 1)
+
+    def test_closed(self):
+        client = _make_client()
+        bulk_writer = self._make_one(client)
+        bulk_writer._closed = True
+        with self.assertRaises(ValueError):
+            bulk_writer.delete(client.document("a", "b"))
+
+    def test__prep_batch_write(self):
+        client = _make_client()
+        bulk_writer = self._make_one(client)
+        bulk_writer.delete(client.document("a", "b"))
+        operations = bulk_writer._operations
+
+        request = bulk_writer._prep_batch_write(operations)
+        expected = {
+            "database": client._database_string,
+            "writes": [operations[0].write_pb],
+        }
+        self.assertEqual(request, expected)
+        self.assertEqual(operations[0].attempts, 1)
+
+    def _make_operations(self, bulk_writer, count):
+        client = _make_client()
+        for i in range(count):
+            bulk_writer.delete(client.document("col", str(i)))
+        operations = bulk_writer._operations
+        bulk_writer._operations = []
+        for operation in operations:
+            operation.attempts = 1
+        return operations
+
+    def test__process_response(self):
+        from google.api_core import exceptions
+        from google.cloud.firestore_v1.types import write
+
+        bulk_writer = self._make_one(mock.sentinel.client, max_attempts=2)
+        operations = self._make_operations(bulk_writer, 4)
+        operations[3].future.cancel()
+        response = _make_batch_write_response([0, 6, 10, 10])
+
+        to_retry = bulk_writer._process_response(operations, response)
+
+        self.assertEqual(to_retry, [operations[2]])
+        self.assertEqual(operations[0].future.result(), write.WriteResult())
+        with self.assertRaises(exceptions.AlreadyExists):
+            operations[1].future.result()
+        self.assertFalse(operations[2].future.done())
+
+        # The last attempt fails the write.
+        operations[2].attempts = 2
+        to_retry = bulk_writer._process_response(
+            operations[2:3], _make_batch_write_response([10])
+        )
+        self.assertEqual(to_retry, [])
+        with self.assertRaises(exceptions.Aborted):
+            operations[2].future.result()
+
+    def test__process_response_cancelled(self):
+        bulk_writer = self._make_one(mock.sentinel.client)
+        operations = self._make_operations(bulk_writer, 1)
+        operations[0].future.cancel()
+
+        to_retry = bulk_writer._process_response(
+            operations, _make_batch_write_response([0])
+        )
+        self.assertEqual(to_retry, [])
+        self.assertTrue(operations[0].future.cancelled())
+
+    def test__process_error(self):
+        from google.api_core import exceptions
+
+        bulk_writer = self._make_one(mock.sentinel.client)
+        operations = self._make_operations(bulk_writer, 2)
+
+        error = exceptions.ServiceUnavailable("try again")
+        self.assertEqual(bulk_writer._process_error(operations, error), operations)
+
+        error = RuntimeError("boom")
+        self.assertEqual(bulk_writer._process_error(operations, error), [])
+        for operation in operations:
+            self.assertIs(operation.future.exception(), error)
+
+
+def _make_batch_write_response(codes):
+    from google.rpc import status_pb2
+    from google.cloud.firestore_v1.types import firestore
+    from google.cloud.firestore_v1.types import write
+
+    return firestore.BatchWriteResponse(
+        write_results=[write.WriteResult() for _ in codes],
+        status=[status_pb2.Status(code=code, message="msg") for code in codes],
+    )
+
+
+def _make_credentials():
+    import google.auth.credentials
+
+    return mock.Mock(spec=google.auth.credentials.Credentials)
+
+
+def _make_client(project="seventy-nine"):
+    from google.cloud.firestore_v1.client import Client
+
+    credentials = _make_credentials()
+    return Client(project=project, credentials=credentials)
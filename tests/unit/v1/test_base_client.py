@@ -90,6 +90,39 @@ class TestBaseClient(unittest.TestCase):
         self.assertIs(client._firestore_api, mock_client.return_value)
         self.assertEqual(mock_client.call_count, 1)
 
+    @mock.patch(
+        "google.cloud.firestore_v1.services.firestore.client.FirestoreClient",
+        autospec=True,
+        return_value=mock.sentinel.firestore_api,
+    )
+    @mock.patch(
+        "google.cloud.firestore_v1.services.firestore.transports.grpc.FirestoreGrpcTransport",
+        autospec=True,
+    )
+    def test__firestore_api_property_w_channel_pool(self, mock_transport, mock_client):
+        from google.cloud.firestore_v1.channel_pool import ChannelOptions
+        from google.cloud.firestore_v1.channel_pool import ChannelPool
+
+        mock_client.DEFAULT_ENDPOINT = "endpoint"
+        options = ChannelOptions(pool_size=2, max_receive_message_length=1024)
+        client = self._make_one(
+            project=self.PROJECT,
+            credentials=_make_credentials(),
+            channel_options=options,
+        )
+
+        self.assertIs(client._firestore_api, mock_client.return_value)
+
+        (_, kwargs) = mock_transport.call_args
+        channel = kwargs["channel"]
+        self.assertIsInstance(channel, ChannelPool)
+        self.assertIs(channel._options, options)
+        mock_transport.create_channel.assert_called_once_with(
+            client._target,
+            credentials=client._credentials,
+            options=options.grpc_options(),
+        )
+
     def test___database_string_property(self):
         credentials = _make_credentials()
         database = "cheeeeez"
@@ -261,6 +294,164 @@ class Test__reference_info(unittest.TestCase):
         self.assertEqual(reference_map, expected_map)
 
 
+class Test__remaining_request(unittest.TestCase):
+    @staticmethod
+    def _call_fut(request, received):
+        from google.cloud.firestore_v1.base_client import _remaining_request
+
+        return _remaining_request(request, received)
+
+    def test_remaining(self):
+        request = {"database": "db", "documents": ["a", "b", "c"]}
+
+        remaining = self._call_fut(request, {"a", "c"})
+
+        self.assertEqual(remaining, {"database": "db", "documents": ["b"]})
+        self.assertEqual(request["documents"], ["a", "b", "c"])
+
+    def test_all_received(self):
+        request = {"database": "db", "documents": ["a", "b"]}
+
+        self.assertIsNone(self._call_fut(request, {"a", "b"}))
+
+
+class Test__finish_commit_many(unittest.TestCase):
+    @staticmethod
+    def _call_fut(batches, request_counts, outcomes):
+        from google.cloud.firestore_v1.base_client import _finish_commit_many
+
+        return _finish_commit_many(batches, request_counts, outcomes)
+
+    @staticmethod
+    def _make_batch(write_count):
+        batch = mock.Mock(spec=["_write_pbs", "write_results", "commit_time"])
+        batch._write_pbs = [mock.sentinel.write_pb] * write_count
+        batch.write_results = None
+        batch.commit_time = None
+        return batch
+
+    @staticmethod
+    def _make_response(*write_results):
+        from google.cloud.firestore_v1.types import firestore
+        from google.cloud.firestore_v1.types import write
+
+        return firestore.CommitResponse(
+            write_results=[
+                write.WriteResult(update_time={"seconds": seconds})
+                for seconds in write_results
+            ],
+            commit_time={"seconds": max(write_results)},
+        )
+
+    def test_partial_failure(self):
+        from google.api_core import exceptions
+        from google.cloud.firestore_v1.base_client import CommitManyError
+
+        error = exceptions.NotFound("")
+        batches = [self._make_batch(count) for count in (2, 0, 2, 1, 1)]
+        outcomes = [
+            self._make_response(1),
+            self._make_response(2),
+            # A split batch of which one request failed after another succeeded.
+            self._make_response(3),
+            error,
+            self._make_response(4),
+            None,
+        ]
+
+        with self.assertRaises(CommitManyError) as exc_info:
+            self._call_fut(batches, [2, 0, 2, 1, 1], outcomes)
+
+        exc = exc_info.exception
+        self.assertEqual(exc.committed, [0, 1, 3])
+        self.assertEqual(exc.failed, [2])
+        self.assertEqual(exc.errors, {2: error})
+        self.assertEqual(exc.unsent, [4])
+        self.assertIs(exc.__cause__, error)
+        self.assertEqual(
+            [result.update_time.second for result in exc.write_results], [1, 2, 4]
+        )
+        self.assertEqual(
+            str(exc),
+            "Batches [2] failed and batches [4] were not sent; "
+            "batches [0, 1, 3] were committed",
+        )
+        self.assertEqual(batches[0]._write_pbs, [])
+        self.assertEqual(batches[0].commit_time.second, 2)
+        self.assertEqual(batches[1].write_results, [])
+        self.assertEqual(len(batches[2]._write_pbs), 2)
+        self.assertEqual(len(batches[4]._write_pbs), 1)
+        for batch in (batches[2], batches[4]):
+            self.assertIsNone(batch.write_results)
+            self.assertIsNone(batch.commit_time)
+
+
+class Test_OrderedSnapshots(unittest.TestCase):
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.firestore_v1.base_client import _OrderedSnapshots
+
+        return _OrderedSnapshots
+
+    def _make_one(self, *args, **kwargs):
+        klass = self._get_target_class()
+        return klass(*args, **kwargs)
+
+    @staticmethod
+    def _make_snapshot(reference):
+        from google.cloud.firestore_v1.base_document import DocumentSnapshot
+
+        return DocumentSnapshot(reference, {}, True, None, None, None)
+
+    def test_add_out_of_order_w_duplicates(self):
+        client = _make_client()
+        ref_a, ref_b, ref_c = [client.document("col", doc_id) for doc_id in "abc"]
+        reassembly = self._make_one([ref_a, ref_b, ref_a, ref_c], client)
+        snap_a, snap_b, snap_c = [
+            self._make_snapshot(ref) for ref in (ref_a, ref_b, ref_c)
+        ]
+
+        self.assertEqual(reassembly.add(snap_b), [])
+        self.assertEqual(reassembly.add(snap_a), [snap_a, snap_b, snap_a])
+        self.assertEqual(reassembly._pending, {})
+        self.assertEqual(reassembly.add(snap_c), [snap_c])
+        self.assertEqual(reassembly.missing(), [])
+
+    def test_missing(self):
+        client = _make_client()
+        ref_a, ref_b, ref_c = [client.document("col", doc_id) for doc_id in "abc"]
+        reassembly = self._make_one([ref_a, ref_b, ref_c, ref_b], client)
+        snap_c = self._make_snapshot(ref_c)
+
+        self.assertEqual(reassembly.add(snap_c), [])
+        missing_a, missing_b, snapshot, missing_b_again = reassembly.missing()
+
+        self.assertIs(snapshot, snap_c)
+        self.assertIs(missing_b_again, missing_b)
+        self.assertIs(missing_a.reference, ref_a)
+        self.assertFalse(missing_a.exists)
+        self.assertIs(missing_b.reference, ref_b)
+        self.assertFalse(missing_b.exists)
+        self.assertIs(type(missing_a), type(snap_c))
+
+    def test_missing_w_snapshot_class(self):
+        from google.cloud.firestore_v1.base_document import FrozenDocumentSnapshot
+        from google.cloud.firestore_v1.base_document import LazyDocumentSnapshot
+
+        client = _make_client()
+        reference = client.document("col", "a")
+
+        for kwargs, klass in (
+            ({"lazy": True}, LazyDocumentSnapshot),
+            ({"frozen": True}, FrozenDocumentSnapshot),
+        ):
+            reassembly = self._make_one([reference], client, **kwargs)
+            (missing,) = reassembly.missing()
+            self.assertIs(type(missing), klass)
+            self.assertFalse(missing.exists)
+            self.assertIsNone(missing.to_dict())
+
+
 class Test__get_reference(unittest.TestCase):
     @staticmethod
     def _call_fut(document_path, reference_map):
@@ -286,10 +477,12 @@ class Test__get_reference(unittest.TestCase):
 
 class Test__parse_batch_get(unittest.TestCase):
     @staticmethod
-    def _call_fut(get_doc_response, reference_map, client=mock.sentinel.client):
+    def _call_fut(get_doc_response, reference_map, client=None, **kwargs):
         from google.cloud.firestore_v1.base_client import _parse_batch_get
 
-        return _parse_batch_get(get_doc_response, reference_map, client)
+        if client is None:
+            client = mock.Mock(_frozen_snapshots=False, spec=["_frozen_snapshots"])
+        return _parse_batch_get(get_doc_response, reference_map, client, **kwargs)
 
     @staticmethod
     def _dummy_ref_string():
@@ -335,6 +528,51 @@ class Test__parse_batch_get(unittest.TestCase):
         self.assertEqual(snapshot.create_time.timestamp_pb(), create_time)
         self.assertEqual(snapshot.update_time.timestamp_pb(), update_time)
 
+    def test_found_lazy(self):
+        from google.cloud.firestore_v1.types import document
+        from google.cloud.firestore_v1.base_document import LazyDocumentSnapshot
+        from google.cloud.firestore_v1.document import DocumentReference
+
+        ref_string = self._dummy_ref_string()
+        document_pb = document.Document(
+            name=ref_string, fields={"foo": document.Value(double_value=1.5)}
+        )
+        response_pb = _make_batch_response(found=document_pb)
+        reference = DocumentReference("fizz", "buzz", client=mock.sentinel.client)
+
+        snapshot = self._call_fut(response_pb, {ref_string: reference}, lazy=True)
+        self.assertIsInstance(snapshot, LazyDocumentSnapshot)
+        self.assertIs(snapshot._reference, reference)
+        self.assertEqual(snapshot._data._decoded, {})
+        self.assertEqual(snapshot.get("foo"), 1.5)
+        self.assertTrue(snapshot._exists)
+
+    def test_found_frozen(self):
+        from google.cloud.firestore_v1.types import document
+        from google.cloud.firestore_v1.base_document import FrozenDocumentSnapshot
+
+        ref_string = self._dummy_ref_string()
+        document_pb = document.Document(
+            name=ref_string,
+            fields={
+                "foo": document.Value(
+                    array_value=document.ArrayValue(
+                        values=[document.Value(double_value=1.5)]
+                    )
+                )
+            },
+        )
+        response_pb = _make_batch_response(found=document_pb)
+        reference_map = {ref_string: mock.sentinel.reference}
+
+        snapshot = self._call_fut(response_pb, reference_map, frozen=True)
+        self.assertIsInstance(snapshot, FrozenDocumentSnapshot)
+        self.assertEqual(snapshot.get("foo"), (1.5,))
+
+        client = mock.Mock(_frozen_snapshots=True, spec=["_frozen_snapshots"])
+        snapshot = self._call_fut(response_pb, reference_map, client=client)
+        self.assertIsInstance(snapshot, FrozenDocumentSnapshot)
+
     def test_missing(self):
         from google.cloud.firestore_v1.document import DocumentReference
 
@@ -347,6 +585,22 @@ class Test__parse_batch_get(unittest.TestCase):
         self.assertEqual(snapshot.id, "bazz")
         self.assertIsNone(snapshot._data)
 
+    def test_missing_lazy_and_frozen(self):
+        from google.cloud.firestore_v1.base_document import FrozenDocumentSnapshot
+        from google.cloud.firestore_v1.base_document import LazyDocumentSnapshot
+
+        ref_string = self._dummy_ref_string()
+        response_pb = _make_batch_response(missing=ref_string)
+        reference_map = {ref_string: mock.sentinel.reference}
+
+        snapshot = self._call_fut(response_pb, reference_map, lazy=True)
+        self.assertIs(type(snapshot), LazyDocumentSnapshot)
+        self.assertFalse(snapshot.exists)
+
+        snapshot = self._call_fut(response_pb, reference_map, frozen=True)
+        self.assertIs(type(snapshot), FrozenDocumentSnapshot)
+        self.assertFalse(snapshot.exists)
+
     def test_unset_result_type(self):
         response_pb = _make_batch_response()
         with self.assertRaises(ValueError):
@@ -392,3 +646,9 @@ def _make_batch_response(**kwargs):
     from google.cloud.firestore_v1.types import firestore
 
     return firestore.BatchGetDocumentsResponse(**kwargs)
+
+
+def _make_client(project="project-project"):
+    from google.cloud.firestore_v1.client import Client
+
+    return Client(project=project, credentials=_make_credentials())
@@ -347,6 +347,282 @@ class TestDocumentSnapshot(unittest.TestCase):
         self.assertIsNone(as_dict)
 
 
+class TestFrozenDocumentSnapshot(unittest.TestCase):
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.firestore_v1.base_document import FrozenDocumentSnapshot
+
+        return FrozenDocumentSnapshot
+
+    def _make_one(self, data, exists=True):
+        from google.cloud.firestore_v1 import _helpers
+        from google.cloud.firestore_v1.types import document
+
+        client = _make_client()
+        reference = client.document("hi", "bye")
+        if data is not None:
+            fields = document.Document(fields=_helpers.encode_dict(data)).fields
+            data = _helpers.decode_dict(fields, client, frozen=True)
+        return self._get_target_class()(
+            reference,
+            data,
+            exists,
+            mock.sentinel.read_time,
+            mock.sentinel.create_time,
+            mock.sentinel.update_time,
+        )
+
+    def test_constructor(self):
+        data = mock.sentinel.data
+        snapshot = self._get_target_class()(
+            mock.sentinel.reference, data, True, None, None, None
+        )
+        self.assertIs(snapshot._data, data)
+        self.assertIs(snapshot.reference, mock.sentinel.reference)
+        self.assertTrue(snapshot.exists)
+
+    def test_get(self):
+        snapshot = self._make_one({"one": {"bold": "move", "list": [1, {"x": 2}]}})
+
+        self.assertEqual(snapshot.get("one.bold"), "move")
+        self.assertIs(snapshot.get("one"), snapshot._data["one"])
+        self.assertEqual(snapshot.get("one.list"), (1, {"x": 2}))
+        with self.assertRaises(KeyError):
+            snapshot.get("two")
+
+    def test_nonexistent_snapshot(self):
+        snapshot = self._make_one(None, exists=False)
+        self.assertIsNone(snapshot.get("one"))
+        self.assertIsNone(snapshot.to_dict())
+        self.assertIsNone(snapshot.to_dict(mutable=True))
+
+    def test_to_dict(self):
+        snapshot = self._make_one({"a": 10, "b": ["immutable"], "c": {"45": 50}})
+        as_dict = snapshot.to_dict()
+
+        self.assertIs(as_dict, snapshot._data)
+        self.assertEqual(as_dict, {"a": 10, "b": ("immutable",), "c": {"45": 50}})
+        with self.assertRaises(TypeError):
+            as_dict["a"] = 11
+        with self.assertRaises(TypeError):
+            as_dict["c"]["45"] = 51
+
+    def test_to_dict_mutable(self):
+        snapshot = self._make_one({"a": [1, {"b": [2]}], "c": {"d": {"e": 3}}})
+        as_dict = snapshot.to_dict(mutable=True)
+
+        self.assertEqual(as_dict, {"a": [1, {"b": [2]}], "c": {"d": {"e": 3}}})
+        self.assertIs(type(as_dict), dict)
+        self.assertIs(type(as_dict["a"][1]), dict)
+        self.assertIs(type(as_dict["c"]["d"]), dict)
+        as_dict["c"]["d"]["e"] = 4
+        self.assertEqual(snapshot.get("c.d.e"), 3)
+        self.assertIsNot(snapshot.to_dict(mutable=True), as_dict)
+
+
+class TestLazyDocumentSnapshot(unittest.TestCase):
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.firestore_v1.base_document import LazyDocumentSnapshot
+
+        return LazyDocumentSnapshot
+
+    def _make_one(self, data, exists=True, client=None):
+        from google.cloud.firestore_v1 import _helpers
+        from google.cloud.firestore_v1.types import document
+
+        if client is None:
+            client = _make_client()
+        reference = client.document("hi", "bye")
+        if data is not None:
+            data = document.Document(fields=_helpers.encode_dict(data))._pb
+        return self._get_target_class()(
+            reference,
+            data,
+            exists,
+            mock.sentinel.read_time,
+            mock.sentinel.create_time,
+            mock.sentinel.update_time,
+        )
+
+    def test_constructor(self):
+        snapshot = self._make_one({"zoop": 83})
+        self.assertEqual(snapshot.reference._path, ("hi", "bye"))
+        self.assertTrue(snapshot.exists)
+        self.assertIs(snapshot.read_time, mock.sentinel.read_time)
+        self.assertIs(snapshot.create_time, mock.sentinel.create_time)
+        self.assertIs(snapshot.update_time, mock.sentinel.update_time)
+        self.assertEqual(snapshot._data._decoded, {})
+
+    def test_get(self):
+        snapshot = self._make_one(
+            {"one": {"bold": "move", "list": [1, {"x": 2}]}, "two": 2}
+        )
+
+        self.assertEqual(snapshot.get("one.bold"), "move")
+        self.assertEqual(list(snapshot._data._decoded), ["one"])
+        self.assertIs(snapshot.get("one"), snapshot.get("one"))
+
+        value = snapshot.get("one.list")
+        self.assertIsInstance(value, tuple)
+        self.assertEqual(value[0], 1)
+        self.assertEqual(dict(value[1]), {"x": 2})
+
+        with self.assertRaises(KeyError):
+            snapshot.get("three")
+        with self.assertRaises(KeyError):
+            snapshot.get("one.missing")
+        with self.assertRaises(KeyError):
+            snapshot.get("two.deeper")
+
+    def test_get_reference(self):
+        client = _make_client()
+        other = client.document("a", "b")
+        snapshot = self._make_one({"ref": other}, client=client)
+        self.assertEqual(snapshot.get("ref"), other)
+
+    def test_nonexistent_snapshot(self):
+        snapshot = self._make_one(None, exists=False)
+        self.assertIsNone(snapshot.get("one"))
+        self.assertIsNone(snapshot.to_dict())
+
+    def test_to_dict(self):
+        data = {"a": 10, "b": ["definitely", "immutable"], "c": {"45": 50}}
+        snapshot = self._make_one(data)
+        as_dict = snapshot.to_dict()
+
+        self.assertEqual(len(as_dict), 3)
+        self.assertEqual(list(as_dict), ["a", "b", "c"])
+        self.assertEqual(as_dict["b"], ("definitely", "immutable"))
+        self.assertEqual(as_dict["c"], {"45": 50})
+        self.assertIs(snapshot.to_dict(), as_dict)
+        with self.assertRaises(TypeError):
+            as_dict["a"] = 11
+        with self.assertRaises(KeyError):
+            as_dict["d"]
+
+    def test_to_dict_mutable(self):
+        snapshot = self._make_one({"a": [{"b": 1}], "c": {"d": 2}})
+        as_dict = snapshot.to_dict(mutable=True)
+
+        self.assertEqual(as_dict, {"a": [{"b": 1}], "c": {"d": 2}})
+        self.assertIs(type(as_dict["a"][0]), dict)
+        self.assertIs(type(as_dict["c"]), dict)
+
+    def test___eq__(self):
+        from google.cloud.firestore_v1.base_document import DocumentSnapshot
+
+        snapshot = self._make_one({"foo": "bar"})
+        other = DocumentSnapshot(
+            snapshot.reference, {"foo": "bar"}, True, None, None, None
+        )
+        self.assertTrue(snapshot == other)
+        self.assertTrue(other == snapshot)
+
+    def test_view_repr(self):
+        snapshot = self._make_one({"foo": {"bar": 1}})
+        self.assertEqual(
+            repr(snapshot.to_dict()),
+            "_LazyFieldsView({'foo': _LazyFieldsView({'bar': 1})})",
+        )
+
+
+class TestProjectedDocumentSnapshot(unittest.TestCase):
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.firestore_v1.base_document import ProjectedDocumentSnapshot
+
+        return ProjectedDocumentSnapshot
+
+    def _make_one(self, data, field_paths, client=None):
+        from google.protobuf import timestamp_pb2
+        from google.cloud.firestore_v1 import _helpers
+        from google.cloud.firestore_v1.types import document
+
+        if client is None:
+            client = _make_client()
+        document_pb = document.Document(
+            name=client.document("hi", "bye")._document_path,
+            fields=_helpers.encode_dict(data),
+            create_time=timestamp_pb2.Timestamp(seconds=1, nanos=2),
+            update_time=timestamp_pb2.Timestamp(seconds=3, nanos=456000789),
+        )._pb
+        return self._get_target_class()(client, document_pb, field_paths)
+
+    def test_constructor(self):
+        client = _make_client()
+        snapshot = self._make_one({"a": 1, "b": 2}, [("a",)], client=client)
+        self.assertIs(snapshot._client, client)
+        self.assertEqual(snapshot.id, "bye")
+        self.assertEqual(snapshot.reference._path, ("hi", "bye"))
+        self.assertEqual(snapshot.reference, client.document("hi", "bye"))
+        self.assertTrue(snapshot.exists)
+        self.assertIsNone(snapshot.read_time)
+        self.assertEqual(snapshot.to_dict(), {"a": 1})
+
+    def test_times(self):
+        snapshot = self._make_one({}, [])
+        self.assertEqual(snapshot._create_nanos, 1000000002)
+        create_time = snapshot.create_time
+        self.assertEqual(create_time.timestamp_pb().seconds, 1)
+        self.assertEqual(create_time.nanosecond, 2)
+        update_time = snapshot.update_time
+        self.assertEqual(update_time.timestamp_pb().seconds, 3)
+        self.assertEqual(update_time.nanosecond, 456000789)
+
+    def test_nested_fields(self):
+        data = {
+            "top": {"middle": {"leaf": 1, "other": 2}, "side": 3},
+            "scalar": 4,
+            "list": [1, 2],
+        }
+        snapshot = self._make_one(
+            data,
+            [
+                ("top", "middle", "leaf"),
+                ("top", "side"),
+                ("list",),
+                ("missing",),
+                ("top", "absent"),
+                ("scalar", "deeper"),
+                ("nowhere", "deeper"),
+            ],
+        )
+        self.assertEqual(
+            snapshot.to_dict(),
+            {"top": {"middle": {"leaf": 1}, "side": 3}, "list": [1, 2]},
+        )
+        self.assertEqual(snapshot.get("top.middle.leaf"), 1)
+        with self.assertRaises(KeyError):
+            snapshot.get("scalar")
+
+    def test___eq__(self):
+        from google.cloud.firestore_v1.base_document import DocumentSnapshot
+
+        snapshot = self._make_one({"foo": "bar", "baz": 1}, [("foo",)])
+        other = DocumentSnapshot(
+            snapshot.reference, {"foo": "bar"}, True, None, None, None
+        )
+        self.assertTrue(snapshot == other)
+        self.assertTrue(other == snapshot)
+        self.assertNotEqual(snapshot, object())
+
+    def test___eq___w_projected(self):
+        snapshot = self._make_one({"foo": "bar", "baz": 1}, [("foo",)])
+        same_version = self._make_one({"foo": "bar", "baz": 1}, [("baz",)])
+        self.assertEqual(snapshot, same_version)
+
+        later = self._make_one({"foo": "bar"}, [("foo",)])
+        later._update_nanos += 1
+        self.assertNotEqual(snapshot, later)
+
+    def test___hash__(self):
+        snapshot = self._make_one({"foo": "bar"}, [("foo",)])
+        self.assertEqual(hash(snapshot), hash((snapshot._name, snapshot._update_nanos)))
+        same_version = self._make_one({"foo": "bar"}, [])
+        self.assertEqual(hash(snapshot), hash(same_version))
+
+
 class Test__get_document_path(unittest.TestCase):
     @staticmethod
     def _call_fut(client, path):
@@ -665,6 +665,25 @@ class TestBaseQuery(unittest.TestCase):
         query = self._make_one(mock.sentinel.parent)
         self.assertIs(query._normalize_projection(projection), projection)
 
+    def test__projection_with_orders_wo_projection(self):
+        query = self._make_one(mock.sentinel.parent).order_by("a")
+        self.assertIsNone(query._projection_with_orders(list(query._orders)))
+
+    def test__projection_with_orders(self):
+        query = (
+            self._make_one(mock.sentinel.parent)
+            .select(["a", "`b`"])
+            .order_by("b.c")
+            .order_by("d")
+            .order_by("__name__")
+        )
+
+        projection = query._projection_with_orders(list(query._orders))
+
+        field_paths = [field_ref.field_path for field_ref in projection.fields]
+        self.assertEqual(field_paths, ["a", "`b`", "d"])
+        self.assertEqual(len(query._projection.fields), 2)
+
     def test__normalize_orders_wo_orders_wo_cursors(self):
         query = self._make_one(mock.sentinel.parent)
         expected = []
@@ -819,6 +838,82 @@ class TestBaseQuery(unittest.TestCase):
 
         self.assertEqual(query._normalize_cursor(cursor, query._orders), ([1], True))
 
+    def test__normalize_cursor_as_frozen_snapshot(self):
+        from google.cloud.firestore_v1.base_document import FrozenDocumentSnapshot
+
+        docref = self._make_docref("here", "doc_id")
+        data = _make_frozen_data({"b": {"c": [1, 2]}})
+        snapshot = FrozenDocumentSnapshot(docref, data, True, None, None, None)
+        cursor = (snapshot, True)
+        collection = self._make_collection("here")
+        query = self._make_one(collection).order_by("b", "ASCENDING")
+
+        self.assertEqual(
+            query._normalize_cursor(cursor, query._orders), ([{"c": [1, 2]}], True)
+        )
+
+    def test__with_order_fields_wo_projection(self):
+        query = self._make_one(mock.sentinel.parent).order_by("b")
+        self.assertIs(query._with_order_fields(), query)
+
+    def test__with_order_fields(self):
+        docref = self._make_docref("here", "doc_id")
+        collection = self._make_collection("here")
+        query = (
+            self._make_one(collection)
+            .select(["a"])
+            .where("c", ">", 1)
+            .order_by("b")
+            .limit(5)
+        )
+
+        with_orders = query._with_order_fields()
+
+        field_paths = [field.field_path for field in with_orders._projection.fields]
+        self.assertEqual(field_paths, ["a", "b", "c"])
+        self.assertEqual(with_orders._orders, query._orders)
+        self.assertEqual(with_orders._field_filters, query._field_filters)
+        self.assertEqual(with_orders._limit, 5)
+
+        # Its snapshots hold the values needed to resume after them.
+        snapshot = self._make_snapshot(docref, {"a": 0, "b": 1, "c": 2})
+        resumed = with_orders._resume_after(snapshot, 3)
+        values, _ = resumed._normalize_cursor(
+            resumed._start_at, resumed._normalize_orders()
+        )
+        self.assertEqual(values, [1, 2, docref])
+        self.assertEqual(resumed._projection, with_orders._projection)
+
+    def test__resume_after_not_started(self):
+        query = self._make_one(mock.sentinel.parent)
+        self.assertIs(query._resume_after(None, 0), query)
+
+    def test__resume_after(self):
+        docref = self._make_docref("here", "doc_id")
+        snapshot = self._make_snapshot(docref, {"b": 1})
+        collection = self._make_collection("here")
+        query = self._make_one(collection).order_by("b")
+
+        resumed = query._resume_after(snapshot, 3)
+
+        self.assertEqual(resumed._start_at, (snapshot, False))
+        self.assertEqual(resumed._orders, query._orders)
+        self.assertIsNone(resumed._limit)
+        self.assertIsNone(resumed._offset)
+
+    def test__resume_after_w_limit_and_offset(self):
+        docref = self._make_docref("here", "doc_id")
+        snapshot = self._make_snapshot(docref, {"b": 1})
+        collection = self._make_collection("here")
+        query = self._make_one(collection).order_by("b").limit(5).offset(10)
+
+        resumed = query._resume_after(snapshot, 3)
+
+        self.assertEqual(resumed._start_at, (snapshot, False))
+        self.assertEqual(resumed._limit, 2)
+        self.assertEqual(resumed._offset, 0)
+        self.assertIsNone(query._resume_after(snapshot, 5))
+
     def test__normalize_cursor_w___name___w_reference(self):
         db_string = "projects/my-project/database/(default)"
         client = mock.Mock(spec=["_database_string"])
@@ -1138,6 +1233,107 @@ class TestBaseQuery(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, "Can only compare fields "):
             query._comparator(doc1, doc2)
 
+    def test_comparator_ordering_descending_enum(self):
+        from google.cloud.firestore_v1.types import StructuredQuery
+
+        query = self._make_one(mock.sentinel.parent)
+        query._orders = [_make_order_pb("last", StructuredQuery.Direction.DESCENDING)]
+        doc1 = mock.Mock()
+        doc1.reference._path = ("col", "adocument1")
+        doc1._data = {"last": "secondlovelace"}
+        doc2 = mock.Mock()
+        doc2.reference._path = ("col", "adocument2")
+        doc2._data = {"last": "lovelace"}
+
+        self.assertEqual(query._comparator(doc1, doc2), -1)
+        self.assertEqual(query._comparator(doc2, doc1), 1)
+
+    def _make_sort_key_snapshots(self):
+        client = _make_client()
+        collection = client.collection("col")
+        rows = [
+            ("d1", {"a": 2, "b": {"c": "x"}}),
+            ("d2", {"a": 1, "b": {"c": "y"}}),
+            ("d3", {"a": 2, "b": {"c": "z"}}),
+            ("d4", {"a": float("nan"), "b": {"c": "x"}}),
+            ("d5", {"a": None, "b": {"c": "y"}}),
+            ("d6", {"a": "one", "b": {"c": "z"}}),
+            ("d7", {"a": [1, {"x": 2}], "b": {"c": "x"}}),
+            ("d8", {"a": 1.0, "b": {"c": "x"}}),
+        ]
+        return (
+            collection,
+            [
+                self._make_snapshot(collection.document(name), data)
+                for name, data in rows
+            ],
+        )
+
+    def _check_sort_key_matches_comparator(self, query, snapshots):
+        import functools
+
+        expected = sorted(snapshots, key=functools.cmp_to_key(query._comparator))
+        actual = sorted(snapshots, key=query._sort_key)
+        self.assertEqual([snap.id for snap in actual], [snap.id for snap in expected])
+        return [snap.id for snap in actual]
+
+    def test__sort_key_no_orders(self):
+        collection, snapshots = self._make_sort_key_snapshots()
+        query = self._make_one(collection)
+        ids = self._check_sort_key_matches_comparator(query, snapshots)
+        self.assertEqual(ids, ["d1", "d2", "d3", "d4", "d5", "d6", "d7", "d8"])
+
+    def test__sort_key_ascending(self):
+        collection, snapshots = self._make_sort_key_snapshots()
+        query = self._make_one(collection).order_by("a")
+        ids = self._check_sort_key_matches_comparator(query, snapshots)
+        self.assertEqual(ids, ["d5", "d4", "d2", "d8", "d1", "d3", "d6", "d7"])
+
+    def test__sort_key_descending(self):
+        collection, snapshots = self._make_sort_key_snapshots()
+        query = self._make_one(collection).order_by("a", direction="DESCENDING")
+        ids = self._check_sort_key_matches_comparator(query, snapshots)
+        self.assertEqual(ids, ["d7", "d6", "d3", "d1", "d8", "d2", "d4", "d5"])
+
+    def test__sort_key_nested_field_and_name(self):
+        collection, snapshots = self._make_sort_key_snapshots()
+        query = (
+            self._make_one(collection)
+            .order_by("b.c", direction="DESCENDING")
+            .order_by("__name__")
+        )
+        ids = [snap.id for snap in sorted(snapshots, key=query._sort_key)]
+        self.assertEqual(ids, ["d3", "d6", "d2", "d5", "d1", "d4", "d7", "d8"])
+
+    def test__sort_key_name_descending(self):
+        collection, snapshots = self._make_sort_key_snapshots()
+        query = self._make_one(collection).order_by("__name__", direction="DESCENDING")
+        ids = [snap.id for snap in sorted(snapshots, key=query._sort_key)]
+        self.assertEqual(ids, ["d8", "d7", "d6", "d5", "d4", "d3", "d2", "d1"])
+
+    def test__sort_key_cached_on_snapshot(self):
+        collection, snapshots = self._make_sort_key_snapshots()
+        snapshot = snapshots[0]
+        query = self._make_one(collection).order_by("a")
+
+        key = query._sort_key(snapshot)
+        self.assertIs(query._sort_key(snapshot), key)
+
+        with mock.patch(
+            "google.cloud.firestore_v1.base_query.value_sort_key"
+        ) as value_sort_key:
+            self.assertIs(query._sort_key(snapshot), key)
+        value_sort_key.assert_not_called()
+
+        other = self._make_one(collection).order_by("a", direction="DESCENDING")
+        self.assertNotEqual(other._sort_key(snapshot), key)
+
+    def test__sort_key_missing_field(self):
+        collection, snapshots = self._make_sort_key_snapshots()
+        query = self._make_one(collection).order_by("missing")
+        with self.assertRaisesRegex(ValueError, "Can only compare fields "):
+            query._sort_key(snapshots[0])
+
 
 class Test__enum_from_op_string(unittest.TestCase):
     @staticmethod
@@ -1309,10 +1505,12 @@ class Test__cursor_pb(unittest.TestCase):
 
 class Test__query_response_to_snapshot(unittest.TestCase):
     @staticmethod
-    def _call_fut(response_pb, collection, expected_prefix):
+    def _call_fut(response_pb, collection, expected_prefix, **kwargs):
         from google.cloud.firestore_v1.base_query import _query_response_to_snapshot
 
-        return _query_response_to_snapshot(response_pb, collection, expected_prefix)
+        return _query_response_to_snapshot(
+            response_pb, collection, expected_prefix, **kwargs
+        )
 
     def test_empty(self):
         response_pb = _make_query_response()
@@ -1348,15 +1546,67 @@ class Test__query_response_to_snapshot(unittest.TestCase):
         self.assertEqual(snapshot.create_time, response_pb.document.create_time)
         self.assertEqual(snapshot.update_time, response_pb.document.update_time)
 
+    def test_response_lazy(self):
+        from google.cloud.firestore_v1.base_document import LazyDocumentSnapshot
+
+        client = _make_client()
+        collection = client.collection("a", "b", "c")
+        _, expected_prefix = collection._parent_info()
+        name = "{}/{}".format(expected_prefix, "gigantic")
+        data = {"a": 901, "b": True}
+        response_pb = _make_query_response(name=name, data=data)
+
+        snapshot = self._call_fut(response_pb, collection, expected_prefix, lazy=True)
+        self.assertIsInstance(snapshot, LazyDocumentSnapshot)
+        self.assertEqual(snapshot._data._decoded, {})
+        self.assertEqual(snapshot.get("b"), True)
+        self.assertEqual(dict(snapshot.to_dict()), data)
+        self.assertEqual(snapshot.update_time, response_pb.document.update_time)
+
+    def test_response_frozen(self):
+        from google.cloud.firestore_v1.base_document import FrozenDocumentSnapshot
+
+        client = _make_client()
+        collection = client.collection("a", "b", "c")
+        _, expected_prefix = collection._parent_info()
+        name = "{}/{}".format(expected_prefix, "gigantic")
+        data = {"a": 901, "b": [True]}
+        response_pb = _make_query_response(name=name, data=data)
+
+        snapshot = self._call_fut(response_pb, collection, expected_prefix, frozen=True)
+        self.assertIsInstance(snapshot, FrozenDocumentSnapshot)
+        self.assertEqual(snapshot.get("b"), (True,))
+        self.assertEqual(snapshot.to_dict(mutable=True), data)
+
+    def test_response_frozen_client_default(self):
+        from google.cloud.firestore_v1.base_document import FrozenDocumentSnapshot
+
+        client = _make_client()
+        client._frozen_snapshots = True
+        collection = client.collection("a", "b", "c")
+        _, expected_prefix = collection._parent_info()
+        name = "{}/{}".format(expected_prefix, "gigantic")
+        response_pb = _make_query_response(name=name, data={"a": 901})
+
+        snapshot = self._call_fut(response_pb, collection, expected_prefix)
+        self.assertIsInstance(snapshot, FrozenDocumentSnapshot)
+
+        snapshot = self._call_fut(
+            response_pb, collection, expected_prefix, frozen=False
+        )
+        self.assertNotIsInstance(snapshot, FrozenDocumentSnapshot)
+
 
 class Test__collection_group_query_response_to_snapshot(unittest.TestCase):
     @staticmethod
-    def _call_fut(response_pb, collection):
+    def _call_fut(response_pb, collection, **kwargs):
         from google.cloud.firestore_v1.base_query import (
             _collection_group_query_response_to_snapshot,
         )
 
-        return _collection_group_query_response_to_snapshot(response_pb, collection)
+        return _collection_group_query_response_to_snapshot(
+            response_pb, collection, **kwargs
+        )
 
     def test_empty(self):
         response_pb = _make_query_response()
@@ -1388,6 +1638,40 @@ class Test__collection_group_query_response_to_snapshot(unittest.TestCase):
         self.assertEqual(snapshot.create_time, response_pb._pb.document.create_time)
         self.assertEqual(snapshot.update_time, response_pb._pb.document.update_time)
 
+    def test_response_lazy(self):
+        from google.cloud.firestore_v1.base_document import LazyDocumentSnapshot
+
+        client = _make_client()
+        collection = client.collection("a", "b", "c")
+        to_match = client.collection("a", "b", "d").document("gigantic")
+        data = {"a": 901, "b": True}
+        response_pb = _make_query_response(name=to_match._document_path, data=data)
+
+        snapshot = self._call_fut(response_pb, collection, lazy=True)
+        self.assertIsInstance(snapshot, LazyDocumentSnapshot)
+        self.assertEqual(snapshot.reference._document_path, to_match._document_path)
+        self.assertEqual(dict(snapshot.to_dict()), data)
+
+    def test_response_frozen(self):
+        from google.cloud.firestore_v1.base_document import FrozenDocumentSnapshot
+
+        client = _make_client()
+        collection = client.collection("a", "b", "c")
+        to_match = client.collection("a", "b", "d").document("gigantic")
+        data = {"a": 901, "b": {"c": True}}
+        response_pb = _make_query_response(name=to_match._document_path, data=data)
+
+        snapshot = self._call_fut(response_pb, collection, frozen=True)
+        self.assertIsInstance(snapshot, FrozenDocumentSnapshot)
+        self.assertEqual(snapshot.reference._document_path, to_match._document_path)
+        self.assertEqual(snapshot.to_dict(), data)
+
+
+def _make_frozen_data(data):
+    from google.cloud.firestore_v1 import _helpers
+
+    return _helpers.decode_dict(_helpers.encode_dict(data), None, frozen=True)
+
 
 def _make_credentials():
     import google.auth.credentials
@@ -1446,6 +1730,54 @@ def _make_cursor_pb(pair):
     return query.Cursor(values=value_pbs, before=before)
 
 
+class TestQueryPage(unittest.TestCase):
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.firestore_v1.base_query import QueryPage
+
+        return QueryPage
+
+    def _make_one(self, *args, **kwargs):
+        klass = self._get_target_class()
+        return klass(*args, **kwargs)
+
+    def test_sequence(self):
+        snapshots = [mock.sentinel.first, mock.sentinel.second]
+        page = self._make_one(snapshots, b"cursor")
+
+        self.assertIs(page.snapshots, snapshots)
+        self.assertEqual(page.cursor, b"cursor")
+        self.assertEqual(len(page), 2)
+        self.assertIs(page[1], mock.sentinel.second)
+        self.assertEqual(list(page), snapshots)
+
+
+class Test__encode_page_cursor(unittest.TestCase):
+    def test_round_trip(self):
+        from google.cloud.firestore_v1.base_query import _encode_page_cursor
+
+        client = _make_client()
+        query = client.collection("here").order_by("n")
+        reference = client.document("here", "doc")
+        cursor = _encode_page_cursor([1, reference], 7)
+
+        orders, values, num_fetched = query._prep_paginate(10, cursor)
+
+        self.assertEqual(values, [1, reference])
+        self.assertEqual(num_fetched, 7)
+        self.assertEqual(len(orders), 2)
+
+    def test_mismatched_orders(self):
+        from google.cloud.firestore_v1.base_query import _encode_page_cursor
+
+        client = _make_client()
+        query = client.collection("here").order_by("n")
+        cursor = _encode_page_cursor([client.document("here", "doc")], 7)
+
+        with self.assertRaises(ValueError):
+            query._prep_paginate(10, cursor)
+
+
 class TestQueryPartition(unittest.TestCase):
     @staticmethod
     def _get_target_class():
@@ -1490,13 +1822,47 @@ class TestQueryPartition(unittest.TestCase):
         assert query.start_at == (["start"], True)
         assert query.end_at is None
 
+    def test_query_keeps_filters_and_cursors(self):
+        client = _make_client()
+        parent = client.collection("charles")
+        original = (
+            client.collection_group("charles")
+            .where("a", "==", 1)
+            .select(["a"])
+            .start_at({"__name__": parent.document("a")})
+            .end_before({"__name__": parent.document("z")})
+        )
+
+        query = self._make_one(original, None, None).query()
+        self.assertEqual(query._field_filters, original._field_filters)
+        self.assertEqual(query._projection, original._projection)
+        self.assertEqual(query._start_at, original._start_at)
+        self.assertEqual(query._end_at, original._end_at)
+
+        query = self._make_one(original, "start", "end").query()
+        self.assertEqual(query._field_filters, original._field_filters)
+        self.assertEqual(query._start_at, (["start"], True))
+        self.assertEqual(query._end_at, (["end"], True))
+
 
 class DummyQuery:
     _all_descendants = "YUP"
     _PARTITION_QUERY_ORDER = "ORDER"
+    _projection = None
+    _field_filters = ()
+    _start_at = None
+    _end_at = None
 
     def __init__(
-        self, parent, *, all_descendants=None, orders=None, start_at=None, end_at=None
+        self,
+        parent,
+        *,
+        all_descendants=None,
+        orders=None,
+        start_at=None,
+        end_at=None,
+        projection=None,
+        field_filters=()
     ):
         self._parent = parent
         self.all_descendants = all_descendants
@@ -0,0 +1,198 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+import mock
+
+
+def _make_client():
+    from google.auth.credentials import AnonymousCredentials
+    from google.cloud.firestore_v1.client import Client
+
+    return Client(project="bench", credentials=AnonymousCredentials())
+
+
+def _result(name, fastest, scale=1.0):
+    return {"name": name, "scale": scale, "stats": {"min": fastest}}
+
+
+class TestScenarios(unittest.TestCase):
+    def test_scenarios_run(self):
+        from benchmarks.suite import SCENARIOS
+
+        client = _make_client()
+        for name, setup in SCENARIOS.items():
+            run = setup(client, 0.05)
+            # Twice, as some scenarios alternate between workloads.
+            run()
+            run()
+
+    def test_watch_change_burst_applies_changes(self):
+        from benchmarks.suite import SCENARIOS
+        from benchmarks.suite import _BenchWatch
+
+        with mock.patch.object(
+            _BenchWatch, "_on_snapshot_callback", autospec=True
+        ) as callback:
+            run = SCENARIOS["watch.change_burst"](_make_client(), 0.05)
+            run()
+            run()
+
+        self.assertEqual(callback.call_count, 3)
+        _, keys, changes, _ = callback.call_args[0]
+        self.assertEqual(len(keys), 15)
+        self.assertEqual(len(changes), 2)
+
+
+class Test_run_scenario(unittest.TestCase):
+    def test_stats(self):
+        from benchmarks.suite import run_scenario
+
+        calls = []
+        stats = run_scenario(lambda: calls.append(None), rounds=3, min_time=0.0)
+
+        self.assertEqual(len(calls), 4)
+        self.assertEqual(stats["rounds"], 3)
+        self.assertEqual(stats["iterations"], 1)
+        self.assertLessEqual(stats["min"], stats["median"])
+        self.assertLessEqual(stats["median"], stats["max"])
+        self.assertGreater(stats["ops"], 0.0)
+
+    def test_single_round(self):
+        from benchmarks.suite import run_scenario
+
+        stats = run_scenario(lambda: None, rounds=1, min_time=0.001)
+
+        self.assertEqual(stats["stddev"], 0.0)
+        self.assertGreater(stats["iterations"], 1)
+
+
+class Test_compare(unittest.TestCase):
+    def test_statuses(self):
+        from benchmarks.suite import compare
+
+        baseline = {
+            "benchmarks": [
+                _result("ok", 1.0),
+                _result("faster", 1.0),
+                _result("slower", 1.0),
+                _result("rescaled", 1.0, scale=0.5),
+            ]
+        }
+        results = {
+            "benchmarks": [
+                _result("ok", 1.2),
+                _result("faster", 0.5),
+                _result("slower", 1.5),
+                _result("rescaled", 1.0),
+                _result("added", 1.0),
+            ]
+        }
+
+        rows = compare(results, baseline, tolerance=0.25)
+
+        self.assertEqual(
+            rows,
+            [
+                ("ok", 1.0, 1.2, 1.2, "ok"),
+                ("faster", 1.0, 0.5, 0.5, "faster"),
+                ("slower", 1.0, 1.5, 1.5, "slower"),
+                ("rescaled", None, 1.0, None, "new"),
+                ("added", None, 1.0, None, "new"),
+            ],
+        )
+
+    def test_empty_baseline(self):
+        from benchmarks.suite import compare
+
+        rows = compare({"benchmarks": [_result("added", 1.0)]}, {})
+
+        self.assertEqual(rows, [("added", None, 1.0, None, "new")])
+
+
+class Test_main(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.baseline = os.path.join(directory.name, "baseline.json")
+        self.results = os.path.join(directory.name, "results.json")
+
+    def _main(self, *args):
+        from benchmarks.suite import main
+
+        argv = ["-k", "query.build", "--rounds", "2", "--min-time", "0"]
+        argv += ["--scale", "0.01", "--baseline", self.baseline] + list(args)
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            status = main(argv)
+        return status, out.getvalue()
+
+    def _edit_baseline(self, edit):
+        with open(self.baseline) as file_obj:
+            baseline = json.load(file_obj)
+        edit(baseline)
+        with open(self.baseline, "w") as file_obj:
+            json.dump(baseline, file_obj)
+
+    def test_list(self):
+        from benchmarks.suite import SCENARIOS
+        from benchmarks.suite import main
+
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            status = main(["--list"])
+
+        self.assertEqual(status, 0)
+        self.assertEqual(out.getvalue().split(), list(SCENARIOS))
+
+    def test_without_baseline(self):
+        status, out = self._main("--json", self.results)
+
+        self.assertEqual(status, 0)
+        self.assertIn("query.build", out)
+        self.assertFalse(os.path.exists(self.baseline))
+        with open(self.results) as file_obj:
+            results = json.load(file_obj)
+        self.assertEqual(
+            [benchmark["name"] for benchmark in results["benchmarks"]], ["query.build"],
+        )
+        self.assertIn("python_version", results["machine_info"])
+
+    def test_save_baseline_then_compare(self):
+        status, _ = self._main("--save-baseline")
+        self.assertEqual(status, 0)
+
+        status, out = self._main("--tolerance", "1000")
+        self.assertEqual(status, 0)
+        self.assertNotIn("warning", out)
+
+    def test_regression(self):
+        self._main("--save-baseline")
+
+        def regress(baseline):
+            baseline["benchmarks"][0]["stats"]["min"] = 1e-9
+            baseline["machine_info"]["python_version"] = "0.0"
+
+        self._edit_baseline(regress)
+        status, out = self._main()
+
+        self.assertEqual(status, 1)
+        self.assertIn("warning: the baseline was recorded on another", out)
+        self.assertIn("1 scenario(s) more than 25% slower", out)
@@ -0,0 +1,168 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import mock
+
+
+class TestBulkWriter(unittest.TestCase):
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.firestore_v1.bulk_writer import BulkWriter
+
+        return BulkWriter
+
+    def _make_one(self, *args, **kwargs):
+        klass = self._get_target_class()
+        return klass(*args, **kwargs)
+
+    def _make_client(self, *responses):
+        firestore_api = mock.Mock(spec=["batch_write"])
+        firestore_api.batch_write.side_effect = responses
+        client = _make_client()
+        client._firestore_api_internal = firestore_api
+        return client
+
+    def test_constructor(self):
+        import concurrent.futures
+
+        bulk_writer = self._make_one(mock.sentinel.client, max_in_flight=3)
+        self.assertIs(bulk_writer._client, mock.sentinel.client)
+        self.assertIsInstance(
+            bulk_writer._executor, concurrent.futures.ThreadPoolExecutor
+        )
+        self.assertEqual(bulk_writer._executor._max_workers, 3)
+        self.assertEqual(bulk_writer._pending, set())
+        bulk_writer.close()
+
+    def test_write_and_flush(self):
+        from google.cloud.firestore_v1.types import write
+
+        client = self._make_client(
+            _make_batch_write_response([0, 0]), _make_batch_write_response([0])
+        )
+        bulk_writer = self._make_one(client, max_batch_size=2)
+        documents = [client.document("col", str(i)) for i in range(3)]
+        futures = [bulk_writer.delete(document) for document in documents]
+
+        bulk_writer.flush()
+
+        for future in futures:
+            self.assertEqual(future.result(), write.WriteResult())
+        self.assertEqual(bulk_writer._pending, set())
+        batch_write = client._firestore_api.batch_write
+        self.assertEqual(batch_write.call_count, 2)
+        requests = sorted(
+            (call[1]["request"] for call in batch_write.call_args_list),
+            key=lambda request: len(request["writes"]),
+        )
+        self.assertEqual(len(requests[0]["writes"]), 1)
+        self.assertEqual(len(requests[1]["writes"]), 2)
+        self.assertEqual(
+            batch_write.call_args[1]["metadata"], client._rpc_metadata,
+        )
+        bulk_writer.close()
+
+    @mock.patch("google.cloud.firestore_v1.bulk_writer._sleep")
+    def test_retry(self, _sleep):
+        from google.api_core import exceptions
+        from google.cloud.firestore_v1.types import write
+
+        _sleep.side_effect = [2.0, 4.0]
+        client = self._make_client(
+            _make_batch_write_response([0, 10, 6]),
+            exceptions.ServiceUnavailable("down"),
+            _make_batch_write_response([0]),
+        )
+        bulk_writer = self._make_one(client)
+        documents = [client.document("col", str(i)) for i in range(3)]
+        futures = [bulk_writer.delete(document) for document in documents]
+
+        bulk_writer.close()
+
+        self.assertEqual(futures[0].result(), write.WriteResult())
+        self.assertEqual(futures[1].result(), write.WriteResult())
+        with self.assertRaises(exceptions.AlreadyExists):
+            futures[2].result()
+        _sleep.assert_has_calls([mock.call(1.0), mock.call(2.0)])
+        retried = client._firestore_api.batch_write.call_args[1]["request"]
+        self.assertEqual(len(retried["writes"]), 1)
+
+    def test_max_attempts(self):
+        from google.api_core import exceptions
+
+        client = self._make_client(exceptions.Aborted("contention"))
+        bulk_writer = self._make_one(client, max_attempts=1)
+        future = bulk_writer.delete(client.document("a", "b"))
+        bulk_writer.close()
+
+        with self.assertRaises(exceptions.Aborted):
+            future.result()
+
+    @mock.patch("time.sleep")
+    def test_throttled(self, sleep):
+        client = self._make_client(_make_batch_write_response([0]))
+        bulk_writer = self._make_one(client)
+        rate_limiter = bulk_writer._rate_limiter = mock.Mock(spec=["try_acquire"])
+        rate_limiter.try_acquire.side_effect = [0.25, 0.0]
+
+        bulk_writer.delete(client.document("a", "b"))
+        bulk_writer.close()
+
+        rate_limiter.try_acquire.assert_has_calls([mock.call(1), mock.call(1)])
+        sleep.assert_called_once_with(0.25)
+
+    def test_unthrottled(self):
+        client = self._make_client(_make_batch_write_response([0]))
+        bulk_writer = self._make_one(client, throttle=False)
+        future = bulk_writer.delete(client.document("a", "b"))
+        bulk_writer.close()
+        self.assertTrue(future.done())
+
+    def test_close(self):
+        client = self._make_client()
+        with self._make_one(client) as bulk_writer:
+            pass
+
+        self.assertTrue(bulk_writer._closed)
+        with self.assertRaises(ValueError):
+            bulk_writer.delete(client.document("a", "b"))
+        # Closing again is a no-op.
+        bulk_writer.close()
+        client._firestore_api.batch_write.assert_not_called()
+
+
+def _make_batch_write_response(codes):
+    from google.rpc import status_pb2
+    from google.cloud.firestore_v1.types import firestore
+    from google.cloud.firestore_v1.types import write
+
+    return firestore.BatchWriteResponse(
+        write_results=[write.WriteResult() for _ in codes],
+        status=[status_pb2.Status(code=code) for code in codes],
+    )
+
+
+def _make_credentials():
+    import google.auth.credentials
+
+    return mock.Mock(spec=google.auth.credentials.Credentials)
+
+
+def _make_client(project="seventy-nine"):
+    from google.cloud.firestore_v1.client import Client
+
+    credentials = _make_credentials()
+    return Client(project=project, credentials=credentials)
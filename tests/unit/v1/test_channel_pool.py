@@ -0,0 +1,374 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import aiounittest
+import mock
+import pytest
+
+from tests.unit.v1.test__helpers import AsyncMock
+
+
+def _make_options(**kwargs):
+    from google.cloud.firestore_v1.channel_pool import ChannelOptions
+
+    return ChannelOptions(**kwargs)
+
+
+class TestChannelOptions(unittest.TestCase):
+    def test_constructor_defaults(self):
+        from google.cloud.firestore_v1.channel_pool import LEAST_LOADED
+
+        options = _make_options()
+
+        self.assertEqual(options.pool_size, 1)
+        self.assertEqual(options.selection, LEAST_LOADED)
+        self.assertEqual(options.max_concurrent_streams, 100)
+        self.assertIsNone(options.max_send_message_length)
+        self.assertIsNone(options.max_receive_message_length)
+        self.assertEqual(options.keepalive_time_ms, 30000)
+        self.assertIsNone(options.keepalive_timeout_ms)
+        self.assertEqual(options.grpc_options(), [("grpc.keepalive_time_ms", 30000)])
+
+    def test_constructor_invalid(self):
+        with self.assertRaises(ValueError):
+            _make_options(pool_size=0)
+        with self.assertRaises(ValueError):
+            _make_options(selection="random")
+        with self.assertRaises(ValueError):
+            _make_options(max_concurrent_streams=0)
+
+    def test_grpc_options(self):
+        from google.cloud.firestore_v1.channel_pool import ROUND_ROBIN
+
+        options = _make_options(
+            pool_size=4,
+            selection=ROUND_ROBIN,
+            max_send_message_length=1024,
+            max_receive_message_length=2048,
+            keepalive_time_ms=10000,
+            keepalive_timeout_ms=5000,
+        )
+
+        self.assertEqual(
+            options.grpc_options(),
+            [
+                ("grpc.keepalive_time_ms", 10000),
+                ("grpc.keepalive_timeout_ms", 5000),
+                ("grpc.max_send_message_length", 1024),
+                ("grpc.max_receive_message_length", 2048),
+                ("grpc.use_local_subchannel_pool", 1),
+            ],
+        )
+
+
+class TestChannelPool(unittest.TestCase):
+    @staticmethod
+    def _make_one(**kwargs):
+        from google.cloud.firestore_v1.channel_pool import ChannelPool
+
+        create_channel = mock.Mock(side_effect=lambda: mock.Mock(name="channel"))
+        return ChannelPool(create_channel, _make_options(**kwargs)), create_channel
+
+    def test_constructor(self):
+        pool, create_channel = self._make_one(pool_size=3)
+
+        create_channel.assert_called_once_with()
+        self.assertEqual(len(pool.channels), 1)
+        self.assertEqual(pool.active, [0])
+
+    def test__acquire_opens_channels_at_capacity(self):
+        pool, create_channel = self._make_one(pool_size=2, max_concurrent_streams=2)
+
+        indexes = [pool._acquire(False) for _ in range(5)]
+
+        # The second channel is opened once the first is full; channels
+        # are never opened beyond the pool size.
+        self.assertEqual(indexes, [0, 0, 1, 1, 0])
+        self.assertEqual(create_channel.call_count, 2)
+        self.assertEqual(pool.active, [3, 2])
+
+        pool._release(0, False)
+        self.assertEqual(pool.active, [2, 2])
+
+    def test__acquire_least_loaded(self):
+        pool, _ = self._make_one(pool_size=3, max_concurrent_streams=1)
+        for _ in range(3):
+            pool._acquire(False)
+        pool._release(1, False)
+
+        self.assertEqual(pool._acquire(False), 1)
+        pool._release(0, False)
+        pool._release(2, False)
+        # Ties are broken in turn.
+        self.assertEqual(pool._acquire(False), 2)
+        self.assertEqual(pool._acquire(False), 0)
+
+    def test__acquire_long_lived(self):
+        pool, _ = self._make_one(pool_size=2, max_concurrent_streams=2)
+        self.assertEqual(pool._acquire(True), 0)
+        self.assertEqual(pool._acquire(False), 0)
+        self.assertEqual(pool._acquire(False), 1)
+        self.assertEqual(pool._acquire(False), 1)
+        pool._release(1, False)
+        pool._release(1, False)
+
+        # Streams are spread over the channels, even if the channel with
+        # fewer streams has more RPCs in flight.
+        self.assertEqual(pool._acquire(True), 1)
+        self.assertEqual(pool._streams, [1, 1])
+        # Ties are broken by the RPCs in flight.
+        self.assertEqual(pool._acquire(True), 1)
+
+        pool._release(0, True)
+        self.assertEqual(pool._streams, [0, 2])
+        self.assertEqual(pool.active, [1, 2])
+
+    def test__acquire_round_robin(self):
+        from google.cloud.firestore_v1.channel_pool import ROUND_ROBIN
+
+        pool, _ = self._make_one(
+            pool_size=2, max_concurrent_streams=1, selection=ROUND_ROBIN
+        )
+
+        indexes = [pool._acquire(False) for _ in range(4)]
+
+        self.assertEqual(indexes, [0, 1, 0, 1])
+
+    def test_unary_unary(self):
+        pool, _ = self._make_one()
+        multi_callable = pool.unary_unary("/method", request_serializer=str)
+
+        def call(*args, **kwargs):
+            self.assertEqual(pool.active, [1])
+            return "response"
+
+        channel = pool.channels[0]
+        channel.unary_unary.return_value.side_effect = call
+        channel.unary_unary.return_value.with_call.side_effect = call
+
+        self.assertEqual(multi_callable("request", timeout=1.0), "response")
+        self.assertEqual(multi_callable.with_call("request"), "response")
+
+        self.assertEqual(pool.active, [0])
+        channel.unary_unary.assert_called_once_with("/method", request_serializer=str)
+        channel.unary_unary.return_value.assert_called_once_with("request", timeout=1.0)
+
+    def test_unary_unary_error(self):
+        pool, _ = self._make_one()
+        multi_callable = pool.unary_unary("/method")
+        pool.channels[0].unary_unary.return_value.side_effect = ValueError("testing")
+
+        with self.assertRaises(ValueError):
+            multi_callable("request")
+
+        self.assertEqual(pool.active, [0])
+
+    def test_unary_unary_future(self):
+        pool, _ = self._make_one()
+        multi_callable = pool.unary_unary("/method")
+        call = pool.channels[0].unary_unary.return_value.future.return_value
+        call.add_callback.return_value = True
+
+        self.assertIs(multi_callable.future("request"), call)
+
+        self.assertEqual(pool.active, [1])
+        (callback,), _ = call.add_callback.call_args
+        callback()
+        self.assertEqual(pool.active, [0])
+
+    def test_unary_stream(self):
+        pool, _ = self._make_one()
+        multi_callable = pool.unary_stream("/method")
+        call = pool.channels[0].unary_stream.return_value.return_value
+        call.add_callback.return_value = True
+
+        self.assertIs(multi_callable("request"), call)
+
+        self.assertEqual(pool.active, [1])
+        (callback,), _ = call.add_callback.call_args
+        callback()
+        self.assertEqual(pool.active, [0])
+
+    def test_stream_unary(self):
+        pool, _ = self._make_one()
+        multi_callable = pool.stream_unary("/method")
+        pool.channels[0].stream_unary.return_value.return_value = "response"
+
+        self.assertEqual(multi_callable(iter(["request"])), "response")
+        self.assertEqual(pool.active, [0])
+
+    def test_stream_stream(self):
+        pool, _ = self._make_one(pool_size=2)
+        multi_callable = pool.stream_stream("/method")
+        call = pool.channels[0].stream_stream.return_value.return_value
+        call.add_callback.return_value = True
+
+        self.assertIs(multi_callable(iter(["request"])), call)
+        self.assertEqual(pool._streams, [1])
+
+        (callback,), _ = call.add_callback.call_args
+        callback()
+        self.assertEqual(pool._streams, [0])
+        self.assertEqual(pool.active, [0])
+
+    def test_stream_stream_already_terminated(self):
+        pool, _ = self._make_one()
+        multi_callable = pool.stream_stream("/method")
+        call = pool.channels[0].stream_stream.return_value.return_value
+        call.add_callback.return_value = False
+
+        multi_callable(iter(["request"]))
+
+        self.assertEqual(pool._streams, [0])
+        self.assertEqual(pool.active, [0])
+
+    def test_multi_callable_per_channel(self):
+        pool, _ = self._make_one(pool_size=2, max_concurrent_streams=1)
+        multi_callable = pool.unary_stream("/method")
+        for channel in pool.channels:
+            channel.unary_stream.return_value.return_value.add_callback.return_value = (
+                True
+            )
+
+        multi_callable("request")
+        multi_callable("request")
+        multi_callable("request")
+
+        first, second = pool.channels
+        first.unary_stream.assert_called_once_with("/method")
+        second.unary_stream.assert_called_once_with("/method")
+        self.assertEqual(first.unary_stream.return_value.call_count, 2)
+
+    def test_subscribe_unsubscribe(self):
+        pool, _ = self._make_one()
+        channel = pool.channels[0]
+        callback = mock.Mock()
+
+        pool.subscribe(callback, try_to_connect=True)
+        pool.unsubscribe(callback)
+
+        channel.subscribe.assert_called_once_with(callback, try_to_connect=True)
+        channel.unsubscribe.assert_called_once_with(callback)
+
+    def test_close(self):
+        pool, _ = self._make_one(pool_size=2, max_concurrent_streams=1)
+        pool._acquire(False)
+        pool._acquire(False)
+
+        with pool as entered:
+            self.assertIs(entered, pool)
+
+        for channel in pool.channels:
+            channel.close.assert_called_once_with()
+
+
+class Test_BaseChannelPool(unittest.TestCase):
+    def test__multi_callable_virtual(self):
+        from google.cloud.firestore_v1.channel_pool import _BaseChannelPool
+
+        pool = _BaseChannelPool(mock.Mock, _make_options())
+
+        with self.assertRaises(NotImplementedError):
+            pool.unary_unary("/method")
+
+    def test__on_done_virtual(self):
+        from google.cloud.firestore_v1.channel_pool import _BaseChannelPool
+        from google.cloud.firestore_v1.channel_pool import _PooledMultiCallable
+
+        pool = _BaseChannelPool(mock.Mock, _make_options())
+        multi_callable = _PooledMultiCallable(pool, "unary_stream", ("/method",), {})
+
+        with self.assertRaises(NotImplementedError):
+            multi_callable._invoke("__call__", False, ("request",), {})
+
+
+class TestAsyncChannelPool(aiounittest.AsyncTestCase):
+    @staticmethod
+    def _make_one(**kwargs):
+        from google.cloud.firestore_v1.channel_pool import AsyncChannelPool
+
+        def create_channel():
+            return mock.Mock(
+                spec=[
+                    "channel_ready",
+                    "close",
+                    "get_state",
+                    "stream_stream",
+                    "unary_unary",
+                    "wait_for_state_change",
+                ],
+                channel_ready=AsyncMock(),
+                close=AsyncMock(),
+                wait_for_state_change=AsyncMock(),
+            )
+
+        return AsyncChannelPool(create_channel, _make_options(**kwargs))
+
+    def test_unary_unary(self):
+        pool = self._make_one()
+        multi_callable = pool.unary_unary("/method")
+        call = pool.channels[0].unary_unary.return_value.return_value
+
+        self.assertIs(multi_callable("request"), call)
+
+        self.assertEqual(pool.active, [1])
+        (callback,), _ = call.add_done_callback.call_args
+        callback(call)
+        self.assertEqual(pool.active, [0])
+
+    def test_stream_stream(self):
+        pool = self._make_one()
+        multi_callable = pool.stream_stream("/method")
+        call = pool.channels[0].stream_stream.return_value.return_value
+
+        multi_callable(mock.sentinel.requests)
+
+        self.assertEqual(pool._streams, [1])
+        (callback,), _ = call.add_done_callback.call_args
+        callback(call)
+        self.assertEqual(pool._streams, [0])
+
+    def test_get_state(self):
+        pool = self._make_one()
+        channel = pool.channels[0]
+        channel.get_state = mock.Mock(return_value=mock.sentinel.state)
+
+        self.assertIs(pool.get_state(try_to_connect=True), mock.sentinel.state)
+        channel.get_state.assert_called_once_with(try_to_connect=True)
+
+    @pytest.mark.asyncio
+    async def test_wait_for_state_change(self):
+        pool = self._make_one()
+
+        await pool.wait_for_state_change(mock.sentinel.state)
+
+        pool.channels[0].wait_for_state_change.assert_called_once_with(
+            mock.sentinel.state
+        )
+
+    @pytest.mark.asyncio
+    async def test_channel_ready_and_close(self):
+        pool = self._make_one(pool_size=2, max_concurrent_streams=1)
+        pool._acquire(False)
+        pool._acquire(False)
+
+        async with pool as entered:
+            self.assertIs(entered, pool)
+            await pool.channel_ready()
+
+        for channel in pool.channels:
+            channel.channel_ready.assert_called_once_with()
+            channel.close.assert_called_once_with(None)
@@ -48,6 +48,51 @@ class TestClient(unittest.TestCase):
         self.assertEqual(client._database, DEFAULT_DATABASE)
         self.assertIs(client._client_info, _CLIENT_INFO)
         self.assertIsNone(client._emulator_host)
+        self.assertFalse(client._frozen_snapshots)
+        self.assertIsNone(client.document_cache)
+        self.assertIsNone(client._single_flight)
+        self.assertIsNone(client._batch_getter)
+        self.assertEqual(client._channel_options.pool_size, 1)
+        self.assertIsNone(client._listen_multiplexer)
+
+    def test_constructor_w_coalesce_reads(self):
+        from google.cloud.firestore_v1.single_flight import BatchGetter
+        from google.cloud.firestore_v1.single_flight import SingleFlight
+
+        client = self._make_one(
+            project=self.PROJECT,
+            credentials=_make_credentials(),
+            coalesce_reads=True,
+            batch_get_window=0.005,
+        )
+        self.assertIsInstance(client._single_flight, SingleFlight)
+        self.assertIsInstance(client._batch_getter, BatchGetter)
+        self.assertIs(client._batch_getter._client, client)
+        self.assertEqual(client._batch_getter._window, 0.005)
+
+    def test_constructor_w_bad_batch_get_window(self):
+        with self.assertRaises(ValueError):
+            self._make_one(
+                project=self.PROJECT,
+                credentials=_make_credentials(),
+                batch_get_window=0,
+            )
+
+    def test_constructor_w_listen_streams(self):
+        from google.cloud.firestore_v1.listen_multiplexer import ListenMultiplexer
+
+        client = self._make_one(
+            project=self.PROJECT, credentials=_make_credentials(), listen_streams=2
+        )
+        self.assertIsInstance(client._listen_multiplexer, ListenMultiplexer)
+        self.assertIs(client._listen_multiplexer._client, client)
+        self.assertEqual(client._listen_multiplexer._max_streams, 2)
+
+    def test_constructor_w_bad_listen_streams(self):
+        with self.assertRaises(ValueError):
+            self._make_one(
+                project=self.PROJECT, credentials=_make_credentials(), listen_streams=0
+            )
 
     def test_constructor_with_emulator_host(self):
         from google.cloud.firestore_v1.base_client import _FIRESTORE_EMULATOR_HOST
@@ -73,12 +118,16 @@ class TestClient(unittest.TestCase):
             database=database,
             client_info=client_info,
             client_options=client_options,
+            frozen_snapshots=True,
+            document_cache=mock.sentinel.document_cache,
         )
         self.assertEqual(client.project, self.PROJECT)
         self.assertEqual(client._credentials, credentials)
         self.assertEqual(client._database, database)
         self.assertIs(client._client_info, client_info)
         self.assertIs(client._client_options, client_options)
+        self.assertTrue(client._frozen_snapshots)
+        self.assertIs(client.document_cache, mock.sentinel.document_cache)
 
     def test_constructor_w_client_options(self):
         credentials = _make_credentials()
@@ -248,8 +297,18 @@ class TestClient(unittest.TestCase):
 
         return list(snapshots)
 
-    def _get_all_helper(self, num_snapshots=2, txn_id=None, retry=None, timeout=None):
+    def _get_all_helper(
+        self,
+        num_snapshots=2,
+        txn_id=None,
+        retry=None,
+        timeout=None,
+        lazy=False,
+        frozen=None,
+    ):
         from google.cloud.firestore_v1 import _helpers
+        from google.cloud.firestore_v1.base_document import FrozenDocumentSnapshot
+        from google.cloud.firestore_v1.base_document import LazyDocumentSnapshot
         from google.cloud.firestore_v1.types import common
         from google.cloud.firestore_v1.async_document import DocumentSnapshot
 
@@ -275,6 +334,10 @@ class TestClient(unittest.TestCase):
             field_path for field_path in ["a", "b", None][:num_snapshots] if field_path
         ]
         kwargs = _helpers.make_retry_timeout_kwargs(retry, timeout)
+        if lazy:
+            kwargs["lazy"] = True
+        if frozen is not None:
+            kwargs["frozen"] = frozen
 
         if txn_id is not None:
             transaction = client.transaction()
@@ -293,13 +356,19 @@ class TestClient(unittest.TestCase):
             if data is None:
                 self.assertFalse(snapshot.exists)
             else:
-                self.assertEqual(snapshot._data, data)
+                self.assertEqual(dict(snapshot._data), data)
+                self.assertEqual(isinstance(snapshot, LazyDocumentSnapshot), lazy)
+                self.assertEqual(
+                    isinstance(snapshot, FrozenDocumentSnapshot), lazy or bool(frozen)
+                )
 
         # Verify the call to the mock.
         doc_paths = [document._document_path for document in documents]
         mask = common.DocumentMask(field_paths=field_paths)
 
         kwargs.pop("transaction", None)
+        kwargs.pop("lazy", None)
+        kwargs.pop("frozen", None)
 
         client._firestore_api.batch_get_documents.assert_called_once_with(
             request={
@@ -329,6 +398,12 @@ class TestClient(unittest.TestCase):
     def test_get_all_wrong_order(self):
         self._get_all_helper(num_snapshots=3)
 
+    def test_get_all_lazy(self):
+        self._get_all_helper(num_snapshots=3, lazy=True)
+
+    def test_get_all_frozen(self):
+        self._get_all_helper(num_snapshots=3, frozen=True)
+
     def test_get_all_unknown_result(self):
         from google.cloud.firestore_v1.base_client import _BAD_DOC_TEMPLATE
 
@@ -360,6 +435,165 @@ class TestClient(unittest.TestCase):
             metadata=client._rpc_metadata,
         )
 
+    def _make_chunked_client(self, failures=None):
+        client = self._make_default_one()
+        failures = failures or {}
+        requests = []
+
+        def batch_get_documents(request, metadata, **kwargs):
+            requests.append(request)
+
+            def responses():
+                for path in request["documents"]:
+                    if failures.get(path):
+                        raise failures[path].pop(0)
+                    yield _make_batch_response(missing=path)
+                if failures.get(None):
+                    raise failures[None].pop(0)
+
+            return responses()
+
+        firestore_api = mock.Mock(spec=["batch_get_documents"])
+        firestore_api.batch_get_documents.side_effect = batch_get_documents
+        client._firestore_api_internal = firestore_api
+        return client, requests
+
+    def test_get_all_chunked(self):
+        client, requests = self._make_chunked_client()
+        documents = [client.document("pineapple", doc_id) for doc_id in "abcde"]
+
+        snapshots = list(client.get_all(documents, chunk_size=2, max_in_flight=2))
+
+        self.assertEqual(sorted(snapshot.id for snapshot in snapshots), list("abcde"))
+        self.assertEqual(
+            sorted(len(request["documents"]) for request in requests), [1, 2, 2]
+        )
+
+    def test_get_all_chunked_error(self):
+        from google.api_core import exceptions
+
+        client, _ = self._make_chunked_client()
+        document = client.document("pineapple", "b")
+        failures = {document._document_path: [exceptions.PermissionDenied("no")]}
+        client, _ = self._make_chunked_client(failures)
+        documents = [client.document("pineapple", doc_id) for doc_id in "abc"]
+
+        with self.assertRaises(exceptions.PermissionDenied):
+            list(client.get_all(documents, chunk_size=1))
+
+    def test_get_all_chunked_closed_early(self):
+        client, _ = self._make_chunked_client()
+        documents = [client.document("pineapple", doc_id) for doc_id in "abcde"]
+
+        snapshots = client.get_all(documents, chunk_size=1)
+        next(snapshots)
+        snapshots.close()
+
+    def test_get_all_ordered(self):
+        client, requests = self._make_chunked_client()
+        ids = ["c", "a", "b", "a", "e", "d", "c"]
+        documents = [client.document("pineapple", doc_id) for doc_id in ids]
+
+        snapshots = list(client.get_all(documents, chunk_size=2, ordered=True))
+
+        self.assertEqual([snapshot.id for snapshot in snapshots], ids)
+        self.assertFalse(any(snapshot.exists for snapshot in snapshots))
+        self.assertEqual(len(requests), 3)
+
+    def test_get_all_ordered_closed_early(self):
+        client, _ = self._make_chunked_client()
+        documents = [client.document("pineapple", doc_id) for doc_id in "abcde"]
+
+        snapshots = client.get_all(documents, chunk_size=1, ordered=True)
+        self.assertEqual(next(snapshots).id, "a")
+        snapshots.close()
+
+    def test_get_all_ordered_not_returned(self):
+        client = self._make_default_one()
+        document = client.document("pineapple", "a")
+        firestore_api = mock.Mock(spec=["batch_get_documents"])
+        firestore_api.batch_get_documents.return_value = iter([])
+        client._firestore_api_internal = firestore_api
+
+        (snapshot,) = client.get_all([document], ordered=True)
+
+        self.assertIs(snapshot.reference, document)
+        self.assertFalse(snapshot.exists)
+
+    def test_get_all_dedupes_references(self):
+        client, requests = self._make_chunked_client()
+        document1 = client.document("pineapple", "a")
+        document2 = client.document("pineapple", "b")
+
+        snapshots = list(client.get_all([document1, document2, document1]))
+
+        self.assertEqual(len(snapshots), 2)
+        (request,) = requests
+        self.assertEqual(
+            request["documents"], [document1._document_path, document2._document_path]
+        )
+
+    def test_get_all_empty(self):
+        client, requests = self._make_chunked_client()
+
+        self.assertEqual(list(client.get_all([])), [])
+        self.assertEqual(requests, [])
+
+    def test_get_all_bad_chunk_size(self):
+        client, _ = self._make_chunked_client()
+
+        with self.assertRaises(ValueError):
+            list(client.get_all([], chunk_size=0))
+
+    @mock.patch("google.cloud.firestore_v1.client.time.sleep")
+    def test_get_all_resumes_chunk(self, sleep):
+        from google.api_core import exceptions
+
+        client, _ = self._make_chunked_client()
+        documents = [client.document("pineapple", doc_id) for doc_id in "abc"]
+        failures = {documents[1]._document_path: [exceptions.ServiceUnavailable("")]}
+        client, requests = self._make_chunked_client(failures)
+
+        snapshots = list(client.get_all(documents))
+
+        self.assertEqual([snapshot.id for snapshot in snapshots], list("abc"))
+        self.assertEqual(
+            requests[1]["documents"],
+            [document._document_path for document in documents[1:]],
+        )
+        sleep.assert_called_once()
+
+    @mock.patch("google.cloud.firestore_v1.client.time.sleep")
+    def test_get_all_resumes_chunk_after_last(self, sleep):
+        from google.api_core import exceptions
+
+        failures = {None: [exceptions.ServiceUnavailable("")]}
+        client, requests = self._make_chunked_client(failures)
+        documents = [client.document("pineapple", doc_id) for doc_id in "ab"]
+
+        snapshots = list(client.get_all(documents))
+
+        self.assertEqual([snapshot.id for snapshot in snapshots], list("ab"))
+        self.assertEqual(len(requests), 1)
+
+    @mock.patch("google.cloud.firestore_v1.client.time.sleep")
+    def test_get_all_resumes_chunk_exhausted(self, sleep):
+        from google.api_core import exceptions
+        from google.cloud.firestore_v1.base_query import _MAX_RESUME_ATTEMPTS
+
+        client, _ = self._make_chunked_client()
+        document = client.document("pineapple", "a")
+        errors = [
+            exceptions.ServiceUnavailable("") for _ in range(_MAX_RESUME_ATTEMPTS)
+        ]
+        client, requests = self._make_chunked_client({document._document_path: errors})
+
+        with self.assertRaises(exceptions.ServiceUnavailable):
+            list(client.get_all([document]))
+
+        self.assertEqual(len(requests), _MAX_RESUME_ATTEMPTS)
+        self.assertEqual(sleep.call_count, _MAX_RESUME_ATTEMPTS - 1)
+
     def test_batch(self):
         from google.cloud.firestore_v1.batch import WriteBatch
 
@@ -369,6 +603,202 @@ class TestClient(unittest.TestCase):
         self.assertIs(batch._client, client)
         self.assertEqual(batch._write_pbs, [])
 
+    def _make_commit_client(self, failures=None):
+        from google.protobuf import timestamp_pb2
+        from google.cloud.firestore_v1.types import document
+        from google.cloud.firestore_v1.types import firestore
+        from google.cloud.firestore_v1.types import write
+
+        client = self._make_default_one()
+        failures = failures or []
+        requests = []
+
+        def commit(request, metadata, **kwargs):
+            requests.append(request)
+            failure = failures.pop(0) if failures else None
+            if failure is not None:
+                raise failure
+            # Echo the path of each deleted document in its write result.
+            return firestore.CommitResponse(
+                write_results=[
+                    write.WriteResult(
+                        transform_results=[document.Value(string_value=write_pb.delete)]
+                    )
+                    for write_pb in request["writes"]
+                ],
+                commit_time=timestamp_pb2.Timestamp(seconds=len(requests)),
+            )
+
+        firestore_api = mock.Mock(spec=["commit"])
+        firestore_api.commit.side_effect = commit
+        client._firestore_api_internal = firestore_api
+        return client, requests
+
+    @staticmethod
+    def _make_delete_batch(client, doc_ids):
+        batch = client.batch()
+        for doc_id in doc_ids:
+            batch.delete(client.document("pineapple", doc_id))
+        return batch
+
+    @staticmethod
+    def _result_ids(write_results):
+        return [
+            write_result.transform_results[0].string_value.rsplit("/", 1)[1]
+            for write_result in write_results
+        ]
+
+    def test_commit_many(self):
+        client, requests = self._make_commit_client()
+        batches = [
+            self._make_delete_batch(client, doc_ids)
+            for doc_ids in (["a", "b"], [], ["c", "d", "e"], ["f"])
+        ]
+
+        write_results = client.commit_many(iter(batches), max_in_flight=2)
+
+        self.assertEqual(self._result_ids(write_results), list("abcdef"))
+        self.assertEqual(
+            sorted(len(request["writes"]) for request in requests), [1, 2, 3]
+        )
+        for batch, doc_ids in zip(batches, (["a", "b"], [], ["c", "d", "e"], ["f"])):
+            self.assertEqual(batch._write_pbs, [])
+            self.assertEqual(self._result_ids(batch.write_results), doc_ids)
+        self.assertIsNone(batches[1].commit_time)
+        self.assertIsNotNone(batches[0].commit_time)
+
+    def test_commit_many_splits_large_batch(self):
+        client, requests = self._make_commit_client()
+        doc_ids = ["doc-{:04d}".format(index) for index in range(1201)]
+        batch = self._make_delete_batch(client, doc_ids)
+
+        write_results = client.commit_many([batch])
+
+        self.assertEqual(self._result_ids(write_results), doc_ids)
+        self.assertEqual(
+            sorted(len(request["writes"]) for request in requests), [201, 500, 500]
+        )
+        self.assertIsNotNone(batch.commit_time)
+
+    def test_commit_many_wo_batches(self):
+        client, requests = self._make_commit_client()
+
+        self.assertEqual(client.commit_many([]), [])
+        self.assertEqual(requests, [])
+
+    def test_commit_many_w_retry_timeout(self):
+        from google.api_core.retry import Retry
+
+        client, _ = self._make_commit_client()
+        batch = self._make_delete_batch(client, ["a"])
+        retry = Retry(predicate=object())
+
+        client.commit_many([batch], retry=retry, timeout=123.0)
+
+        client._firestore_api.commit.assert_called_once_with(
+            request=mock.ANY, metadata=client._rpc_metadata, retry=retry, timeout=123.0,
+        )
+
+    def test_commit_many_w_bad_max_in_flight(self):
+        client, _ = self._make_commit_client()
+
+        with self.assertRaises(ValueError):
+            client.commit_many([], max_in_flight=0)
+
+    @mock.patch("google.cloud.firestore_v1.client._sleep")
+    def test_commit_many_retries_transient_errors(self, _sleep):
+        from google.api_core import exceptions
+
+        failures = [exceptions.Aborted(""), exceptions.ServiceUnavailable("")]
+        client, requests = self._make_commit_client(failures)
+        batch = self._make_delete_batch(client, ["a", "b"])
+
+        write_results = client.commit_many([batch])
+
+        self.assertEqual(self._result_ids(write_results), ["a", "b"])
+        self.assertEqual(len(requests), 3)
+        self.assertEqual(_sleep.call_count, 2)
+
+    @mock.patch("google.cloud.firestore_v1.client._sleep")
+    def test_commit_many_retries_exhausted(self, _sleep):
+        from google.api_core import exceptions
+        from google.cloud.firestore_v1.base_client import CommitManyError
+
+        failures = [exceptions.Aborted("") for _ in range(3)]
+        client, requests = self._make_commit_client(failures)
+        batch = self._make_delete_batch(client, ["a"])
+
+        with self.assertRaises(CommitManyError) as exc_info:
+            client.commit_many([batch], max_attempts=3)
+
+        self.assertIsInstance(exc_info.exception.__cause__, exceptions.Aborted)
+        self.assertEqual(len(requests), 3)
+        self.assertEqual(_sleep.call_count, 2)
+        self.assertEqual(len(batch._write_pbs), 1)
+        self.assertIsNone(batch.write_results)
+
+    def test_commit_many_w_error(self):
+        from google.api_core import exceptions
+        from google.cloud.firestore_v1.base_client import CommitManyError
+
+        client, requests = self._make_commit_client([exceptions.NotFound("")])
+        batches = [self._make_delete_batch(client, [doc_id]) for doc_id in "abc"]
+
+        with self.assertRaises(CommitManyError) as exc_info:
+            client.commit_many(batches, max_in_flight=1)
+
+        error = exc_info.exception
+        self.assertEqual(error.committed, [])
+        self.assertEqual(error.failed, [0])
+        self.assertEqual(error.unsent, [1, 2])
+        self.assertIsInstance(error.errors[0], exceptions.NotFound)
+        self.assertIs(error.__cause__, error.errors[0])
+        # The requests not sent yet are dropped.
+        self.assertEqual(len(requests), 1)
+        for batch in batches:
+            self.assertEqual(len(batch._write_pbs), 1)
+            self.assertIsNone(batch.write_results)
+
+    def test_commit_many_w_error_mid_series(self):
+        from google.api_core import exceptions
+        from google.cloud.firestore_v1.base_client import CommitManyError
+
+        failures = [None, exceptions.NotFound("")]
+        client, requests = self._make_commit_client(failures)
+        batches = [self._make_delete_batch(client, [doc_id]) for doc_id in "abc"]
+
+        with self.assertRaises(CommitManyError) as exc_info:
+            client.commit_many(batches, max_in_flight=1)
+
+        error = exc_info.exception
+        self.assertEqual(error.committed, [0])
+        self.assertEqual(error.failed, [1])
+        self.assertEqual(error.unsent, [2])
+        self.assertEqual(self._result_ids(error.write_results), ["a"])
+        self.assertEqual(len(requests), 2)
+        # The committed batch is emptied, so committing it again is a no-op.
+        self.assertEqual(batches[0]._write_pbs, [])
+        self.assertEqual(self._result_ids(batches[0].write_results), ["a"])
+        self.assertIsNotNone(batches[0].commit_time)
+        for batch in batches[1:]:
+            self.assertEqual(len(batch._write_pbs), 1)
+            self.assertIsNone(batch.write_results)
+
+        write_results = client.commit_many(batches)
+
+        self.assertEqual(self._result_ids(write_results), ["b", "c"])
+        self.assertEqual(len(requests), 4)
+
+    def test_bulk_writer(self):
+        from google.cloud.firestore_v1.bulk_writer import BulkWriter
+
+        client = self._make_default_one()
+        bulk_writer = client.bulk_writer(max_batch_size=5)
+        self.assertIsInstance(bulk_writer, BulkWriter)
+        self.assertIs(bulk_writer._client, client)
+        self.assertEqual(bulk_writer._max_batch_size, 5)
+        bulk_writer.close()
+
     def test_transaction(self):
         from google.cloud.firestore_v1.transaction import Transaction
 
@@ -381,6 +811,42 @@ class TestClient(unittest.TestCase):
         self.assertIsNone(transaction._id)
 
 
+class Test__stream_chunk(unittest.TestCase):
+    @staticmethod
+    def _call_fut(snapshots, results, stopped):
+        from google.cloud.firestore_v1.client import _stream_chunk
+
+        return _stream_chunk(snapshots, results, stopped)
+
+    def test_already_stopped(self):
+        import queue
+        import threading
+
+        stopped = threading.Event()
+        stopped.set()
+        results = queue.Queue()
+
+        self._call_fut(iter([mock.sentinel.snapshot]), results, stopped)
+
+        self.assertTrue(results.empty())
+
+    def test_stopped_while_streaming(self):
+        import queue
+        import threading
+
+        stopped = threading.Event()
+
+        def snapshots():
+            stopped.set()
+            yield mock.sentinel.snapshot
+
+        results = queue.Queue()
+
+        self._call_fut(snapshots(), results, stopped)
+
+        self.assertTrue(results.empty())
+
+
 def _make_credentials():
     import google.auth.credentials
 
@@ -312,7 +312,9 @@ class TestCollectionReference(unittest.TestCase):
         query_class.assert_called_once_with(collection)
         query_instance = query_class.return_value
         self.assertIs(stream_response, query_instance.stream.return_value)
-        query_instance.stream.assert_called_once_with(transaction=None)
+        query_instance.stream.assert_called_once_with(
+            transaction=None, lazy=False, frozen=None, resumable=False
+        )
 
     @mock.patch("google.cloud.firestore_v1.query.Query", autospec=True)
     def test_stream_w_retry_timeout(self, query_class):
@@ -327,7 +329,12 @@ class TestCollectionReference(unittest.TestCase):
         query_instance = query_class.return_value
         self.assertIs(stream_response, query_instance.stream.return_value)
         query_instance.stream.assert_called_once_with(
-            transaction=None, retry=retry, timeout=timeout,
+            transaction=None,
+            retry=retry,
+            timeout=timeout,
+            lazy=False,
+            frozen=None,
+            resumable=False,
         )
 
     @mock.patch("google.cloud.firestore_v1.query.Query", autospec=True)
@@ -339,13 +346,56 @@ class TestCollectionReference(unittest.TestCase):
         query_class.assert_called_once_with(collection)
         query_instance = query_class.return_value
         self.assertIs(stream_response, query_instance.stream.return_value)
-        query_instance.stream.assert_called_once_with(transaction=transaction)
+        query_instance.stream.assert_called_once_with(
+            transaction=transaction, lazy=False, frozen=None, resumable=False
+        )
+
+    @mock.patch("google.cloud.firestore_v1.query.Query", autospec=True)
+    def test_paginate(self, query_class):
+        collection = self._make_one("collection")
+        pages = collection.paginate(10, start_after=b"cursor", prefetch=True)
+
+        query_class.assert_called_once_with(collection)
+        query_instance = query_class.return_value
+        self.assertIs(pages, query_instance.paginate.return_value)
+        query_instance.paginate.assert_called_once_with(
+            10,
+            start_after=b"cursor",
+            prefetch=True,
+            transaction=None,
+            lazy=False,
+            frozen=None,
+        )
 
     @mock.patch("google.cloud.firestore_v1.collection.Watch", autospec=True)
     def test_on_snapshot(self, watch):
         collection = self._make_one("collection")
         collection.on_snapshot(None)
-        watch.for_query.assert_called_once()
+        watch.for_query.assert_called_once_with(
+            mock.ANY,
+            None,
+            mock.ANY,
+            mock.ANY,
+            changes_only=False,
+            delivery=None,
+            fields=None,
+        )
+
+    @mock.patch("google.cloud.firestore_v1.collection.Watch", autospec=True)
+    def test_on_snapshot_changes_only(self, watch):
+        collection = self._make_one("collection")
+        collection.on_snapshot(
+            None, changes_only=True, delivery=mock.sentinel.delivery, fields=["a"]
+        )
+        watch.for_query.assert_called_once_with(
+            mock.ANY,
+            None,
+            mock.ANY,
+            mock.ANY,
+            changes_only=True,
+            delivery=mock.sentinel.delivery,
+            fields=["a"],
+        )
 
 
 def _make_credentials():
@@ -393,6 +393,7 @@ class DummyQuery(object):  # pragma: NO COVER
     def __init__(self, parent):
         self._parent = parent
         self._comparator = lambda x, y: 1
+        self._sort_key = lambda doc: doc.reference._path
 
     @property
     def _client(self):
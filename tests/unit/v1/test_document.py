@@ -368,9 +368,13 @@ class TestDocumentReference(unittest.TestCase):
         not_found=False,
         retry=None,
         timeout=None,
+        lazy=False,
+        frozen=None,
     ):
         from google.api_core.exceptions import NotFound
         from google.cloud.firestore_v1 import _helpers
+        from google.cloud.firestore_v1.base_document import FrozenDocumentSnapshot
+        from google.cloud.firestore_v1.base_document import LazyDocumentSnapshot
         from google.cloud.firestore_v1.types import common
         from google.cloud.firestore_v1.types import document
         from google.cloud.firestore_v1.transaction import Transaction
@@ -381,6 +385,7 @@ class TestDocumentReference(unittest.TestCase):
         firestore_api = mock.Mock(spec=["get_document"])
         response = mock.create_autospec(document.Document)
         response.fields = {}
+        response._pb = document.Document.pb()()
         response.create_time = create_time
         response.update_time = update_time
 
@@ -403,10 +408,18 @@ class TestDocumentReference(unittest.TestCase):
         kwargs = _helpers.make_retry_timeout_kwargs(retry, timeout)
 
         snapshot = document.get(
-            field_paths=field_paths, transaction=transaction, **kwargs
+            field_paths=field_paths,
+            transaction=transaction,
+            lazy=lazy,
+            frozen=frozen,
+            **kwargs,
         )
 
         self.assertIs(snapshot.reference, document)
+        self.assertEqual(isinstance(snapshot, LazyDocumentSnapshot), lazy)
+        self.assertEqual(
+            isinstance(snapshot, FrozenDocumentSnapshot), lazy or bool(frozen)
+        )
         if not_found:
             self.assertIsNone(snapshot._data)
             self.assertFalse(snapshot.exists)
@@ -414,7 +427,7 @@ class TestDocumentReference(unittest.TestCase):
             self.assertIsNone(snapshot.create_time)
             self.assertIsNone(snapshot.update_time)
         else:
-            self.assertEqual(snapshot.to_dict(), {})
+            self.assertEqual(dict(snapshot.to_dict()), {})
             self.assertTrue(snapshot.exists)
             self.assertIsNone(snapshot.read_time)
             self.assertIs(snapshot.create_time, create_time)
@@ -447,6 +460,18 @@ class TestDocumentReference(unittest.TestCase):
     def test_get_default(self):
         self._get_helper()
 
+    def test_get_lazy(self):
+        self._get_helper(lazy=True)
+
+    def test_get_lazy_not_found(self):
+        self._get_helper(not_found=True, lazy=True)
+
+    def test_get_frozen(self):
+        self._get_helper(frozen=True)
+
+    def test_get_frozen_not_found(self):
+        self._get_helper(not_found=True, frozen=True)
+
     def test_get_w_retry_timeout(self):
         from google.api_core.retry import Retry
 
@@ -467,6 +492,127 @@ class TestDocumentReference(unittest.TestCase):
     def test_get_with_transaction(self):
         self._get_helper(use_transaction=True)
 
+    def _make_cached_client(self, not_found=False):
+        from google.api_core.exceptions import NotFound
+        from google.cloud.firestore_v1 import _helpers
+        from google.cloud.firestore_v1.document_cache import DocumentCache
+        from google.cloud.firestore_v1.types import document
+        from google.protobuf import timestamp_pb2
+
+        firestore_api = mock.Mock(spec=["commit", "get_document"])
+        if not_found:
+            firestore_api.get_document.side_effect = NotFound("testing")
+        else:
+            firestore_api.get_document.return_value = document.Document(
+                fields=_helpers.encode_dict({"a": 1}),
+                create_time=timestamp_pb2.Timestamp(seconds=1),
+                update_time=timestamp_pb2.Timestamp(seconds=2),
+            )
+        firestore_api.commit.return_value = self._make_commit_repsonse()
+        client = _make_client("donut-base")
+        client._firestore_api_internal = firestore_api
+        client._document_cache = DocumentCache()
+        return client, firestore_api
+
+    def test_get_w_document_cache(self):
+        client, firestore_api = self._make_cached_client()
+        document = self._make_one("where", "we-are", client=client)
+
+        snapshot1 = document.get()
+        snapshot2 = document.get(frozen=True)
+
+        self.assertEqual(snapshot1.to_dict(), {"a": 1})
+        self.assertEqual(snapshot2.to_dict(), {"a": 1})
+        self.assertEqual(snapshot2.update_time, snapshot1.update_time)
+        self.assertEqual(firestore_api.get_document.call_count, 1)
+        self.assertEqual(client.document_cache.hits, 1)
+
+        # Projections are not cached.
+        document.get(field_paths=["a"])
+        self.assertEqual(firestore_api.get_document.call_count, 2)
+
+        # Writes of the client invalidate the cache.
+        document.delete()
+        document.get()
+        self.assertEqual(firestore_api.get_document.call_count, 3)
+        self.assertEqual(client.document_cache.invalidations, 1)
+
+    def test_get_w_document_cache_not_found(self):
+        client, firestore_api = self._make_cached_client(not_found=True)
+        document = self._make_one("where", "we-are", client=client)
+
+        self.assertFalse(document.get().exists)
+        self.assertFalse(document.get().exists)
+
+        firestore_api.get_document.assert_called_once()
+
+    def _make_coalescing_client(self, **kwargs):
+        from google.cloud.firestore_v1 import _helpers
+        from google.cloud.firestore_v1.client import Client
+        from google.cloud.firestore_v1.types import document
+
+        firestore_api = mock.Mock(spec=["batch_get_documents", "get_document"])
+        firestore_api.get_document.return_value = document.Document(
+            fields=_helpers.encode_dict({"a": 1})
+        )
+        client = Client(project="donut-base", credentials=_make_credentials(), **kwargs)
+        client._firestore_api_internal = firestore_api
+        return client, firestore_api
+
+    def test_get_w_coalesce_reads(self):
+        from google.cloud.firestore_v1.transaction import Transaction
+
+        client, firestore_api = self._make_coalescing_client(coalesce_reads=True)
+        document = self._make_one("where", "we-are", client=client)
+
+        with mock.patch.object(
+            client._single_flight, "do", wraps=client._single_flight.do
+        ) as do:
+            snapshot = document.get(field_paths=["a"], timeout=5.0)
+            transaction = Transaction(client)
+            transaction._id = b"asking-me-2"
+            document.get(transaction=transaction)
+
+        self.assertEqual(snapshot.to_dict(), {"a": 1})
+        self.assertIs(snapshot.reference, document)
+        do.assert_called_once()
+        self.assertEqual(
+            do.call_args[0][0], ("get", document._document_path, ("a",), None, 5.0),
+        )
+        self.assertEqual(firestore_api.get_document.call_count, 2)
+
+    def test_get_w_batch_get_window(self):
+        from google.cloud.firestore_v1 import _helpers
+        from google.cloud.firestore_v1.types import document
+        from google.cloud.firestore_v1.types import firestore
+
+        client, firestore_api = self._make_coalescing_client(batch_get_window=0.01)
+        found = self._make_one("where", "we-are", client=client)
+        missing = self._make_one("where", "we-are-not", client=client)
+        firestore_api.batch_get_documents.side_effect = [
+            iter(
+                [
+                    firestore.BatchGetDocumentsResponse(
+                        found=document.Document(
+                            name=found._document_path,
+                            fields=_helpers.encode_dict({"b": 2}),
+                        )
+                    )
+                ]
+            ),
+            iter([firestore.BatchGetDocumentsResponse(missing=missing._document_path)]),
+        ]
+
+        with mock.patch("time.sleep") as sleep:
+            snapshot = found.get()
+            missing_snapshot = missing.get()
+
+        sleep.assert_called_with(0.01)
+        self.assertEqual(snapshot.to_dict(), {"b": 2})
+        self.assertFalse(missing_snapshot.exists)
+        self.assertEqual(firestore_api.batch_get_documents.call_count, 2)
+        firestore_api.get_document.assert_not_called()
+
     def _collections_helper(self, page_size=None, retry=None, timeout=None):
         from google.cloud.firestore_v1.collection import CollectionReference
         from google.cloud.firestore_v1 import _helpers
@@ -523,7 +669,35 @@ class TestDocumentReference(unittest.TestCase):
         client = mock.Mock(_database_string="sprinklez", spec=["_database_string"])
         document = self._make_one("yellow", "mellow", client=client)
         document.on_snapshot(None)
-        watch.for_document.assert_called_once()
+        watch.for_document.assert_called_once_with(
+            document,
+            None,
+            mock.ANY,
+            mock.ANY,
+            changes_only=False,
+            delivery=None,
+            fields=None,
+        )
+
+    @mock.patch("google.cloud.firestore_v1.document.Watch", autospec=True)
+    def test_on_snapshot_changes_only(self, watch):
+        from google.cloud.firestore_v1.document import DocumentReference
+        from google.cloud.firestore_v1.document import DocumentSnapshot
+
+        client = mock.Mock(_database_string="sprinklez", spec=["_database_string"])
+        document = self._make_one("yellow", "mellow", client=client)
+        document.on_snapshot(
+            None, changes_only=True, delivery=mock.sentinel.delivery, fields=["a"]
+        )
+        watch.for_document.assert_called_once_with(
+            document,
+            None,
+            DocumentSnapshot,
+            DocumentReference,
+            changes_only=True,
+            delivery=mock.sentinel.delivery,
+            fields=["a"],
+        )
 
 
 def _make_credentials():
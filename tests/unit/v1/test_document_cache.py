@@ -0,0 +1,380 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import mock
+
+
+_PATH_A = "projects/p/databases/(default)/documents/col/a"
+_PATH_B = "projects/p/databases/(default)/documents/col/b"
+_PATH_C = "projects/p/databases/(default)/documents/col/c"
+
+
+def _make_document_pb(path, seconds=1, **data):
+    from google.cloud.firestore_v1 import _helpers
+    from google.cloud.firestore_v1.types import document
+    from google.protobuf import timestamp_pb2
+
+    return document.Document(
+        name=path,
+        fields=_helpers.encode_dict(data),
+        update_time=timestamp_pb2.Timestamp(seconds=seconds),
+    )
+
+
+class TestDocumentCache(unittest.TestCase):
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.firestore_v1.document_cache import DocumentCache
+
+        return DocumentCache
+
+    def _make_one(self, **kwargs):
+        self.now = 1000.0
+        return self._get_target_class()(clock=lambda: self.now, **kwargs)
+
+    def test_constructor_defaults(self):
+        from google.cloud.firestore_v1 import document_cache
+
+        cache = self._make_one()
+        self.assertEqual(cache._max_entries, document_cache._MAX_ENTRIES)
+        self.assertEqual(cache._max_bytes, document_cache._MAX_BYTES)
+        self.assertEqual(cache._ttl, document_cache._TTL)
+        self.assertFalse(cache.watch)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.num_bytes, 0)
+        self.assertEqual(cache.version, 0)
+
+    def test_constructor_invalid(self):
+        with self.assertRaises(ValueError):
+            self._make_one(max_entries=0)
+        with self.assertRaises(ValueError):
+            self._make_one(max_bytes=0)
+        with self.assertRaises(ValueError):
+            self._make_one(ttl=0)
+
+    def test_lookup_and_store(self):
+        cache = self._make_one()
+        document_pb = _make_document_pb(_PATH_A, a=1)
+
+        self.assertEqual(cache.lookup(_PATH_A), (False, None))
+        self.assertTrue(cache.store(_PATH_A, document_pb, cache.version))
+        self.assertEqual(cache.lookup(_PATH_A), (True, document_pb))
+
+        self.assertIn(_PATH_A, cache)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 1)
+        self.assertGreater(cache.num_bytes, len(_PATH_A))
+
+    def test_store_missing_document(self):
+        cache = self._make_one()
+
+        self.assertTrue(cache.store(_PATH_A, None, cache.version))
+
+        self.assertEqual(cache.lookup(_PATH_A), (True, None))
+        self.assertEqual(cache.num_bytes, len(_PATH_A))
+
+    def test_store_after_invalidation(self):
+        cache = self._make_one()
+        version = cache.version
+        cache.invalidate([_PATH_B])
+
+        self.assertFalse(cache.store(_PATH_A, None, version))
+        self.assertNotIn(_PATH_A, cache)
+
+    def test_store_older_document(self):
+        cache = self._make_one()
+        newer = _make_document_pb(_PATH_A, seconds=2, a=2)
+        older = _make_document_pb(_PATH_A, seconds=1, a=1)
+        newest = _make_document_pb(_PATH_A, seconds=3, a=3)
+
+        self.assertTrue(cache.store(_PATH_A, newer, cache.version))
+        self.assertFalse(cache.store(_PATH_A, older, cache.version))
+        self.assertEqual(cache.lookup(_PATH_A), (True, newer))
+        self.assertTrue(cache.store(_PATH_A, newest, cache.version))
+        self.assertEqual(cache.lookup(_PATH_A), (True, newest))
+        self.assertTrue(cache.store(_PATH_A, None, cache.version))
+        self.assertEqual(cache.lookup(_PATH_A), (True, None))
+
+    def test_store_too_large(self):
+        cache = self._make_one(max_bytes=100)
+        document_pb = _make_document_pb(_PATH_A, a="x" * 100)
+
+        self.assertFalse(cache.store(_PATH_A, document_pb, cache.version))
+        self.assertEqual(len(cache), 0)
+
+    def test_evict_least_recently_used(self):
+        cache = self._make_one(max_entries=2)
+        cache.store(_PATH_A, None, cache.version)
+        cache.store(_PATH_B, None, cache.version)
+        cache.lookup(_PATH_A)
+
+        cache.store(_PATH_C, None, cache.version)
+
+        self.assertIn(_PATH_A, cache)
+        self.assertNotIn(_PATH_B, cache)
+        self.assertIn(_PATH_C, cache)
+        self.assertEqual(cache.evictions, 1)
+
+    def test_evict_over_max_bytes(self):
+        from google.cloud.firestore_v1.document_cache import _entry_size
+
+        document_pb = _make_document_pb(_PATH_C, c=1)
+        max_bytes = len(_PATH_B) + _entry_size(_PATH_C, document_pb)
+        cache = self._make_one(max_bytes=max_bytes)
+        cache.store(_PATH_A, None, cache.version)
+        cache.store(_PATH_B, None, cache.version)
+
+        cache.store(_PATH_C, document_pb, cache.version)
+
+        self.assertNotIn(_PATH_A, cache)
+        self.assertIn(_PATH_B, cache)
+        self.assertIn(_PATH_C, cache)
+        self.assertEqual(cache.num_bytes, max_bytes)
+
+    def test_ttl(self):
+        cache = self._make_one(ttl=10.0)
+        cache.store(_PATH_A, None, cache.version)
+
+        self.now += 9.0
+        self.assertEqual(cache.lookup(_PATH_A), (True, None))
+        self.now += 1.0
+        self.assertEqual(cache.lookup(_PATH_A), (False, None))
+
+        self.assertEqual(cache.evictions, 1)
+        self.assertEqual(cache.num_bytes, 0)
+
+    def test_ttl_none(self):
+        cache = self._make_one(ttl=None)
+        cache.store(_PATH_A, None, cache.version)
+
+        self.now += 10 ** 9
+        self.assertEqual(cache.lookup(_PATH_A), (True, None))
+
+    def test_invalidate(self):
+        cache = self._make_one()
+        cache.store(_PATH_A, None, cache.version)
+        cache.store(_PATH_B, None, cache.version)
+
+        cache.invalidate([_PATH_A, _PATH_C])
+
+        self.assertNotIn(_PATH_A, cache)
+        self.assertIn(_PATH_B, cache)
+        self.assertEqual(cache.invalidations, 1)
+        self.assertEqual(cache.version, 1)
+
+    def test_invalidate_writes(self):
+        from google.cloud.firestore_v1.types import write
+
+        cache = self._make_one()
+        for path in (_PATH_A, _PATH_B, _PATH_C):
+            cache.store(path, None, cache.version)
+
+        cache.invalidate_writes(
+            [
+                write.Write(update=_make_document_pb(_PATH_A)),
+                write.Write(delete=_PATH_B),
+                write.Write(transform=write.DocumentTransform(document=_PATH_C)),
+                write.Write(),
+            ]
+        )
+
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.invalidations, 3)
+
+    def test_clear(self):
+        cache = self._make_one()
+        cache.store(_PATH_A, None, cache.version)
+
+        cache.clear()
+
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.num_bytes, 0)
+        self.assertEqual(cache.version, 1)
+
+
+class TestDocumentCacheWatch(unittest.TestCase):
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.firestore_v1.document_cache import DocumentCache
+
+        return DocumentCache
+
+    def _make_one(self, **kwargs):
+        return self._get_target_class()(watch=True, **kwargs)
+
+    @staticmethod
+    def _make_reference():
+        reference = mock.Mock(spec=["on_snapshot"])
+        reference.on_snapshot.return_value = mock.Mock(spec=["unsubscribe"])
+        return reference
+
+    @staticmethod
+    def _make_snapshot(**data):
+        from google.protobuf import timestamp_pb2
+
+        snapshot = mock.Mock(spec=["_data", "create_time", "update_time"])
+        snapshot._data = data
+        snapshot.create_time = timestamp_pb2.Timestamp(seconds=1)
+        snapshot.update_time = timestamp_pb2.Timestamp(seconds=5)
+        return snapshot
+
+    def test_store_starts_watch(self):
+        cache = self._make_one()
+        reference = self._make_reference()
+
+        cache.store(_PATH_A, None, cache.version, reference=reference)
+        cache.store(_PATH_A, None, cache.version, reference=reference)
+
+        reference.on_snapshot.assert_called_once()
+        self.assertIs(
+            cache._entries[_PATH_A].active_watch, reference.on_snapshot.return_value
+        )
+
+    def test_store_without_reference(self):
+        cache = self._make_one()
+
+        cache.store(_PATH_A, None, cache.version)
+
+        self.assertIsNone(cache._entries[_PATH_A].active_watch)
+
+    def test_on_snapshot_updates_entry(self):
+        cache = self._make_one()
+        reference = self._make_reference()
+        cache.store(_PATH_A, None, cache.version, reference=reference)
+        callback = reference.on_snapshot.call_args[0][0]
+
+        callback([self._make_snapshot(a=1)], [], None)
+
+        found, document_pb = cache.lookup(_PATH_A)
+        self.assertTrue(found)
+        self.assertEqual(document_pb.name, _PATH_A)
+        self.assertEqual(document_pb.fields["a"].integer_value, 1)
+
+        callback([], [], None)
+
+        self.assertEqual(cache.lookup(_PATH_A), (True, None))
+
+    def test_on_snapshot_while_starting(self):
+        cache = self._make_one()
+        reference = self._make_reference()
+        snapshot = self._make_snapshot(a=1)
+
+        def on_snapshot(callback):
+            self.assertIsNone(cache._entries[_PATH_A].active_watch)
+            callback([snapshot], [], None)
+            return mock.sentinel.watch
+
+        reference.on_snapshot.side_effect = on_snapshot
+
+        cache.store(_PATH_A, None, cache.version, reference=reference)
+
+        self.assertIsNotNone(cache.lookup(_PATH_A)[1])
+        self.assertIs(cache._entries[_PATH_A].active_watch, mock.sentinel.watch)
+
+    def test_on_snapshot_after_removal(self):
+        cache = self._make_one()
+        reference = self._make_reference()
+        cache.store(_PATH_A, None, cache.version, reference=reference)
+        callback = reference.on_snapshot.call_args[0][0]
+
+        with mock.patch(
+            "google.cloud.firestore_v1.document_cache._unsubscribe"
+        ) as unsubscribe:
+            cache.invalidate([_PATH_A])
+            callback([self._make_snapshot(a=1)], [], None)
+
+        self.assertNotIn(_PATH_A, cache)
+        unsubscribe.assert_called_once_with([reference.on_snapshot.return_value])
+
+    def test_on_snapshot_too_large(self):
+        cache = self._make_one(max_bytes=100)
+        reference = self._make_reference()
+        cache.store(_PATH_A, None, cache.version, reference=reference)
+        callback = reference.on_snapshot.call_args[0][0]
+
+        with mock.patch(
+            "google.cloud.firestore_v1.document_cache._unsubscribe"
+        ) as unsubscribe:
+            callback([self._make_snapshot(a="x" * 100)], [], None)
+
+        self.assertNotIn(_PATH_A, cache)
+        self.assertEqual(cache.evictions, 1)
+        unsubscribe.assert_called_once_with([reference.on_snapshot.return_value])
+
+    def test_removed_while_starting(self):
+        cache = self._make_one()
+        reference = self._make_reference()
+        watch = reference.on_snapshot.return_value
+
+        def on_snapshot(callback):
+            cache.invalidate([_PATH_A])
+            return watch
+
+        reference.on_snapshot.side_effect = on_snapshot
+
+        with mock.patch(
+            "google.cloud.firestore_v1.document_cache._unsubscribe"
+        ) as unsubscribe:
+            cache.store(_PATH_A, None, cache.version, reference=reference)
+
+        self.assertNotIn(_PATH_A, cache)
+        unsubscribe.assert_called_with([watch])
+
+    def test_eviction_unsubscribes(self):
+        cache = self._make_one(max_entries=1)
+        reference = self._make_reference()
+        cache.store(_PATH_A, None, cache.version, reference=reference)
+
+        with mock.patch(
+            "google.cloud.firestore_v1.document_cache._unsubscribe"
+        ) as unsubscribe:
+            cache.store(_PATH_B, None, cache.version)
+
+        unsubscribe.assert_any_call([reference.on_snapshot.return_value])
+
+    def test_clear_unsubscribes(self):
+        cache = self._make_one()
+        reference = self._make_reference()
+        cache.store(_PATH_A, None, cache.version, reference=reference)
+        cache.store(_PATH_B, None, cache.version)
+
+        with mock.patch(
+            "google.cloud.firestore_v1.document_cache._unsubscribe"
+        ) as unsubscribe:
+            cache.clear()
+
+        (watches,) = unsubscribe.call_args[0]
+        self.assertEqual(list(watches), [reference.on_snapshot.return_value])
+
+
+class Test__unsubscribe(unittest.TestCase):
+    @staticmethod
+    def _call_fut(watches):
+        from google.cloud.firestore_v1.document_cache import _unsubscribe
+
+        return _unsubscribe(watches)
+
+    def test_empty(self):
+        self.assertIsNone(self._call_fut([]))
+
+    def test_unsubscribes_in_background(self):
+        watches = [mock.Mock(spec=["unsubscribe"]) for _ in range(2)]
+
+        thread = self._call_fut(iter(watches))
+        thread.join()
+
+        for watch in watches:
+            watch.unsubscribe.assert_called_once_with()
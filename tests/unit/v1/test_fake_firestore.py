@@ -0,0 +1,510 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""End-to-end tests of the client against ``benchmarks.fake_firestore``."""
+
+import queue
+import time
+import unittest
+
+import aiounittest
+import grpc  # type: ignore
+import mock
+
+from google.api_core import exceptions  # type: ignore
+
+from benchmarks.fake_firestore import FakeFirestore
+from benchmarks.fake_firestore import FakeFirestoreServer
+
+
+class _ServerMixin(object):
+    def _start(self, **kwargs):
+        self.fake = FakeFirestore(**kwargs)
+        server = FakeFirestoreServer(self.fake).start()
+        self.addCleanup(server.stop)
+        return server
+
+
+class TestFakeFirestore(_ServerMixin, unittest.TestCase):
+    def setUp(self):
+        self.client = self._start().client()
+        self.cities = self.client.collection("cities")
+
+    def _add_cities(self):
+        for doc_id, data in [
+            ("BJ", {"name": "Beijing", "population": 21500000, "tags": ["asia"]}),
+            ("LA", {"name": "Los Angeles", "population": 3900000, "tags": ["us"]}),
+            ("SF", {"name": "San Francisco", "population": 860000, "tags": ["us"]}),
+            ("TOK", {"name": "Tokyo", "population": 9000000, "tags": ["asia"]}),
+            ("NOP", {"name": "Nowhere"}),
+        ]:
+            self.cities.document(doc_id).set(data)
+
+    def _ids(self, query):
+        return [snapshot.id for snapshot in query.stream()]
+
+    def test_set_get_delete(self):
+        from google.cloud.firestore_v1 import DELETE_FIELD
+
+        document = self.cities.document("SF")
+        write_result = document.set({"name": "San Francisco", "area": {"km2": 121}})
+        snapshot = document.get()
+        self.assertTrue(snapshot.exists)
+        self.assertEqual(
+            snapshot.to_dict(), {"name": "San Francisco", "area": {"km2": 121}}
+        )
+        self.assertEqual(snapshot.update_time, write_result.update_time)
+        self.assertEqual(document.get(["area.km2"]).to_dict(), {"area": {"km2": 121}})
+
+        document.update({"area.km2": 122, "name": DELETE_FIELD})
+        self.assertEqual(document.get().to_dict(), {"area": {"km2": 122}})
+        document.set({"state": "CA"}, merge=True)
+        self.assertEqual(
+            document.get().to_dict(), {"area": {"km2": 122}, "state": "CA"}
+        )
+
+        document.delete()
+        self.assertFalse(document.get().exists)
+        self.assertIsNone(self.fake.get(document._document_path))
+
+    def test_transforms(self):
+        from google.cloud.firestore_v1 import ArrayRemove
+        from google.cloud.firestore_v1 import ArrayUnion
+        from google.cloud.firestore_v1 import Increment
+        from google.cloud.firestore_v1 import Maximum
+        from google.cloud.firestore_v1 import Minimum
+        from google.cloud.firestore_v1 import SERVER_TIMESTAMP
+
+        document = self.cities.document("SF")
+        document.set({"count": 1, "ratio": 0.5, "tags": ["a", "b"], "low": 3})
+        write_result = document.update(
+            {
+                "count": Increment(2),
+                "ratio": Increment(1),
+                "new": Increment(4),
+                "high": Maximum(7),
+                "low": Minimum(5),
+                "tags": ArrayUnion(["b", "c"]),
+                "updated": SERVER_TIMESTAMP,
+            }
+        )
+        document.update(
+            {"low": Minimum(2), "high": Maximum(6), "gone": ArrayRemove([1])}
+        )
+        document.update({"tags": ArrayRemove(["a"]), "list": ArrayUnion([1, 1])})
+
+        data = document.get().to_dict()
+        self.assertEqual(data["count"], 3)
+        self.assertEqual(data["ratio"], 1.5)
+        self.assertEqual(data["new"], 4)
+        self.assertEqual((data["low"], data["high"]), (2, 7))
+        self.assertEqual(data["tags"], ["b", "c"])
+        self.assertEqual(data["list"], [1])
+        self.assertEqual(data["gone"], [])
+        self.assertEqual(data["updated"], write_result.update_time)
+
+    def test_preconditions(self):
+        document = self.cities.document("SF")
+        with self.assertRaises(exceptions.NotFound):
+            document.update({"name": "San Francisco"})
+        document.create({"name": "San Francisco"})
+        with self.assertRaises(exceptions.Conflict):
+            document.create({"name": "San Francisco"})
+
+        snapshot = document.get()
+        document.update({"name": "SF"})
+        option = self.client.write_option(last_update_time=snapshot.update_time)
+        with self.assertRaises(exceptions.FailedPrecondition):
+            document.delete(option=option)
+        with self.assertRaises(exceptions.FailedPrecondition):
+            self.cities.document("LA").delete(option=option)
+
+    def test_batch_is_atomic(self):
+        batch = self.client.batch()
+        batch.set(self.cities.document("LA"), {"name": "Los Angeles"})
+        batch.update(self.cities.document("SF"), {"name": "San Francisco"})
+        with self.assertRaises(exceptions.NotFound):
+            batch.commit()
+        self.assertEqual(list(self.cities.stream()), [])
+
+        batch = self.client.batch()
+        batch.set(self.cities.document("SF"), {"name": "San Francisco"})
+        batch.update(self.cities.document("SF"), {"state": "CA"})
+        write_results = batch.commit()
+        self.assertEqual(len(write_results), 2)
+        self.assertEqual(
+            self.cities.document("SF").get().to_dict(),
+            {"name": "San Francisco", "state": "CA"},
+        )
+
+    def test_transaction(self):
+        from google.cloud.firestore_v1 import transactional
+
+        document = self.cities.document("SF")
+        document.set({"visits": 1})
+
+        @transactional
+        def visit(transaction):
+            snapshot = document.get(transaction=transaction)
+            transaction.update(document, {"visits": snapshot.get("visits") + 1})
+
+        visit(self.client.transaction())
+        self.assertEqual(document.get().get("visits"), 2)
+        self.assertEqual(self.fake.requests["BeginTransaction"], 1)
+
+        transaction = self.client.transaction()
+        transaction._begin()
+        self.assertEqual(len(list(self.cities.stream(transaction=transaction))), 1)
+        transaction._rollback()
+        self.assertEqual(self.fake.requests["Rollback"], 1)
+
+    def test_get_all(self):
+        self._add_cities()
+        references = [self.cities.document(doc_id) for doc_id in ["SF", "XX", "LA"]]
+        snapshots = {
+            snapshot.id: snapshot
+            for snapshot in self.client.get_all(references, field_paths=["name"])
+        }
+        self.assertEqual(snapshots["SF"].to_dict(), {"name": "San Francisco"})
+        self.assertEqual(snapshots["LA"].to_dict(), {"name": "Los Angeles"})
+        self.assertFalse(snapshots["XX"].exists)
+        self.assertEqual(self.fake.requests["BatchGetDocuments"], 1)
+
+    def test_query_filters(self):
+        self._add_cities()
+        self.assertEqual(self._ids(self.cities), ["BJ", "LA", "NOP", "SF", "TOK"])
+        self.assertEqual(
+            self._ids(self.cities.where("population", ">", 3900000)), ["TOK", "BJ"]
+        )
+        self.assertEqual(
+            self._ids(self.cities.where("population", "<=", 3900000)), ["SF", "LA"]
+        )
+        self.assertEqual(self._ids(self.cities.where("population", ">", "a")), [])
+        self.assertEqual(
+            self._ids(self.cities.where("name", ">=", "S").where("name", "<", "T")),
+            ["SF"],
+        )
+        self.assertEqual(self._ids(self.cities.where("name", "==", "Tokyo")), ["TOK"])
+        self.assertEqual(
+            self._ids(self.cities.where("population", "!=", 860000)),
+            ["LA", "TOK", "BJ"],
+        )
+        self.assertEqual(
+            self._ids(self.cities.where("tags", "array_contains", "asia")),
+            ["BJ", "TOK"],
+        )
+        self.assertEqual(
+            self._ids(self.cities.where("tags", "array_contains_any", ["us", "eu"])),
+            ["LA", "SF"],
+        )
+        self.assertEqual(
+            self._ids(self.cities.where("name", "in", ["Tokyo", "Nowhere"])),
+            ["NOP", "TOK"],
+        )
+        self.assertEqual(
+            self._ids(self.cities.where("name", "not-in", ["Tokyo", "Nowhere"])),
+            ["BJ", "LA", "SF"],
+        )
+        self.assertEqual(self._ids(self.cities.where("population", "==", None)), [])
+        self.assertEqual(
+            self._ids(self.cities.where("population", "==", float("nan"))), []
+        )
+        self.cities.document("NOP").update({"population": None})
+        self.assertEqual(
+            self._ids(self.cities.where("population", "==", None)), ["NOP"]
+        )
+
+    def test_query_orders_cursors_and_limits(self):
+        self._add_cities()
+        by_population = self.cities.order_by("population")
+        self.assertEqual(self._ids(by_population), ["SF", "LA", "TOK", "BJ"])
+        self.assertEqual(
+            self._ids(
+                self.cities.order_by("population", direction="DESCENDING").limit(2)
+            ),
+            ["BJ", "TOK"],
+        )
+        self.assertEqual(self._ids(by_population.offset(3)), ["BJ"])
+        self.assertEqual(
+            self._ids(by_population.start_at({"population": 3900000})),
+            ["LA", "TOK", "BJ"],
+        )
+        self.assertEqual(
+            self._ids(by_population.start_after({"population": 3900000})), ["TOK", "BJ"]
+        )
+        self.assertEqual(
+            self._ids(by_population.end_at({"population": 3900000})), ["SF", "LA"]
+        )
+        self.assertEqual(
+            self._ids(by_population.end_before({"population": 3900000})), ["SF"]
+        )
+
+        descending = self.cities.order_by("population", direction="DESCENDING")
+        self.assertEqual(
+            self._ids(descending.start_after({"population": 9000000})), ["LA", "SF"]
+        )
+        snapshot = self.cities.document("TOK").get()
+        self.assertEqual(self._ids(self.cities.start_after(snapshot)), [])
+        self.assertEqual(
+            self._ids(self.cities.end_before(snapshot)), ["BJ", "LA", "NOP", "SF"]
+        )
+
+        projected = [
+            snapshot.to_dict()
+            for snapshot in by_population.select(["name"]).limit(1).stream()
+        ]
+        self.assertEqual(projected, [{"name": "San Francisco"}])
+
+    def test_query_orders_mixed_types(self):
+        import datetime
+
+        from google.cloud.firestore_v1 import GeoPoint
+
+        values = [
+            None,
+            False,
+            True,
+            float("nan"),
+            -1,
+            0.5,
+            2,
+            datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc),
+            "a",
+            b"a",
+            self.cities.document("SF"),
+            GeoPoint(1.0, 2.0),
+            [1, "b"],
+            {"a": 1},
+        ]
+        for index, value in reversed(list(enumerate(values))):
+            self.cities.document("{:02d}".format(index)).set({"value": value})
+        self.cities.document("99").set({})
+
+        expected = ["{:02d}".format(index) for index in range(len(values))]
+        self.assertEqual(self._ids(self.cities.order_by("value")), expected)
+        self.assertEqual(
+            self._ids(self.cities.order_by("value", direction="DESCENDING")),
+            expected[::-1],
+        )
+        self.assertEqual(
+            self._ids(self.cities.where("value", "==", float("nan"))), ["03"]
+        )
+        self.assertEqual(self._ids(self.cities.where("value", ">", 0)), ["05", "06"])
+
+    def test_query_orders_maps_w_cursors(self):
+        for doc_id, value in [
+            ("a", {"x": 1}),
+            ("b", {"x": 2}),
+            ("c", {"x": 2, "y": 0}),
+        ]:
+            self.cities.document(doc_id).set({"value": value})
+
+        ascending = self.cities.order_by("value")
+        descending = self.cities.order_by("value", direction="DESCENDING")
+        self.assertEqual(self._ids(ascending), ["a", "b", "c"])
+        self.assertEqual(self._ids(descending), ["c", "b", "a"])
+        self.assertEqual(
+            self._ids(ascending.end_before({"value": {"x": 2, "y": 0}})), ["a", "b"]
+        )
+        self.assertEqual(self._ids(descending.start_after({"value": {"x": 2}})), ["a"])
+
+    def test_collection_group_query(self):
+        self._add_cities()
+        self.cities.document("SF").collection("landmarks").document("GG").set(
+            {"type": "bridge"}
+        )
+        self.cities.document("XX").collection("landmarks").document("ZZ").set(
+            {"type": "museum"}
+        )
+        self.client.collection("landmarks").document("AA").set({"type": "park"})
+
+        group = self.client.collection_group("landmarks")
+        self.assertEqual(self._ids(group), ["GG", "ZZ", "AA"])
+        self.assertEqual(self._ids(group.where("type", "==", "bridge")), ["GG"])
+        self.assertEqual(
+            self._ids(self.cities.document("SF").collection("landmarks")), ["GG"]
+        )
+
+        partitions = list(group.get_partitions(2))
+        self.assertEqual(len(partitions), 2)
+        self.assertEqual(
+            [self._ids(partition.query()) for partition in partitions],
+            [["GG"], ["ZZ", "AA"]],
+        )
+
+    def test_list_documents_and_collections(self):
+        self._add_cities()
+        self.cities.document("XX").collection("landmarks").document("ZZ").set({})
+        self.client.collection("users").document("ada").set({})
+
+        self.assertEqual(
+            [collection.id for collection in self.client.collections()],
+            ["cities", "users"],
+        )
+        self.assertEqual(
+            [collection.id for collection in self.cities.document("XX").collections()],
+            ["landmarks"],
+        )
+        documents = list(self.cities.list_documents(page_size=2))
+        self.assertEqual(
+            [document.id for document in documents],
+            ["BJ", "LA", "NOP", "SF", "TOK", "XX"],
+        )
+        self.assertEqual(self.fake.requests["ListDocuments"], 3)
+
+    def test_bulk_writer(self):
+        writer = self.client.bulk_writer()
+        for i in range(30):
+            writer.create(self.cities.document("city-{}".format(i)), {"i": i})
+        writer.close()
+        self.assertEqual(len(list(self.cities.stream())), 30)
+
+        writer = self.client.bulk_writer()
+        future = writer.create(self.cities.document("city-0"), {"i": 0})
+        writer.close()
+        with self.assertRaises(exceptions.Conflict):
+            future.result()
+
+    def test_on_snapshot(self):
+        from google.cloud.firestore_v1.watch import ChangeType
+
+        self._add_cities()
+        events = queue.Queue()
+
+        def on_snapshot(snapshots, changes, read_time):
+            events.put(set((change.type, change.document.id) for change in changes))
+
+        query = self.cities.where("population", ">", 3900000)
+        watch = query.on_snapshot(on_snapshot)
+        self.addCleanup(watch.unsubscribe)
+        self.assertEqual(
+            events.get(timeout=10),
+            {(ChangeType.ADDED, "TOK"), (ChangeType.ADDED, "BJ")},
+        )
+
+        self.cities.document("LA").update({"population": 4000000})
+        self.assertEqual(events.get(timeout=10), {(ChangeType.ADDED, "LA")})
+        self.cities.document("LA").update({"population": 5000000})
+        self.assertEqual(events.get(timeout=10), {(ChangeType.MODIFIED, "LA")})
+        self.cities.document("LA").update({"population": 3000000})
+        self.assertEqual(events.get(timeout=10), {(ChangeType.REMOVED, "LA")})
+        self.cities.document("TOK").delete()
+        self.assertEqual(events.get(timeout=10), {(ChangeType.REMOVED, "TOK")})
+        self.cities.document("SF").update({"name": "SF"})
+
+        limited = self.cities.order_by("population").limit(1)
+        limited_watch = limited.on_snapshot(on_snapshot)
+        self.addCleanup(limited_watch.unsubscribe)
+        self.assertEqual(events.get(timeout=10), {(ChangeType.ADDED, "SF")})
+        self.cities.document("SF").delete()
+        self.assertEqual(
+            events.get(timeout=10),
+            {(ChangeType.REMOVED, "SF"), (ChangeType.ADDED, "LA")},
+        )
+
+    def test_document_on_snapshot(self):
+        document = self.cities.document("SF")
+        snapshots = queue.Queue()
+        watch = document.on_snapshot(
+            lambda docs, changes, read_time: snapshots.put([doc.id for doc in docs])
+        )
+        self.addCleanup(watch.unsubscribe)
+        self.assertEqual(snapshots.get(timeout=10), [])
+        self.cities.document("LA").set({"name": "Los Angeles"})
+        document.set({"name": "San Francisco"})
+        self.assertEqual(snapshots.get(timeout=10), ["SF"])
+        document.delete()
+        self.assertEqual(snapshots.get(timeout=10), [])
+
+    def test_clear(self):
+        self._add_cities()
+        self.fake.clear()
+        self.assertEqual(list(self.cities.stream()), [])
+
+
+class TestFakeFirestoreServer(unittest.TestCase):
+    def test_context_manager(self):
+        with FakeFirestoreServer() as server:
+            document = server.client().collection("cities").document("SF")
+            document.set({"name": "San Francisco"})
+            stored = server.fake.get(document._document_path)
+        self.assertEqual(stored.name, document._document_path)
+        self.assertEqual(stored.fields["name"].string_value, "San Francisco")
+
+
+class TestFakeFirestoreInjection(_ServerMixin, unittest.TestCase):
+    def test_fail_next(self):
+        client = self._start().client()
+        document = client.collection("cities").document("SF")
+        self.fake.fail_next("GetDocument", grpc.StatusCode.PERMISSION_DENIED)
+        with self.assertRaises(exceptions.PermissionDenied):
+            document.get()
+        self.assertFalse(document.get().exists)
+        self.assertEqual(self.fake.requests["GetDocument"], 2)
+
+    def test_fail_next_retried(self):
+        client = self._start().client()
+        document = client.collection("cities").document("SF")
+        self.fake.fail_next("Commit", grpc.StatusCode.UNAVAILABLE, count=2)
+        document.set({"name": "San Francisco"})
+        self.assertEqual(self.fake.requests["Commit"], 3)
+
+    def test_error_rate(self):
+        client = self._start(
+            error_rate={"Commit": 1.0}, error_code=grpc.StatusCode.ABORTED, seed=1
+        ).client()
+        document = client.collection("cities").document("SF")
+        with self.assertRaises(exceptions.Aborted):
+            document.set({"name": "San Francisco"})
+        self.assertFalse(document.get().exists)
+
+    @mock.patch("google.cloud.firestore_v1.bulk_writer._sleep")
+    def test_batch_write_error_rate(self, _sleep):
+        client = self._start(error_rate={"BatchWrite": 0.5}, seed=1).client()
+        cities = client.collection("cities")
+        writer = client.bulk_writer()
+        for i in range(20):
+            writer.set(cities.document("city-{}".format(i)), {"i": i})
+        writer.close()
+        _sleep.assert_called()
+        self.assertEqual(len(list(cities.stream())), 20)
+        self.assertGreater(self.fake.requests["BatchWrite"], 1)
+
+    def test_latency(self):
+        client = self._start(latency={"GetDocument": 0.05}).client()
+        document = client.collection("cities").document("SF")
+        start = time.perf_counter()
+        document.get()
+        self.assertGreaterEqual(time.perf_counter() - start, 0.05)
+        start = time.perf_counter()
+        document.set({})
+        self.assertLess(time.perf_counter() - start, 0.05)
+
+
+class TestFakeFirestoreAsync(_ServerMixin, aiounittest.AsyncTestCase):
+    async def test_async_client(self):
+        client = self._start().async_client()
+        cities = client.collection("cities")
+        await cities.document("SF").set({"name": "San Francisco", "population": 860000})
+        await cities.document("LA").set({"name": "Los Angeles", "population": 3900000})
+
+        snapshot = await cities.document("SF").get()
+        self.assertEqual(snapshot.get("name"), "San Francisco")
+        ids = [
+            snapshot.id
+            async for snapshot in cities.order_by(
+                "population", direction="DESCENDING"
+            ).stream()
+        ]
+        self.assertEqual(ids, ["LA", "SF"])
@@ -103,6 +103,19 @@ class Test_split_field_path(unittest.TestCase):
     def test_w_quoted_field_escaped_backtick(self):
         self.assertEqual(self._call_fut(r"`c*\`de`"), [r"`c*\`de`"])
 
+    def test_w_non_ascii_identifier(self):
+        with self.assertRaises(ValueError):
+            self._call_fut("a.é")
+
+    def test_w_trailing_newline(self):
+        with self.assertRaises(ValueError):
+            self._call_fut("a.b\n")
+
+    def test_returns_new_list(self):
+        elements = self._call_fut("a.b")
+        elements.append("c")
+        self.assertEqual(self._call_fut("a.b"), ["a", "b"])
+
 
 class Test_parse_field_path(unittest.TestCase):
     @staticmethod
@@ -124,6 +137,16 @@ class Test_parse_field_path(unittest.TestCase):
         with self.assertRaises(ValueError):
             self._call_fut("`a\\`b.c.d")
 
+    def test_cached(self):
+        from google.cloud.firestore_v1 import field_path
+
+        field_path._parse_field_path.cache_clear()
+        field_names = self._call_fut("a.`b c`")
+        field_names.append("d")
+        self.assertEqual(self._call_fut("a.`b c`"), ["a", "b c"])
+        info = field_path._parse_field_path.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+
 
 class Test_render_field_path(unittest.TestCase):
     @staticmethod
@@ -153,6 +176,15 @@ class Test_render_field_path(unittest.TestCase):
     def test_multiple(self):
         self.assertEqual(self._call_fut(["a", "b", "c"]), "a.b.c")
 
+    def test_w_trailing_newline(self):
+        self.assertEqual(self._call_fut(["a\n"]), "`a\n`")
+
+    def test_w_non_ascii_identifier(self):
+        self.assertEqual(self._call_fut(["é"]), "`é`")
+
+    def test_w_generator(self):
+        self.assertEqual(self._call_fut(name for name in ("a", "b")), "a.b")
+
 
 class Test_get_nested_value(unittest.TestCase):
 
@@ -253,6 +285,15 @@ class TestFieldPath(unittest.TestCase):
         field_path = self._make_one("a", "b", "c")
         self.assertEqual(field_path.parts, ("a", "b", "c"))
 
+    def test__from_parts(self):
+        klass = self._get_target_class()
+
+        field_path = klass._from_parts(("a", "b"))
+
+        self.assertEqual(field_path.parts, ("a", "b"))
+        self.assertEqual(field_path, self._make_one("a", "b"))
+        self.assertEqual(hash(field_path), hash(self._make_one("a", "b")))
+
     def test_ctor_w_invalid_chars_in_part(self):
         invalid_parts = ("~", "*", "/", "[", "]", ".")
         for invalid_part in invalid_parts:
@@ -362,6 +403,50 @@ class TestFieldPath(unittest.TestCase):
         field_path = self._make_one("a", "3")
         self.assertEqual(hash(field_path), hash("a.`3`"))
 
+    def test___hash___cached(self):
+        field_path = self._make_one("a", "b")
+        self.assertIsNone(field_path._hash)
+        self.assertEqual(hash(field_path), hash("a.b"))
+        self.assertEqual(field_path._hash, hash("a.b"))
+
+    def test_parts_read_only(self):
+        field_path = self._make_one("a", "b")
+        with self.assertRaises(AttributeError):
+            field_path.parts = ("c",)
+        with self.assertRaises(AttributeError):
+            field_path.other = 1
+
+    def test_from_api_repr_interned(self):
+        klass = self._get_target_class()
+        field_path = klass.from_api_repr("a.`b c`")
+        self.assertIs(klass.from_api_repr("a.`b c`"), field_path)
+        self.assertIsNot(klass.from_api_repr(" a.`b c`"), field_path)
+
+    def test_from_string_interned(self):
+        klass = self._get_target_class()
+        field_path = klass.from_string("a.b")
+        self.assertIs(klass.from_string("a.b"), field_path)
+        self.assertIs(klass.from_string("a.一"), klass.from_string("a.一"))
+
+    def test_from_string_w_subclass(self):
+        klass = self._get_target_class()
+
+        class Subclass(klass):
+            __slots__ = ()
+
+        field_path = Subclass.from_string("a.b")
+        self.assertIsInstance(field_path, Subclass)
+        self.assertIs(type(klass.from_string("a.b")), klass)
+
+    def test_deepcopy(self):
+        import copy
+
+        field_path = self._make_one("a", "b")
+        hash(field_path)
+        copied = copy.deepcopy(field_path)
+        self.assertEqual(copied, field_path)
+        self.assertEqual(copied.parts, ("a", "b"))
+
     def test___eq___w_matching_type(self):
         field_path = self._make_one("a", "b")
         string_path = self._get_target_class().from_string("a.b")
@@ -0,0 +1,639 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import concurrent.futures
+import itertools
+import queue
+import threading
+import time
+import unittest
+
+import grpc  # type: ignore
+import mock
+
+from google.api_core import exceptions
+from google.cloud.firestore_v1.types import document
+from google.cloud.firestore_v1.types import firestore
+from google.cloud.firestore_v1.types import write
+from google.protobuf import timestamp_pb2
+from tests.unit.v1.test__helpers import _make_credentials
+
+
+def _make_client(listen_streams=1, **kwargs):
+    from google.cloud.firestore_v1.client import Client
+
+    return Client(
+        project="project",
+        credentials=_make_credentials(),
+        listen_streams=listen_streams,
+        **kwargs
+    )
+
+
+def _wait_for(predicate, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:  # pragma: NO COVER
+            raise AssertionError("Timed out")
+        time.sleep(0.001)
+
+
+def _no_backoff():
+    return mock.patch(
+        "google.cloud.firestore_v1.listen_multiplexer.retries."
+        "exponential_sleep_generator",
+        return_value=itertools.repeat(0),
+    )
+
+
+class TestListenMultiplexer(unittest.TestCase):
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.firestore_v1.listen_multiplexer import ListenMultiplexer
+
+        return ListenMultiplexer
+
+    def _make_one(self, *args, **kwargs):
+        klass = self._get_target_class()
+        return klass(*args, **kwargs)
+
+    def _make_client(self, listen_streams=1):
+        client = _make_client(listen_streams)
+        calls = []
+
+        def listen(request_iterator, metadata):
+            call = _FakeCall(request_iterator)
+            calls.append(call)
+            return call
+
+        firestore_api = mock.Mock(spec=["_transport"])
+        firestore_api._transport.listen.side_effect = listen
+        client._firestore_api_internal = firestore_api
+        return client, calls
+
+    def test_constructor(self):
+        client = mock.sentinel.client
+        multiplexer = self._make_one(client)
+        self.assertIs(multiplexer._client, client)
+        self.assertEqual(multiplexer._max_streams, 1)
+        self.assertEqual(multiplexer.targets, [])
+
+    def test_constructor_w_bad_max_streams(self):
+        with self.assertRaises(ValueError):
+            self._make_one(mock.sentinel.client, max_streams=0)
+
+    def test_watch_document(self):
+        from google.cloud.firestore_v1.listen_multiplexer import MultiplexedWatch
+
+        client, calls = self._make_client()
+        document_ref = client.document("users", "a")
+        watch = document_ref.on_snapshot(mock.Mock())
+        self.assertIsInstance(watch, MultiplexedWatch)
+        self.assertTrue(watch.is_active)
+        self.assertFalse(watch._changes_only)
+        self.assertEqual(watch._target_id, 1)
+        self.assertEqual(client._listen_multiplexer.targets, [1])
+
+        _wait_for(lambda: calls)
+        call = calls[0]
+        request = call.next_request()
+        self.assertEqual(request.database, client._database_string)
+        self.assertEqual(request.add_target.target_id, 1)
+        self.assertEqual(
+            list(request.add_target.documents.documents), [document_ref._document_path],
+        )
+        client._firestore_api._transport.listen.assert_called_once_with(
+            mock.ANY, metadata=client._rpc_metadata
+        )
+
+        watch.unsubscribe()
+        self.assertFalse(watch.is_active)
+        self.assertEqual(client._listen_multiplexer.targets, [])
+        self.assertTrue(call.cancelled)
+        self.assertIsNone(call.next_request())
+        watch.unsubscribe()
+
+    def test_watch_queries_share_streams(self):
+        client, calls = self._make_client(listen_streams=2)
+        multiplexer = client._listen_multiplexer
+        collection = client.collection("users")
+        watches = [
+            collection.on_snapshot(mock.Mock()),
+            collection.where("n", "==", 1).on_snapshot(mock.Mock()),
+            collection.where("n", "==", 2).on_snapshot(mock.Mock(), changes_only=True),
+        ]
+        self.assertEqual(multiplexer.targets, [2, 1])
+        self.assertEqual([watch._changes_only for watch in watches], [0, 0, 1])
+        self.assertEqual([watch._target_id for watch in watches], [1, 2, 3])
+        self.assertIs(watches[0]._stream, watches[2]._stream)
+
+        _wait_for(lambda: len(calls) == 2)
+        first = {call.next_request().add_target.target_id for call in calls}
+        self.assertEqual(first, {1, 2})
+
+        watches[0].close()
+        self.assertEqual(multiplexer.targets, [1, 1])
+        multiplexer.close()
+        self.assertEqual(multiplexer.targets, [])
+        self.assertFalse(any(watch.is_active for watch in watches))
+        self.assertTrue(all(call.cancelled for call in calls))
+
+    def test_watch_added_and_removed_on_open_stream(self):
+        client, calls = self._make_client()
+        watch_a = client.document("users", "a").on_snapshot(mock.Mock())
+        _wait_for(lambda: calls)
+        call = calls[0]
+        self.assertEqual(call.next_request().add_target.target_id, 1)
+
+        watch_b = client.document("users", "b").on_snapshot(mock.Mock())
+        self.assertEqual(call.next_request().add_target.target_id, 2)
+
+        watch_a.close(reason="done")
+        self.assertEqual(call.next_request().remove_target, 1)
+        self.assertTrue(watch_b.is_active)
+        watch_b.close()
+        self.assertTrue(call.cancelled)
+
+    def test_snapshots_routed_to_targets(self):
+        client, calls = self._make_client()
+        callback_a = mock.Mock()
+        callback_b = mock.Mock()
+        client.document("users", "a").on_snapshot(callback_a)
+        client.document("users", "b").on_snapshot(callback_b)
+        _wait_for(lambda: calls)
+        call = calls[0]
+
+        call.respond(_target_change("ADD", [1, 2]))
+        call.respond(_document_change("users/a", [1]))
+        call.respond(_target_change("CURRENT", [1, 2]))
+        call.respond(_target_change("NO_CHANGE", seconds=2))
+        _wait_for(lambda: callback_a.called and callback_b.called)
+
+        docs, changes, read_time = callback_a.call_args[0]
+        self.assertEqual([doc.id for doc in docs], ["a"])
+        self.assertEqual(read_time.timestamp(), 2)
+        docs, changes, read_time = callback_b.call_args[0]
+        self.assertEqual(docs, [])
+        client._listen_multiplexer.close()
+
+    def test_snapshots_w_delivery(self):
+        from google.cloud.firestore_v1.snapshot_delivery import SnapshotDelivery
+
+        client, calls = self._make_client()
+        delivered = threading.Event()
+        delivery_a = SnapshotDelivery()
+        delivery_b = SnapshotDelivery()
+        callback_a = mock.Mock(side_effect=ValueError("bad"))
+        callback_b = mock.Mock(side_effect=lambda *args: delivered.set())
+        watch_a = client.document("users", "a").on_snapshot(
+            callback_a, delivery=delivery_a
+        )
+        watch_b = client.document("users", "b").on_snapshot(
+            callback_b, delivery=delivery_b
+        )
+        _wait_for(lambda: calls)
+        call = calls[0]
+        call.next_request()
+        call.next_request()
+
+        call.respond(_target_change("CURRENT", [1, 2]))
+        call.respond(_target_change("NO_CHANGE", seconds=2))
+        self.assertTrue(delivered.wait(5))
+
+        # The failing callback removes its target, on the delivery thread.
+        self.assertEqual(call.next_request().remove_target, 1)
+        self.assertFalse(watch_a.is_active)
+        self.assertTrue(delivery_a._closed)
+        self.assertEqual(delivery_b.delivered, 1)
+
+        watch_b.unsubscribe()
+        self.assertTrue(delivery_b._closed)
+        self.assertTrue(call.cancelled)
+
+    def test_resume_after_recoverable_error(self):
+        client, calls = self._make_client()
+        callback = mock.Mock()
+        watch = client.document("users", "a").on_snapshot(callback)
+        _wait_for(lambda: calls)
+        first = calls[0]
+        first.next_request()
+        first.respond(_target_change("CURRENT", [1]))
+        first.respond(_target_change("NO_CHANGE", seconds=1, resume_token=b"token"))
+        _wait_for(lambda: callback.called)
+
+        with _no_backoff():
+            first.respond(exceptions.ServiceUnavailable("unavailable"))
+            _wait_for(lambda: len(calls) == 2)
+            second = calls[1]
+            second.respond(None)
+            _wait_for(lambda: len(calls) == 3)
+
+        # The request iterator of a failed stream ends.
+        self.assertIsNone(first.next_request())
+        for call in calls[1:]:
+            request = call.next_request()
+            self.assertEqual(request.add_target.target_id, 1)
+            self.assertEqual(request.add_target.resume_token, b"token")
+        self.assertTrue(watch.is_active)
+        watch.close()
+
+    def test_stop_during_backoff(self):
+        client, calls = self._make_client()
+        watch = client.document("users", "a").on_snapshot(mock.Mock())
+        _wait_for(lambda: calls)
+        stream = watch._stream
+        sleep_generator = mock.patch(
+            "google.cloud.firestore_v1.listen_multiplexer.retries."
+            "exponential_sleep_generator",
+            return_value=itertools.repeat(60),
+        )
+        with sleep_generator as generator:
+            calls[0].respond(exceptions.ServiceUnavailable("unavailable"))
+            _wait_for(lambda: generator.called)
+            watch.close()
+        stream._thread.join(5)
+        self.assertFalse(stream._thread.is_alive())
+        self.assertEqual(len(calls), 1)
+
+    def test_stop_before_reopen(self):
+        from google.cloud.firestore_v1.listen_multiplexer import _ListenStream
+
+        client, calls = self._make_client()
+        stream = _ListenStream(client._listen_multiplexer)
+        stream._stopped.set()
+        stream._run()
+        self.assertEqual(calls, [])
+
+    def test_terminal_error(self):
+        client, calls = self._make_client()
+        multiplexer = client._listen_multiplexer
+        watches = [
+            client.document("users", name).on_snapshot(mock.Mock())
+            for name in ("a", "b")
+        ]
+        _wait_for(lambda: calls)
+        calls[0].respond(exceptions.PermissionDenied("denied"))
+        watches[0]._stream._thread.join(5)
+        self.assertFalse(any(watch.is_active for watch in watches))
+        self.assertEqual(multiplexer.targets, [])
+        self.assertEqual(len(calls), 1)
+
+        # A new watch opens a new stream.
+        watch = client.document("users", "c").on_snapshot(mock.Mock())
+        _wait_for(lambda: len(calls) == 2)
+        watch.close()
+
+    def test_fail_after_stop(self):
+        client, calls = self._make_client()
+        watch = client.document("users", "a").on_snapshot(mock.Mock())
+        stream = watch._stream
+        watch.close()
+        stream._fail(exceptions.PermissionDenied("denied"))
+        self.assertEqual(client._listen_multiplexer.targets, [])
+
+
+class Test_ListenStream_route(unittest.TestCase):
+    def _make_stream(self, *target_ids):
+        from google.cloud.firestore_v1.listen_multiplexer import _ListenStream
+
+        multiplexer = _make_client()._listen_multiplexer
+        stream = _ListenStream(multiplexer)
+        multiplexer._streams.append(stream)
+        stream._requests = queue.Queue()
+        for target_id in target_ids:
+            stream.watches[target_id] = mock.Mock(_target_id=target_id)
+        return stream
+
+    def _routed(self, stream, response):
+        watches = dict(stream.watches)
+        stream._route(response)
+        return sorted(
+            target_id
+            for target_id, watch in watches.items()
+            if watch.on_snapshot.called or watch.push.called
+        )
+
+    def test_target_change_w_target_ids(self):
+        stream = self._make_stream(1, 2, 3)
+        response = _target_change("CURRENT", [1, 3, 4])
+        self.assertEqual(self._routed(stream, response), [1, 3])
+
+    def test_target_change_wo_target_ids(self):
+        stream = self._make_stream(1, 2)
+        response = _target_change("CURRENT")
+        self.assertEqual(self._routed(stream, response), [1, 2])
+
+    def test_consistent_snapshot(self):
+        stream = self._make_stream(1, 2)
+        stream.watches[2].current = False
+        response = _target_change("NO_CHANGE", seconds=1, resume_token=b"token")
+        self.assertEqual(self._routed(stream, response), [1])
+        watch = stream.watches[1]
+        watch.push.assert_called_once_with(response.target_change.read_time, b"token")
+        watch.on_snapshot.assert_not_called()
+
+    def test_no_change_wo_read_time(self):
+        stream = self._make_stream(1)
+        response = _target_change("NO_CHANGE", resume_token=b"token")
+        self.assertEqual(self._routed(stream, response), [1])
+        stream.watches[1].on_snapshot.assert_called_once_with(response)
+
+    def test_document_change(self):
+        stream = self._make_stream(1, 2, 3)
+        response = _document_change("users/a", [1], removed_target_ids=[3])
+        self.assertEqual(self._routed(stream, response), [1, 3])
+
+    def test_document_delete(self):
+        stream = self._make_stream(1, 2)
+        response = firestore.ListenResponse(
+            document_delete=write.DocumentDelete(document="d", removed_target_ids=[2])
+        )
+        self.assertEqual(self._routed(stream, response), [2])
+
+    def test_document_remove(self):
+        stream = self._make_stream(1, 2)
+        response = firestore.ListenResponse(
+            document_remove=write.DocumentRemove(document="d", removed_target_ids=[1])
+        )
+        self.assertEqual(self._routed(stream, response), [1])
+
+    def test_filter(self):
+        stream = self._make_stream(1, 2)
+        response = firestore.ListenResponse(
+            filter=write.ExistenceFilter(target_id=2, count=3)
+        )
+        self.assertEqual(self._routed(stream, response), [2])
+
+    def test_empty_response(self):
+        stream = self._make_stream(1, 2)
+        self.assertEqual(self._routed(stream, firestore.ListenResponse()), [1, 2])
+
+    def test_removed_by_server(self):
+        stream = self._make_stream(1, 2)
+        watch = stream.watches[1]
+        watch.on_snapshot.side_effect = RuntimeError("Error 7: denied")
+        stream._route(_target_change("REMOVE", [1]))
+        self.assertEqual(list(stream.watches), [2])
+        self.assertTrue(stream._requests.empty())
+
+    def test_watch_error(self):
+        stream = self._make_stream(1, 2)
+        watch = stream.watches[1]
+        watch.on_snapshot.side_effect = ValueError("bad")
+        stream._route(_target_change("CURRENT", [1]))
+        self.assertEqual(list(stream.watches), [2])
+        request = stream._requests.get_nowait()
+        self.assertEqual(request.remove_target, 1)
+
+
+class TestListenStress(unittest.TestCase):
+    """Many watches over the streams of a local ``Listen`` server."""
+
+    NUM_TARGETS = 2000
+    NUM_STREAMS = 2
+
+    def setUp(self):
+        self.servicer = _FakeListenServicer()
+        self.server, address = _start_server(self.servicer)
+        self.channel = grpc.insecure_channel(address)
+
+    def tearDown(self):
+        self.channel.close()
+        self.server.stop(None)
+
+    def _make_client(self):
+        from google.cloud.firestore_v1.services.firestore import client as gapic
+        from google.cloud.firestore_v1.services.firestore.transports import grpc as t
+
+        client = _make_client(self.NUM_STREAMS)
+        client._firestore_api_internal = gapic.FirestoreClient(
+            transport=t.FirestoreGrpcTransport(channel=self.channel)
+        )
+        return client
+
+    def test_many_document_watches(self):
+        from google.cloud.firestore_v1.listen_multiplexer import _STREAM_THREAD_NAME
+
+        client = self._make_client()
+        multiplexer = client._listen_multiplexer
+        lock = threading.Lock()
+        received = {}
+        done = threading.Event()
+
+        def callback(name, docs, changes, read_time):
+            with lock:
+                received[name] = [doc.id for doc in docs]
+                if len(received) == self.NUM_TARGETS:
+                    done.set()
+
+        watches = []
+        for index in range(self.NUM_TARGETS):
+            name = "doc-{}".format(index)
+            document_ref = client.document("stress", name)
+            watches.append(
+                document_ref.on_snapshot(
+                    lambda docs, changes, read_time, name=name: callback(
+                        name, docs, changes, read_time
+                    )
+                )
+            )
+
+        self.assertTrue(done.wait(60))
+        self.assertEqual(received, {name: [name] for name in received})
+        self.assertEqual(self.servicer.streams, self.NUM_STREAMS)
+        self.assertEqual(
+            multiplexer.targets, [self.NUM_TARGETS // self.NUM_STREAMS] * 2
+        )
+        stream_threads = [
+            thread
+            for thread in threading.enumerate()
+            if thread.name == _STREAM_THREAD_NAME
+        ]
+        self.assertEqual(len(stream_threads), self.NUM_STREAMS)
+
+        # Targets are removed from the streams while they are open...
+        for watch in watches[: -self.NUM_STREAMS]:
+            watch.unsubscribe()
+        self.assertEqual(multiplexer.targets, [1] * self.NUM_STREAMS)
+        _wait_for(lambda: self.servicer.removed == self.NUM_TARGETS - self.NUM_STREAMS)
+
+        # ...and removing the last target of a stream closes it.
+        for watch in watches[-self.NUM_STREAMS :]:
+            watch.unsubscribe()
+        self.assertEqual(multiplexer.targets, [])
+        for thread in stream_threads:
+            thread.join(5)
+            self.assertFalse(thread.is_alive())
+
+    def test_query_watch_resumes(self):
+        self.servicer.abort_first_stream = True
+        client = self._make_client()
+        snapshots = queue.Queue()
+
+        def callback(docs, changes, read_time):
+            snapshots.put(docs)
+
+        with _no_backoff():
+            watch = client.collection("stress").on_snapshot(callback)
+            self.assertEqual(snapshots.get(timeout=10), [])
+            _wait_for(lambda: len(self.servicer.resume_tokens) == 2)
+
+        self.assertEqual(self.servicer.resume_tokens, [b"", b"token-1"])
+        watch.unsubscribe()
+
+
+class _FakeCall(object):
+    """A ``Listen`` call whose responses are fed by a test."""
+
+    def __init__(self, request_iterator):
+        self.request_iterator = request_iterator
+        self._responses = queue.Queue()
+        self.cancelled = False
+
+    def next_request(self):
+        return next(self.request_iterator, None)
+
+    def respond(self, response):
+        self._responses.put(response)
+
+    def __iter__(self):
+        while True:
+            response = self._responses.get()
+            if response is None:
+                return
+            if isinstance(response, Exception):
+                raise response
+            yield response
+
+    def cancel(self):
+        self.cancelled = True
+        self.respond(exceptions.Cancelled("cancelled"))
+
+
+class _FakeListenServicer(object):
+    """Answers each added target with its documents, then CURRENT.
+
+    Like Firestore, it sends a global NO_CHANGE, making the current targets
+    consistent, once it has no more requests to handle.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tokens = itertools.count(1)
+        self.streams = 0
+        self.removed = 0
+        self.resume_tokens = []
+        self.abort_first_stream = False
+
+    @staticmethod
+    def _read(request_iterator, requests):
+        try:
+            for request in request_iterator:
+                requests.put(request)
+        except grpc.RpcError:
+            pass  # The stream was cancelled.
+        finally:
+            requests.put(None)
+
+    def listen(self, request_iterator, context):
+        with self._lock:
+            self.streams += 1
+            abort = self.abort_first_stream and self.streams == 1
+        requests = queue.Queue()
+        reader = threading.Thread(target=self._read, args=(request_iterator, requests))
+        reader.daemon = True
+        reader.start()
+
+        consistent = True
+        while True:
+            if not consistent and requests.empty():
+                token = "token-{}".format(next(self._tokens)).encode()
+                yield _target_change("NO_CHANGE", seconds=1, resume_token=token)
+                consistent = True
+                if abort:
+                    context.abort(grpc.StatusCode.UNAVAILABLE, "try again")
+
+            request = requests.get()
+            if request is None:
+                return
+            if request.remove_target:
+                with self._lock:
+                    self.removed += 1
+                yield _target_change("REMOVE", [request.remove_target])
+                continue
+
+            target = request.add_target
+            with self._lock:
+                self.resume_tokens.append(target.resume_token)
+            yield _target_change("ADD", [target.target_id])
+            for path in target.documents.documents:
+                yield _document_change(path, [target.target_id], prefix="")
+            yield _target_change("CURRENT", [target.target_id])
+            consistent = False
+
+
+def _start_server(servicer):
+    handlers = {
+        "Listen": grpc.stream_stream_rpc_method_handler(
+            servicer.listen,
+            request_deserializer=firestore.ListenRequest.deserialize,
+            response_serializer=firestore.ListenResponse.serialize,
+        )
+    }
+    server = grpc.server(concurrent.futures.ThreadPoolExecutor(max_workers=8))
+    server.add_generic_rpc_handlers(
+        (
+            grpc.method_handlers_generic_handler(
+                "google.firestore.v1.Firestore", handlers
+            ),
+        )
+    )
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+    return server, "localhost:{}".format(port)
+
+
+def _target_change(change_type, target_ids=(), seconds=None, resume_token=b""):
+    read_time = None
+    if seconds is not None:
+        read_time = timestamp_pb2.Timestamp(seconds=seconds)
+    return firestore.ListenResponse(
+        target_change=firestore.TargetChange(
+            target_change_type=firestore.TargetChange.TargetChangeType[change_type],
+            target_ids=list(target_ids),
+            read_time=read_time,
+            resume_token=resume_token,
+        )
+    )
+
+
+def _document_change(
+    path,
+    target_ids,
+    removed_target_ids=(),
+    prefix="projects/project/databases/(default)/documents/",
+):
+    timestamp = timestamp_pb2.Timestamp(seconds=1)
+    return firestore.ListenResponse(
+        document_change=write.DocumentChange(
+            document=document.Document(
+                name=prefix + path,
+                fields={"n": document.Value(integer_value=1)},
+                create_time=timestamp,
+                update_time=timestamp,
+            ),
+            target_ids=list(target_ids),
+            removed_target_ids=list(removed_target_ids),
+        )
+    )
@@ -194,6 +194,178 @@ class TestOrder(unittest.TestCase):
         target.compare(left, right)
 
 
+class Test_value_sort_key(unittest.TestCase):
+    @staticmethod
+    def _call_fut(value):
+        from google.cloud.firestore_v1.order import value_sort_key
+
+        return value_sort_key(value)
+
+    def test_matches_order_compare(self):
+        from google.api_core.datetime_helpers import DatetimeWithNanoseconds
+
+        float_nan = float("nan")
+        inf = float("inf")
+
+        def timestamp(seconds, nanos):
+            return DatetimeWithNanoseconds.from_timestamp_pb(
+                timestamp_pb2.Timestamp(seconds=seconds, nanos=nanos)
+            )
+
+        groups = [
+            [None],
+            [False],
+            [True],
+            [float_nan, float_nan],
+            [-inf],
+            [-(2 ** 31) - 1],
+            [-1.1],
+            [-1, -1.0],
+            [0, -0.0, 0.0],
+            [1, 1.0],
+            [2 ** 31],
+            [inf],
+            [timestamp(123, 0)],
+            [timestamp(123, 123)],
+            [timestamp(345, 0)],
+            [""],
+            ["a"],
+            ["abc def"],
+            ["\u00e9a"],
+            [b""],
+            [b"\x00"],
+            [b"\x7f"],
+            [_DummyReference("projects/p1/databases/d1/documents/c1/doc1")],
+            [_DummyReference("projects/p1/databases/d1/documents/c1/doc1/c2/d")],
+            [_DummyReference("projects/p1/databases/d1/documents/c10/doc1")],
+            [GeoPoint(-90, 180)],
+            [GeoPoint(0, -180)],
+            [[], ()],
+            [["bar"]],
+            [["foo"]],
+            [["foo", 0]],
+            [["foo", 1], ("foo", 1.0)],
+            [["foo", "0"]],
+            [{"bar": 0}],
+            [{"bar": 0, "foo": 1}],
+            [{"bar": 1}],
+            [{"bar": "0"}],
+            [{"foo": 0}],
+        ]
+
+        for i, left_group in enumerate(groups):
+            for left in left_group:
+                for j, right_group in enumerate(groups):
+                    for right in right_group:
+                        left_key = self._call_fut(left)
+                        right_key = self._call_fut(right)
+                        actual = Order._compare_to(left_key, right_key)
+                        self.assertEqual(
+                            actual,
+                            Order._compare_to(i, j),
+                            "comparing {!r} to {!r}".format(left, right),
+                        )
+                        if not isinstance(left, _DummyReference) and not (
+                            isinstance(right, _DummyReference)
+                        ):
+                            self.assertEqual(
+                                actual,
+                                Order.compare(encode_value(left), encode_value(right)),
+                            )
+
+    def test_descending_sort_key(self):
+        from google.cloud.firestore_v1.order import descending_sort_key
+
+        values = [
+            None,
+            False,
+            True,
+            float("nan"),
+            -1,
+            0.5,
+            2,
+            "",
+            "a",
+            "b",
+            b"\x00",
+            GeoPoint(0, 0),
+            GeoPoint(0, 1),
+            [],
+            ["a"],
+            ["a", "b"],
+            {"a": 1},
+        ]
+        keys = [descending_sort_key(self._call_fut(value)) for value in values]
+        for i, left in enumerate(keys):
+            for j, right in enumerate(keys):
+                self.assertEqual(
+                    Order._compare_to(left, right),
+                    Order._compare_to(j, i),
+                    "comparing {!r} to {!r}".format(values[i], values[j]),
+                )
+
+    def test_datetime(self):
+        import datetime
+        import pytz
+
+        naive = datetime.datetime(2020, 1, 2, 3, 4, 5, 6)
+        aware = pytz.utc.localize(naive)
+        self.assertEqual(self._call_fut(naive), self._call_fut(aware))
+        self.assertEqual(self._call_fut(naive)[0], TypeOrder.TIMESTAMP.value)
+
+    def test_read_only_maps(self):
+        from google.cloud.firestore_v1._helpers import decode_value
+        from google.cloud.firestore_v1.base_document import _LazyFieldsView
+
+        value = {"foo": [1, {"baz": "x"}], "bar": {"qux": None}}
+        value_pb = encode_value(value)
+        frozen = decode_value(value_pb, None, frozen=True)
+        lazy = _LazyFieldsView(value_pb._pb.map_value.fields, None)
+
+        expected = self._call_fut(value)
+        self.assertEqual(self._call_fut(frozen), expected)
+        self.assertEqual(self._call_fut(lazy), expected)
+
+    def test_invalid_type(self):
+        with self.assertRaises(TypeError):
+            self._call_fut(object())
+
+
+class TestDescendingKey(unittest.TestCase):
+    @staticmethod
+    def _make_one(key):
+        from google.cloud.firestore_v1.order import DescendingKey
+
+        return DescendingKey(key)
+
+    def test_ordering(self):
+        keys = [self._make_one(key) for key in (1, 3, 2)]
+        self.assertEqual([key.key for key in sorted(keys)], [3, 2, 1])
+        self.assertTrue(self._make_one(1) > self._make_one(2))
+        self.assertFalse(self._make_one(1) < self._make_one(2))
+        self.assertEqual(self._make_one(1), self._make_one(1))
+
+    def test_in_tuple(self):
+        keys = [(self._make_one(1), "b"), (self._make_one(1), "a")]
+        self.assertEqual(sorted(keys)[0][1], "a")
+
+    def test_other_type(self):
+        key = self._make_one(1)
+        self.assertNotEqual(key, 1)
+        with self.assertRaises(TypeError):
+            key < 1
+        with self.assertRaises(TypeError):
+            key > 1
+
+
+class _DummyReference(object):
+    def __init__(self, document_path):
+        self._document_path = document_path
+
+    def __repr__(self):
+        return "_DummyReference({!r})".format(self._document_path)
+
+
 def _boolean_value(b):
     return encode_value(b)
 
@@ -101,6 +101,52 @@ class TestQuery(unittest.TestCase):
         timeout = 123.0
         self._get_helper(retry=retry, timeout=timeout)
 
+    def test_get_w_coalesce_reads(self):
+        from google.cloud.firestore_v1.client import Client
+        from google.cloud.firestore_v1.types import firestore
+
+        firestore_api = mock.Mock(spec=["run_query"])
+        client = Client(
+            project="project-project",
+            credentials=_make_credentials(),
+            coalesce_reads=True,
+        )
+        client._firestore_api_internal = firestore_api
+        parent = client.collection("dee")
+        _, expected_prefix = parent._parent_info()
+        name = "{}/sleep".format(expected_prefix)
+        response_pbs = [
+            _make_query_response(name=name, data={"snooze": 10}),
+            firestore.RunQueryResponse(),
+        ]
+        firestore_api.run_query.side_effect = lambda **kwargs: iter(response_pbs)
+
+        query = self._make_one(parent).where("snooze", "==", 10)
+        with mock.patch.object(
+            client._single_flight, "do", wraps=client._single_flight.do
+        ) as do:
+            returned = query.get(timeout=5.0)
+            returned_again = parent.where("snooze", "==", 10).get(timeout=5.0)
+
+        self.assertEqual(
+            [snapshot.to_dict() for snapshot in returned], [{"snooze": 10}]
+        )
+        self.assertEqual(returned[0].reference._path, ("dee", "sleep"))
+        self.assertIsNot(returned_again[0], returned[0])
+        key1 = do.call_args_list[0][0][0]
+        key2 = do.call_args_list[1][0][0]
+        self.assertEqual(key1, key2)
+        self.assertEqual(key1[:2], ("query", parent._parent_info()[0]))
+        firestore_api.run_query.assert_called_with(
+            request={
+                "parent": parent._parent_info()[0],
+                "structured_query": query._to_protobuf(),
+                "transaction": None,
+            },
+            metadata=client._rpc_metadata,
+            timeout=5.0,
+        )
+
     def test_get_limit_to_last(self):
         from google.cloud import firestore
         from google.cloud.firestore_v1.base_query import _enum_from_direction
@@ -158,8 +204,10 @@ class TestQuery(unittest.TestCase):
             metadata=client._rpc_metadata,
         )
 
-    def _stream_helper(self, retry=None, timeout=None):
+    def _stream_helper(self, retry=None, timeout=None, lazy=False, frozen=None):
         from google.cloud.firestore_v1 import _helpers
+        from google.cloud.firestore_v1.base_document import FrozenDocumentSnapshot
+        from google.cloud.firestore_v1.base_document import LazyDocumentSnapshot
 
         # Create a minimal fake GAPIC.
         firestore_api = mock.Mock(spec=["run_query"])
@@ -182,14 +230,18 @@ class TestQuery(unittest.TestCase):
         # Execute the query and check the response.
         query = self._make_one(parent)
 
-        get_response = query.stream(**kwargs)
+        get_response = query.stream(lazy=lazy, frozen=frozen, **kwargs)
 
         self.assertIsInstance(get_response, types.GeneratorType)
         returned = list(get_response)
         self.assertEqual(len(returned), 1)
         snapshot = returned[0]
         self.assertEqual(snapshot.reference._path, ("dee", "sleep"))
-        self.assertEqual(snapshot.to_dict(), data)
+        self.assertEqual(dict(snapshot.to_dict()), data)
+        self.assertEqual(isinstance(snapshot, LazyDocumentSnapshot), lazy)
+        self.assertEqual(
+            isinstance(snapshot, FrozenDocumentSnapshot), lazy or bool(frozen)
+        )
 
         # Verify the mock call.
         parent_path, _ = parent._parent_info()
@@ -206,6 +258,12 @@ class TestQuery(unittest.TestCase):
     def test_stream_simple(self):
         self._stream_helper()
 
+    def test_stream_lazy(self):
+        self._stream_helper(lazy=True)
+
+    def test_stream_frozen(self):
+        self._stream_helper(frozen=True)
+
     def test_stream_w_retry_timeout(self):
         from google.api_core.retry import Retry
 
@@ -458,7 +516,285 @@ class TestQuery(unittest.TestCase):
     def test_on_snapshot(self, watch):
         query = self._make_one(mock.sentinel.parent)
         query.on_snapshot(None)
-        watch.for_query.assert_called_once()
+        watch.for_query.assert_called_once_with(
+            query,
+            None,
+            mock.ANY,
+            mock.ANY,
+            changes_only=False,
+            delivery=None,
+            fields=None,
+        )
+
+    @mock.patch("google.cloud.firestore_v1.query.Watch", autospec=True)
+    def test_on_snapshot_changes_only(self, watch):
+        query = self._make_one(mock.sentinel.parent)
+        query.on_snapshot(
+            None, changes_only=True, delivery=mock.sentinel.delivery, fields=["a"]
+        )
+        watch.for_query.assert_called_once_with(
+            query,
+            None,
+            mock.ANY,
+            mock.ANY,
+            changes_only=True,
+            delivery=mock.sentinel.delivery,
+            fields=["a"],
+        )
+
+    def _make_resumable_client(self, *streams):
+        firestore_api = mock.Mock(spec=["run_query"])
+        firestore_api.run_query.side_effect = streams
+        client = _make_client()
+        client._firestore_api_internal = firestore_api
+        return client
+
+    @staticmethod
+    def _interrupted(responses, error):
+        def stream():
+            yield from responses
+            raise error
+
+        return stream()
+
+    @mock.patch("time.sleep")
+    def test_stream_resumable(self, sleep):
+        from google.api_core import exceptions
+
+        client = self._make_resumable_client()
+        parent = client.collection("dee")
+        _, expected_prefix = parent._parent_info()
+        response_a = _make_query_response(
+            name="{}/a".format(expected_prefix), data={"n": 1}
+        )
+        response_b = _make_query_response(
+            name="{}/b".format(expected_prefix), data={"n": 2}
+        )
+        client._firestore_api.run_query.side_effect = [
+            self._interrupted([response_a], exceptions.ServiceUnavailable("down")),
+            iter([response_b]),
+        ]
+        query = self._make_one(parent).order_by("n").limit(5).offset(1)
+
+        snapshots = list(query.stream(frozen=True, resumable=True))
+
+        self.assertEqual([snapshot.id for snapshot in snapshots], ["a", "b"])
+        sleep.assert_called_once()
+        expected = query.start_after(snapshots[0]).limit(4).offset(0)
+        request = client._firestore_api.run_query.call_args[1]["request"]
+        self.assertEqual(request["structured_query"], expected._to_protobuf())
+
+    @mock.patch("time.sleep")
+    def test_stream_resumable_w_projection(self, sleep):
+        from google.api_core import exceptions
+
+        client = self._make_resumable_client()
+        parent = client.collection("dee")
+        _, expected_prefix = parent._parent_info()
+        response_a = _make_query_response(
+            name="{}/a".format(expected_prefix), data={"a": 0, "n": 1}
+        )
+        response_b = _make_query_response(
+            name="{}/b".format(expected_prefix), data={"a": 0, "n": 2}
+        )
+        client._firestore_api.run_query.side_effect = [
+            self._interrupted([response_a], exceptions.ServiceUnavailable("down")),
+            iter([response_b]),
+        ]
+        query = self._make_one(parent).select(["a"]).order_by("n")
+
+        snapshots = list(query.stream(resumable=True))
+
+        self.assertEqual([snapshot.id for snapshot in snapshots], ["a", "b"])
+        with_orders = query.select(["a", "n"])
+        first, second = [
+            call[1]["request"]["structured_query"]
+            for call in client._firestore_api.run_query.call_args_list
+        ]
+        self.assertEqual(first, with_orders._to_protobuf())
+        expected = with_orders.start_after(snapshots[0])
+        self.assertEqual(second, expected._to_protobuf())
+
+    @mock.patch("time.sleep")
+    def test_stream_resumable_exhausted(self, sleep):
+        from google.api_core import exceptions
+
+        error = exceptions.DeadlineExceeded("slow")
+        client = self._make_resumable_client(*[error] * 5)
+        query = self._make_one(client.collection("dee"))
+
+        with self.assertRaises(exceptions.DeadlineExceeded):
+            list(query.stream(resumable=True))
+
+        self.assertEqual(client._firestore_api.run_query.call_count, 5)
+        self.assertEqual(sleep.call_count, 4)
+
+    @mock.patch("time.sleep")
+    def test_stream_resumable_at_limit(self, sleep):
+        from google.api_core import exceptions
+
+        client = self._make_resumable_client()
+        parent = client.collection("dee")
+        _, expected_prefix = parent._parent_info()
+        response = _make_query_response(
+            name="{}/a".format(expected_prefix), data={"n": 1}
+        )
+        client._firestore_api.run_query.side_effect = [
+            self._interrupted([response], exceptions.InternalServerError("oops")),
+        ]
+        query = self._make_one(parent).limit(1)
+
+        snapshots = list(query.stream(resumable=True))
+
+        self.assertEqual([snapshot.id for snapshot in snapshots], ["a"])
+        client._firestore_api.run_query.assert_called_once()
+
+    def _make_paginated(self, *pages):
+        client = self._make_resumable_client()
+        parent = client.collection("dee")
+        _, expected_prefix = parent._parent_info()
+        streams = []
+        for page in pages:
+            streams.append(
+                iter(
+                    [
+                        _make_query_response(
+                            name="{}/{}".format(expected_prefix, doc_id), data={"n": 1},
+                        )
+                        for doc_id in page
+                    ]
+                )
+            )
+        client._firestore_api.run_query.side_effect = streams
+        return client, parent
+
+    @staticmethod
+    def _structured_queries(client):
+        return [
+            call[1]["request"]["structured_query"]
+            for call in client._firestore_api.run_query.call_args_list
+        ]
+
+    def test_paginate(self):
+        client, parent = self._make_paginated(["a", "b"], ["c"])
+        query = self._make_one(parent)
+
+        pages = list(query.paginate(2))
+
+        self.assertEqual([[s.id for s in page] for page in pages], [["a", "b"], ["c"]])
+        by_name = query.order_by("__name__")
+        self.assertEqual(
+            self._structured_queries(client),
+            [
+                by_name.limit(2)._to_protobuf(),
+                by_name.limit(2)
+                .start_after({"__name__": parent.document("b")})
+                ._to_protobuf(),
+            ],
+        )
+
+    def test_paginate_last_page_full(self):
+        client, parent = self._make_paginated(["a", "b"], [])
+        query = self._make_one(parent)
+
+        pages = list(query.paginate(2))
+
+        self.assertEqual(len(pages), 1)
+        self.assertEqual(client._firestore_api.run_query.call_count, 2)
+
+    def test_paginate_w_limit_and_offset(self):
+        client, parent = self._make_paginated(["a", "b"], ["c"])
+        query = self._make_one(parent).order_by("n").limit(3).offset(4)
+
+        pages = list(query.paginate(2))
+
+        self.assertEqual(sum(len(page) for page in pages), 3)
+        first, second = self._structured_queries(client)
+        self.assertEqual(first.limit, 2)
+        self.assertEqual(first.offset, 4)
+        self.assertEqual(second.limit, 1)
+        self.assertEqual(second.offset, 0)
+        self.assertEqual(len(second.order_by), 2)
+
+    def test_paginate_from_cursor(self):
+        client, parent = self._make_paginated(["a", "b"], ["c"])
+        query = self._make_one(parent)
+        first_page = next(query.paginate(2))
+
+        client, parent = self._make_paginated(["c"])
+        query = self._make_one(parent)
+        pages = list(query.paginate(2, start_after=first_page.cursor))
+
+        self.assertEqual([[s.id for s in page] for page in pages], [["c"]])
+        (structured_query,) = self._structured_queries(client)
+        expected = (
+            query.order_by("__name__")
+            .limit(2)
+            .start_after({"__name__": parent.document("b")})
+        )
+        self.assertEqual(structured_query, expected._to_protobuf())
+
+    def test_paginate_from_cursor_w_limit(self):
+        client, parent = self._make_paginated(["a", "b"], ["c", "d"])
+        query = self._make_one(parent).limit(3)
+        first_page = next(query.paginate(2))
+
+        client, parent = self._make_paginated(["c"])
+        query = self._make_one(parent).limit(3)
+        pages = list(query.paginate(2, start_after=first_page.cursor))
+
+        self.assertEqual([[s.id for s in page] for page in pages], [["c"]])
+        (structured_query,) = self._structured_queries(client)
+        self.assertEqual(structured_query.limit, 1)
+
+        # The limit was reached by the pages read before this cursor.
+        client, parent = self._make_paginated()
+        query = self._make_one(parent).limit(3)
+        self.assertEqual(list(query.paginate(2, start_after=pages[0].cursor)), [])
+        client._firestore_api.run_query.assert_not_called()
+
+    def test_paginate_w_projection(self):
+        client, parent = self._make_paginated(["a", "b"], ["c"])
+        query = self._make_one(parent).select(["a", "n.x"]).order_by("n")
+
+        pages = list(query.paginate(2))
+
+        self.assertEqual([[s.id for s in page] for page in pages], [["a", "b"], ["c"]])
+        expected = (
+            query.select(["a", "n.x", "n"])
+            .order_by("__name__")
+            .limit(2)
+            .start_after({"n": 1, "__name__": parent.document("b")})
+        )
+        self.assertEqual(self._structured_queries(client)[1], expected._to_protobuf())
+
+    def test_paginate_prefetch(self):
+        client, parent = self._make_paginated(["a", "b"], ["c", "d"], ["e"])
+        query = self._make_one(parent)
+
+        pages = list(query.paginate(2, prefetch=True))
+
+        self.assertEqual(
+            [[s.id for s in page] for page in pages], [["a", "b"], ["c", "d"], ["e"]]
+        )
+
+    def test_paginate_prefetch_closed_early(self):
+        client, parent = self._make_paginated(["a", "b"], ["c", "d"], ["e"])
+        query = self._make_one(parent)
+
+        iterator = query.paginate(2, prefetch=True)
+        self.assertEqual(len(next(iterator)), 2)
+        iterator.close()
+
+    def test_paginate_bad_page_size(self):
+        query = self._make_one(mock.sentinel.parent)
+        with self.assertRaises(ValueError):
+            list(query.paginate(0))
+
+    def test_paginate_w_limit_to_last(self):
+        query = self._make_one(mock.sentinel.parent).limit_to_last(2)
+        with self.assertRaises(ValueError):
+            list(query.paginate(2))
 
 
 class TestCollectionGroup(unittest.TestCase):
@@ -585,6 +921,249 @@ class TestCollectionGroup(unittest.TestCase):
         with pytest.raises(ValueError):
             list(query.get_partitions(2))
 
+    def test_parallel_stream_w_orders(self):
+        client = _make_client()
+        query = self._make_one(client.collection("charles")).order_by("a")
+        with pytest.raises(ValueError):
+            list(query.parallel_stream(2))
+
+    def test_parallel_stream_w_limit(self):
+        client = _make_client()
+        query = self._make_one(client.collection("charles")).limit(10)
+        with pytest.raises(ValueError):
+            list(query.parallel_stream(2))
+
+    def test_parallel_stream_w_offset(self):
+        client = _make_client()
+        query = self._make_one(client.collection("charles")).offset(10)
+        with pytest.raises(ValueError):
+            list(query.parallel_stream(2))
+
+    def test_parallel_stream_w_inequality_filter(self):
+        client = _make_client()
+        parent = client.collection("charles")
+        for op_string in ("<", "<=", "!=", ">=", ">", "not-in"):
+            value = [1] if op_string == "not-in" else 1
+            query = self._make_one(parent).where("a", op_string, value)
+            with pytest.raises(ValueError, match="inequality filters"):
+                list(query.parallel_stream(2))
+
+    def test_parallel_stream_unordered(self):
+        client, fake = _make_partitioned_client()
+        query = self._make_one(client.collection("charles"))
+
+        snapshots = list(query.parallel_stream(2, max_workers=2))
+
+        self.assertEqual(sorted(snapshot.id for snapshot in snapshots), _DOC_IDS)
+        self.assertEqual(len(fake.requests), 3)
+
+    def test_parallel_stream_ordered(self):
+        client, fake = _make_partitioned_client()
+        query = self._make_one(client.collection("charles"))
+
+        snapshots = list(
+            query.parallel_stream(2, max_workers=2, ordered=True, max_buffered=1)
+        )
+
+        self.assertEqual([snapshot.id for snapshot in snapshots], _DOC_IDS)
+
+    def test_parallel_stream_w_filter(self):
+        client, fake = _make_partitioned_client()
+        parent = client.collection("charles")
+        query = (
+            self._make_one(parent)
+            .where("a", "==", 1)
+            .where("b", "==", None)
+            .where("c", "in", [1, 2])
+            .select(["a"])
+            .start_at({"__name__": parent.document("a")})
+        )
+
+        list(query.parallel_stream(2))
+
+        partition_request = client._firestore_api.partition_query.call_args[1]
+        structured_query = partition_request["request"]["structured_query"]
+        self.assertFalse(structured_query._pb.HasField("where"))
+        self.assertFalse(structured_query._pb.HasField("select"))
+        self.assertTrue(structured_query._pb.HasField("start_at"))
+        for structured_query in fake.requests:
+            self.assertTrue(structured_query._pb.HasField("where"))
+            self.assertTrue(structured_query._pb.HasField("select"))
+            self.assertTrue(structured_query._pb.HasField("start_at"))
+
+    @mock.patch("time.sleep")
+    def test_parallel_stream_resumed(self, sleep):
+        from google.api_core import exceptions
+
+        client, fake = _make_partitioned_client()
+        fake.failures["c"] = [exceptions.ServiceUnavailable("down")]
+        query = self._make_one(client.collection("charles"))
+
+        snapshots = list(query.parallel_stream(2, ordered=True))
+
+        self.assertEqual([snapshot.id for snapshot in snapshots], _DOC_IDS)
+        sleep.assert_called_once()
+        self.assertEqual(len(fake.requests), 4)
+        (resumed,) = [
+            structured_query
+            for structured_query in fake.requests
+            if structured_query.start_at.values and not structured_query.start_at.before
+        ]
+        self.assertTrue(resumed.start_at.values[0].reference_value.endswith("/b"))
+
+    @mock.patch("time.sleep")
+    def test_parallel_stream_resume_exhausted(self, sleep):
+        from google.api_core import exceptions
+
+        client, fake = _make_partitioned_client()
+        error = exceptions.DeadlineExceeded("slow")
+        fake.failures["a"] = [error, error, error]
+        query = self._make_one(client.collection("charles"))
+
+        with self.assertRaises(exceptions.DeadlineExceeded):
+            list(query.parallel_stream(2, ordered=True, max_attempts=3))
+
+        self.assertEqual(sleep.call_count, 2)
+
+    def test_parallel_stream_error(self):
+        from google.api_core import exceptions
+
+        client, fake = _make_partitioned_client()
+        fake.failures["a"] = [exceptions.PermissionDenied("nope")]
+        query = self._make_one(client.collection("charles"))
+
+        with self.assertRaises(exceptions.PermissionDenied):
+            list(query.parallel_stream(2, max_workers=1))
+
+    def test_parallel_stream_closed_early(self):
+        client, fake = _make_partitioned_client()
+        query = self._make_one(client.collection("charles"))
+
+        iterator = query.parallel_stream(2, ordered=True, max_buffered=1)
+        self.assertEqual(next(iterator).id, "a")
+        iterator.close()
+
+
+class Test__put_until_stopped(unittest.TestCase):
+    @staticmethod
+    def _call_fut(partition_queue, item, stopped):
+        from google.cloud.firestore_v1.query import _put_until_stopped
+
+        return _put_until_stopped(partition_queue, item, stopped)
+
+    def test_put(self):
+        import queue
+        import threading
+
+        partition_queue = queue.Queue(1)
+        self.assertTrue(self._call_fut(partition_queue, 1, threading.Event()))
+        self.assertEqual(partition_queue.get_nowait(), 1)
+
+    @mock.patch("google.cloud.firestore_v1.query._QUEUE_POLL_INTERVAL", new=0.01)
+    def test_stopped_while_full(self):
+        import queue
+        import threading
+
+        partition_queue = queue.Queue(1)
+        partition_queue.put(1)
+        stopped = threading.Event()
+        timer = threading.Timer(0.05, stopped.set)
+        timer.start()
+
+        self.assertFalse(self._call_fut(partition_queue, 2, stopped))
+        timer.join()
+        self.assertEqual(partition_queue.get_nowait(), 1)
+
+
+class Test__stream_partition(unittest.TestCase):
+    @staticmethod
+    def _call_fut(query, partition_queue, stopped):
+        from google.cloud.firestore_v1.query import _stream_partition
+
+        return _stream_partition(query, partition_queue, stopped, 5, {})
+
+    def test_already_stopped(self):
+        import queue
+        import threading
+
+        query = mock.Mock(spec=["stream"])
+        stopped = threading.Event()
+        stopped.set()
+        partition_queue = queue.Queue()
+
+        self._call_fut(query, partition_queue, stopped)
+
+        query.stream.assert_not_called()
+        self.assertTrue(partition_queue.empty())
+
+    def test_stopped_while_streaming(self):
+        import queue
+        import threading
+
+        stopped = threading.Event()
+
+        def stream():
+            stopped.set()
+            yield mock.sentinel.snapshot
+
+        query = mock.Mock(spec=["stream", "_with_order_fields"])
+        query.stream.side_effect = stream
+        query._with_order_fields.return_value = query
+        partition_queue = queue.Queue()
+
+        self._call_fut(query, partition_queue, stopped)
+
+        self.assertTrue(partition_queue.empty())
+
+
+_DOC_IDS = ["a", "b", "c", "d", "e"]
+
+
+class _FakePartitionedFirestore(object):
+    """Serve ``RunQuery`` for documents ``_DOC_IDS``, honouring cursors."""
+
+    def __init__(self, client):
+        self.client = client
+        self.requests = []
+        self.failures = {}
+
+    def run_query(self, request, metadata, **kwargs):
+        structured_query = request["structured_query"]
+        self.requests.append(structured_query)
+        return self._responses(structured_query)
+
+    def _responses(self, structured_query):
+        start_at = structured_query.start_at
+        end_at = structured_query.end_at
+        for doc_id in _DOC_IDS:
+            name = self.client.document("charles", doc_id)._document_path
+            if start_at.values:
+                start = start_at.values[0].reference_value
+                if name < start or (name == start and not start_at.before):
+                    continue
+            if end_at.values and name >= end_at.values[0].reference_value:
+                continue
+            failures = self.failures.get(doc_id)
+            if failures:
+                raise failures.pop(0)
+            yield _make_query_response(name=name, data={"a": 1})
+
+
+def _make_partitioned_client():
+    # Partitions are [start, b), [b, d) and [d, end).
+    client = _make_client()
+    fake = _FakePartitionedFirestore(client)
+    firestore_api = mock.Mock(spec=["partition_query", "run_query"])
+    firestore_api.partition_query.return_value = iter(
+        [
+            _make_cursor_pb(([client.document("charles", "b")], False)),
+            _make_cursor_pb(([client.document("charles", "d")], False)),
+        ]
+    )
+    firestore_api.run_query.side_effect = fake.run_query
+    client._firestore_api_internal = firestore_api
+    return client, fake
+
 
 def _make_client(project="project-project"):
     from google.cloud.firestore_v1.client import Client
@@ -0,0 +1,487 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import concurrent.futures
+import threading
+import unittest
+
+import aiounittest
+import mock
+import pytest
+
+from tests.unit.v1.test__helpers import AsyncIter
+from tests.unit.v1.test__helpers import AsyncMock
+
+
+_PATH_A = "projects/p/databases/(default)/documents/col/a"
+_PATH_B = "projects/p/databases/(default)/documents/col/b"
+_PATH_C = "projects/p/databases/(default)/documents/col/c"
+
+
+def _patch_future():
+    """Patch futures to count the callers blocked on a result."""
+    waiting = threading.Semaphore(0)
+
+    class _Future(concurrent.futures.Future):
+        def result(self, timeout=None):
+            if not self.done():
+                waiting.release()
+            return super(_Future, self).result(timeout)
+
+    return mock.patch("concurrent.futures.Future", new=_Future), waiting
+
+
+def _start(func, *args):
+    """Call a function in a thread; ``join`` the thread to get its outcome."""
+    outcome = {}
+
+    def target():
+        try:
+            outcome["result"] = func(*args)
+        except Exception as exc:
+            outcome["error"] = exc
+
+    thread = threading.Thread(target=target)
+    thread.start()
+
+    def join():
+        thread.join()
+        return outcome
+
+    return join
+
+
+def _make_document_pb(path):
+    from google.cloud.firestore_v1 import _helpers
+    from google.cloud.firestore_v1.types import document
+
+    return document.Document(name=path, fields=_helpers.encode_dict({"path": path}))
+
+
+def _make_responses(found=(), missing=()):
+    from google.cloud.firestore_v1.types import firestore
+
+    responses = [
+        firestore.BatchGetDocumentsResponse(found=_make_document_pb(path))
+        for path in found
+    ]
+    responses.extend(
+        firestore.BatchGetDocumentsResponse(missing=path) for path in missing
+    )
+    return responses
+
+
+def _make_client(firestore_api):
+    client = mock.Mock(spec=["_database_string", "_firestore_api", "_rpc_metadata"])
+    client._database_string = "projects/p/databases/(default)"
+    client._firestore_api = firestore_api
+    return client
+
+
+class TestSingleFlight(unittest.TestCase):
+    @staticmethod
+    def _make_one():
+        from google.cloud.firestore_v1.single_flight import SingleFlight
+
+        return SingleFlight()
+
+    def test_do(self):
+        single_flight = self._make_one()
+
+        self.assertEqual(single_flight.do("key", lambda: 1), 1)
+        self.assertEqual(single_flight.do("key", lambda: 2), 2)
+        self.assertEqual(single_flight._calls, {})
+
+    def test_do_concurrent(self):
+        single_flight = self._make_one()
+        patch, waiting = _patch_future()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            joins.append(_start(single_flight.do, "key", fetch))
+            joins.append(_start(single_flight.do, "other", lambda: "other"))
+            waiting.acquire()
+            return "shared"
+
+        joins = []
+        with patch:
+            self.assertEqual(single_flight.do("key", fetch), "shared")
+
+        self.assertEqual(joins[0](), {"result": "shared"})
+        self.assertEqual(joins[1](), {"result": "other"})
+        self.assertEqual(calls, [1])
+        self.assertEqual(single_flight._calls, {})
+
+    def test_do_concurrent_error(self):
+        single_flight = self._make_one()
+        patch, waiting = _patch_future()
+        error = ValueError("testing")
+        joins = []
+
+        def fetch():
+            joins.append(_start(single_flight.do, "key", fetch))
+            waiting.acquire()
+            raise error
+
+        with patch:
+            with self.assertRaises(ValueError):
+                single_flight.do("key", fetch)
+
+        self.assertIs(joins[0]()["error"], error)
+        self.assertEqual(single_flight._calls, {})
+
+
+class TestAsyncSingleFlight(aiounittest.AsyncTestCase):
+    @staticmethod
+    def _make_one():
+        from google.cloud.firestore_v1.single_flight import AsyncSingleFlight
+
+        return AsyncSingleFlight()
+
+    @pytest.mark.asyncio
+    async def test_do(self):
+        single_flight = self._make_one()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0)
+            return "shared"
+
+        async def other():
+            return "other"
+
+        results = await asyncio.gather(
+            single_flight.do("key", fetch),
+            single_flight.do("key", fetch),
+            single_flight.do("other", other),
+        )
+
+        self.assertEqual(results, ["shared", "shared", "other"])
+        self.assertEqual(calls, [1])
+        self.assertEqual(single_flight._calls, {})
+
+        self.assertEqual(await single_flight.do("key", fetch), "shared")
+        self.assertEqual(calls, [1, 1])
+
+    @pytest.mark.asyncio
+    async def test_do_error(self):
+        single_flight = self._make_one()
+
+        async def fetch():
+            await asyncio.sleep(0)
+            raise ValueError("testing")
+
+        results = await asyncio.gather(
+            single_flight.do("key", fetch),
+            single_flight.do("key", fetch),
+            return_exceptions=True,
+        )
+
+        self.assertIsInstance(results[0], ValueError)
+        self.assertIs(results[1], results[0])
+        self.assertEqual(single_flight._calls, {})
+
+    @pytest.mark.asyncio
+    async def test_do_leader_cancelled(self):
+        single_flight = self._make_one()
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            return "shared"
+
+        leader = asyncio.ensure_future(single_flight.do("key", fetch))
+        follower = asyncio.ensure_future(single_flight.do("key", fetch))
+        await asyncio.sleep(0)
+        leader.cancel()
+        release.set()
+
+        self.assertEqual(await follower, "shared")
+        with self.assertRaises(asyncio.CancelledError):
+            await leader
+
+    @pytest.mark.asyncio
+    async def test_do_all_cancelled(self):
+        single_flight = self._make_one()
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            raise ValueError("testing")
+
+        caller = asyncio.ensure_future(single_flight.do("key", fetch))
+        await asyncio.sleep(0)
+        (task,) = single_flight._calls.values()
+        caller.cancel()
+        release.set()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        self.assertTrue(task.done())
+        self.assertEqual(single_flight._calls, {})
+
+    @pytest.mark.asyncio
+    async def test_do_task_cancelled(self):
+        single_flight = self._make_one()
+
+        async def fetch():
+            await asyncio.Event().wait()
+
+        caller = asyncio.ensure_future(single_flight.do("key", fetch))
+        await asyncio.sleep(0)
+        (task,) = single_flight._calls.values()
+        task.cancel()
+
+        with self.assertRaises(asyncio.CancelledError):
+            await caller
+        self.assertEqual(single_flight._calls, {})
+
+
+class TestBatchGetter(unittest.TestCase):
+    @staticmethod
+    def _make_one(client, window=0.01):
+        from google.cloud.firestore_v1.single_flight import BatchGetter
+
+        return BatchGetter(client, window)
+
+    def test_get_batches_concurrent_reads(self):
+        firestore_api = mock.Mock(spec=["batch_get_documents"])
+        firestore_api.batch_get_documents.return_value = iter(
+            _make_responses(found=[_PATH_A], missing=[_PATH_B])
+        )
+        client = _make_client(firestore_api)
+        getter = self._make_one(client)
+        patch, waiting = _patch_future()
+        joins = []
+
+        def sleep(window):
+            self.assertEqual(window, 0.01)
+            joins.append(_start(getter.get, _PATH_B, None, {}))
+            joins.append(_start(getter.get, _PATH_A, None, {}))
+            waiting.acquire()
+            waiting.acquire()
+
+        with patch:
+            with mock.patch("time.sleep", side_effect=sleep):
+                document_pb = getter.get(_PATH_A, None, {})
+
+        self.assertEqual(document_pb.name, _PATH_A)
+        self.assertEqual(joins[0](), {"result": None})
+        self.assertIs(joins[1]()["result"], document_pb)
+        firestore_api.batch_get_documents.assert_called_once_with(
+            request={
+                "database": client._database_string,
+                "documents": [_PATH_A, _PATH_B],
+                "mask": None,
+                "transaction": None,
+            },
+            metadata=client._rpc_metadata,
+        )
+        self.assertEqual(getter._batches, {})
+
+    def test_get_w_mask_and_kwargs(self):
+        from google.cloud.firestore_v1.types import common
+
+        firestore_api = mock.Mock(spec=["batch_get_documents"])
+        firestore_api.batch_get_documents.return_value = iter(
+            _make_responses(found=[_PATH_A])
+        )
+        client = _make_client(firestore_api)
+        getter = self._make_one(client)
+        mask = common.DocumentMask(field_paths=["path"])
+
+        with mock.patch("time.sleep"):
+            document_pb = getter.get(_PATH_A, mask, {"timeout": 5.0})
+
+        self.assertEqual(document_pb.name, _PATH_A)
+        firestore_api.batch_get_documents.assert_called_once_with(
+            request={
+                "database": client._database_string,
+                "documents": [_PATH_A],
+                "mask": mask,
+                "transaction": None,
+            },
+            metadata=client._rpc_metadata,
+            timeout=5.0,
+        )
+
+    def test_get_full_batch(self):
+        firestore_api = mock.Mock(spec=["batch_get_documents"])
+        firestore_api.batch_get_documents.side_effect = [
+            iter(_make_responses(found=[_PATH_C])),
+            iter(_make_responses(found=[_PATH_A, _PATH_B])),
+        ]
+        client = _make_client(firestore_api)
+        getter = self._make_one(client)
+        patch, waiting = _patch_future()
+        joins = []
+
+        def sleep(window):
+            if not joins:
+                joins.append(_start(getter.get, _PATH_B, None, {}))
+                waiting.acquire()
+                # The batch is full, so this read starts another one.
+                self.assertEqual(getter.get(_PATH_C, None, {}).name, _PATH_C)
+
+        with patch:
+            with mock.patch(
+                "google.cloud.firestore_v1.single_flight._MAX_BATCH_SIZE", new=2
+            ):
+                with mock.patch("time.sleep", side_effect=sleep):
+                    document_pb = getter.get(_PATH_A, None, {})
+
+        self.assertEqual(document_pb.name, _PATH_A)
+        self.assertEqual(joins[0]()["result"].name, _PATH_B)
+        self.assertEqual(firestore_api.batch_get_documents.call_count, 2)
+        self.assertEqual(getter._batches, {})
+
+    def test_get_not_returned(self):
+        firestore_api = mock.Mock(spec=["batch_get_documents"])
+        firestore_api.batch_get_documents.return_value = iter(
+            _make_responses(found=[_PATH_B])
+        )
+        getter = self._make_one(_make_client(firestore_api))
+
+        with mock.patch("time.sleep"):
+            self.assertIsNone(getter.get(_PATH_A, None, {}))
+
+    def test_get_error(self):
+        from google.api_core import exceptions
+
+        firestore_api = mock.Mock(spec=["batch_get_documents"])
+        firestore_api.batch_get_documents.side_effect = exceptions.InternalServerError(
+            "testing"
+        )
+        getter = self._make_one(_make_client(firestore_api))
+
+        with mock.patch("time.sleep"):
+            with self.assertRaises(exceptions.InternalServerError):
+                getter.get(_PATH_A, None, {})
+        self.assertEqual(getter._batches, {})
+
+
+class TestAsyncBatchGetter(aiounittest.AsyncTestCase):
+    @staticmethod
+    def _make_one(client, window=0.001):
+        from google.cloud.firestore_v1.single_flight import AsyncBatchGetter
+
+        return AsyncBatchGetter(client, window)
+
+    @staticmethod
+    def _make_firestore_api(*responses):
+        firestore_api = AsyncMock(spec=["batch_get_documents"])
+        firestore_api.batch_get_documents.side_effect = [
+            AsyncIter(items) for items in responses
+        ]
+        return firestore_api
+
+    @pytest.mark.asyncio
+    async def test_get_batches_concurrent_reads(self):
+        firestore_api = self._make_firestore_api(
+            _make_responses(found=[_PATH_A], missing=[_PATH_B])
+        )
+        client = _make_client(firestore_api)
+        getter = self._make_one(client)
+
+        results = await asyncio.gather(
+            getter.get(_PATH_A, None, {}),
+            getter.get(_PATH_B, None, {}),
+            getter.get(_PATH_A, None, {}),
+        )
+
+        self.assertEqual(results[0].name, _PATH_A)
+        self.assertIsNone(results[1])
+        self.assertIs(results[2], results[0])
+        firestore_api.batch_get_documents.assert_called_once_with(
+            request={
+                "database": client._database_string,
+                "documents": [_PATH_A, _PATH_B],
+                "mask": None,
+                "transaction": None,
+            },
+            metadata=client._rpc_metadata,
+        )
+        self.assertEqual(getter._batches, {})
+        self.assertEqual(getter._tasks, set())
+
+    @pytest.mark.asyncio
+    async def test_get_w_mask_and_kwargs(self):
+        from google.cloud.firestore_v1.types import common
+
+        firestore_api = self._make_firestore_api(
+            _make_responses(found=[_PATH_A]), _make_responses(found=[_PATH_A])
+        )
+        getter = self._make_one(_make_client(firestore_api))
+        mask = common.DocumentMask(field_paths=["path"])
+
+        await asyncio.gather(
+            getter.get(_PATH_A, mask, {}), getter.get(_PATH_A, None, {"timeout": 5.0}),
+        )
+
+        self.assertEqual(firestore_api.batch_get_documents.call_count, 2)
+        first, second = firestore_api.batch_get_documents.call_args_list
+        self.assertEqual(first[1]["request"]["mask"], mask)
+        self.assertEqual(second[1]["timeout"], 5.0)
+
+    @pytest.mark.asyncio
+    async def test_get_full_batch(self):
+        firestore_api = self._make_firestore_api(
+            _make_responses(found=[_PATH_A, _PATH_B]), _make_responses(found=[_PATH_C])
+        )
+        getter = self._make_one(_make_client(firestore_api))
+
+        with mock.patch(
+            "google.cloud.firestore_v1.single_flight._MAX_BATCH_SIZE", new=2
+        ):
+            results = await asyncio.gather(
+                getter.get(_PATH_A, None, {}),
+                getter.get(_PATH_B, None, {}),
+                getter.get(_PATH_C, None, {}),
+            )
+
+        self.assertEqual(
+            [document_pb.name for document_pb in results], [_PATH_A, _PATH_B, _PATH_C]
+        )
+        self.assertEqual(firestore_api.batch_get_documents.call_count, 2)
+        self.assertEqual(getter._batches, {})
+
+    @pytest.mark.asyncio
+    async def test_get_read_cancelled(self):
+        firestore_api = self._make_firestore_api(_make_responses(found=[_PATH_A]))
+        getter = self._make_one(_make_client(firestore_api))
+
+        cancelled = asyncio.ensure_future(getter.get(_PATH_A, None, {}))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+
+        document_pb = await getter.get(_PATH_A, None, {})
+
+        self.assertEqual(document_pb.name, _PATH_A)
+        self.assertTrue(cancelled.cancelled())
+
+    @pytest.mark.asyncio
+    async def test_get_error(self):
+        from google.api_core import exceptions
+
+        firestore_api = AsyncMock(spec=["batch_get_documents"])
+        firestore_api.batch_get_documents.side_effect = exceptions.InternalServerError(
+            "testing"
+        )
+        getter = self._make_one(_make_client(firestore_api))
+
+        with self.assertRaises(exceptions.InternalServerError):
+            await getter.get(_PATH_A, None, {})
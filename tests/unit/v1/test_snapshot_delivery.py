@@ -0,0 +1,226 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import queue
+import threading
+import time
+import unittest
+
+import mock
+
+
+class TestSnapshotDelivery(unittest.TestCase):
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.firestore_v1.snapshot_delivery import SnapshotDelivery
+
+        return SnapshotDelivery
+
+    def _make_one(self, *args, **kwargs):
+        klass = self._get_target_class()
+        return klass(*args, **kwargs)
+
+    def _bind(self, delivery, changes_only=False, on_error=None):
+        """Bind a callback blocking until released, one call at a time."""
+        self.calls = queue.Queue()
+        self.release = queue.Queue()
+
+        def callback(*args):
+            self.calls.put(args)
+            self.release.get(timeout=5)
+
+        return delivery.bind(callback, changes_only=changes_only, on_error=on_error)
+
+    def _next_call(self):
+        args = self.calls.get(timeout=5)
+        self.release.put(None)
+        return args
+
+    def test_constructor_defaults(self):
+        delivery = self._make_one()
+        self.assertTrue(delivery._coalesce)
+        self.assertEqual(delivery._max_pending, 1)
+        self.assertEqual(delivery._min_interval, 0.0)
+        self.assertIsNone(delivery._max_latency)
+        self.assertEqual(delivery.delivered, 0)
+        self.assertEqual(delivery.merged, 0)
+        self.assertEqual(delivery.dropped, 0)
+        self.assertEqual(delivery.queue_depth, 0)
+        self.assertEqual(delivery.max_queue_depth, 0)
+
+    def test_constructor_wo_coalesce(self):
+        delivery = self._make_one(max_pending=3, coalesce=False)
+        self.assertEqual(delivery._max_pending, 3)
+
+    def test_constructor_w_bad_values(self):
+        for kwargs in (
+            {"max_pending": 0},
+            {"min_interval": -1.0},
+            {"max_latency": 0.0},
+        ):
+            with self.assertRaises(ValueError):
+                self._make_one(**kwargs)
+
+    def test_bind_twice(self):
+        delivery = self._make_one()
+        put = delivery.bind(mock.Mock())
+        self.assertEqual(put, delivery.put)
+        with self.assertRaises(ValueError):
+            delivery.bind(mock.Mock())
+
+    def test_bind_changes_only_wo_coalesce(self):
+        delivery = self._make_one(coalesce=False)
+        with self.assertRaises(ValueError):
+            delivery.bind(mock.Mock(), changes_only=True)
+
+    def test_coalesce_while_callback_runs(self):
+        delivery = self._make_one()
+        put = self._bind(delivery)
+
+        put(["a"], ["change-a"], 1)
+        self.assertEqual(self.calls.get(timeout=5), (["a"], ["change-a"], 1))
+        put(["a", "b"], ["change-b"], 2)
+        put(["a", "b", "c"], ["change-c"], 3)
+        put(["b", "c"], ["change-d"], 4)
+        self.assertEqual(delivery.queue_depth, 1)
+        self.release.put(None)
+
+        documents, changes, read_time = self._next_call()
+        self.assertEqual(documents, ["b", "c"])
+        self.assertEqual(changes, ["change-b", "change-c", "change-d"])
+        self.assertEqual(read_time, 4)
+        delivery.close()
+        self.assertEqual(delivery.merged, 2)
+        self.assertEqual(delivery.dropped, 0)
+        self.assertEqual(delivery.max_queue_depth, 1)
+        delivery._thread.join(5)
+        self.assertEqual(delivery.delivered, 2)
+
+    def test_drop_oldest_wo_coalesce(self):
+        delivery = self._make_one(max_pending=2, coalesce=False)
+        put = self._bind(delivery)
+
+        put(["a"], ["change-1"], 1)
+        self.calls.get(timeout=5)
+        for read_time in (2, 3, 4):
+            put(["a"], ["change-%d" % read_time], read_time)
+        self.assertEqual(delivery.queue_depth, 2)
+        self.release.put(None)
+
+        self.assertEqual(self._next_call(), (["a"], ["change-3"], 3))
+        self.assertEqual(self._next_call(), (["a"], ["change-4"], 4))
+        self.assertEqual(delivery.dropped, 1)
+        self.assertEqual(delivery.merged, 0)
+        self.assertEqual(delivery.max_queue_depth, 2)
+        delivery.close()
+
+    def test_changes_only(self):
+        delivery = self._make_one()
+        put = self._bind(delivery, changes_only=True)
+
+        put(["change-1"], 1)
+        self.assertEqual(self.calls.get(timeout=5), (["change-1"], 1))
+        put(["change-2"], 2)
+        put(["change-3"], 3)
+        self.release.put(None)
+        self.assertEqual(self._next_call(), (["change-2", "change-3"], 3))
+        delivery.close()
+
+    def test_min_interval(self):
+        delivery = self._make_one(min_interval=0.05)
+        put = self._bind(delivery)
+
+        put([], [], 1)
+        self._next_call()
+        started = time.monotonic()
+        put([], [], 2)
+        self._next_call()
+        self.assertGreaterEqual(time.monotonic() - started, 0.04)
+        delivery.close()
+
+    def test__delay(self):
+        from google.cloud.firestore_v1.snapshot_delivery import _PendingSnapshot
+
+        delivery = self._make_one(min_interval=10.0, max_latency=2.0)
+        self.assertEqual(delivery._delay(100.0), 0.0)
+
+        delivery._last_delivery = 100.0
+        pending = _PendingSnapshot([], [], 1, 101.0)
+        delivery._pending.append(pending)
+        self.assertEqual(delivery._delay(101.0), 2.0)
+        pending.arrived = 109.0
+        self.assertEqual(delivery._delay(101.0), 9.0)
+
+    def test__delay_wo_max_latency(self):
+        delivery = self._make_one(min_interval=10.0)
+        delivery._last_delivery = 100.0
+        self.assertEqual(delivery._delay(104.0), 6.0)
+
+    def test_close_discards_pending(self):
+        delivery = self._make_one()
+        put = self._bind(delivery)
+
+        put([], [], 1)
+        self.calls.get(timeout=5)
+        put([], [], 2)
+        delivery.close()
+        delivery.close()
+        self.assertEqual(delivery.queue_depth, 0)
+        put([], [], 3)
+        self.assertEqual(delivery.queue_depth, 0)
+        self.release.put(None)
+        delivery._thread.join(5)
+        self.assertFalse(delivery._thread.is_alive())
+        self.assertEqual(delivery.delivered, 1)
+
+    def test_close_while_waiting(self):
+        delivery = self._make_one()
+        delivery.bind(mock.Mock())
+        delivery.put([], [], 1)
+        thread = delivery._thread
+        thread.join(0.1)
+        self.assertTrue(thread.is_alive())
+        delivery.close()
+        thread.join(5)
+        self.assertFalse(thread.is_alive())
+
+    def test_callback_error(self):
+        delivery = self._make_one()
+        error = ValueError("bad")
+        errors = []
+        done = threading.Event()
+
+        def callback(*args):
+            raise error
+
+        def on_error(exc):
+            errors.append(exc)
+            done.set()
+
+        put = delivery.bind(callback, on_error=on_error)
+        put([], [], 1)
+        self.assertTrue(done.wait(5))
+        self.assertEqual(errors, [error])
+        put([], [], 2)
+        self.assertEqual(delivery.queue_depth, 0)
+        delivery._thread.join(5)
+        self.assertEqual(delivery.delivered, 0)
+
+    def test_callback_error_wo_on_error(self):
+        delivery = self._make_one()
+        put = delivery.bind(mock.Mock(side_effect=ValueError("bad")))
+        put([], [], 1)
+        delivery._thread.join(5)
+        self.assertFalse(delivery._thread.is_alive())
+        self.assertTrue(delivery._closed)
@@ -18,11 +18,15 @@ import mock
 from google.cloud.firestore_v1.types import firestore
 
 
+def _cmp(left, right):
+    return (left > right) - (left < right)
+
+
 class TestWatchDocTree(unittest.TestCase):
-    def _makeOne(self):
+    def _makeOne(self, comparator=None):
         from google.cloud.firestore_v1.watch import WatchDocTree
 
-        return WatchDocTree()
+        return WatchDocTree(comparator)
 
     def test_insert_and_keys(self):
         inst = self._makeOne()
@@ -62,6 +66,124 @@ class TestWatchDocTree(unittest.TestCase):
         self.assertTrue("b" in inst)
         self.assertFalse("a" in inst)
 
+    def test_keys_insertion_order_wo_comparator(self):
+        inst = self._makeOne()
+        inst = inst.insert("b", 1)
+        inst = inst.insert("a", 2)
+        inst = inst.insert("c", 3)
+        self.assertEqual(inst.keys(), ["b", "a", "c"])
+        self.assertEqual(inst.find("a").index, 1)
+
+    def test_keys_w_comparator(self):
+        inst = self._makeOne(comparator=_cmp)
+        for key in ["d", "b", "e", "a", "c"]:
+            inst = inst.insert(key, None)
+        self.assertEqual(inst.keys(), ["a", "b", "c", "d", "e"])
+        self.assertEqual(list(inst), ["a", "b", "c", "d", "e"])
+
+    def test_find_index_w_comparator(self):
+        inst = self._makeOne(comparator=_cmp)
+        for key in ["d", "b", "e", "a", "c"]:
+            inst = inst.insert(key, key.upper())
+        for index, key in enumerate("abcde"):
+            entry = inst.find(key)
+            self.assertEqual(entry.index, index)
+            self.assertEqual(entry.value, key.upper())
+
+    def test_find_missing(self):
+        inst = self._makeOne(comparator=_cmp)
+        with self.assertRaises(KeyError):
+            inst.find("a")
+
+    def test_remove_updates_index(self):
+        inst = self._makeOne(comparator=_cmp)
+        for key in "abcde":
+            inst = inst.insert(key, None)
+        inst = inst.remove("b")
+        self.assertEqual(inst.keys(), ["a", "c", "d", "e"])
+        self.assertEqual(inst.find("e").index, 3)
+        self.assertFalse("b" in inst)
+
+    def test_insert_existing_key_replaces(self):
+        inst = self._makeOne(comparator=_cmp)
+        inst = inst.insert("a", 1)
+        inst = inst.insert("a", 2)
+        self.assertEqual(len(inst), 1)
+        self.assertEqual(inst.find("a").value, 2)
+
+    def test_many_keys_split_sublists(self):
+        import random
+
+        inst = self._makeOne(comparator=_cmp)
+        inst._LOAD = 2
+        keys = ["{:03d}".format(i) for i in range(50)]
+        shuffled = list(keys)
+        random.Random(1234).shuffle(shuffled)
+        for key in shuffled:
+            inst = inst.insert(key, None)
+        self.assertGreater(len(inst._lists), 1)
+        self.assertEqual(inst.keys(), keys)
+        for index, key in enumerate(keys):
+            self.assertEqual(inst.find(key).index, index)
+
+        for key in shuffled[:40]:
+            inst = inst.remove(key)
+        remaining = sorted(shuffled[40:])
+        self.assertEqual(inst.keys(), remaining)
+        for index, key in enumerate(remaining):
+            self.assertEqual(inst.find(key).index, index)
+
+        for key in remaining:
+            inst = inst.remove(key)
+        self.assertEqual(len(inst), 0)
+        self.assertEqual(inst.keys(), [])
+
+    def test_equal_sort_keys(self):
+        def by_first_char(key1, key2):
+            return _cmp(key1[0], key2[0])
+
+        inst = self._makeOne(comparator=by_first_char)
+        inst = inst.insert("a1", None)
+        inst = inst.insert("a2", None)
+        inst = inst.insert("b1", None)
+        inst = inst.insert("a3", None)
+        self.assertEqual(inst.keys(), ["a1", "a2", "a3", "b1"])
+        self.assertEqual(inst.find("a3").index, 2)
+        inst = inst.remove("a2")
+        self.assertEqual(inst.keys(), ["a1", "a3", "b1"])
+
+    def test_equal_sort_keys_span_sublists(self):
+        inst = self._makeOne(comparator=lambda key1, key2: 0)
+        inst._LOAD = 1
+        for key in "abcde":
+            inst = inst.insert(key, None)
+        self.assertGreater(len(inst._lists), 1)
+        self.assertEqual(inst.find("e").index, 4)
+
+    def test_inconsistent_comparator(self):
+        inst = self._makeOne(comparator=lambda key1, key2: -1)
+        inst._LOAD = 1
+        for key in "abc":
+            inst = inst.insert(key, None)
+        self.assertEqual(inst.keys(), ["c", "b", "a"])
+        self.assertEqual(inst.find("a").index, 2)
+        inst = inst.remove("a")
+        self.assertEqual(inst.keys(), ["c", "b"])
+
+    def test_key_order_changed_after_insert(self):
+        class Key(object):
+            def __init__(self, rank):
+                self.rank = rank
+
+        inst = self._makeOne(comparator=lambda key1, key2: _cmp(key1.rank, key2.rank))
+        first, second, third = Key(1), Key(2), Key(3)
+        for key in (first, second, third):
+            inst = inst.insert(key, None)
+        second.rank = 0
+        self.assertEqual(inst.find(second).index, 1)
+        inst = inst.remove(second)
+        self.assertEqual(inst.keys(), [first, third])
+
 
 class TestDocumentChange(unittest.TestCase):
     def _makeOne(self, type, document, old_index, new_index):
@@ -172,6 +294,9 @@ class TestWatch(unittest.TestCase):
         snapshot_callback=None,
         snapshot_class=None,
         reference_class=None,
+        changes_only=False,
+        delivery=None,
+        fields=None,
     ):  # pragma: NO COVER
         from google.cloud.firestore_v1.watch import Watch
 
@@ -200,6 +325,9 @@ class TestWatch(unittest.TestCase):
             reference_class,
             BackgroundConsumer=DummyBackgroundConsumer,
             ResumableBidiRpc=DummyRpc,
+            changes_only=changes_only,
+            delivery=delivery,
+            fields=fields,
         )
         return inst
 
@@ -242,6 +370,19 @@ class TestWatch(unittest.TestCase):
         self.assertEqual(inst._rpc, None)
         self.assertTrue(inst._closed)
 
+    def test_close_w_delivery(self):
+        delivery = mock.Mock(spec=["bind", "close"])
+        inst = self._makeOne(delivery=delivery)
+        inst.close()
+        delivery.close.assert_called_once_with()
+
+    def test__on_delivery_error(self):
+        inst = self._makeOne()
+        error = ValueError("bad")
+        with mock.patch.object(inst, "_on_rpc_done") as on_rpc_done:
+            inst._on_delivery_error(error)
+        on_rpc_done.assert_called_once_with(error)
+
     def test_close_already_closed(self):
         inst = self._makeOne()
         inst._closed = True
@@ -281,6 +422,41 @@ class TestWatch(unittest.TestCase):
                 )
         self.assertTrue(inst._consumer.started)
         self.assertTrue(inst._rpc.callbacks, [inst._on_rpc_done])
+        self.assertFalse(inst._changes_only)
+
+    def test_for_document_changes_only(self):
+        from google.cloud.firestore_v1.watch import Watch
+
+        modulename = "google.cloud.firestore_v1.watch"
+        with mock.patch("%s.Watch.ResumableBidiRpc" % modulename, DummyRpc):
+            with mock.patch(
+                "%s.Watch.BackgroundConsumer" % modulename, DummyBackgroundConsumer
+            ):
+                inst = Watch.for_document(
+                    DummyDocumentReference(),
+                    self._snapshot_callback,
+                    DummyDocumentSnapshot,
+                    DummyDocumentReference,
+                    changes_only=True,
+                )
+        self.assertTrue(inst._changes_only)
+
+    def test_for_document_w_fields(self):
+        from google.cloud.firestore_v1.watch import Watch
+
+        modulename = "google.cloud.firestore_v1.watch"
+        with mock.patch("%s.Watch.ResumableBidiRpc" % modulename, DummyRpc):
+            with mock.patch(
+                "%s.Watch.BackgroundConsumer" % modulename, DummyBackgroundConsumer
+            ):
+                inst = Watch.for_document(
+                    DummyDocumentReference(),
+                    self._snapshot_callback,
+                    DummyDocumentSnapshot,
+                    DummyDocumentReference,
+                    fields=["a", "b.c"],
+                )
+        self.assertEqual(inst._fields, (("a",), ("b", "c")))
 
     def test_for_query(self):
         from google.cloud.firestore_v1.watch import Watch
@@ -303,10 +479,34 @@ class TestWatch(unittest.TestCase):
                         snapshot_callback,
                         snapshot_class_instance,
                         document_reference_class_instance,
+                        changes_only=True,
                     )
         self.assertTrue(inst._consumer.started)
         self.assertTrue(inst._rpc.callbacks, [inst._on_rpc_done])
         self.assertEqual(inst._targets["query"], "dummy query target")
+        self.assertTrue(inst._changes_only)
+        self.assertIsNone(inst._fields)
+
+    def test_for_query_w_fields(self):
+        from google.cloud.firestore_v1.watch import Watch
+
+        client = DummyFirestore()
+        query = DummyQuery(parent=DummyCollection(client))
+        query._orders = (DummyOrder("n"), DummyOrder("__name__"))
+        modulename = "google.cloud.firestore_v1.watch"
+        with mock.patch("%s.firestore" % modulename, DummyPb2()):
+            with mock.patch("%s.Watch.ResumableBidiRpc" % modulename, DummyRpc):
+                with mock.patch(
+                    "%s.Watch.BackgroundConsumer" % modulename, DummyBackgroundConsumer
+                ):
+                    inst = Watch.for_query(
+                        query,
+                        self._snapshot_callback,
+                        DummyDocumentSnapshot,
+                        DummyDocumentReference,
+                        fields=["a", "n"],
+                    )
+        self.assertEqual(inst._fields, (("a",), ("n",)))
 
     def test_for_query_nested(self):
         from google.cloud.firestore_v1.watch import Watch
@@ -465,6 +665,25 @@ class TestWatch(unittest.TestCase):
         inst.on_snapshot(proto)
         self.assertEqual(inst.change_map["fred"].data, {})
 
+    def test_on_snapshot_document_change_changed_w_fields(self):
+        from google.cloud.firestore_v1 import _helpers
+        from google.cloud.firestore_v1.base_document import ProjectedDocumentSnapshot
+        from google.cloud.firestore_v1.types import document
+        from google.cloud.firestore_v1.watch import WATCH_TARGET_ID
+
+        inst = self._makeOne(fields=(("a",),))
+
+        proto = DummyProto()
+        proto.target_change = ""
+        proto.document_change.target_ids = [WATCH_TARGET_ID]
+        proto.document_change.document = document.Document(
+            name="fred", fields=_helpers.encode_dict({"a": 1, "b": 2})
+        )
+        inst.on_snapshot(proto)
+        snapshot = inst.change_map["fred"]
+        self.assertIsInstance(snapshot, ProjectedDocumentSnapshot)
+        self.assertEqual(snapshot.to_dict(), {"a": 1})
+
     def test_on_snapshot_document_change_changed_docname_db_prefix(self):
         # TODO: Verify the current behavior. The change map currently contains
         # the db-prefixed document name and not the bare document name.
@@ -578,6 +797,106 @@ class TestWatch(unittest.TestCase):
         self.assertTrue(inst.has_pushed)
         self.assertEqual(inst.resume_token, "token")
 
+    def test_push_callback_keys_in_query_order(self):
+        def comparator(doc1, doc2):
+            return _cmp(doc1.reference._document_path, doc2.reference._document_path)
+
+        inst = self._makeOne(comparator=comparator)
+        for name in ("c", "a", "b"):
+            doc = DummyDocumentReference(name)
+            snapshot = DummyDocumentSnapshot(doc, None, True, None, None, None)
+            inst.change_map[doc._document_path] = snapshot
+
+        inst.push(None, "token")
+
+        keys, changes, _ = self.snapshotted
+        self.assertEqual(
+            [key.reference._document_path for key in keys], ["/a", "/b", "/c"]
+        )
+        self.assertEqual([change.new_index for change in changes], [0, 1, 2])
+
+    def test_push_changes_only(self):
+        from google.cloud.firestore_v1.watch import ChangeType
+
+        def comparator(doc1, doc2):
+            return _cmp(doc1.reference._document_path, doc2.reference._document_path)
+
+        def snapshot(name, update_time):
+            doc = DummyDocumentReference(name)
+            return DummyDocumentSnapshot(doc, None, True, None, None, update_time)
+
+        calls = []
+
+        def callback(changes, read_time):
+            calls.append((changes, read_time, inst.documents()))
+
+        inst = self._makeOne(
+            comparator=comparator, snapshot_callback=callback, changes_only=True
+        )
+        for name in ("c", "a", "b"):
+            inst.change_map["/" + name] = snapshot(name, 1)
+        inst.push("time-1", "token-1")
+
+        inst.change_map["/b"] = snapshot("b", 2)
+        inst.change_map["/d"] = snapshot("d", 2)
+        inst.change_map["/a"] = ChangeType.REMOVED
+        inst.push("time-2", "token-2")
+
+        (changes, read_time, documents), (changes_2, read_time_2, documents_2) = calls
+        self.assertEqual([change.new_index for change in changes], [0, 1, 2])
+        self.assertEqual(read_time, "time-1")
+        self.assertEqual(
+            [doc.reference._document_path for doc in documents], ["/a", "/b", "/c"]
+        )
+        self.assertEqual(
+            [(change.type, change.old_index, change.new_index) for change in changes_2],
+            [
+                (ChangeType.REMOVED, 0, -1),
+                (ChangeType.ADDED, -1, 2),
+                (ChangeType.MODIFIED, 0, 0),
+            ],
+        )
+        self.assertEqual(read_time_2, "time-2")
+        self.assertEqual(
+            [doc.reference._document_path for doc in documents_2], ["/b", "/c", "/d"]
+        )
+        self.assertEqual(inst.documents(), documents_2)
+        self.assertEqual(inst.resume_token, "token-2")
+
+    def test_push_w_delivery(self):
+        delivery = mock.Mock(spec=["bind", "close"])
+        inst = self._makeOne(delivery=delivery)
+        delivery.bind.assert_called_once_with(
+            self._snapshot_callback, False, on_error=inst._on_delivery_error
+        )
+        inst.push("time", "token")
+        delivery.bind.return_value.assert_called_once_with([], [], "time")
+        self.assertIsNone(self.snapshotted)
+
+    def test__watch_options(self):
+        from google.cloud.firestore_v1.watch import Watch
+
+        self.assertEqual(Watch._watch_options(True, None), {"changes_only": True})
+        self.assertEqual(
+            Watch._watch_options(False, mock.sentinel.delivery),
+            {"changes_only": False, "delivery": mock.sentinel.delivery},
+        )
+        self.assertEqual(
+            Watch._watch_options(False, None, (("a",),)),
+            {"changes_only": False, "fields": (("a",),)},
+        )
+
+    def test__projected_field_paths(self):
+        from google.cloud.firestore_v1.watch import _projected_field_paths
+
+        self.assertEqual(
+            _projected_field_paths(["a.b", "`c.d`", "a.b"], ["e", "a.b"]),
+            (("a", "b"), ("c.d",), ("e",)),
+        )
+        self.assertEqual(_projected_field_paths([]), ())
+        with self.assertRaises(ValueError):
+            _projected_field_paths(["a..b"])
+
     def test_push_already_pushed(self):
         class DummyReadTime(object):
             seconds = 1534858278
@@ -589,6 +908,20 @@ class TestWatch(unittest.TestCase):
         self.assertTrue(inst.has_pushed)
         self.assertEqual(inst.resume_token, "token")
 
+    def test_push_already_pushed_no_applied_changes(self):
+        from google.cloud.firestore_v1.watch import ChangeType
+
+        class DummyReadTime(object):
+            seconds = 1534858278
+
+        inst = self._makeOne()
+        inst.has_pushed = True
+        inst.change_map["/missing"] = ChangeType.REMOVED
+        inst.push(DummyReadTime, "token")
+        self.assertEqual(self.snapshotted, None)
+        self.assertEqual(inst.change_map, {})
+        self.assertEqual(inst.resume_token, "token")
+
     def test__current_size_empty(self):
         inst = self._makeOne()
         result = inst._current_size()
@@ -852,10 +1185,16 @@ def _compare(x, y):  # pragma: NO COVER
     return 1
 
 
+def _sort_key(doc):  # pragma: NO COVER
+    return doc.reference._document_path
+
+
 class DummyQuery(object):
     def __init__(self, parent):
         self._comparator = _compare
+        self._sort_key = _sort_key
         self._parent = parent
+        self._orders = ()
 
     @property
     def _client(self):
@@ -865,10 +1204,16 @@ class DummyQuery(object):
         return ""
 
 
+class DummyOrder(object):
+    def __init__(self, field_path):
+        self.field = mock.Mock(field_path=field_path)
+
+
 class DummyFirestore(object):
     _firestore_api = DummyFirestoreClient()
     _database_string = "abc://bar/"
     _rpc_metadata = None
+    _listen_multiplexer = None
 
     def ListenRequest(self, **kw):  # pragma: NO COVER
         pass